@@ -0,0 +1,734 @@
+#!/usr/bin/env python3
+"""Basic-block translation cache for the mos6502 CPU.
+
+The interpreter in MOS6502CPU.execute() fetches and dispatches one opcode at a
+time. The block engine instead decodes straight-line runs of instructions
+(basic blocks), generates a single Python function per block and caches it by
+(PC, memory-bank fingerprint).
+
+Each generated function:
+- Folds the opcode fetch of every instruction into the block (the opcode byte
+  is a constant, PC is updated inline, no fetch_byte call)
+- Splices in the bodies of the specialized handlers (see
+  mos6502.instructions.specialized), with operand bytes folded into constants
+- Sums the fixed cycle costs of the block at translation time; only
+  page-crossing and branch penalties are counted at run time, and the CPU's
+  cycle counters are charged at exits and before I/O accesses
+- Calls the handler instead where its body cannot be spliced (it returns,
+  raises or calls anything but the flag and BCD helpers: BRK, JAM, PLP, ...)
+- Returns to the execute loop at exactly the instruction boundary where the
+  interpreter would have to do something (cycle budget reached, periodic
+  callback or scheduler event due, NMI edge, unmasked IRQ, PC left the
+  decoded path, or the block's code bytes were written)
+
+Self-modifying code is handled through RAM.code_watcher: every address covered
+by a cached block is flagged in a 64K bytearray and a write to a flagged
+address drops all blocks that cover it. Memory handlers that switch banks on
+writes (e.g. the C64 processor port) list those addresses through an optional
+bank_switch_addresses() method; a write there ends the running block so the
+next lookup uses the new bank fingerprint.
+
+Usage:
+    cpu = MOS6502CPU(execution_engine="block")
+    # or, on an existing CPU:
+    cpu.execution_engine = "block"
+"""
+
+import ast
+import builtins
+import importlib
+import logging
+import textwrap
+from typing import TYPE_CHECKING, Callable, Self
+
+from mos6502 import instructions
+from mos6502.instructions.specialized import inline_handler
+from mos6502.instructions.specialized import specialize_handler
+from mos6502.memory import Byte
+
+if TYPE_CHECKING:
+    from mos6502.core import MOS6502CPU
+
+log: logging.Logger = logging.getLogger("mos6502.cpu.blocks")
+
+# Mnemonics that end a basic block - the next PC is not statically known
+BLOCK_TERMINATORS: frozenset[str] = frozenset({
+    "BCC", "BCS", "BEQ", "BMI", "BNE", "BPL", "BVC", "BVS",
+    "BRK", "JAM", "JMP", "JSR", "RTI", "RTS",
+})
+
+# Upper bound on instructions per block (keeps generated functions small)
+MAX_BLOCK_INSTRUCTIONS: int = 32
+
+# code_map flag bits
+CODE_BYTE: int = 0x01  # Address is covered by at least one cached block
+BANK_SWITCH: int = 0x02  # Writing this address may change the bank fingerprint
+
+
+class BasicBlock:
+    """A translated straight-line run of instructions.
+
+    Attributes:
+    ----------
+        start: Address of the first opcode
+        end: Address of the last byte covered by the block (inclusive)
+        fingerprint: Memory-bank fingerprint the block was decoded under
+        length: Number of instructions in the block
+        function: Generated function, or None for an untranslatable address
+        source: Generated Python source (kept for debugging)
+    """
+
+    __slots__ = ('start', 'end', 'fingerprint', 'length', 'function', 'source')
+
+    def __init__(
+        self: Self,
+        start: int,
+        end: int,
+        fingerprint: int,
+        length: int,
+        function: Callable | None,
+        source: str,
+    ) -> None:
+        self.start = start
+        self.end = end
+        self.fingerprint = fingerprint
+        self.length = length
+        self.function = function
+        self.source = source
+
+    def __repr__(self: Self) -> str:
+        """Return a short description of the block."""
+        return (f"BasicBlock(${self.start:04X}-${self.end:04X}, "
+                f"fingerprint={self.fingerprint}, length={self.length})")
+
+
+def _instruction_info(opcode: int) -> tuple[str, int] | None:
+    """Return (mnemonic, byte count) for an opcode, or None if unknown."""
+    info = instructions.InstructionSet.map.get(opcode)
+    if info is None:
+        return None
+    return info["assembler"].split()[0], int(info["bytes"])
+
+
+# Calls a spliced handler body may make besides the page readers: value
+# constructors, flag register methods and CPU helpers that neither access
+# memory nor tick
+PURE_FUNCTIONS: tuple = (int, Byte)
+PURE_CPU_METHODS: frozenset[str] = frozenset({"_adc_bcd", "_sbc_bcd"})
+
+# CPU attributes a spliced body must not use (the counters lag behind inside a block)
+CYCLE_ATTRIBUTES: frozenset[str] = frozenset({"cycles", "cycles_executed", "_pending_cycles", "tick"})
+
+# Statements and expressions that keep a handler from being spliced
+UNSPLICEABLE_NODES: tuple = (
+    ast.Return, ast.Raise, ast.Try, ast.With, ast.Global, ast.Nonlocal, ast.Delete, ast.Import,
+    ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda, ast.Yield, ast.YieldFrom, ast.Await,
+)
+
+_PC_INCREMENT: str = ast.dump(ast.parse("_sp_registers._PC = (_sp_registers._PC + 1) & 0xFFFF").body[0])
+_PC_CALLBACK_TEST: str = ast.dump(ast.parse("cpu._pc_callback is not None", mode="eval").body)
+
+
+def _charge(static: int) -> str:
+    """Return source charging the CPU with the cycles it is owed at this point.
+
+    static is the block's fixed cycle count up to here; _sp_cycles holds the
+    penalty cycles counted at run time minus the fixed cycles already charged.
+    """
+    return (
+        f"_sp_cycles += {static}\n"
+        "cpu.cycles_executed += _sp_cycles\n"
+        "if _sp_finite:\n"
+        "    cpu.cycles -= _sp_cycles\n"
+    )
+
+
+def _settle(static: int) -> str:
+    """Return source charging the CPU mid-block (see _charge) and carrying on."""
+    return _charge(static) + f"_sp_cycles = -{static}\n"
+
+
+def _tick_cost(statement: ast.stmt) -> int | None:
+    """Return n if statement is an inlined _sp_tick(n) with a literal n."""
+    if (isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Call)
+            and isinstance(statement.value.func, ast.Name) and statement.value.func.id == "_sp_tick"
+            and len(statement.value.args) == 1 and isinstance(statement.value.args[0], ast.Constant)):
+        return statement.value.args[0].value
+    return None
+
+
+def _read_statement(statement: ast.stmt) -> tuple[str | None, ast.expr] | None:
+    """Return (target, address) if statement is an inlined page-table read (see specialized._read)."""
+    if isinstance(statement, ast.Assign) and len(statement.targets) == 1 and isinstance(statement.targets[0], ast.Name):
+        target, read = statement.targets[0].id, statement.value
+    elif isinstance(statement, ast.Expr):
+        target, read = None, statement.value
+    else:
+        return None
+    if not (isinstance(read, ast.IfExp) and isinstance(read.test, ast.Compare)
+            and isinstance(read.test.left, ast.NamedExpr) and read.test.left.target.id == "_sp_view"):
+        return None
+    return target, read.test.left.value.slice.left.value
+
+
+def _write_address(statement: ast.stmt) -> ast.expr | None:
+    """Return the address if statement is an inlined RAM write (_sp_ram[address] = value)."""
+    if (isinstance(statement, ast.Assign) and len(statement.targets) == 1
+            and isinstance(statement.targets[0], ast.Subscript)
+            and isinstance(statement.targets[0].value, ast.Name) and statement.targets[0].value.id == "_sp_ram"):
+        return statement.targets[0].slice
+    return None
+
+
+def _page(address: ast.expr) -> str:
+    """Return source for the page number of address."""
+    value = _constant(address)
+    if value is not None:
+        return f"0x{value >> 8:02X}"
+    return f"{ast.unparse(address)} >> 8"
+
+
+def _is_pc(node: ast.AST) -> bool:
+    """Return True if node is _sp_registers._PC."""
+    return (isinstance(node, ast.Attribute) and node.attr == "_PC"
+            and isinstance(node.value, ast.Name) and node.value.id == "_sp_registers")
+
+
+def _constant(node: ast.expr) -> int | None:
+    """Return the value of an integer expression built from literals only, else None."""
+    if not all(isinstance(child, (ast.Constant, ast.BinOp, ast.UnaryOp, ast.operator, ast.unaryop))
+               for child in ast.walk(node)):
+        return None
+    try:
+        value = eval(ast.unparse(node), {"__builtins__": {}})  # noqa: S307
+    except ArithmeticError:
+        return None
+    return value if type(value) is int else None
+
+
+def _stored_names(node: ast.AST) -> set[str]:
+    """Return the names assigned anywhere in node."""
+    return {child.id for child in ast.walk(node) if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store)}
+
+
+class _PCCallbackStripper(ast.NodeTransformer):
+    """Drop the "if cpu._pc_callback is not None:" checks (blocks never run with one)."""
+
+    def visit_If(self, node: ast.If) -> ast.If | None:
+        """Remove a pc_callback check, keep any other if."""
+        if ast.dump(node.test) == _PC_CALLBACK_TEST:
+            return None
+        self.generic_visit(node)
+        node.body = node.body or [ast.Pass()]
+        return node
+
+
+class _Substitute(ast.NodeTransformer):
+    """Replace loads of names holding known constants with the constants."""
+
+    def __init__(self, constants: dict[str, int]) -> None:
+        self.constants = constants
+
+    def visit_Name(self, node: ast.Name) -> ast.expr:
+        """Replace a load of a known name."""
+        if isinstance(node.ctx, ast.Load) and node.id in self.constants:
+            return ast.copy_location(ast.Constant(self.constants[node.id]), node)
+        return node
+
+
+class _BlockWriter:
+    """Generate the source of one block function, instruction by instruction.
+
+    Handlers are spliced in as their inlined statements (see
+    mos6502.instructions.specialized.inline_handler()):
+    - Operand fetches become constants read at translation time, and PC is
+      stored once per instruction
+    - Fixed cycle costs (the opcode fetch and every unconditional tick) are
+      summed into static at translation time; ticks under a condition
+      (page-crossing and branch penalties) are added to _sp_cycles at run time
+    - The CPU is charged at every exit, and before a read through a page
+      reader or a write to a page without a read view (I/O), so memory
+      handlers see the same cycle count as in the interpreter: up to the
+      access with per-access ticks, up to the start of the instruction with
+      batched cycles (whose penalties then wait in _sp_penalty until the
+      instruction ends)
+
+    Handlers that cannot be spliced are called, with the cycles charged first.
+    """
+
+    def __init__(self, ram, batching_cycles: bool) -> None:
+        self.ram = ram
+        self.batching_cycles = batching_cycles
+        self.lines: list[str] = []
+        self.namespace: dict[str, object] = {}
+        self.locals: set[str] = set()
+        self.static = 0
+        # static at the start of the current instruction
+        self.start = 0
+        self.penalized = False
+        # What the previous instruction may have done
+        self.wrote = False
+        self.moved_pc = False
+        # Spliced instruction state: PC reached by the code (None once a
+        # handler sets it), whether _sp_registers._PC still lags behind, the
+        # operand bytes left to fold and locals holding folded constants
+        self.pc: int | None = None
+        self.pc_behind = False
+        self.operands = 0
+        self.constants: dict[str, int] = {}
+
+    def _visible(self) -> int:
+        """Return the fixed cycles a memory handler may see charged at this point."""
+        return self.start if self.batching_cycles else self.static
+
+    def _emit(self, statements: list[ast.stmt]) -> None:
+        """Add statements to the function body."""
+        for statement in statements:
+            self.lines.append(textwrap.indent(ast.unparse(statement), "    "))
+
+    def comment(self, text: str) -> None:
+        """Add a comment line."""
+        self.lines.append(f"    # {text}")
+
+    def boundary(self, index: int, address: int) -> None:
+        """Return index from the block if the interpreter would act before address."""
+        conditions = [f"cpu.cycles_executed + _sp_cycles + {self.static} >= _sp_deadline"]
+        if self.wrote:
+            conditions.append("_sp_cache.stale")
+        conditions.append("cpu.nmi_pending != cpu._nmi_line_previous")
+        conditions.append("(cpu.irq_pending and not cpu._flags._value & 0x04)")
+        if self.moved_pc:
+            conditions.append(f"_sp_registers._PC != 0x{address:04X}")
+        self.lines.append(f"    if {' or '.join(conditions)}:")
+        self.lines.append(textwrap.indent(_charge(self.static) + f"return {index}", "        "))
+
+    def finish(self, length: int) -> None:
+        """Charge the block's cycles and return its length."""
+        self.lines.append(textwrap.indent(_charge(self.static) + f"return {length}", "    "))
+
+    def call(self, name: str, handler: Callable, address: int) -> None:
+        """Call a handler that cannot be spliced (it charges its own cycles)."""
+        self.start = self.static
+        self.namespace[name] = handler
+        self.lines.append(f"    _sp_registers._PC = 0x{(address + 1) & 0xFFFF:04X}")
+        if self.batching_cycles:
+            # The opcode fetch waits with the handler's ticks, charged by the
+            # flush (or by execute() if the handler raises)
+            self.lines.append(textwrap.indent(_settle(self.static) + "cpu._pending_cycles += 1", "    "))
+            self.lines.append(f"    {name}(cpu)")
+            self.lines.append("    cpu._flush_cycles()")
+        else:
+            self.static += 1
+            self.lines.append(textwrap.indent(_settle(self.static) + f"{name}(cpu)", "    "))
+        self.wrote = self.moved_pc = True
+
+    def prepare(self, handler: Callable, statements: list[ast.stmt]) -> dict[str, object] | None:
+        """Check that a handler's inlined statements can be spliced.
+
+        Bodies that return, raise, call anything but pure helpers, use the
+        cycle counters, or whose names clash with the bodies already spliced
+        are called instead.
+
+        Returns:
+        -------
+            The globals the statements need (module globals, builtins and
+            function-local imports, resolved now), or None. statements is
+            stripped of its imports and pc_callback checks in place.
+        """
+        module = _PCCallbackStripper().visit(ast.Module(body=statements, type_ignores=[]))
+
+        bindings: dict[str, object] = {}
+        for statement in module.body:
+            if isinstance(statement, ast.ImportFrom):
+                if statement.level:
+                    return None
+                imported = importlib.import_module(statement.module)
+                for alias in statement.names:
+                    if not hasattr(imported, alias.name):
+                        return None
+                    bindings[alias.asname or alias.name] = getattr(imported, alias.name)
+        module.body = [statement for statement in module.body if not isinstance(statement, ast.ImportFrom)]
+
+        stored = _stored_names(module)
+        loaded = {node.id for node in ast.walk(module) if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)}
+        for name in loaded - stored - bindings.keys() - {"cpu"}:
+            if name.startswith("_sp_"):
+                continue
+            if name in handler.__globals__:
+                bindings[name] = handler.__globals__[name]
+            elif hasattr(builtins, name):
+                bindings[name] = getattr(builtins, name)
+            else:
+                return None
+
+        for node in ast.walk(module):
+            if isinstance(node, (*UNSPLICEABLE_NODES, ast.ImportFrom)):
+                return None
+            if (isinstance(node, ast.Attribute) and node.attr in CYCLE_ATTRIBUTES
+                    and isinstance(node.value, ast.Name) and node.value.id == "cpu"):
+                return None
+            if isinstance(node, ast.Call) and not self._pure(node.func, bindings):
+                return None
+
+        if "cpu" in stored or stored & self.namespace.keys():
+            return None
+        for name, value in bindings.items():
+            if name in self.locals or self.namespace.get(name, value) is not value:
+                return None
+        statements[:] = module.body
+        self.locals |= stored
+        return bindings
+
+    @staticmethod
+    def _pure(function: ast.expr, bindings: dict[str, object]) -> bool:
+        """Return True if a spliced body may call function."""
+        if isinstance(function, ast.Name):
+            return function.id == "_sp_tick" or any(bindings.get(function.id) is pure for pure in PURE_FUNCTIONS)
+        if isinstance(function, ast.Subscript):
+            return isinstance(function.value, ast.Name) and function.value.id == "_sp_readers"
+        if isinstance(function, ast.Attribute):
+            owner = function.value
+            if isinstance(owner, ast.Name):
+                return owner.id == "cpu" and function.attr in PURE_CPU_METHODS
+            return (isinstance(owner, ast.Attribute) and owner.attr == "_flags"
+                    and isinstance(owner.value, ast.Name) and owner.value.id == "cpu")
+        return False
+
+    def splice(self, statements: list[ast.stmt], bindings: dict[str, object], address: int, size: int) -> None:
+        """Add a handler's prepared statements as the instruction at address."""
+        self.namespace.update(bindings)
+        self.start = self.static
+        self.static += 1
+        self.penalized = False
+        self.pc = (address + 1) & 0xFFFF
+        self.pc_behind = True
+        self.operands = size - 1
+        self.constants = {}
+        self.wrote = self.moved_pc = False
+        for statement in statements:
+            self._emit(self._top_level(statement))
+        if self.pc_behind:
+            self._emit(self._store_pc())
+        if self.penalized:
+            self.lines.append("    _sp_cycles += _sp_penalty")
+            self.lines.append("    _sp_penalty = 0")
+
+    def _store_pc(self) -> list[ast.stmt]:
+        """Bring _sp_registers._PC up to the PC the code has reached."""
+        self.pc_behind = False
+        return ast.parse(f"_sp_registers._PC = 0x{self.pc:04X}").body
+
+    def _top_level(self, statement: ast.stmt) -> list[ast.stmt]:
+        """Return what a top-level statement of a spliced body becomes."""
+        cost = _tick_cost(statement)
+        if cost is not None:
+            self.static += cost
+            return []
+        if self.pc is not None and ast.dump(statement) == _PC_INCREMENT:
+            self.pc = (self.pc + 1) & 0xFFFF
+            self.pc_behind = True
+            self.operands -= 1
+            return []
+        read = _read_statement(statement)
+        if read is not None and self.pc is not None and self.operands > 0 and _is_pc(read[1]):
+            # Operand byte: code bytes are watched, so it cannot change under the block
+            if read[0] is not None:
+                self.constants[read[0]] = self.ram[self.pc]
+            return []
+
+        replacement = []
+        for name in sorted(_stored_names(statement) & self.constants.keys()):
+            replacement.extend(ast.parse(f"{name} = {self.constants.pop(name)}").body)
+        if self.constants:
+            statement = _Substitute(self.constants).visit(statement)
+        if (isinstance(statement, (ast.Assign, ast.AnnAssign)) and statement.value is not None
+                and isinstance(statement.targets[0] if isinstance(statement, ast.Assign) else statement.target, ast.Name)
+                and (not isinstance(statement, ast.Assign) or len(statement.targets) == 1)):
+            value = _constant(statement.value)
+            if value is not None:
+                target = statement.targets[0] if isinstance(statement, ast.Assign) else statement.target
+                self.constants[target.id] = value
+                return replacement
+
+        if self.pc_behind:
+            # An assignment of a new PC that does not read the old one replaces it
+            sets_pc = (isinstance(statement, ast.Assign) and _is_pc(statement.targets[0])
+                       and not any(_is_pc(node) for node in ast.walk(statement.value)))
+            if sets_pc:
+                self.pc_behind = False
+            else:
+                replacement.extend(self._store_pc())
+        if any(_is_pc(node) and isinstance(node.ctx, ast.Store) for node in ast.walk(statement)):
+            self.pc = None
+            self.pc_behind = False
+            self.moved_pc = True
+        return replacement + self._rewrite(statement)
+
+    def _rewrite(self, statement: ast.stmt) -> list[ast.stmt]:
+        """Return statement with its ticks, reads and writes turned into block code."""
+        cost = _tick_cost(statement)
+        if cost is not None:
+            if self.batching_cycles:
+                self.penalized = True
+                return ast.parse(f"_sp_penalty += {cost}").body
+            return ast.parse(f"_sp_cycles += {cost}").body
+        read = _read_statement(statement)
+        if read is not None:
+            return self._read(*read)
+        address = _write_address(statement)
+        if address is not None:
+            self.wrote = True
+            return self._unless_viewed(_page(address), "") + [statement]
+        for field in ("body", "orelse"):
+            nested = getattr(statement, field, None)
+            if isinstance(nested, list) and nested and isinstance(nested[0], ast.stmt):
+                setattr(statement, field, [node for child in nested for node in self._rewrite(child)])
+        return [statement]
+
+    def _unless_viewed(self, page: str, then: str) -> list[ast.stmt]:
+        """Return "if page has no read view: charge the CPU, then"."""
+        return ast.parse(
+            f"if _sp_pages[{page}] is None:\n"
+            + textwrap.indent(_settle(self._visible()) + then, "    "),
+        ).body
+
+    def _read(self, target: str | None, address: ast.expr) -> list[ast.stmt]:
+        """Return a page-table read that charges the CPU before calling a page reader."""
+        value = _constant(address)
+        if value is None:
+            setup = ast.parse(f"_sp_at = {ast.unparse(address)}").body
+            offset, address_source = "_sp_at & 0xFF", "_sp_at"
+            page = _page(ast.Name(id="_sp_at", ctx=ast.Load()))
+        else:
+            setup = []
+            offset, address_source = f"0x{value & 0xFF:02X}", f"0x{value:04X}"
+            page = _page(address)
+        reader = f"_sp_readers[{page}]({address_source})"
+        if target is None:
+            return setup + self._unless_viewed(page, reader)
+        return setup + ast.parse(
+            f"_sp_view = _sp_pages[{page}]\n"
+            "if _sp_view is not None:\n"
+            f"    {target} = _sp_view[{offset}]\n"
+            "else:\n"
+            + textwrap.indent(_settle(self._visible()) + f"{target} = {reader}", "    "),
+        ).body
+
+
+class BlockCache:
+    """Cache of translated basic blocks for one CPU instance.
+
+    The cache is attached to cpu.ram as its code_watcher so that writes to
+    translated code bytes invalidate the affected blocks.
+    """
+
+    __slots__ = (
+        'cpu',
+        'memory_handler',
+        'blocks',
+        'code_map',
+        '_blocks_by_address',
+        'stale',
+        'translations',
+        'invalidations',
+    )
+
+    def __init__(self: Self, cpu: "MOS6502CPU") -> None:
+        self.cpu = cpu
+        self.memory_handler = None
+
+        # (pc, fingerprint) -> BasicBlock
+        self.blocks: dict[tuple[int, int], BasicBlock] = {}
+
+        # 64K map of CODE_BYTE / BANK_SWITCH flags
+        # Checked by RAM.__setitem__ on every write while the engine is enabled
+        self.code_map: bytearray = bytearray(0x10000)
+        self._blocks_by_address: dict[int, set[tuple[int, int]]] = {}
+
+        # Set when a write hits cached code; generated blocks bail out at the
+        # next instruction boundary so stale opcodes are never executed
+        self.stale: bool = False
+
+        # Statistics
+        self.translations: int = 0
+        self.invalidations: int = 0
+
+    def __len__(self: Self) -> int:
+        """Return the number of cached blocks."""
+        return len(self.blocks)
+
+    def sync(self: Self) -> None:
+        """Track the CPU's current memory handler.
+
+        Blocks decoded under a different handler are dropped and the handler's
+        bank-switch addresses are flagged in the code map.
+        """
+        handler = self.cpu.ram.memory_handler
+        if handler is self.memory_handler:
+            return
+        self.memory_handler = handler
+        self.invalidate_all()
+
+    def _mark_bank_switch_addresses(self: Self) -> None:
+        """Flag the memory handler's bank-switch registers in the code map."""
+        bank_switch_addresses = getattr(self.memory_handler, "bank_switch_addresses", None)
+        if bank_switch_addresses is None:
+            return
+        code_map = self.code_map
+        for address in bank_switch_addresses():
+            code_map[address & 0xFFFF] |= BANK_SWITCH
+
+    def lookup(self: Self, pc: int, fingerprint: int) -> BasicBlock:
+        """Return the block starting at pc, translating it on a cache miss."""
+        block = self.blocks.get((pc, fingerprint))
+        if block is None:
+            block = self.translate(pc, fingerprint)
+        return block
+
+    def translate(self: Self, pc: int, fingerprint: int) -> BasicBlock:
+        """Decode and compile the basic block starting at pc.
+
+        Arguments:
+        ---------
+            pc: Address of the first opcode
+            fingerprint: Current memory-bank fingerprint
+
+        Returns:
+        -------
+            The new BasicBlock. Its function is None if no instruction at pc
+            can be translated (illegal opcode or volatile memory), in which
+            case the execute loop interprets that instruction instead.
+        """
+        cpu = self.cpu
+        ram = cpu.ram
+        handler_table = cpu._opcode_handler_cache
+        is_volatile = getattr(ram.memory_handler, "is_volatile", None)
+        batching_cycles = cpu._batching_cycles
+        breakpoint_map = cpu._breakpoint_map
+
+        writer = _BlockWriter(ram, batching_cycles)
+        length = 0
+        address = pc
+        end = pc
+
+        while length < MAX_BLOCK_INSTRUCTIONS:
+            if is_volatile is not None and is_volatile(address):
+                break
+            # End the block where PC would reach a breakpoint (checked by execute())
+            if length and breakpoint_map is not None and breakpoint_map[address]:
+                break
+            opcode = ram[address]
+            handler = handler_table[opcode]
+            info = _instruction_info(opcode)
+            if handler is None or info is None:
+                break
+            mnemonic, size = info
+            # Operand bytes are folded into the code, so they must not be volatile either
+            if is_volatile is not None and any(is_volatile((address + offset) & 0xFFFF) for offset in range(1, size)):
+                break
+
+            if length:
+                writer.boundary(length, address)
+            writer.comment(f"${address:04X}: {mnemonic} (${opcode:02X})")
+            # Splice the handler if the table holds its specialized form (no
+            # overridden helpers) and its body allows it
+            original = getattr(handler, "__wrapped__", None)
+            statements = bindings = None
+            if original is not None and specialize_handler(original, batched_cycles=batching_cycles) is handler:
+                statements = inline_handler(original)
+            if statements is not None:
+                bindings = writer.prepare(original, statements)
+            if bindings is None:
+                writer.call(f"_sp_h{length}", handler, address)
+            else:
+                writer.splice(statements, bindings, address, size)
+            length += 1
+
+            end = (address + size - 1) & 0xFFFF
+            address = (address + size) & 0xFFFF
+
+            if mnemonic in BLOCK_TERMINATORS:
+                break
+
+        if length == 0:
+            block = BasicBlock(pc, pc, fingerprint, 0, None, "")
+        else:
+            writer.finish(length)
+            name = f"_block_{pc:04X}_{fingerprint}"
+            source = "\n".join([
+                f"def {name}(cpu, _sp_finite, _sp_deadline, _sp_cache):",
+                "    _sp_registers = cpu._registers",
+                "    _sp_ram = cpu.ram",
+                "    _sp_pages = _sp_ram.read_pages",
+                "    _sp_readers = _sp_ram.page_readers",
+                "    _sp_cycles = 0",
+                *(["    _sp_penalty = 0"] if batching_cycles else []),
+                *writer.lines,
+            ])
+            namespace = dict(writer.namespace)
+            exec(compile(source, f"<block ${pc:04X}>", "exec"), namespace)  # noqa: S102
+            block = BasicBlock(pc, end, fingerprint, length, namespace[name], source)
+            self.translations += 1
+
+        self._insert(block)
+        return block
+
+    def _insert(self: Self, block: BasicBlock) -> None:
+        """Add a block to the cache and flag the code bytes it covers."""
+        key = (block.start, block.fingerprint)
+        self.blocks[key] = block
+
+        code_map = self.code_map
+        by_address = self._blocks_by_address
+        address = block.start
+        while True:
+            code_map[address] |= CODE_BYTE
+            by_address.setdefault(address, set()).add(key)
+            if address == block.end:
+                break
+            address = (address + 1) & 0xFFFF
+
+    def invalidate(self: Self, address: int) -> None:
+        """Handle a write to a flagged address (called by RAM).
+
+        Drops every block covering address. A write to a bank-switch register
+        only ends the running block.
+        """
+        address &= 0xFFFF
+        code_map = self.code_map
+        if code_map[address] & BANK_SWITCH:
+            self.stale = True
+        keys = self._blocks_by_address.pop(address, None)
+        code_map[address] &= ~CODE_BYTE & 0xFF
+        if not keys:
+            return
+
+        by_address = self._blocks_by_address
+        for key in keys:
+            block = self.blocks.pop(key, None)
+            if block is None:
+                continue
+            self.invalidations += 1
+            covered = block.start
+            while True:
+                others = by_address.get(covered)
+                if others is not None:
+                    others.discard(key)
+                    if not others:
+                        del by_address[covered]
+                        code_map[covered] &= ~CODE_BYTE & 0xFF
+                if covered == block.end:
+                    break
+                covered = (covered + 1) & 0xFFFF
+
+        self.stale = True
+        log.debug(f"Code write at ${address:04X} invalidated {len(keys)} block(s)")
+
+    def invalidate_all(self: Self) -> None:
+        """Drop every cached block."""
+        self.invalidations += len(self.blocks)
+        self.blocks.clear()
+        self._blocks_by_address.clear()
+        self.code_map[:] = bytes(0x10000)
+        self._mark_bank_switch_addresses()
+        self.stale = True
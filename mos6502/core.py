@@ -14,17 +14,33 @@ from mos6502 import instructions
 from mos6502 import memory
 from mos6502 import registers
 from mos6502 import variants
+from mos6502.flags import FlagsRegister
+from mos6502.flags import LazyFlagsRegister
+from mos6502.flags import QuietFlagsRegister
 from mos6502.instructions import _nop as nop
+from mos6502.instructions.specialized import INLINED_HELPERS
+from mos6502.instructions.specialized import INLINED_REGISTERS
+from mos6502.instructions.specialized import specialize_handler
 from mos6502.memory import Byte
 from mos6502.memory import RAM
 from mos6502.memory import Word
+from mos6502.release_handlers import release_handler
 
 if TYPE_CHECKING:
+    from mos6502.block_cache import BlockCache
+    from mos6502.idle_loop import IdleLoopDetector
+    from mos6502.profiler import ExecutionProfiler
     from mos6502.registers import Registers
+    from mos6502.scheduler import EventScheduler
 
 
 INFINITE_CYCLES: Literal[4294967295] = 0xFFFFFFFF
 
+# Execution engines selectable per CPU instance (see MOS6502CPU.execution_engine)
+ENGINE_INTERPRETER: str = "interpreter"  # Reference opcode-at-a-time interpreter
+ENGINE_BLOCK: str = "block"  # Basic-block translation cache (mos6502.block_cache)
+EXECUTION_ENGINES: tuple[str, ...] = (ENGINE_INTERPRETER, ENGINE_BLOCK)
+
 # Bit masks for byte operations
 BYTE_BIT_0_MASK: int = 0x01  # Bit 0 mask
 BYTE_BIT_1_MASK: int = 0x02  # Bit 1 mask
@@ -54,6 +70,12 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         'verbose_cycles',
         'endianness',
         '_registers',
+        '_flat_registers',
+        '_PC',
+        '_S',
+        '_A',
+        '_X',
+        '_Y',
         '_flags',
         'ram',
         'cycles',
@@ -66,12 +88,25 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         'periodic_callback',
         'periodic_callback_interval',
         '_last_periodic_callback_cycle',
-        'pc_callback',
+        'scheduler',
+        '_pc_callback',
+        '_breakpoint_map',
+        'breakpoint_callback',
         'pre_instruction_callback',
         'post_instruction_callback',
         'pre_tick_callback',
         'post_tick_callback',
+        'profiler',
         '_opcode_handler_cache',
+        '_handler_table_verbose',
+        '_release_handlers',
+        '_lazy_flags',
+        '_batched_cycles',
+        '_batching_cycles',
+        '_pending_cycles',
+        '_execution_engine',
+        '_block_cache',
+        '_idle_loop_detector',
         'unstable_config',
         'halted',
     )
@@ -82,6 +117,11 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         self: Self,
         cpu_variant: str | variants.CPUVariant = variants.CPUVariant.NMOS_6502,
         verbose_cycles: bool = False,
+        execution_engine: str = ENGINE_INTERPRETER,
+        lazy_flags: bool = False,
+        batched_cycles: bool = False,
+        flat_registers: bool = False,
+        idle_loop_skip: bool = False,
     ) -> Self:
         """Instantiate a mos6502 CPU core.
 
@@ -93,6 +133,18 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
                 Defaults to NMOS 6502 for backward compatibility.
             verbose_cycles: If True, emit per-cycle log messages (slow).
                 Defaults to False for performance.
+            execution_engine: "interpreter" (default, the reference implementation)
+                or "block" to run translated basic blocks from a cache.
+            lazy_flags: If True, defer N/Z/C/V computation until a flag is read
+                (see flags.LazyFlagsRegister). Ignored while verbose_cycles is on or
+                release_handlers is off.
+            batched_cycles: If True, charge each instruction's cycles with a single
+                tick at instruction end (see batched_cycles). Ignored while
+                verbose_cycles is on or release_handlers is off.
+            flat_registers: If True, keep PC/S/A/X/Y in the CPU's own slots instead
+                of a Registers object (see flat_registers).
+            idle_loop_skip: If True, fast-forward through idle loops in the
+                interpreter (see idle_loop_skip).
         """
         super().__init__()
 
@@ -116,8 +168,9 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         # for newly created Byte/Word/etc... objects here
         memory.ENDIANNESS = self.endianness
 
-        self._registers: Registers = registers.Registers(endianness=self.endianness)
-        from mos6502.flags import FlagsRegister
+        # Register storage: a Registers object, or the CPU itself (see flat_registers)
+        self._registers: Registers | Self = registers.Registers(endianness=self.endianness)
+        self._flat_registers: bool = False
         self._flags: FlagsRegister = FlagsRegister()
         self.ram: RAM = RAM(endianness=self.endianness)
         self.cycles = 0
@@ -147,10 +200,20 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         self.periodic_callback_interval: int = 100  # Call every 100 cycles
         self._last_periodic_callback_cycle: int = 0  # Track last callback cycle
 
+        # Optional mos6502.scheduler.EventScheduler: peripheral events run at
+        # the first instruction boundary at or after their cycle
+        self.scheduler: EventScheduler | None = None
+
         # Optional callback called when PC changes (for breakpoints, monitors, etc.)
         # Signature: pc_callback(new_pc: int) -> None
         # If callback raises StopIteration, execution will stop
-        self.pc_callback: callable = None
+        self._pc_callback: callable = None
+
+        # Breakpoints: 64K bitmap checked at instruction boundaries (None when empty)
+        # Signature: breakpoint_callback(cpu, pc: int) -> None
+        # Without a callback, reaching a breakpoint raises errors.CPUBreakpointError
+        self._breakpoint_map: bytearray | None = None
+        self.breakpoint_callback: callable = None
 
         # Optional callbacks for instruction execution hooks
         # Useful for debugging, profiling, breakpoints, and generalizing to other CPU cores
@@ -168,10 +231,37 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         self.pre_tick_callback: callable = None
         self.post_tick_callback: callable = None
 
+        # Optional mos6502.profiler.ExecutionProfiler updated inline by execute()
+        # (keeps the fast path; turns off the block engine and idle-loop skipping)
+        self.profiler: ExecutionProfiler | None = None
+
+        # Batched cycle accounting: tick() accumulates into _pending_cycles and
+        # execute() charges the sum once per instruction (see batched_cycles)
+        self._batched_cycles: bool = batched_cycles
+        self._batching_cycles: bool = batched_cycles and not verbose_cycles
+        self._pending_cycles: int = 0
+
         # Opcode -> handler cache for fast dispatch (per-instance since variant is per-instance)
         # 256-entry list indexed by opcode byte for O(1) array access (faster than dict)
         # None entries indicate illegal opcodes
+        # Built from logging-free release handlers while verbose_cycles is off
+        self._release_handlers: bool = True
         self._opcode_handler_cache: list = self._build_opcode_handler_table()
+        self._handler_table_verbose: bool = self.verbose_cycles
+        self._lazy_flags: bool = lazy_flags
+        self._flags.__class__ = self._flags_register_class()
+
+        # Execution engine selection - the block cache is created on demand
+        self._execution_engine: str = ENGINE_INTERPRETER
+        self._block_cache = None
+        self.execution_engine = execution_engine
+
+        # Idle-loop fast-forward - the detector is created on demand
+        self._idle_loop_detector = None
+        self.idle_loop_skip = idle_loop_skip
+
+        self.flat_registers = flat_registers
+        self._sync_register_access()
 
     @property
     def variant(self: Self) -> variants.CPUVariant:
@@ -183,6 +273,100 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         """Return the CPU variant name as a string."""
         return str(self._variant)
 
+    @property
+    def execution_engine(self: Self) -> str:
+        """Return the execution engine in use ("interpreter" or "block")."""
+        return self._execution_engine
+
+    @execution_engine.setter
+    def execution_engine(self: Self, engine: str) -> None:
+        """Select the execution engine.
+
+        The block engine is only used while no per-cycle/per-PC hooks are installed
+        (verbose_cycles, pc_callback, instruction or tick callbacks) and the memory
+        handler (if any) provides bank_fingerprint(). Otherwise execute() falls back
+        to the interpreter, which remains the reference implementation.
+
+        Arguments:
+        ---------
+            engine: "interpreter" or "block"
+        """
+        if engine not in EXECUTION_ENGINES:
+            valid_engines = ", ".join(EXECUTION_ENGINES)
+            raise ValueError(f"Unknown execution engine: {engine}. Valid engines: {valid_engines}")
+
+        self._execution_engine = engine
+        if engine == ENGINE_BLOCK:
+            if self._block_cache is None:
+                from mos6502.block_cache import BlockCache
+                self._block_cache = BlockCache(self)
+            self.ram.code_watcher = self._block_cache
+        else:
+            if self._block_cache is not None and self.ram.code_watcher is self._block_cache:
+                self.ram.code_watcher = None
+            self._block_cache = None
+
+    @property
+    def release_handlers(self: Self) -> bool:
+        """Return True if the logging-free release handlers are used when not verbose."""
+        return self._release_handlers
+
+    @release_handlers.setter
+    def release_handlers(self: Self, enabled: bool) -> None:
+        """Enable or disable the release handlers.
+
+        On by default. Turning them off keeps the original logging handlers and
+        flags register without enabling verbose_cycles tracing, e.g. to measure
+        what the release handlers save.
+
+        Arguments:
+        ---------
+            enabled: True to use the release handlers while verbose_cycles is off
+        """
+        self._flush_cycles()
+        self._release_handlers = bool(enabled)
+        self._sync_handler_table()
+
+    @property
+    def block_cache(self: Self) -> "BlockCache | None":
+        """Return the basic-block cache (None unless the block engine is selected)."""
+        return self._block_cache
+
+    @property
+    def idle_loop_skip(self: Self) -> bool:
+        """Return True if the interpreter fast-forwards through idle loops."""
+        return self._idle_loop_detector is not None
+
+    @idle_loop_skip.setter
+    def idle_loop_skip(self: Self, enabled: bool) -> None:
+        """Enable or disable idle-loop fast-forward.
+
+        Loops that neither change registers nor depend on volatile memory are
+        probed once and later skipped up to the next instruction boundary where
+        periodic_callback or a scheduler event runs or the cycle/instruction
+        budget ends, with the skipped cycles charged in bulk (see
+        mos6502.idle_loop). Execution stays
+        bit-for-bit identical. Only the interpreter fast path skips loops, and
+        only while no pc_callback, tick callbacks or breakpoints are set and the
+        memory handler (if any) provides is_volatile().
+
+        Arguments:
+        ---------
+            enabled: True to detect and skip idle loops
+        """
+        if enabled:
+            if self._idle_loop_detector is None:
+                from mos6502.idle_loop import IdleLoopDetector
+                self._idle_loop_detector = IdleLoopDetector(self)
+        elif self._idle_loop_detector is not None:
+            self._idle_loop_detector.abort()
+            self._idle_loop_detector = None
+
+    @property
+    def idle_loop_detector(self: Self) -> "IdleLoopDetector | None":
+        """Return the idle-loop detector (None unless idle_loop_skip is enabled)."""
+        return self._idle_loop_detector
+
     # Variant handler cache: {(instruction_package_name, function_name, variant): handler}
     _variant_handler_cache: dict[tuple[str, str, variants.CPUVariant], Callable[[Self], None]] = {}
 
@@ -237,18 +421,224 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         Pre-populates handlers for all legal opcodes using OPCODE_LOOKUP.
         Illegal opcodes are set to None.
 
+        When verbose_cycles is off (and release_handlers is on) the table holds
+        the logging-free release variants of the handlers (see
+        mos6502.release_handlers), with the addressing helpers and register
+        properties inlined (see mos6502.instructions.specialized) unless a
+        subclass overrides one of them.
+
         Returns:
             256-entry list where table[opcode] is the handler function or None
         """
         table = [None] * 256
+        release = self._release_handlers and not self.verbose_cycles
+        batched = release and self._batched_cycles
+        reference = QuietMOS6502CPU if isinstance(self, QuietMOS6502CPU) else MOS6502CPU
+        specialize = release and not any(
+            getattr(type(self), name) is not getattr(reference, name)
+            for name in (*INLINED_HELPERS, *INLINED_REGISTERS)
+        )
 
         for opcode, instruction in instructions.OPCODE_LOOKUP.items():
             if isinstance(instruction, instructions.InstructionOpcode):
                 handler = self._load_variant_handler(instruction.package, instruction.function)
+                if specialize:
+                    handler = specialize_handler(handler, batched_cycles=batched)
+                elif release:
+                    handler = release_handler(handler)
                 table[opcode] = handler
 
         return table
 
+    def _flags_register_class(self: Self) -> type[FlagsRegister]:
+        """Return the flags register class for the current verbose_cycles/release_handlers/lazy_flags."""
+        if self.verbose_cycles or not self._release_handlers:
+            return FlagsRegister
+        if self._lazy_flags:
+            return LazyFlagsRegister
+        return QuietFlagsRegister
+
+    @property
+    def lazy_flags(self: Self) -> bool:
+        """Return True if N/Z/C/V are computed lazily (see flags.LazyFlagsRegister)."""
+        return self._lazy_flags
+
+    @lazy_flags.setter
+    def lazy_flags(self: Self, enabled: bool) -> None:
+        """Enable or disable lazy flag evaluation.
+
+        Arguments:
+        ---------
+            enabled: True to record flag results and compute them on read
+        """
+        self._lazy_flags = bool(enabled)
+        self._flags.resolve()
+        self._flags.__class__ = self._flags_register_class()
+
+    @property
+    def batched_cycles(self: Self) -> bool:
+        """Return True if cycles are charged once per instruction instead of per access."""
+        return self._batched_cycles
+
+    @batched_cycles.setter
+    def batched_cycles(self: Self, enabled: bool) -> None:
+        """Enable or disable batched cycle accounting.
+
+        In batched mode tick() only accumulates cycles; execute() charges an
+        instruction's total (including page-crossing and branch penalties) once
+        when the instruction completes, so pre/post_tick_callback run at most once
+        per instruction with the summed cycles and cycles_executed is not updated
+        during the instruction. Keep it off for cycle-exact work that needs the
+        per-access ticks (e.g. the IEC bus lockstep in the C64 system).
+
+        Arguments:
+        ---------
+            enabled: True to charge cycles once per instruction
+        """
+        self._flush_cycles()
+        self._batched_cycles = bool(enabled)
+        self._sync_handler_table()
+
+    @property
+    def flat_registers(self: Self) -> bool:
+        """Return True if PC/S/A/X/Y live in the CPU's own slots."""
+        return self._flat_registers
+
+    @flat_registers.setter
+    def flat_registers(self: Self, enabled: bool) -> None:
+        """Select the register storage.
+
+        In flat mode _registers is the CPU itself, so handlers and translated
+        blocks reading cpu._registers._A read the CPU's _A slot with no
+        intermediate object. Register values are carried over either way.
+
+        Arguments:
+        ---------
+            enabled: True to store registers in the CPU's own slots
+        """
+        enabled = bool(enabled)
+        if enabled == self._flat_registers:
+            return
+
+        current = self._registers
+        values = (current._PC, current._S, current._A, current._X, current._Y)
+        if enabled:
+            self._PC, self._S, self._A, self._X, self._Y = values
+            self._registers = self
+        else:
+            self._registers = registers.Registers(endianness=self.endianness)
+            (self._registers._PC, self._registers._S, self._registers._A,
+             self._registers._X, self._registers._Y) = values
+        self._flat_registers = enabled
+
+    @property
+    def pc_callback(self: Self) -> callable:
+        """Return the callback called when PC changes (None if unset)."""
+        return self._pc_callback
+
+    @pc_callback.setter
+    def pc_callback(self: Self, callback: callable) -> None:
+        """Set the callback called when PC changes.
+
+        Arguments:
+        ---------
+            callback: pc_callback(new_pc: int) -> None, or None to remove it
+        """
+        self._pc_callback = callback
+        self._sync_register_access()
+
+    @property
+    def breakpoints(self: Self) -> frozenset[int]:
+        """Return the set of breakpoint addresses."""
+        if self._breakpoint_map is None:
+            return frozenset()
+        return frozenset(address for address, flag in enumerate(self._breakpoint_map) if flag)
+
+    def add_breakpoint(self: Self, target: int | range) -> None:
+        """Stop or dispatch when PC reaches an address or any address in a range.
+
+        Breakpoints are checked with a bitmap lookup at instruction boundaries in
+        execute(), after an instruction (or interrupt sequence) leaves PC at the
+        address. On a hit breakpoint_callback(cpu, pc) is called if set, otherwise
+        errors.CPUBreakpointError is raised. Resuming runs the instruction at the
+        breakpoint.
+
+        Arguments:
+        ---------
+            target: An address, or a range of addresses (e.g. range(0xA000, 0xC000))
+        """
+        if self._breakpoint_map is None:
+            self._breakpoint_map = bytearray(0x10000)
+        self._set_breakpoints(target, 1)
+
+    def remove_breakpoint(self: Self, target: int | range) -> None:
+        """Remove the breakpoints at an address or range of addresses.
+
+        Arguments:
+        ---------
+            target: An address, or a range of addresses
+        """
+        if self._breakpoint_map is None:
+            return
+        self._set_breakpoints(target, 0)
+        if not any(self._breakpoint_map):
+            self._breakpoint_map = None
+
+    def clear_breakpoints(self: Self) -> None:
+        """Remove every breakpoint."""
+        self._breakpoint_map = None
+        if self._block_cache is not None:
+            self._block_cache.invalidate_all()
+
+    def _set_breakpoints(self: Self, target: int | range, flag: int) -> None:
+        """Set the bitmap entries of target to flag."""
+        breakpoint_map = self._breakpoint_map
+        if isinstance(target, range):
+            for address in target:
+                breakpoint_map[address & 0xFFFF] = flag
+        else:
+            breakpoint_map[target & 0xFFFF] = flag
+        # Translated blocks must end before newly added breakpoints
+        if self._block_cache is not None:
+            self._block_cache.invalidate_all()
+
+    def _hit_breakpoint(self: Self, pc: int) -> None:
+        """Dispatch a breakpoint hit at pc."""
+        if self.breakpoint_callback is not None:
+            self.breakpoint_callback(self, pc)
+        else:
+            raise errors.CPUBreakpointError(address=pc)
+
+    def _sync_register_access(self: Self) -> None:
+        """Swap between MOS6502CPU and QuietMOS6502CPU for the current hooks.
+
+        The register properties of MOS6502CPU log in verbose mode and call
+        pc_callback; QuietMOS6502CPU's do neither, so it is swapped in while
+        verbose_cycles is off, release_handlers is on and no pc_callback is set.
+        Subclasses keep their own class.
+        """
+        if type(self) not in (MOS6502CPU, QuietMOS6502CPU):
+            return
+        if self.verbose_cycles or not self._release_handlers or self._pc_callback is not None:
+            self.__class__ = MOS6502CPU
+        else:
+            self.__class__ = QuietMOS6502CPU
+
+    def _sync_handler_table(self: Self) -> None:
+        """Rebuild the handler table and flags register for the current verbose_cycles.
+
+        Called by execute() when verbose_cycles was toggled after the table was built.
+        """
+        self._opcode_handler_cache = self._build_opcode_handler_table()
+        self._handler_table_verbose = self.verbose_cycles
+        self._batching_cycles = self._batched_cycles and self._release_handlers and not self.verbose_cycles
+        self._sync_register_access()
+        self._flags.resolve()
+        self._flags.__class__ = self._flags_register_class()
+        # Translated blocks hold references to the previous handlers
+        if self._block_cache is not None:
+            self._block_cache.invalidate_all()
+
     def __enter__(self: Self) -> Self:
         """With entrypoint."""
         return self
@@ -276,6 +666,11 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         -------
             The number of cycles remaining (can be negative).
         """
+        # Batched mode: charged once per instruction by _flush_cycles()
+        if self._batching_cycles:
+            self._pending_cycles += cycles
+            return self.cycles - self._pending_cycles
+
         # Pre-tick callback (for external hardware synchronization)
         if self.pre_tick_callback:
             self.pre_tick_callback(self, cycles)
@@ -312,6 +707,21 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
 
         return self.cycles
 
+    def _flush_cycles(self: Self) -> None:
+        """Charge the cycles accumulated in batched mode as a single tick."""
+        cycles = self._pending_cycles
+        if not cycles:
+            return
+        self._pending_cycles = 0
+
+        if self.pre_tick_callback:
+            self.pre_tick_callback(self, cycles)
+        self.cycles_executed += cycles
+        if self.cycles != INFINITE_CYCLES:
+            self.cycles -= cycles
+        if self.post_tick_callback:
+            self.post_tick_callback(self, cycles)
+
     def spend_cpu_cycles(self: Self, cost: int) -> None:
         """
         Tick the CPU and spend {cost} cycles.
@@ -671,13 +1081,8 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         ---------
             register_name: the name of th register to read to determine status
         """
-        register: Byte = getattr(self, register_name)
-        self.Z = flags.ProcessorStatusFlags.Z[flags.Z] \
-            if (register == 0x0) else not flags.ProcessorStatusFlags.Z[flags.Z]
-
-        # Set negative flag if bit 7 of A is set
-        self.N = flags.ProcessorStatusFlags.N[flags.N] \
-            if (register & 128) else not flags.ProcessorStatusFlags.N[flags.N]
+        # Z if the register is zero, N from bit 7
+        self._flags.set_nz(getattr(self, register_name))
 
     def fetch_zeropage_mode_address(self: Self, offset_register_name: str) -> int:
         """
@@ -1249,14 +1654,19 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         # Cache frequently accessed attributes as local variables for speed
         # These are looked up on every iteration, so caching saves attribute access overhead
         verbose_cycles = self.verbose_cycles
+        if verbose_cycles != self._handler_table_verbose:
+            self._sync_handler_table()
         periodic_callback = self.periodic_callback
         periodic_callback_interval = self.periodic_callback_interval
+        scheduler = self.scheduler
         pre_instruction_callback = self.pre_instruction_callback
         post_instruction_callback = self.post_instruction_callback
         opcode_handler_cache = self._opcode_handler_cache
 
         # Cache method references to avoid repeated lookups
         fetch_byte = self.fetch_byte
+        flush_cycles = self._flush_cycles
+        batching_cycles = self._batching_cycles
         handle_nmi = self._handle_nmi
         handle_irq = self._handle_irq
 
@@ -1268,190 +1678,336 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         # Pre-compute whether we can use the fast path (no debug/callbacks)
         use_fast_path = not (verbose_cycles or pre_instruction_callback or post_instruction_callback)
 
-        while True:
-            # Check if CPU is halted (by JAM instruction)
-            # Halted CPU cannot execute until reset
-            if self.halted:
-                # Write back cached counters before raising exception
-                self.instructions_executed = instructions_executed
-                if use_instruction_limit:
-                    self.instructions_remaining = instructions_remaining
-                raise errors.CPUHaltError(
-                    opcode=0x00,  # Unknown - set by JAM instruction
-                    address=int(self.PC),
-                    message="CPU is halted. Call reset() to recover."
-                )
-
-            # Check for cycle exhaustion BEFORE fetching the next instruction
-            # This prevents PC from being incremented into the next instruction
-            # when we don't have enough cycles to execute it
-            if self.cycles <= 0:
-                # Write back cached counters before raising exception
-                self.instructions_executed = instructions_executed
-                if use_instruction_limit:
-                    self.instructions_remaining = instructions_remaining
-                raise errors.CPUCycleExhaustionError(
-                    f"Exhausted available CPU cycles after {self.cycles_executed} "
-                    f"executed cycles with {self.cycles} remaining.",
-                )
-
-            # Check instruction limit if using instruction-based control
-            if use_instruction_limit and instructions_remaining <= 0:
-                # Write back cached counters before raising exception
-                self.instructions_executed = instructions_executed
-                self.instructions_remaining = instructions_remaining
-                raise errors.CPUCycleExhaustionError(
-                    f"Executed requested instructions after {self.cycles_executed} cycles.",
-                )
+        # Block engine: only without per-cycle/per-PC hooks and with a memory
+        # handler that can report its banking state (see execution_engine)
+        block_cache = self._block_cache
+        bank_fingerprint = None
+        if block_cache is not None:
+            memory_handler = self.ram.memory_handler
+            if memory_handler is not None:
+                bank_fingerprint = getattr(memory_handler, "bank_fingerprint", None)
+            if (
+                not use_fast_path
+                or self.pc_callback is not None
+                or self.pre_tick_callback is not None
+                or self.post_tick_callback is not None
+                or self.profiler is not None
+                or (memory_handler is not None and bank_fingerprint is None)
+            ):
+                block_cache = None
+            else:
+                block_cache.sync()
+                self.ram.code_watcher = block_cache
+        registers = self._registers
+        breakpoint_map = self._breakpoint_map
+
+        # Idle-loop fast-forward: interpreter fast path only, without per-access
+        # hooks and with a memory handler that can report volatile addresses
+        idle_loops = self._idle_loop_detector
+        if idle_loops is not None:
+            memory_handler = self.ram.memory_handler
+            if (
+                not use_fast_path
+                or block_cache is not None
+                or self.pc_callback is not None
+                or self.pre_tick_callback is not None
+                or self.post_tick_callback is not None
+                or breakpoint_map is not None
+                or self.profiler is not None
+                or (memory_handler is not None and getattr(memory_handler, "is_volatile", None) is None)
+            ):
+                idle_loops = None
+        pc = 0
+
+        # Profiler counters (see mos6502.profiler)
+        profiler = self.profiler
+        if profiler is not None:
+            opcode_counts = profiler.opcode_counts
+            pc_hits = profiler.pc_hits
+            pc_cycles = profiler.pc_cycles
+        profile_pc = profile_cycles = 0
 
-            instruction_byte: int = fetch_byte()
+        try:
+            while True:
+                # Check if CPU is halted (by JAM instruction)
+                # Halted CPU cannot execute until reset
+                if self.halted:
+                    # Write back cached counters before raising exception
+                    self.instructions_executed = instructions_executed
+                    if use_instruction_limit:
+                        self.instructions_remaining = instructions_remaining
+                    raise errors.CPUHaltError(
+                        opcode=0x00,  # Unknown - set by JAM instruction
+                        address=int(self.PC),
+                        message="CPU is halted. Call reset() to recover."
+                    )
 
-            # Fast path: use opcode -> handler table when no debug/callbacks needed
-            # Direct list indexing is faster than dict.get() - no hash computation
-            # Uses pre-computed use_fast_path and cached opcode_handler_cache
-            if use_fast_path:
-                handler = opcode_handler_cache[instruction_byte]
-                if handler is not None:
-                    handler(self)
-                    instructions_executed += 1
+                # Check for cycle exhaustion BEFORE fetching the next instruction
+                # This prevents PC from being incremented into the next instruction
+                # when we don't have enough cycles to execute it
+                if self.cycles <= 0:
+                    # Write back cached counters before raising exception
+                    self.instructions_executed = instructions_executed
                     if use_instruction_limit:
-                        instructions_remaining -= 1
-                    if periodic_callback:
-                        cycles_since_last = self.cycles_executed - self._last_periodic_callback_cycle
-                        if cycles_since_last >= periodic_callback_interval:
-                            self._last_periodic_callback_cycle = self.cycles_executed
-                            periodic_callback()
-                    # NMI check (edge-triggered, higher priority than IRQ)
-                    if self.nmi_pending and not self._nmi_line_previous:
-                        self._nmi_line_previous = True
-                        handle_nmi()
-                    elif not self.nmi_pending:
-                        self._nmi_line_previous = False
-                    # IRQ check (level-triggered, maskable)
-                    if self.irq_pending and not self.I:
-                        handle_irq()
-                    continue
-
-            # Slow path: need full instruction lookup for cache miss, verbose, or callbacks
-            instruction = instructions.OPCODE_LOOKUP.get(instruction_byte, instruction_byte)
-
-            # Verbose instruction tracing (only when verbose_cycles is enabled)
-            # This entire block is for debug output and NOT needed for execution
-            if verbose_cycles:
-                instruction_bytes: int = 0
-                machine_code = []
-                operand: memory.MemoryUnit = 0
-                assembly = ""
-                instruction_cycle_count: int = 0
-                if int(instruction) in instructions.InstructionSet.map:
-                    instruction_map: int = instructions.InstructionSet.map[int(instruction)]
-
-                    instruction_bytes: int = int(instruction_map["bytes"])
-
-                    instruction_cycle_count = instruction_map["cycles"]
-
-                    with contextlib.suppress(ValueError):
-                        instruction_cycle_count: int = int(instruction_map["cycles"])
-
-                    # Subtract 1 for the instruction
-                    for i in range(instruction_bytes - 1):
-                        # Wrap address to stay within 16-bit address space (0-65535)
-                        machine_code.append(int(self.ram[(self.PC + i) & 0xFFFF]))
-
-                    if len(machine_code) > 2:
-                        raise errors.MachineCodeExecutionException(
-                            f"Unsure how to handle: {machine_code}",
-                        )
+                        self.instructions_remaining = instructions_remaining
+                    raise errors.CPUCycleExhaustionError(
+                        f"Exhausted available CPU cycles after {self.cycles_executed} "
+                        f"executed cycles with {self.cycles} remaining.",
+                    )
 
-                    if len(machine_code) == 0:
-                        assembly: str = instruction_map["assembler"]
-                        operand: memory.MemoryUnit = None
+                # Check instruction limit if using instruction-based control
+                if use_instruction_limit and instructions_remaining <= 0:
+                    # Write back cached counters before raising exception
+                    self.instructions_executed = instructions_executed
+                    self.instructions_remaining = instructions_remaining
+                    raise errors.CPUCycleExhaustionError(
+                        f"Executed requested instructions after {self.cycles_executed} cycles.",
+                    )
 
-                    if len(machine_code) == 1:
-                        operand: memory.MemoryUnit = Byte(
-                            value=machine_code[0],
-                            endianness=self.endianness,
+                # Block engine: run a translated basic block, then do the same
+                # instruction-boundary work as the interpreter below
+                if block_cache is not None:
+                    block = block_cache.lookup(
+                        registers._PC,
+                        bank_fingerprint() if bank_fingerprint is not None else 0,
+                    )
+                    if block.function is not None and (
+                        not use_instruction_limit or block.length <= instructions_remaining
+                    ):
+                        finite = self.cycles != INFINITE_CYCLES
+                        deadline = self.cycles_executed + self.cycles if finite else INFINITE_CYCLES << 32
+                        if periodic_callback:
+                            deadline = min(
+                                deadline,
+                                self._last_periodic_callback_cycle + periodic_callback_interval,
+                            )
+                        if scheduler is not None:
+                            deadline = min(deadline, scheduler.next_cycle)
+                        block_cache.stale = False
+                        executed = block.function(self, finite, deadline, block_cache)
+                        instructions_executed += executed
+                        if use_instruction_limit:
+                            instructions_remaining -= executed
+                        if periodic_callback:
+                            cycles_since_last = self.cycles_executed - self._last_periodic_callback_cycle
+                            if cycles_since_last >= periodic_callback_interval:
+                                self._last_periodic_callback_cycle = self.cycles_executed
+                                periodic_callback()
+                        if scheduler is not None and self.cycles_executed >= scheduler.next_cycle:
+                            scheduler.run(self.cycles_executed)
+                        if self.nmi_pending and not self._nmi_line_previous:
+                            self._nmi_line_previous = True
+                            handle_nmi()
+                        elif not self.nmi_pending:
+                            self._nmi_line_previous = False
+                        if self.irq_pending and not self.I:
+                            handle_irq()
+                        if breakpoint_map is not None and breakpoint_map[registers._PC]:
+                            self.instructions_executed = instructions_executed
+                            if use_instruction_limit:
+                                self.instructions_remaining = instructions_remaining
+                            self._hit_breakpoint(registers._PC)
+                        continue
+
+                if profiler is not None:
+                    profile_pc = registers._PC
+                    profile_cycles = self.cycles_executed
+                instruction_byte: int = fetch_byte()
+
+                # Fast path: use opcode -> handler table when no debug/callbacks needed
+                # Direct list indexing is faster than dict.get() - no hash computation
+                # Uses pre-computed use_fast_path and cached opcode_handler_cache
+                if use_fast_path:
+                    handler = opcode_handler_cache[instruction_byte]
+                    if handler is not None:
+                        if idle_loops is not None:
+                            pc = (registers._PC - 1) & 0xFFFF
+                        handler(self)
+                        if batching_cycles:
+                            flush_cycles()
+                        if profiler is not None:
+                            opcode_counts[instruction_byte] += 1
+                            pc_hits[profile_pc] += 1
+                            pc_cycles[profile_pc] += self.cycles_executed - profile_cycles
+                        instructions_executed += 1
+                        if use_instruction_limit:
+                            instructions_remaining -= 1
+                        # Idle loops: probe, or jump to the next boundary that needs work
+                        if idle_loops is not None and (idle_loops.probing or registers._PC <= pc):
+                            skipped = idle_loops.step(
+                                pc, instructions_remaining if use_instruction_limit else None,
+                            )
+                            if skipped:
+                                instructions_executed += skipped
+                                if use_instruction_limit:
+                                    instructions_remaining -= skipped
+                        if periodic_callback:
+                            cycles_since_last = self.cycles_executed - self._last_periodic_callback_cycle
+                            if cycles_since_last >= periodic_callback_interval:
+                                self._last_periodic_callback_cycle = self.cycles_executed
+                                periodic_callback()
+                        if scheduler is not None and self.cycles_executed >= scheduler.next_cycle:
+                            scheduler.run(self.cycles_executed)
+                        # NMI check (edge-triggered, higher priority than IRQ)
+                        if self.nmi_pending and not self._nmi_line_previous:
+                            self._nmi_line_previous = True
+                            handle_nmi()
+                        elif not self.nmi_pending:
+                            self._nmi_line_previous = False
+                        # IRQ check (level-triggered, maskable)
+                        if self.irq_pending and not self.I:
+                            handle_irq()
+                        if breakpoint_map is not None and breakpoint_map[registers._PC]:
+                            self.instructions_executed = instructions_executed
+                            if use_instruction_limit:
+                                self.instructions_remaining = instructions_remaining
+                            self._hit_breakpoint(registers._PC)
+                        continue
+
+                # Slow path: need full instruction lookup for cache miss, verbose, or callbacks
+                instruction = instructions.OPCODE_LOOKUP.get(instruction_byte, instruction_byte)
+
+                # Verbose instruction tracing (only when verbose_cycles is enabled)
+                # This entire block is for debug output and NOT needed for execution
+                if verbose_cycles:
+                    instruction_bytes: int = 0
+                    machine_code = []
+                    operand: memory.MemoryUnit = 0
+                    assembly = ""
+                    instruction_cycle_count: int = 0
+                    if int(instruction) in instructions.InstructionSet.map:
+                        instruction_map: int = instructions.InstructionSet.map[int(instruction)]
+
+                        instruction_bytes: int = int(instruction_map["bytes"])
+
+                        instruction_cycle_count = instruction_map["cycles"]
+
+                        with contextlib.suppress(ValueError):
+                            instruction_cycle_count: int = int(instruction_map["cycles"])
+
+                        # Subtract 1 for the instruction
+                        for i in range(instruction_bytes - 1):
+                            # Wrap address to stay within 16-bit address space (0-65535)
+                            machine_code.append(int(self.ram[(self.PC + i) & 0xFFFF]))
+
+                        if len(machine_code) > 2:
+                            raise errors.MachineCodeExecutionException(
+                                f"Unsure how to handle: {machine_code}",
+                            )
+
+                        if len(machine_code) == 0:
+                            assembly: str = instruction_map["assembler"]
+                            operand: memory.MemoryUnit = None
+
+                        if len(machine_code) == 1:
+                            operand: memory.MemoryUnit = Byte(
+                                value=machine_code[0],
+                                endianness=self.endianness,
+                            )
+                            assembly = instruction_map["assembler"].format(oper=f"0x{operand:02X}")
+
+                        if len(machine_code) == 2:
+                            low_byte: memory.MemoryUnit = machine_code[0]
+                            high_byte: memory.MemoryUnit = machine_code[1]
+
+                            operand: memory.MemoryUnit = Word((high_byte << 8) + low_byte)
+
+                            assembly: str = instruction_map["assembler"].format(oper=f"0x{operand:02X}")
+
+                    if operand is not None:
+                        self.log.info(
+                            f"0x{self.PC - 1:02X}: 0x{instruction:02X} "
+                            f"0x{operand:02X} \t\t\t {assembly} \t\t\t {instruction_cycle_count}",
+                        )
+                    else:
+                        self.log.info(
+                            f"0x{self.PC - 1:02X}: 0x{instruction:02X} ---- "
+                            f"\t\t\t {assembly} \t\t\t {instruction_cycle_count}",
                         )
-                        assembly = instruction_map["assembler"].format(oper=f"0x{operand:02X}")
-
-                    if len(machine_code) == 2:
-                        low_byte: memory.MemoryUnit = machine_code[0]
-                        high_byte: memory.MemoryUnit = machine_code[1]
 
-                        operand: memory.MemoryUnit = Word((high_byte << 8) + low_byte)
+                # This automatically invokes the correct opcode handler based on the configured CPU variant.
+                # Legal instructions are InstructionOpcode objects with package/function metadata
+                if isinstance(instruction, instructions.InstructionOpcode):
+                    # Get handler from pre-built table (faster) or load if somehow missing
+                    handler = opcode_handler_cache[instruction_byte]
+                    if handler is None:
+                        handler = self._load_variant_handler(instruction.package, instruction.function)
+                        opcode_handler_cache[instruction_byte] = handler
 
-                        assembly: str = instruction_map["assembler"].format(oper=f"0x{operand:02X}")
+                    # Pre-instruction callback (for debugging, profiling, breakpoints)
+                    if pre_instruction_callback:
+                        pre_instruction_callback(self, instruction)
 
-                if operand is not None:
-                    self.log.info(
-                        f"0x{self.PC - 1:02X}: 0x{instruction:02X} "
-                        f"0x{operand:02X} \t\t\t {assembly} \t\t\t {instruction_cycle_count}",
-                    )
+                    handler(self)
+                    if batching_cycles:
+                        flush_cycles()
+                    if profiler is not None:
+                        opcode_counts[instruction_byte] += 1
+                        pc_hits[profile_pc] += 1
+                        pc_cycles[profile_pc] += self.cycles_executed - profile_cycles
+
+                    # Post-instruction callback (for debugging, profiling, state validation)
+                    if post_instruction_callback:
+                        post_instruction_callback(self, instruction)
                 else:
-                    self.log.info(
-                        f"0x{self.PC - 1:02X}: 0x{instruction:02X} ---- "
-                        f"\t\t\t {assembly} \t\t\t {instruction_cycle_count}",
+                    # Illegal instruction - not in OPCODE_LOOKUP, just a raw byte
+                    self.log.error(f"ILLEGAL INSTRUCTION: {instruction} ({instruction:02X})")
+                    # Write back cached counters before raising exception
+                    self.instructions_executed = instructions_executed
+                    if use_instruction_limit:
+                        self.instructions_remaining = instructions_remaining
+                    raise errors.IllegalCPUInstructionError(
+                        f"Illegal instruction: 0x{int(instruction):02X}"
                     )
 
-            # This automatically invokes the correct opcode handler based on the configured CPU variant.
-            # Legal instructions are InstructionOpcode objects with package/function metadata
-            if isinstance(instruction, instructions.InstructionOpcode):
-                # Get handler from pre-built table (faster) or load if somehow missing
-                handler = opcode_handler_cache[instruction_byte]
-                if handler is None:
-                    handler = self._load_variant_handler(instruction.package, instruction.function)
-                    opcode_handler_cache[instruction_byte] = handler
-
-                # Pre-instruction callback (for debugging, profiling, breakpoints)
-                if pre_instruction_callback:
-                    pre_instruction_callback(self, instruction)
-
-                handler(self)
+                # Track total instructions executed (using cached local)
+                instructions_executed += 1
 
-                # Post-instruction callback (for debugging, profiling, state validation)
-                if post_instruction_callback:
-                    post_instruction_callback(self, instruction)
-            else:
-                # Illegal instruction - not in OPCODE_LOOKUP, just a raw byte
-                self.log.error(f"ILLEGAL INSTRUCTION: {instruction} ({instruction:02X})")
-                # Write back cached counters before raising exception
-                self.instructions_executed = instructions_executed
+                # Decrement instruction counter (for instruction-based execution control)
                 if use_instruction_limit:
-                    self.instructions_remaining = instructions_remaining
-                raise errors.IllegalCPUInstructionError(
-                    f"Illegal instruction: 0x{int(instruction):02X}"
-                )
-
-            # Track total instructions executed (using cached local)
-            instructions_executed += 1
-
-            # Decrement instruction counter (for instruction-based execution control)
-            if use_instruction_limit:
-                instructions_remaining -= 1
-
-            # Periodically call system update callback (e.g., VIC raster updates)
-            # This allows external hardware to check cycle count and trigger IRQs
-            # Use threshold check instead of modulo to avoid missing callbacks when
-            # instructions don't land exactly on the interval boundary
-            if periodic_callback:
-                cycles_since_last = self.cycles_executed - self._last_periodic_callback_cycle
-                if cycles_since_last >= periodic_callback_interval:
-                    self._last_periodic_callback_cycle = self.cycles_executed
-                    periodic_callback()
-
-            # Check for pending NMI between instructions (after instruction completes)
-            # NMI is edge-triggered and cannot be masked by the I flag
-            # NMI has higher priority than IRQ
-            if self.nmi_pending and not self._nmi_line_previous:
-                self._nmi_line_previous = True  # Remember we've seen the edge
-                handle_nmi()
-            elif not self.nmi_pending:
-                self._nmi_line_previous = False  # Reset edge detection when line goes high
-
-            # Check for pending hardware IRQ between instructions (after instruction completes)
-            # This is when the real 6502 samples the IRQ line
-            if self.irq_pending and not self.I:
-                handle_irq()
+                    instructions_remaining -= 1
+
+                # Periodically call system update callback (e.g., VIC raster updates)
+                # This allows external hardware to check cycle count and trigger IRQs
+                # Use threshold check instead of modulo to avoid missing callbacks when
+                # instructions don't land exactly on the interval boundary
+                if periodic_callback:
+                    cycles_since_last = self.cycles_executed - self._last_periodic_callback_cycle
+                    if cycles_since_last >= periodic_callback_interval:
+                        self._last_periodic_callback_cycle = self.cycles_executed
+                        periodic_callback()
+
+                # Run peripheral events that are due (see mos6502.scheduler)
+                if scheduler is not None and self.cycles_executed >= scheduler.next_cycle:
+                    scheduler.run(self.cycles_executed)
+
+                # Check for pending NMI between instructions (after instruction completes)
+                # NMI is edge-triggered and cannot be masked by the I flag
+                # NMI has higher priority than IRQ
+                if self.nmi_pending and not self._nmi_line_previous:
+                    self._nmi_line_previous = True  # Remember we've seen the edge
+                    handle_nmi()
+                elif not self.nmi_pending:
+                    self._nmi_line_previous = False  # Reset edge detection when line goes high
+
+                # Check for pending hardware IRQ between instructions (after instruction completes)
+                # This is when the real 6502 samples the IRQ line
+                if self.irq_pending and not self.I:
+                    handle_irq()
+
+                # Breakpoints are checked once PC has settled at the next instruction
+                if breakpoint_map is not None and breakpoint_map[registers._PC]:
+                    self.instructions_executed = instructions_executed
+                    if use_instruction_limit:
+                        self.instructions_remaining = instructions_remaining
+                    self._hit_breakpoint(registers._PC)
+        finally:
+            # Charge cycles left pending by an instruction that raised (JAM)
+            if self._pending_cycles:
+                self._flush_cycles()
+            # Never leave the probe's observing memory handler installed
+            if idle_loops is not None:
+                idle_loops.abort()
 
     def _handle_irq(self: Self) -> None:
         """Handle a pending hardware IRQ.
@@ -1499,6 +2055,9 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
 
         self.log.info(f"*** IRQ HANDLER CALLED: PC ${old_pc:04X} -> ${irq_vector:04X}, I flag now set ***")
 
+        # Batched mode: the interrupt sequence is charged as one tick
+        self._flush_cycles()
+
     def _handle_nmi(self: Self) -> None:
         """Handle a pending NMI (Non-Maskable Interrupt).
 
@@ -1548,6 +2107,9 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
 
         self.log.info(f"*** NMI HANDLER CALLED: PC ${old_pc:04X} -> ${nmi_vector:04X}, I flag now set ***")
 
+        # Batched mode: the interrupt sequence is charged as one tick
+        self._flush_cycles()
+
     def push_pc_to_stack(self: Self) -> None:
         """Push the PC to the stack."""
 
@@ -1666,8 +2228,8 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
             int (16-bit value)
         """
         if self.verbose_cycles:
-            self.log.debug(f"PC <- 0x{self._registers.PC:04X}")
-        return self._registers.PC
+            self.log.debug(f"PC <- 0x{self._registers._PC:04X}")
+        return self._registers._PC
 
     @PC.setter
     def PC(self: Self, PC: int) -> None:  # noqa: N802 N803
@@ -1682,13 +2244,13 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         -------
             None
         """
-        self._registers.PC = PC & 0xFFFF
+        self._registers._PC = PC & 0xFFFF
         if self.verbose_cycles:
-            self.log.info(f"PC -> 0x{self._registers.PC:04X}")
+            self.log.info(f"PC -> 0x{self._registers._PC:04X}")
 
         # Call PC change callback if set
-        if self.pc_callback is not None:
-            self.pc_callback(self._registers.PC)
+        if self._pc_callback is not None:
+            self._pc_callback(self._registers._PC)
 
     @property
     def S(self: Self) -> int:  # noqa: N802
@@ -1704,8 +2266,8 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
             int (9-bit value: 0x0100-0x01FF)
         """
         if self.verbose_cycles:
-            self.log.debug(f"S <- 0x{self._registers.S:02X} ")
-        return self._registers.S
+            self.log.debug(f"S <- 0x{self._registers._S:02X} ")
+        return self._registers._S
 
     @S.setter
     def S(self: Self, S: int) -> None:  # noqa: N802 N803
@@ -1725,9 +2287,9 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         """
         # Stack pointer is 8 bits, always in page 1 (0x0100-0x01FF)
         # Mask to 8 bits and force page 1
-        self._registers.S = 0x0100 | (S & 0xFF)
+        self._registers._S = 0x0100 | (S & 0xFF)
         if self.verbose_cycles:
-            self.log.info(f"S -> 0x{self._registers.S & 0xFF:02X}")
+            self.log.info(f"S -> 0x{self._registers._S & 0xFF:02X}")
 
     @property
     def A(self: Self) -> int:  # noqa: N802
@@ -1739,8 +2301,8 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
             int (8-bit value)
         """
         if self.verbose_cycles:
-            self.log.debug(f"A <- 0x{self._registers.A:02X}")
-        return self._registers.A
+            self.log.debug(f"A <- 0x{self._registers._A:02X}")
+        return self._registers._A
 
     @A.setter
     def A(self: Self, A: int) -> None:  # noqa: N802 N803
@@ -1755,9 +2317,9 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         -------
             None
         """
-        self._registers.A = A & 0xFF
+        self._registers._A = A & 0xFF
         if self.verbose_cycles:
-            self.log.info(f"A -> 0x{self._registers.A:02X}")
+            self.log.info(f"A -> 0x{self._registers._A:02X}")
 
     @property
     def X(self: Self) -> int:  # noqa: N802
@@ -1769,8 +2331,8 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
             int (8-bit value)
         """
         if self.verbose_cycles:
-            self.log.debug(f"X <- 0x{self._registers.X:02X}")
-        return self._registers.X
+            self.log.debug(f"X <- 0x{self._registers._X:02X}")
+        return self._registers._X
 
     @X.setter
     def X(self: Self, X: int) -> None:  # noqa: N802 N803
@@ -1785,9 +2347,9 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         -------
             None
         """
-        self._registers.X = X & 0xFF
+        self._registers._X = X & 0xFF
         if self.verbose_cycles:
-            self.log.info(f"X -> 0x{self._registers.X:02X}")
+            self.log.info(f"X -> 0x{self._registers._X:02X}")
 
     @property
     def Y(self: Self) -> int:  # noqa: N802
@@ -1799,8 +2361,8 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
             int (8-bit value)
         """
         if self.verbose_cycles:
-            self.log.debug(f"Y <- 0x{self._registers.Y:02X}")
-        return self._registers.Y
+            self.log.debug(f"Y <- 0x{self._registers._Y:02X}")
+        return self._registers._Y
 
     @Y.setter
     def Y(self: Self, Y: int) -> None:  # noqa: N802 N803
@@ -1815,9 +2377,9 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         -------
             None
         """
-        self._registers.Y = Y & 0xFF
+        self._registers._Y = Y & 0xFF
         if self.verbose_cycles:
-            self.log.info(f"Y -> 0x{self._registers.Y:02X}")
+            self.log.info(f"Y -> 0x{self._registers._Y:02X}")
 
     def __str__(self: Self) -> str:
         """Return the CPU status."""
@@ -1837,6 +2399,67 @@ class MOS6502CPU(flags.ProcessorStatusFlagsInterface):
         return description
 
 
+class QuietMOS6502CPU(MOS6502CPU):
+    """MOS6502CPU whose register properties skip logging and pc_callback.
+
+    Swapped in by MOS6502CPU._sync_register_access() while verbose_cycles is off,
+    release_handlers is on and no pc_callback is set. Same slots as MOS6502CPU, so a CPU can switch
+    between the two by assigning __class__.
+    """
+
+    __slots__ = ()
+
+    @property
+    def PC(self: Self) -> int:  # noqa: N802
+        """Return the CPU PC register (16-bit)."""
+        return self._registers._PC
+
+    @PC.setter
+    def PC(self: Self, PC: int) -> None:  # noqa: N802 N803
+        """Set the CPU PC register (16-bit)."""
+        self._registers._PC = PC & 0xFFFF
+
+    @property
+    def S(self: Self) -> int:  # noqa: N802
+        """Return the CPU S register (0x0100-0x01FF)."""
+        return self._registers._S
+
+    @S.setter
+    def S(self: Self, S: int) -> None:  # noqa: N802 N803
+        """Set the CPU S register (low byte used, always in page 1)."""
+        self._registers._S = 0x0100 | (S & 0xFF)
+
+    @property
+    def A(self: Self) -> int:  # noqa: N802
+        """Return the CPU A register (8-bit)."""
+        return self._registers._A
+
+    @A.setter
+    def A(self: Self, A: int) -> None:  # noqa: N802 N803
+        """Set the CPU A register (8-bit)."""
+        self._registers._A = A & 0xFF
+
+    @property
+    def X(self: Self) -> int:  # noqa: N802
+        """Return the CPU X register (8-bit)."""
+        return self._registers._X
+
+    @X.setter
+    def X(self: Self, X: int) -> None:  # noqa: N802 N803
+        """Set the CPU X register (8-bit)."""
+        self._registers._X = X & 0xFF
+
+    @property
+    def Y(self: Self) -> int:  # noqa: N802
+        """Return the CPU Y register (8-bit)."""
+        return self._registers._Y
+
+    @Y.setter
+    def Y(self: Self, Y: int) -> None:  # noqa: N802 N803
+        """Set the CPU Y register (8-bit)."""
+        self._registers._Y = Y & 0xFF
+
+
 def main() -> None:
     """
     Demo program.
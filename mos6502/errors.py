@@ -26,6 +26,28 @@ class CPUBreakError(Exception):
     """Raise when BRK instruction is executed."""
 
 
+class CPUBreakpointError(Exception):
+    """Raise when execution reaches a breakpoint and no breakpoint_callback is set.
+
+    Attributes:
+    ----------
+        address: The breakpoint address PC reached
+    """
+
+    def __init__(self, address: int, message: str = None) -> None:
+        """Initialize CPUBreakpointError.
+
+        Arguments:
+        ---------
+            address: The breakpoint address PC reached
+            message: Optional custom message
+        """
+        self.address = address
+        if message is None:
+            message = f"Breakpoint hit at ${address:04X}"
+        super().__init__(message)
+
+
 class QuitRequestError(Exception):
     """Raise when user requests to quit (window close, Ctrl+C, etc.)."""
 
@@ -32,6 +32,12 @@ _MASK: int = 1 << _   # 0x20
 V_MASK: int = 1 << V  # 0x40
 N_MASK: int = 1 << N  # 0x80
 
+# Pending operation kinds recorded by the set_* methods (see LazyFlagsRegister)
+OP_NONE: int = 0
+OP_COMPARE: int = 1  # C from register >= operand (CMP/CPX/CPY)
+OP_ADD: int = 2  # C and V from a binary ADC
+OP_SUB: int = 3  # C and V from a binary SBC
+
 # Flag names for logging
 FLAG_NAMES = {
     0: "C",
@@ -74,9 +80,24 @@ class FlagsRegister:
 
     Stores the 6502 processor status register as a plain int for performance.
     Provides indexed access via __getitem__/__setitem__ for compatibility.
+
+    Handlers update several flags at once through set_nz(), set_add(),
+    set_sub() and set_compare(). Here they are applied immediately;
+    LazyFlagsRegister only records them until a flag is read.
     """
 
-    __slots__ = ('_value', '_last_logged_value')
+    __slots__ = (
+        '_value',
+        '_last_logged_value',
+        '_pending_nz',
+        '_pending_op',
+        '_pending_a',
+        '_pending_b',
+        '_pending_result',
+    )
+
+    # Log each change of the register value (QuietFlagsRegister turns this off)
+    _log_changes: bool = True
 
     def __init__(self: Self, value: int = 0, endianness: str = "little") -> None:
         """Initialize FlagsRegister.
@@ -86,7 +107,7 @@ class FlagsRegister:
             endianness: Ignored, kept for API compatibility
         """
         if isinstance(value, FlagsRegister):
-            self._value: int = value._value
+            self._value: int = value.value
         elif hasattr(value, 'value'):
             # Handle Byte or other objects with .value
             self._value: int = int(value.value) & 0xFF
@@ -94,6 +115,13 @@ class FlagsRegister:
             self._value: int = int(value) & 0xFF
         self._last_logged_value: int = self._value
 
+        # Pending flag updates (LazyFlagsRegister only)
+        self._pending_nz: int | None = None  # Result N/Z are derived from
+        self._pending_op: int = OP_NONE
+        self._pending_a: int = 0
+        self._pending_b: int = 0
+        self._pending_result: int = 0
+
     @property
     def value(self: Self) -> int:
         """Return the flags register value as an int (0x00-0xFF)."""
@@ -102,8 +130,115 @@ class FlagsRegister:
     @value.setter
     def value(self: Self, new_value: int) -> None:
         """Set the flags register value."""
+        self._pending_nz = None
+        self._pending_op = OP_NONE
         self._value = int(new_value) & 0xFF
 
+    def _log_value(self: Self) -> None:
+        """Log the register value (called when it changed since the last log)."""
+        flag_logger.info(f"⎿ {format_flags(self._value)} (0x{self._value:02X})")
+        self._last_logged_value = self._value
+
+    def set_nz(self: Self, result: int) -> None:
+        """Set N and Z from a result byte (Z if result == 0, N from bit 7).
+
+        Args:
+            result: The value loaded, transferred or computed by the instruction
+        """
+        value = (self._value & ~(N_MASK | Z_MASK)) | (result & N_MASK)
+        if result == 0:
+            value |= Z_MASK
+        self._value = value
+        if self._log_changes and value != self._last_logged_value:
+            self._log_value()
+
+    def set_add(self: Self, a: int, operand: int, result: int) -> None:
+        """Set C and V from a binary ADC.
+
+        Args:
+            a: Accumulator before the addition
+            operand: Memory operand
+            result: Unmasked sum a + operand + carry
+        """
+        value = self._value & ~(C_MASK | V_MASK)
+        if result > 0xFF:
+            value |= C_MASK
+        if (a ^ result) & (operand ^ result) & 0x80:
+            value |= V_MASK
+        self._value = value
+        if self._log_changes and value != self._last_logged_value:
+            self._log_value()
+
+    def set_sub(self: Self, a: int, operand: int, result: int) -> None:
+        """Set C and V from a binary SBC.
+
+        Args:
+            a: Accumulator before the subtraction
+            operand: Memory operand
+            result: Unmasked difference a - operand - borrow (may be negative)
+        """
+        value = self._value & ~(C_MASK | V_MASK)
+        if result >= 0:
+            value |= C_MASK
+        if (a ^ operand) & (a ^ result) & 0x80:
+            value |= V_MASK
+        self._value = value
+        if self._log_changes and value != self._last_logged_value:
+            self._log_value()
+
+    def set_compare(self: Self, register: int, operand: int) -> None:
+        """Set N, Z and C for CMP/CPX/CPY.
+
+        Args:
+            register: The register being compared (A, X or Y)
+            operand: Memory operand
+        """
+        result = (register - operand) & 0xFF
+        value = (self._value & ~(N_MASK | Z_MASK | C_MASK)) | (result & N_MASK)
+        if result == 0:
+            value |= Z_MASK
+        if register >= operand:
+            value |= C_MASK
+        self._value = value
+        if self._log_changes and value != self._last_logged_value:
+            self._log_value()
+
+    def resolve(self: Self) -> None:
+        """Apply pending flag updates recorded by LazyFlagsRegister."""
+        op = self._pending_op
+        nz = self._pending_nz
+        if op == OP_NONE and nz is None:
+            return
+
+        value = self._value
+        if op != OP_NONE:
+            a = self._pending_a
+            b = self._pending_b
+            if op == OP_COMPARE:
+                value = (value & ~C_MASK) | (C_MASK if a >= b else 0)
+            else:
+                result = self._pending_result
+                value &= ~(C_MASK | V_MASK)
+                if op == OP_ADD:
+                    if result > 0xFF:
+                        value |= C_MASK
+                    if (a ^ result) & (b ^ result) & 0x80:
+                        value |= V_MASK
+                else:
+                    if result >= 0:
+                        value |= C_MASK
+                    if (a ^ b) & (a ^ result) & 0x80:
+                        value |= V_MASK
+            self._pending_op = OP_NONE
+
+        if nz is not None:
+            value = (value & ~(N_MASK | Z_MASK)) | (nz & N_MASK)
+            if nz == 0:
+                value |= Z_MASK
+            self._pending_nz = None
+
+        self._value = value
+
     def __getitem__(self: Self, bit_index: int) -> int:
         """Get a flag bit by index. Returns 0 or 1."""
         return (self._value >> bit_index) & 1
@@ -131,8 +266,7 @@ class FlagsRegister:
 
         # Log if overall value changed since last log
         if self._value != self._last_logged_value:
-            flag_logger.info(f"⎿ {format_flags(self._value)} (0x{self._value:02X})")
-            self._last_logged_value = self._value
+            self._log_value()
 
     def __int__(self: Self) -> int:
         """Return the flags value as an int."""
@@ -159,6 +293,128 @@ class FlagsRegister:
         return f"FlagsRegister(0x{self._value:02X})"
 
 
+class QuietFlagsRegister(FlagsRegister):
+    """FlagsRegister without change logging.
+
+    Used by the CPU while verbose_cycles is off. Same slots as FlagsRegister,
+    so a register can switch between the two by assigning __class__.
+    """
+
+    __slots__ = ()
+
+    _log_changes: bool = False
+
+    def __setitem__(self: Self, bit_index: int, bit_value: int) -> None:
+        """Set a flag bit by index.
+
+        Args:
+            bit_index: Bit position (0-7)
+            bit_value: New value (0 or non-zero for 1)
+        """
+        if bit_value:
+            self._value |= (1 << bit_index)
+        else:
+            self._value &= ~(1 << bit_index)
+
+
+class LazyFlagsRegister(QuietFlagsRegister):
+    """FlagsRegister that defers N/Z/C/V until they are read.
+
+    set_nz(), set_add(), set_sub() and set_compare() only record the result
+    and operands. Any read (flag index, value, int(), comparisons) or
+    single-bit write applies the pending updates first, so branches, PHP,
+    BRK/IRQ/NMI pushes and explicit cpu.flags reads see exact values.
+
+    Used by the CPU when lazy_flags is enabled and verbose_cycles is off.
+    """
+
+    __slots__ = ()
+
+    @property
+    def value(self: Self) -> int:
+        """Return the flags register value as an int (0x00-0xFF)."""
+        if self._pending_op or self._pending_nz is not None:
+            self.resolve()
+        return self._value
+
+    @value.setter
+    def value(self: Self, new_value: int) -> None:
+        """Set the flags register value, discarding pending updates."""
+        self._pending_nz = None
+        self._pending_op = OP_NONE
+        self._value = int(new_value) & 0xFF
+
+    def set_nz(self: Self, result: int) -> None:
+        """Record the result byte N and Z are derived from."""
+        self._pending_nz = result
+
+    def set_add(self: Self, a: int, operand: int, result: int) -> None:
+        """Record a binary ADC for C and V."""
+        self._pending_op = OP_ADD
+        self._pending_a = a
+        self._pending_b = operand
+        self._pending_result = result
+
+    def set_sub(self: Self, a: int, operand: int, result: int) -> None:
+        """Record a binary SBC for C and V."""
+        self._pending_op = OP_SUB
+        self._pending_a = a
+        self._pending_b = operand
+        self._pending_result = result
+
+    def set_compare(self: Self, register: int, operand: int) -> None:
+        """Record a CMP/CPX/CPY for N, Z and C."""
+        # A pending ADC/SBC also owns V, which a compare does not overwrite
+        if self._pending_op >= OP_ADD:
+            self.resolve()
+        self._pending_op = OP_COMPARE
+        self._pending_a = register
+        self._pending_b = operand
+        self._pending_nz = (register - operand) & 0xFF
+
+    def __getitem__(self: Self, bit_index: int) -> int:
+        """Get a flag bit by index. Returns 0 or 1."""
+        if self._pending_op or self._pending_nz is not None:
+            self.resolve()
+        return (self._value >> bit_index) & 1
+
+    def __setitem__(self: Self, bit_index: int, bit_value: int) -> None:
+        """Set a flag bit by index, after applying pending updates."""
+        if self._pending_op or self._pending_nz is not None:
+            self.resolve()
+        if bit_value:
+            self._value |= (1 << bit_index)
+        else:
+            self._value &= ~(1 << bit_index)
+
+    def __int__(self: Self) -> int:
+        """Return the flags value as an int."""
+        return self.value
+
+    def __and__(self: Self, other: int) -> int:
+        """Bitwise AND with an int."""
+        return self.value & other
+
+    def __or__(self: Self, other: int) -> int:
+        """Bitwise OR with an int."""
+        return self.value | other
+
+    def __eq__(self: Self, other: object) -> bool:
+        """Compare equality with another FlagsRegister or int."""
+        if isinstance(other, FlagsRegister):
+            return self.value == other.value
+        if isinstance(other, int):
+            return self.value == other
+        return NotImplemented
+
+    # Mutable and compared by value, so not hashable
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self: Self) -> str:
+        """Return a string representation."""
+        return f"FlagsRegister(0x{self.value:02X})"
+
+
 # Legacy compatibility - these were used for bitarray operations
 # Now we use simple bit masks instead
 class ProcessorStatusFlags:
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""Idle-loop detection and fast-forward for the mos6502 CPU.
+
+Programs spend much of their time in wait loops: a KERNAL routine polling a
+zero-page counter until an interrupt changes it, a delay loop waiting for the
+next raster line, a drive waiting for a command. Emulating every pass through
+such a loop costs host time without changing anything.
+
+A loop is idle when one pass through it, starting at its head (the target of a
+backward branch or jump), leaves A, X, Y, S and P exactly as they were, reads
+only non-volatile memory and does not write anything it read with a different
+value. Every later pass is then an exact replay of the first, until something
+outside the CPU changes the state the loop depends on. Inside execute() that
+can only happen at an instruction boundary where periodic_callback or a
+scheduler event runs or an interrupt is serviced.
+
+IdleLoopDetector probes a candidate loop once: an observing memory handler is
+installed in cpu.ram for one pass and records every address read or written,
+while execute() reports the CPU state at each instruction boundary. When the
+loop head is reached again with the same registers and the same memory
+contents, the detector computes arithmetically the first boundary at which the
+interpreter would have to do something (periodic callback or scheduler event
+due, cycle budget or instruction limit reached) and jumps straight there: registers, flags,
+cycle counters and instruction counters are set to the values recorded for
+that boundary and the skipped cycles are charged in bulk. The result is
+bit-for-bit identical to running the loop.
+
+Loops are not skipped while anything observes individual instructions or
+memory accesses (verbose mode, instruction/tick callbacks, pc_callback,
+breakpoints, the block engine), with a memory handler that cannot report
+volatile addresses, or while an interrupt would be serviced inside the loop.
+
+Usage:
+    cpu = MOS6502CPU(idle_loop_skip=True)
+    # or, on an existing CPU:
+    cpu.idle_loop_skip = True
+"""
+
+import logging
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Callable, Self
+
+from mos6502.core import INFINITE_CYCLES
+
+if TYPE_CHECKING:
+    from mos6502.core import MOS6502CPU
+
+log: logging.Logger = logging.getLogger("mos6502.cpu.idle")
+
+# Upper bound on instructions per probed loop
+MAX_LOOP_INSTRUCTIONS: int = 64
+
+# Upper bound on loop passes skipped at once when nothing else bounds the skip
+# (no periodic callback, infinite cycles, no instruction limit)
+MAX_SKIP_PASSES: int = 1 << 16
+
+# Arrivals at a rejected loop head to ignore before probing it again
+# (doubles on every failed probe of the same head, up to MAX_BACKOFF)
+INITIAL_BACKOFF: int = 4
+MAX_BACKOFF: int = 4096
+
+
+class IdleLoop:
+    """A probed idle loop.
+
+    Attributes:
+    ----------
+        head: Address of the loop's first instruction
+        states: (PC, A, X, Y, S, P) after each instruction of one pass; the
+            last entry is the state at the head
+        offsets: Cycles since the head after each instruction of one pass; the
+            last entry is the cycle length of a pass
+        memory: Address -> value the loop depends on (first reads and final
+            writes of one pass)
+        interruptible: True if the I flag is clear at some boundary
+    """
+
+    __slots__ = ('head', 'states', 'offsets', 'memory', 'interruptible')
+
+    def __init__(
+        self: Self,
+        head: int,
+        states: tuple[tuple[int, int, int, int, int, int], ...],
+        offsets: tuple[int, ...],
+        memory: dict[int, int],
+    ) -> None:
+        self.head = head
+        self.states = states
+        self.offsets = offsets
+        self.memory = memory
+        self.interruptible = any(not state[5] & 0x04 for state in states)
+
+    def __repr__(self: Self) -> str:
+        """Return a short description of the loop."""
+        return (f"IdleLoop(${self.head:04X}, instructions={len(self.states)}, "
+                f"cycles={self.offsets[-1]})")
+
+    def first_boundary(self: Self, threshold: int) -> int:
+        """Return the smallest boundary n >= 1 whose cycle offset is >= threshold.
+
+        Boundary n is reached after the n-th skipped instruction; its offset
+        is the number of cycles since the boundary the skip started at.
+        """
+        if threshold <= self.offsets[0]:
+            return 1
+        length = len(self.offsets)
+        passes, rest = divmod(threshold, self.offsets[-1])
+        if rest == 0:
+            # Exactly at the end of a pass
+            return passes * length
+        return passes * length + bisect_left(self.offsets, rest) + 1
+
+
+class _ObservingMemory:
+    """Memory handler that records accesses while a loop is probed.
+
+    Forwards every access to the real memory handler (or the flat RAM array)
+    so the probed pass executes exactly as it would otherwise.
+    """
+
+    __slots__ = ('inner', 'data', 'is_volatile', 'reads', 'writes', 'rejected')
+
+    # No page tables: RAM must route every read through read() while probing
+    read_pages = None
+
+    def __init__(self: Self, inner, data: bytearray) -> None:  # noqa: ANN001
+        self.inner = inner
+        self.data = data
+        self.is_volatile: Callable[[int], bool] | None = (
+            getattr(inner, "is_volatile", None) if inner is not None else None
+        )
+        self.reads: dict[int, int] = {}
+        self.writes: dict[int, int] = {}
+        self.rejected: bool = False
+
+    def __getattr__(self: Self, name: str):  # noqa: ANN204
+        """Delegate everything else (bank_fingerprint, snapshots, ...) to the real handler."""
+        return getattr(self.inner, name)
+
+    def read(self: Self, addr: int) -> int:
+        """Read through the real handler, recording the first read of addr."""
+        value = self.inner.read(addr) if self.inner is not None else self.data[addr]
+        if addr not in self.reads and addr not in self.writes:
+            if self.is_volatile is not None and self.is_volatile(addr):
+                self.rejected = True
+            self.reads[addr] = value
+        return value
+
+    def write(self: Self, addr: int, value: int) -> None:
+        """Write through the real handler, recording the value written."""
+        value = int(value) & 0xFF
+        if self.is_volatile is not None and self.is_volatile(addr):
+            self.rejected = True
+        self.writes[addr] = value
+        if self.inner is not None:
+            self.inner.write(addr, value)
+        else:
+            self.data[addr] = value
+
+
+class IdleLoopDetector:
+    """Idle-loop probe and fast-forward for one CPU instance.
+
+    execute() calls step() after every instruction that did not move PC
+    forward, and after every instruction while a probe is running.
+    """
+
+    __slots__ = (
+        'cpu',
+        'loop',
+        'probing',
+        '_observer',
+        '_head',
+        '_expected_pc',
+        '_start_state',
+        '_start_cycles',
+        '_callback_mark',
+        '_event_mark',
+        '_states',
+        '_offsets',
+        '_backoff',
+        'skips',
+        'skipped_instructions',
+        'skipped_cycles',
+    )
+
+    def __init__(self: Self, cpu: "MOS6502CPU") -> None:
+        self.cpu = cpu
+        self.loop: IdleLoop | None = None
+        self.probing: bool = False
+        self._observer: _ObservingMemory | None = None
+        self._head: int = 0
+        self._expected_pc: int = 0
+        self._start_state: tuple[int, ...] = ()
+        self._start_cycles: int = 0
+        self._callback_mark: int = 0
+        self._event_mark: int = 0
+        self._states: list[tuple[int, int, int, int, int, int]] = []
+        self._offsets: list[int] = []
+
+        # Loop head -> [arrivals left to ignore, next backoff]
+        self._backoff: dict[int, list[int]] = {}
+
+        # Statistics
+        self.skips: int = 0
+        self.skipped_instructions: int = 0
+        self.skipped_cycles: int = 0
+
+    def _state(self: Self) -> tuple[int, int, int, int, int, int]:
+        """Return (PC, A, X, Y, S, P) of the CPU."""
+        registers = self.cpu._registers
+        return (
+            registers._PC, registers._A, registers._X, registers._Y, registers._S,
+            self.cpu._flags.value,
+        )
+
+    def step(self: Self, pc: int, instructions_remaining: int | None) -> int:
+        """Observe an instruction boundary.
+
+        Arguments:
+        ---------
+            pc: Address of the instruction that was just executed
+            instructions_remaining: Instructions left before execute() stops,
+                or None without an instruction limit
+
+        Returns:
+        -------
+            The number of instructions skipped (0 if execution continues
+            normally). The CPU state is that of the boundary reached.
+        """
+        head = self.cpu._registers._PC
+        backward = head <= pc
+
+        if self.probing:
+            return self._record(pc, head, backward, instructions_remaining)
+        if not backward:
+            return 0
+
+        loop = self.loop
+        if loop is not None and loop.head == head:
+            skipped = self.fast_forward(instructions_remaining)
+            if skipped is not None:
+                return skipped
+            self.loop = None
+
+        backoff = self._backoff.get(head)
+        if backoff is not None and backoff[0]:
+            backoff[0] -= 1
+            return 0
+        self._start_probe(head)
+        return 0
+
+    def _start_probe(self: Self, head: int) -> None:
+        """Install the observing memory handler and record the state at head."""
+        cpu = self.cpu
+        ram = cpu.ram
+        self._observer = _ObservingMemory(ram.memory_handler, ram.data)
+        ram.memory_handler = self._observer
+        self.probing = True
+        self._head = head
+        self._expected_pc = head
+        self._start_state = self._state()
+        self._start_cycles = cpu.cycles_executed
+        self._callback_mark = cpu._last_periodic_callback_cycle
+        self._event_mark = cpu.scheduler.dispatched if cpu.scheduler is not None else 0
+        self._states = []
+        self._offsets = []
+
+    def _record(self: Self, pc: int, head: int, backward: bool, instructions_remaining: int | None) -> int:
+        """Record one boundary of the probed pass; finish the probe at the loop head."""
+        cpu = self.cpu
+        # An interrupt or callback between boundaries invalidates the pass
+        if (
+            pc != self._expected_pc
+            or cpu._last_periodic_callback_cycle != self._callback_mark
+            or (cpu.scheduler is not None and cpu.scheduler.dispatched != self._event_mark)
+            or self._observer.rejected
+            or len(self._states) >= MAX_LOOP_INSTRUCTIONS
+        ):
+            self._reject()
+            return 0
+
+        state = self._state()
+        self._states.append(state)
+        self._offsets.append(cpu.cycles_executed - self._start_cycles)
+        self._expected_pc = head
+        if not (backward and head == self._head):
+            return 0
+
+        observer = self._observer
+        self.abort()
+        if state != self._start_state or any(
+            observer.writes.get(addr, value) != value for addr, value in observer.reads.items()
+        ):
+            self._reject()
+            return 0
+
+        self._backoff.pop(head, None)
+        self.loop = IdleLoop(
+            head, tuple(self._states), tuple(self._offsets), {**observer.reads, **observer.writes},
+        )
+        log.debug(f"Idle loop found: {self.loop!r}")
+        skipped = self.fast_forward(instructions_remaining)
+        return skipped or 0
+
+    def _reject(self: Self) -> None:
+        """End a probe that did not find an idle loop and back off from its head."""
+        self.abort()
+        backoff = self._backoff.get(self._head)
+        if backoff is None:
+            self._backoff[self._head] = [INITIAL_BACKOFF, INITIAL_BACKOFF * 2]
+        else:
+            backoff[0] = backoff[1]
+            backoff[1] = min(backoff[1] * 2, MAX_BACKOFF)
+
+    def abort(self: Self) -> None:
+        """Stop a running probe and restore the real memory handler."""
+        if not self.probing:
+            return
+        self.probing = False
+        ram = self.cpu.ram
+        if ram.memory_handler is self._observer:
+            ram.memory_handler = self._observer.inner
+        self._observer = None
+
+    def fast_forward(self: Self, instructions_remaining: int | None) -> int | None:
+        """Skip passes of the recorded loop from its head.
+
+        Returns:
+        -------
+            None if the CPU state or memory no longer matches the loop,
+            otherwise the number of instructions skipped (0 if the next
+            boundary already needs the interpreter).
+        """
+        cpu = self.cpu
+        loop = self.loop
+        registers = cpu._registers
+        if (
+            registers._A, registers._X, registers._Y, registers._S, cpu._flags.value,
+        ) != loop.states[-1][1:]:
+            return None
+
+        memory_handler = cpu.ram.memory_handler
+        if memory_handler is not None:
+            read = memory_handler.read
+            is_volatile = memory_handler.is_volatile
+            for addr, value in loop.memory.items():
+                if is_volatile(addr) or read(addr) != value:
+                    return None
+        else:
+            data = cpu.ram.data
+            for addr, value in loop.memory.items():
+                if data[addr] != value:
+                    return None
+
+        # Interrupt lines do not change while the loop runs, so an interrupt
+        # that is not serviced at this boundary is not serviced inside the loop
+        if cpu.nmi_pending and not cpu._nmi_line_previous:
+            return 0
+        if cpu.irq_pending and loop.interruptible:
+            return 0
+
+        boundary = len(loop.states) * MAX_SKIP_PASSES
+        if cpu.periodic_callback:
+            since_last = cpu.cycles_executed - cpu._last_periodic_callback_cycle
+            if since_last >= cpu.periodic_callback_interval:
+                return 0
+            boundary = min(boundary, loop.first_boundary(cpu.periodic_callback_interval - since_last))
+        if cpu.scheduler is not None:
+            until_event = cpu.scheduler.next_cycle - cpu.cycles_executed
+            if until_event <= 0:
+                return 0
+            boundary = min(boundary, loop.first_boundary(until_event))
+        finite = cpu.cycles != INFINITE_CYCLES
+        if finite:
+            boundary = min(boundary, loop.first_boundary(cpu.cycles))
+        if instructions_remaining is not None:
+            boundary = min(boundary, instructions_remaining)
+        if boundary < 2:
+            return 0
+
+        passes, index = divmod(boundary - 1, len(loop.states))
+        cycles = passes * loop.offsets[-1] + loop.offsets[index]
+        pc, a, x, y, s, p = loop.states[index]
+        registers._PC = pc
+        registers._A = a
+        registers._X = x
+        registers._Y = y
+        registers._S = s
+        cpu._flags.value = p
+        cpu.cycles_executed += cycles
+        if finite:
+            cpu.cycles -= cycles
+
+        self.skips += 1
+        self.skipped_instructions += boundary
+        self.skipped_cycles += cycles
+        return boundary
@@ -37,19 +37,15 @@ def adc_immediate_0x69(cpu: MOS6502CPU) -> None:
         # Binary mode addition
         result: int = cpu.A + value + cpu.flags[flags.C]
 
-        # Set Carry flag if result > 255
-        cpu.flags[flags.C] = 1 if result > 0xFF else 0
-
-        # Set Overflow flag: V = (A^result) & (M^result) & 0x80
-        # Overflow occurs if both operands have same sign and result has different sign
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ result) & (value ^ result) & 0x80) else 0
+        # Set Carry flag if result > 255, Overflow if both operands have the same
+        # sign and the result has a different sign: V = (A^result) & (M^result) & 0x80
+        cpu._flags.set_add(cpu.A, value, result)
 
         # Store result (masked to 8 bits)
         cpu.A = result & 0xFF
 
     # VARIANT: 6502 (NMOS) - N and Z flags are set from BCD result
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -76,12 +72,10 @@ def adc_zeropage_0x65(cpu: MOS6502CPU) -> None:
         cpu.A = result
     else:
         result: int = cpu.A + value + cpu.flags[flags.C]
-        cpu.flags[flags.C] = 1 if result > 0xFF else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ result) & (value ^ result) & 0x80) else 0
+        cpu._flags.set_add(cpu.A, value, result)
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("z")
 
@@ -108,12 +102,10 @@ def adc_zeropage_x_0x75(cpu: MOS6502CPU) -> None:
         cpu.A = result
     else:
         result: int = cpu.A + value + cpu.flags[flags.C]
-        cpu.flags[flags.C] = 1 if result > 0xFF else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ result) & (value ^ result) & 0x80) else 0
+        cpu._flags.set_add(cpu.A, value, result)
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("zx")
 
@@ -140,12 +132,10 @@ def adc_absolute_0x6d(cpu: MOS6502CPU) -> None:
         cpu.A = result
     else:
         result: int = cpu.A + value + cpu.flags[flags.C]
-        cpu.flags[flags.C] = 1 if result > 0xFF else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ result) & (value ^ result) & 0x80) else 0
+        cpu._flags.set_add(cpu.A, value, result)
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("a")
 
@@ -172,12 +162,10 @@ def adc_absolute_x_0x7d(cpu: MOS6502CPU) -> None:
         cpu.A = result
     else:
         result: int = cpu.A + value + cpu.flags[flags.C]
-        cpu.flags[flags.C] = 1 if result > 0xFF else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ result) & (value ^ result) & 0x80) else 0
+        cpu._flags.set_add(cpu.A, value, result)
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ax")
 
@@ -204,12 +192,10 @@ def adc_absolute_y_0x79(cpu: MOS6502CPU) -> None:
         cpu.A = result
     else:
         result: int = cpu.A + value + cpu.flags[flags.C]
-        cpu.flags[flags.C] = 1 if result > 0xFF else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ result) & (value ^ result) & 0x80) else 0
+        cpu._flags.set_add(cpu.A, value, result)
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ay")
 
@@ -236,12 +222,10 @@ def adc_indexed_indirect_x_0x61(cpu: MOS6502CPU) -> None:
         cpu.A = result
     else:
         result: int = cpu.A + value + cpu.flags[flags.C]
-        cpu.flags[flags.C] = 1 if result > 0xFF else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ result) & (value ^ result) & 0x80) else 0
+        cpu._flags.set_add(cpu.A, value, result)
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ix")
 
@@ -268,11 +252,9 @@ def adc_indirect_indexed_y_0x71(cpu: MOS6502CPU) -> None:
         cpu.A = result
     else:
         result: int = cpu.A + value + cpu.flags[flags.C]
-        cpu.flags[flags.C] = 1 if result > 0xFF else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ result) & (value ^ result) & 0x80) else 0
+        cpu._flags.set_add(cpu.A, value, result)
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("iy")
@@ -20,8 +20,6 @@ def inc_zeropage_0xe6(cpu: MOS6502CPU) -> None:
     ---------
         cpu: The CPU instance to operate on
     """
-    from mos6502 import flags
-
     address: int = cpu.fetch_zeropage_mode_address(offset_register_name=None)
     value: int = cpu.read_byte(address=address)
 
@@ -29,8 +27,7 @@ def inc_zeropage_0xe6(cpu: MOS6502CPU) -> None:
     cpu.write_byte(address=address, data=result)
 
     # Set N and Z flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("z")
 
@@ -42,8 +39,6 @@ def inc_zeropage_x_0xf6(cpu: MOS6502CPU) -> None:
     Cycles: 6
     Flags: N Z
     """
-    from mos6502 import flags
-
     address: int = cpu.fetch_zeropage_mode_address(offset_register_name="X")
     value: int = cpu.read_byte(address=address)
 
@@ -51,8 +46,7 @@ def inc_zeropage_x_0xf6(cpu: MOS6502CPU) -> None:
     cpu.write_byte(address=address, data=result)
 
     # Set N and Z flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("zx")
 
@@ -64,8 +58,6 @@ def inc_absolute_0xee(cpu: MOS6502CPU) -> None:
     Cycles: 6
     Flags: N Z
     """
-    from mos6502 import flags
-
     address: int = cpu.fetch_absolute_mode_address(offset_register_name=None)
     value: int = cpu.read_byte(address=address)
 
@@ -76,8 +68,7 @@ def inc_absolute_0xee(cpu: MOS6502CPU) -> None:
     cpu.write_byte(address=address & 0xFFFF, data=result)
 
     # Set N and Z flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("a")
 
@@ -89,8 +80,6 @@ def inc_absolute_x_0xfe(cpu: MOS6502CPU) -> None:
     Cycles: 7
     Flags: N Z
     """
-    from mos6502 import flags
-
     address: int = cpu.fetch_absolute_mode_address(offset_register_name="X")
 
     # Read-Modify-Write with Absolute,X always does a dummy read regardless of page crossing
@@ -105,7 +94,6 @@ def inc_absolute_x_0xfe(cpu: MOS6502CPU) -> None:
     cpu.write_byte(address=address & 0xFFFF, data=result)
 
     # Set N and Z flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("ax")
@@ -38,18 +38,14 @@ def sbc_immediate_0xe9(cpu: MOS6502CPU) -> None:
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
 
         # Set Carry flag (inverted borrow): C=1 if no borrow (A >= M)
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-
         # Set Overflow flag: V = (A^M) & (A^result) & 0x80
-        # Overflow occurs if operands have different signs and result has different sign from A
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
 
         # Store result (masked to 8 bits)
         cpu.A = result & 0xFF
 
     # VARIANT: 6502 (NMOS) - N and Z flags are set from BCD result
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -76,12 +72,10 @@ def sbc_zeropage_0xe5(cpu: MOS6502CPU) -> None:
         cpu.A = result
     else:
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("z")
 
@@ -108,12 +102,10 @@ def sbc_zeropage_x_0xf5(cpu: MOS6502CPU) -> None:
         cpu.A = result
     else:
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("zx")
 
@@ -140,12 +132,10 @@ def sbc_absolute_0xed(cpu: MOS6502CPU) -> None:
         cpu.A = result
     else:
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("a")
 
@@ -172,12 +162,10 @@ def sbc_absolute_x_0xfd(cpu: MOS6502CPU) -> None:
         cpu.A = result
     else:
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ax")
 
@@ -204,12 +192,10 @@ def sbc_absolute_y_0xf9(cpu: MOS6502CPU) -> None:
         cpu.A = result
     else:
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ay")
 
@@ -236,12 +222,10 @@ def sbc_indexed_indirect_x_0xe1(cpu: MOS6502CPU) -> None:
         cpu.A = result
     else:
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ix")
 
@@ -268,11 +252,9 @@ def sbc_indirect_indexed_y_0xf1(cpu: MOS6502CPU) -> None:
         cpu.A = result
     else:
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("iy")
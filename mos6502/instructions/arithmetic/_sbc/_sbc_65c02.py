@@ -35,25 +35,20 @@ def sbc_immediate_0xe9(cpu: MOS6502CPU) -> None:
         cpu.A = result
 
         # VARIANT: 65C02 (CMOS) - N and Z flags are set from binary result, not BCD result
-        cpu.flags[flags.Z] = 1 if (binary_result & 0xFF) == 0 else 0
-        cpu.flags[flags.N] = 1 if ((binary_result & 0xFF) & 0x80) else 0
+        cpu._flags.set_nz((binary_result & 0xFF))
     else:
         # Binary mode subtraction
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
 
         # Set Carry flag (inverted borrow): C=1 if no borrow (A >= M)
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-
         # Set Overflow flag: V = (A^M) & (A^result) & 0x80
-        # Overflow occurs if operands have different signs and result has different sign from A
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
 
         # Store result (masked to 8 bits)
         cpu.A = result & 0xFF
 
         # Set N and Z flags from binary result
-        cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-        cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+        cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -78,15 +73,12 @@ def sbc_zeropage_0xe5(cpu: MOS6502CPU) -> None:
         cpu.flags[flags.C] = carry_out
         cpu.flags[flags.V] = overflow
         cpu.A = result
-        cpu.flags[flags.Z] = 1 if (binary_result & 0xFF) == 0 else 0
-        cpu.flags[flags.N] = 1 if ((binary_result & 0xFF) & 0x80) else 0
+        cpu._flags.set_nz((binary_result & 0xFF))
     else:
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
         cpu.A = result & 0xFF
-        cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-        cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+        cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("z")
 
@@ -111,15 +103,12 @@ def sbc_zeropage_x_0xf5(cpu: MOS6502CPU) -> None:
         cpu.flags[flags.C] = carry_out
         cpu.flags[flags.V] = overflow
         cpu.A = result
-        cpu.flags[flags.Z] = 1 if (binary_result & 0xFF) == 0 else 0
-        cpu.flags[flags.N] = 1 if ((binary_result & 0xFF) & 0x80) else 0
+        cpu._flags.set_nz((binary_result & 0xFF))
     else:
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
         cpu.A = result & 0xFF
-        cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-        cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+        cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("zx")
 
@@ -144,15 +133,12 @@ def sbc_absolute_0xed(cpu: MOS6502CPU) -> None:
         cpu.flags[flags.C] = carry_out
         cpu.flags[flags.V] = overflow
         cpu.A = result
-        cpu.flags[flags.Z] = 1 if (binary_result & 0xFF) == 0 else 0
-        cpu.flags[flags.N] = 1 if ((binary_result & 0xFF) & 0x80) else 0
+        cpu._flags.set_nz((binary_result & 0xFF))
     else:
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
         cpu.A = result & 0xFF
-        cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-        cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+        cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("a")
 
@@ -177,15 +163,12 @@ def sbc_absolute_x_0xfd(cpu: MOS6502CPU) -> None:
         cpu.flags[flags.C] = carry_out
         cpu.flags[flags.V] = overflow
         cpu.A = result
-        cpu.flags[flags.Z] = 1 if (binary_result & 0xFF) == 0 else 0
-        cpu.flags[flags.N] = 1 if ((binary_result & 0xFF) & 0x80) else 0
+        cpu._flags.set_nz((binary_result & 0xFF))
     else:
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
         cpu.A = result & 0xFF
-        cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-        cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+        cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ax")
 
@@ -210,15 +193,12 @@ def sbc_absolute_y_0xf9(cpu: MOS6502CPU) -> None:
         cpu.flags[flags.C] = carry_out
         cpu.flags[flags.V] = overflow
         cpu.A = result
-        cpu.flags[flags.Z] = 1 if (binary_result & 0xFF) == 0 else 0
-        cpu.flags[flags.N] = 1 if ((binary_result & 0xFF) & 0x80) else 0
+        cpu._flags.set_nz((binary_result & 0xFF))
     else:
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
         cpu.A = result & 0xFF
-        cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-        cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+        cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ay")
 
@@ -243,15 +223,12 @@ def sbc_indexed_indirect_x_0xe1(cpu: MOS6502CPU) -> None:
         cpu.flags[flags.C] = carry_out
         cpu.flags[flags.V] = overflow
         cpu.A = result
-        cpu.flags[flags.Z] = 1 if (binary_result & 0xFF) == 0 else 0
-        cpu.flags[flags.N] = 1 if ((binary_result & 0xFF) & 0x80) else 0
+        cpu._flags.set_nz((binary_result & 0xFF))
     else:
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
         cpu.A = result & 0xFF
-        cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-        cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+        cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ix")
 
@@ -276,14 +253,11 @@ def sbc_indirect_indexed_y_0xf1(cpu: MOS6502CPU) -> None:
         cpu.flags[flags.C] = carry_out
         cpu.flags[flags.V] = overflow
         cpu.A = result
-        cpu.flags[flags.Z] = 1 if (binary_result & 0xFF) == 0 else 0
-        cpu.flags[flags.N] = 1 if ((binary_result & 0xFF) & 0x80) else 0
+        cpu._flags.set_nz((binary_result & 0xFF))
     else:
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
         cpu.A = result & 0xFF
-        cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-        cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+        cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("iy")
@@ -27,13 +27,8 @@ def cmp_immediate_0xc9(cpu: MOS6502CPU) -> None:
         cpu: The CPU instance to operate on
     """
     value: int = cpu.fetch_byte()
-    result: int = (cpu.A - value) & 0xFF
-
-    # Set flags based on comparison
-    from mos6502 import flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
-    cpu.flags[flags.C] = 1 if cpu.A >= value else 0  # C=1 if A >= M (no borrow)
+    # Set flags based on comparison (C=1 if A >= M, no borrow)
+    cpu._flags.set_compare(cpu.A, value)
 
     cpu.log.info("i")
 
@@ -56,12 +51,7 @@ def cmp_zeropage_0xc5(cpu: MOS6502CPU) -> None:
     """
     address: int = cpu.fetch_zeropage_mode_address(offset_register_name=None)
     value: int = cpu.read_byte(address=address)
-    result: int = (cpu.A - value) & 0xFF
-
-    from mos6502 import flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
-    cpu.flags[flags.C] = 1 if cpu.A >= value else 0
+    cpu._flags.set_compare(cpu.A, value)
 
     cpu.log.info("i")
 
@@ -84,12 +74,7 @@ def cmp_zeropage_x_0xd5(cpu: MOS6502CPU) -> None:
     """
     address: int = cpu.fetch_zeropage_mode_address(offset_register_name="X")
     value: int = cpu.read_byte(address=address)
-    result: int = (cpu.A - value) & 0xFF
-
-    from mos6502 import flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
-    cpu.flags[flags.C] = 1 if cpu.A >= value else 0
+    cpu._flags.set_compare(cpu.A, value)
 
     cpu.log.info("i")
 
@@ -112,12 +97,7 @@ def cmp_absolute_0xcd(cpu: MOS6502CPU) -> None:
     """
     address: int = cpu.fetch_absolute_mode_address(offset_register_name=None)
     value: int = cpu.read_byte(address=address)
-    result: int = (cpu.A - value) & 0xFF
-
-    from mos6502 import flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
-    cpu.flags[flags.C] = 1 if cpu.A >= value else 0
+    cpu._flags.set_compare(cpu.A, value)
 
     cpu.log.info("i")
 
@@ -140,12 +120,7 @@ def cmp_absolute_x_0xdd(cpu: MOS6502CPU) -> None:
     """
     address: int = cpu.fetch_absolute_mode_address(offset_register_name="X")
     value: int = cpu.read_byte(address=address)
-    result: int = (cpu.A - value) & 0xFF
-
-    from mos6502 import flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
-    cpu.flags[flags.C] = 1 if cpu.A >= value else 0
+    cpu._flags.set_compare(cpu.A, value)
 
     cpu.log.info("i")
 
@@ -168,12 +143,7 @@ def cmp_absolute_y_0xd9(cpu: MOS6502CPU) -> None:
     """
     address: int = cpu.fetch_absolute_mode_address(offset_register_name="Y")
     value: int = cpu.read_byte(address=address)
-    result: int = (cpu.A - value) & 0xFF
-
-    from mos6502 import flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
-    cpu.flags[flags.C] = 1 if cpu.A >= value else 0
+    cpu._flags.set_compare(cpu.A, value)
 
     cpu.log.info("i")
 
@@ -196,12 +166,7 @@ def cmp_indexed_indirect_x_0xc1(cpu: MOS6502CPU) -> None:
     """
     address: int = cpu.fetch_indexed_indirect_mode_address()
     value: int = cpu.read_byte(address=address)
-    result: int = (cpu.A - value) & 0xFF
-
-    from mos6502 import flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
-    cpu.flags[flags.C] = 1 if cpu.A >= value else 0
+    cpu._flags.set_compare(cpu.A, value)
 
     cpu.log.info("i")
 
@@ -224,11 +189,6 @@ def cmp_indirect_indexed_y_0xd1(cpu: MOS6502CPU) -> None:
     """
     address: int = cpu.fetch_indirect_indexed_mode_address()
     value: int = cpu.read_byte(address=address)
-    result: int = (cpu.A - value) & 0xFF
-
-    from mos6502 import flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
-    cpu.flags[flags.C] = 1 if cpu.A >= value else 0
+    cpu._flags.set_compare(cpu.A, value)
 
     cpu.log.info("i")
@@ -26,13 +26,8 @@ def cpy_immediate_0xc0(cpu: MOS6502CPU) -> None:
         cpu: The CPU instance to operate on
     """
     value: int = cpu.fetch_byte()
-    result: int = (cpu.Y - value) & 0xFF
-
-    # Set flags based on comparison
-    from mos6502 import flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
-    cpu.flags[flags.C] = 1 if cpu.Y >= value else 0  # C=1 if Y >= M (no borrow)
+    # Set flags based on comparison (C=1 if Y >= M, no borrow)
+    cpu._flags.set_compare(cpu.Y, value)
 
     cpu.log.info("i")
 
@@ -55,12 +50,7 @@ def cpy_zeropage_0xc4(cpu: MOS6502CPU) -> None:
     """
     address: int = cpu.fetch_zeropage_mode_address(offset_register_name=None)
     value: int = cpu.read_byte(address=address)
-    result: int = (cpu.Y - value) & 0xFF
-
-    from mos6502 import flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
-    cpu.flags[flags.C] = 1 if cpu.Y >= value else 0
+    cpu._flags.set_compare(cpu.Y, value)
 
     cpu.log.info("i")
 
@@ -83,11 +73,6 @@ def cpy_absolute_0xcc(cpu: MOS6502CPU) -> None:
     """
     address: int = cpu.fetch_absolute_mode_address(offset_register_name=None)
     value: int = cpu.read_byte(address=address)
-    result: int = (cpu.Y - value) & 0xFF
-
-    from mos6502 import flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
-    cpu.flags[flags.C] = 1 if cpu.Y >= value else 0
+    cpu._flags.set_compare(cpu.Y, value)
 
     cpu.log.info("i")
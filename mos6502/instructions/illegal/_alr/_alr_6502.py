@@ -51,7 +51,6 @@ def alr_immediate_0x4b(cpu: MOS6502CPU) -> None:
 
     # Set N and Z flags based on result
     # Note: N is always 0 after LSR since bit 7 becomes 0
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
@@ -46,8 +46,7 @@ def anc_immediate_0x0b(cpu: MOS6502CPU) -> None:
     cpu.A = int(cpu.A) & value
 
     # Set N and Z flags based on result
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     # Set C flag to match N flag (bit 7 of result)
     cpu.flags[flags.C] = cpu.flags[flags.N]
@@ -82,8 +81,7 @@ def anc_immediate_0x2b(cpu: MOS6502CPU) -> None:
 
     cpu.A = int(cpu.A) & value
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
     cpu.flags[flags.C] = cpu.flags[flags.N]
 
     cpu.log.info("i")
@@ -45,8 +45,6 @@ def ane_immediate_0x8b(cpu: MOS6502CPU) -> None:
     ---------
         cpu: The CPU instance to operate on
     """
-    from mos6502 import flags
-
     immediate: int = cpu.fetch_byte()
 
     # Get the "magic" CONST value from configuration
@@ -60,7 +58,6 @@ def ane_immediate_0x8b(cpu: MOS6502CPU) -> None:
     cpu.A = result & 0xFF
 
     # Set N and Z flags based on result
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
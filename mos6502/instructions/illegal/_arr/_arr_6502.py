@@ -53,8 +53,7 @@ def arr_immediate_0x6b(cpu: MOS6502CPU) -> None:
     cpu.A = ((result >> 1) | (carry_in << 7)) & 0xFF
 
     # Set N and Z flags based on result
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     # Special flag handling for ARR:
     # C is set from bit 6 of the result
@@ -55,8 +55,7 @@ def dcp_zeropage_0xc7(cpu: MOS6502CPU) -> None:
 
     # Compare A with decremented value (like CMP)
     result: int = (int(cpu.A) - decremented) & 0xFF
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
     cpu.flags[flags.C] = 1 if int(cpu.A) >= decremented else 0
 
     # Internal cycle
@@ -98,8 +97,7 @@ def dcp_zeropage_x_0xd7(cpu: MOS6502CPU) -> None:
 
     # Compare A with decremented value
     result: int = (int(cpu.A) - decremented) & 0xFF
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
     cpu.flags[flags.C] = 1 if int(cpu.A) >= decremented else 0
 
     # Internal cycle
@@ -141,8 +139,7 @@ def dcp_indexed_indirect_x_0xc3(cpu: MOS6502CPU) -> None:
 
     # Compare A with decremented value
     result: int = (int(cpu.A) - decremented) & 0xFF
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
     cpu.flags[flags.C] = 1 if int(cpu.A) >= decremented else 0
 
     # Internal cycle
@@ -184,8 +181,7 @@ def dcp_indirect_indexed_y_0xd3(cpu: MOS6502CPU) -> None:
 
     # Compare A with decremented value
     result: int = (int(cpu.A) - decremented) & 0xFF
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
     cpu.flags[flags.C] = 1 if int(cpu.A) >= decremented else 0
 
     # Internal cycle
@@ -227,8 +223,7 @@ def dcp_absolute_0xcf(cpu: MOS6502CPU) -> None:
 
     # Compare A with decremented value
     result: int = (int(cpu.A) - decremented) & 0xFF
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
     cpu.flags[flags.C] = 1 if int(cpu.A) >= decremented else 0
 
     # Internal cycle
@@ -276,8 +271,7 @@ def dcp_absolute_x_0xdf(cpu: MOS6502CPU) -> None:
 
     # Compare A with decremented value
     result: int = (int(cpu.A) - decremented) & 0xFF
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
     cpu.flags[flags.C] = 1 if int(cpu.A) >= decremented else 0
 
     cpu.log.info("ax")
@@ -324,8 +318,7 @@ def dcp_absolute_y_0xdb(cpu: MOS6502CPU) -> None:
 
     # Compare A with decremented value
     result: int = (int(cpu.A) - decremented) & 0xFF
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
     cpu.flags[flags.C] = 1 if int(cpu.A) >= decremented else 0
 
     cpu.log.info("ay")
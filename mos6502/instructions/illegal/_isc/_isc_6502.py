@@ -65,8 +65,7 @@ def isc_zeropage_0xe7(cpu: MOS6502CPU) -> None:
         cpu.flags[flags.V] = 1 if ((cpu.A ^ incremented) & (cpu.A ^ result) & 0x80) else 0
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     # Internal cycle
     cpu.log.info("i")
@@ -117,8 +116,7 @@ def isc_zeropage_x_0xf7(cpu: MOS6502CPU) -> None:
         cpu.flags[flags.V] = 1 if ((cpu.A ^ incremented) & (cpu.A ^ result) & 0x80) else 0
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     # Internal cycle
     cpu.log.info("i")
@@ -169,8 +167,7 @@ def isc_indexed_indirect_x_0xe3(cpu: MOS6502CPU) -> None:
         cpu.flags[flags.V] = 1 if ((cpu.A ^ incremented) & (cpu.A ^ result) & 0x80) else 0
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     # Internal cycle
     cpu.log.info("i")
@@ -221,8 +218,7 @@ def isc_indirect_indexed_y_0xf3(cpu: MOS6502CPU) -> None:
         cpu.flags[flags.V] = 1 if ((cpu.A ^ incremented) & (cpu.A ^ result) & 0x80) else 0
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     # Internal cycle
     cpu.log.info("i")
@@ -273,8 +269,7 @@ def isc_absolute_0xef(cpu: MOS6502CPU) -> None:
         cpu.flags[flags.V] = 1 if ((cpu.A ^ incremented) & (cpu.A ^ result) & 0x80) else 0
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     # Internal cycle
     cpu.log.info("i")
@@ -331,8 +326,7 @@ def isc_absolute_x_0xff(cpu: MOS6502CPU) -> None:
         cpu.flags[flags.V] = 1 if ((cpu.A ^ incremented) & (cpu.A ^ result) & 0x80) else 0
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ax")
 
@@ -388,7 +382,6 @@ def isc_absolute_y_0xfb(cpu: MOS6502CPU) -> None:
         cpu.flags[flags.V] = 1 if ((cpu.A ^ incremented) & (cpu.A ^ result) & 0x80) else 0
         cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ay")
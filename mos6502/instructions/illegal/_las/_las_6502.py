@@ -40,8 +40,6 @@ def las_absolute_y_0xbb(cpu: MOS6502CPU) -> None:
     ---------
         cpu: The CPU instance to operate on
     """
-    from mos6502 import flags
-
     address: int = cpu.fetch_absolute_mode_address(offset_register_name="Y")
     value: int = cpu.read_byte(address=address)
 
@@ -54,7 +52,6 @@ def las_absolute_y_0xbb(cpu: MOS6502CPU) -> None:
     cpu.S = result
 
     # Set N and Z flags based on result
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("ay")
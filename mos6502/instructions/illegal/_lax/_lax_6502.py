@@ -48,8 +48,7 @@ def lax_zeropage_0xa7(cpu: MOS6502CPU) -> None:
     cpu.X = value
 
     # Set flags based on loaded value
-    cpu.Z = (value == 0x00)
-    cpu.N = bool(value & 0x80)
+    cpu._flags.set_nz(value)
 
     # Internal cycle
     cpu.log.info("i")
@@ -83,8 +82,7 @@ def lax_zeropage_y_0xb7(cpu: MOS6502CPU) -> None:
     cpu.X = value
 
     # Set flags based on loaded value
-    cpu.Z = (value == 0x00)
-    cpu.N = bool(value & 0x80)
+    cpu._flags.set_nz(value)
 
     # Internal cycle
     cpu.log.info("i")
@@ -118,8 +116,7 @@ def lax_indexed_indirect_x_0xa3(cpu: MOS6502CPU) -> None:
     cpu.X = value
 
     # Set flags based on loaded value
-    cpu.Z = (value == 0x00)
-    cpu.N = bool(value & 0x80)
+    cpu._flags.set_nz(value)
 
     # Internal cycle
     cpu.log.info("i")
@@ -153,8 +150,7 @@ def lax_indirect_indexed_y_0xb3(cpu: MOS6502CPU) -> None:
     cpu.X = value
 
     # Set flags based on loaded value
-    cpu.Z = (value == 0x00)
-    cpu.N = bool(value & 0x80)
+    cpu._flags.set_nz(value)
 
     # Internal cycle
     cpu.log.info("i")
@@ -188,8 +184,7 @@ def lax_absolute_0xaf(cpu: MOS6502CPU) -> None:
     cpu.X = value
 
     # Set flags based on loaded value
-    cpu.Z = (value == 0x00)
-    cpu.N = bool(value & 0x80)
+    cpu._flags.set_nz(value)
 
     # Internal cycle
     cpu.log.info("i")
@@ -223,8 +218,7 @@ def lax_absolute_y_0xbf(cpu: MOS6502CPU) -> None:
     cpu.X = value
 
     # Set flags based on loaded value
-    cpu.Z = (value == 0x00)
-    cpu.N = bool(value & 0x80)
+    cpu._flags.set_nz(value)
 
     # Internal cycle
     cpu.log.info("i")
@@ -277,8 +271,7 @@ def lax_immediate_0xab(cpu: MOS6502CPU) -> None:
     cpu.X = result
 
     # Set flags based on result
-    cpu.Z = (result == 0x00)
-    cpu.N = bool(result & 0x80)
+    cpu._flags.set_nz(result)
 
     # Internal cycle
     cpu.log.info("i")
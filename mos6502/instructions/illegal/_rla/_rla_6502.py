@@ -56,8 +56,7 @@ def rla_zeropage_0x27(cpu: MOS6502CPU) -> None:
     cpu.A = int(cpu.A) & rotated
 
     # Set N and Z flags based on accumulator
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -94,8 +93,7 @@ def rla_zeropage_x_0x37(cpu: MOS6502CPU) -> None:
 
     cpu.A = int(cpu.A) & rotated
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -132,8 +130,7 @@ def rla_indexed_indirect_x_0x23(cpu: MOS6502CPU) -> None:
 
     cpu.A = int(cpu.A) & rotated
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -170,8 +167,7 @@ def rla_indirect_indexed_y_0x33(cpu: MOS6502CPU) -> None:
 
     cpu.A = int(cpu.A) & rotated
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -208,8 +204,7 @@ def rla_absolute_0x2f(cpu: MOS6502CPU) -> None:
 
     cpu.A = int(cpu.A) & rotated
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -254,8 +249,7 @@ def rla_absolute_x_0x3f(cpu: MOS6502CPU) -> None:
 
     cpu.A = int(cpu.A) & rotated
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ax")
 
@@ -300,7 +294,6 @@ def rla_absolute_y_0x3b(cpu: MOS6502CPU) -> None:
 
     cpu.A = int(cpu.A) & rotated
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ay")
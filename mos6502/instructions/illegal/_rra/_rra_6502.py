@@ -66,8 +66,7 @@ def rra_zeropage_0x67(cpu: MOS6502CPU) -> None:
     cpu.A = result & 0xFF
 
     # Set N and Z flags based on accumulator
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -107,8 +106,7 @@ def rra_zeropage_x_0x77(cpu: MOS6502CPU) -> None:
     cpu.flags[flags.V] = 1 if ((cpu.A ^ result) & (rotated ^ result) & 0x80) else 0
     cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -148,8 +146,7 @@ def rra_indexed_indirect_x_0x63(cpu: MOS6502CPU) -> None:
     cpu.flags[flags.V] = 1 if ((cpu.A ^ result) & (rotated ^ result) & 0x80) else 0
     cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -189,8 +186,7 @@ def rra_indirect_indexed_y_0x73(cpu: MOS6502CPU) -> None:
     cpu.flags[flags.V] = 1 if ((cpu.A ^ result) & (rotated ^ result) & 0x80) else 0
     cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -230,8 +226,7 @@ def rra_absolute_0x6f(cpu: MOS6502CPU) -> None:
     cpu.flags[flags.V] = 1 if ((cpu.A ^ result) & (rotated ^ result) & 0x80) else 0
     cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -279,8 +274,7 @@ def rra_absolute_x_0x7f(cpu: MOS6502CPU) -> None:
     cpu.flags[flags.V] = 1 if ((cpu.A ^ result) & (rotated ^ result) & 0x80) else 0
     cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ax")
 
@@ -328,7 +322,6 @@ def rra_absolute_y_0x7b(cpu: MOS6502CPU) -> None:
     cpu.flags[flags.V] = 1 if ((cpu.A ^ result) & (rotated ^ result) & 0x80) else 0
     cpu.A = result & 0xFF
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ay")
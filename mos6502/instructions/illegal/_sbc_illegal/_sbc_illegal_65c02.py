@@ -45,24 +45,19 @@ def sbc_immediate_0xeb(cpu: MOS6502CPU) -> None:
         cpu.A = result
 
         # VARIANT: 65C02 (CMOS) - N and Z flags are set from binary result, not BCD result
-        cpu.flags[flags.Z] = 1 if (binary_result & 0xFF) == 0 else 0
-        cpu.flags[flags.N] = 1 if ((binary_result & 0xFF) & 0x80) else 0
+        cpu._flags.set_nz((binary_result & 0xFF))
     else:
         # Binary mode subtraction
         result: int = cpu.A - value - (1 - cpu.flags[flags.C])
 
         # Set Carry flag (inverted borrow): C=1 if no borrow (A >= M)
-        cpu.flags[flags.C] = 1 if result >= 0 else 0
-
         # Set Overflow flag: V = (A^M) & (A^result) & 0x80
-        # Overflow occurs if operands have different signs and result has different sign from A
-        cpu.flags[flags.V] = 1 if ((cpu.A ^ value) & (cpu.A ^ result) & 0x80) else 0
+        cpu._flags.set_sub(cpu.A, value, result)
 
         # Store result (masked to 8 bits)
         cpu.A = result & 0xFF
 
         # Set N and Z flags from binary result
-        cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-        cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+        cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
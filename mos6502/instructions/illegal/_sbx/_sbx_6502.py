@@ -55,7 +55,6 @@ def sbx_immediate_0xcb(cpu: MOS6502CPU) -> None:
     cpu.X = result & 0xFF
 
     # Set N and Z flags based on result
-    cpu.flags[flags.Z] = 1 if cpu.X == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.X & 0x80) else 0
+    cpu._flags.set_nz(cpu.X)
 
     cpu.log.info("i")
@@ -58,8 +58,7 @@ def slo_zeropage_0x07(cpu: MOS6502CPU) -> None:
     cpu.A = int(cpu.A) | shifted
 
     # Set N and Z flags based on accumulator
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     # Internal cycle
     cpu.log.info("i")
@@ -103,8 +102,7 @@ def slo_zeropage_x_0x17(cpu: MOS6502CPU) -> None:
     cpu.A = int(cpu.A) | shifted
 
     # Set N and Z flags based on accumulator
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     # Internal cycle
     cpu.log.info("i")
@@ -148,8 +146,7 @@ def slo_indexed_indirect_x_0x03(cpu: MOS6502CPU) -> None:
     cpu.A = int(cpu.A) | shifted
 
     # Set N and Z flags based on accumulator
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     # Internal cycle
     cpu.log.info("i")
@@ -193,8 +190,7 @@ def slo_indirect_indexed_y_0x13(cpu: MOS6502CPU) -> None:
     cpu.A = int(cpu.A) | shifted
 
     # Set N and Z flags based on accumulator
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     # Internal cycle
     cpu.log.info("i")
@@ -238,8 +234,7 @@ def slo_absolute_0x0f(cpu: MOS6502CPU) -> None:
     cpu.A = int(cpu.A) | shifted
 
     # Set N and Z flags based on accumulator
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     # Internal cycle
     cpu.log.info("i")
@@ -289,8 +284,7 @@ def slo_absolute_x_0x1f(cpu: MOS6502CPU) -> None:
     cpu.A = int(cpu.A) | shifted
 
     # Set N and Z flags based on accumulator
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ax")
 
@@ -339,7 +333,6 @@ def slo_absolute_y_0x1b(cpu: MOS6502CPU) -> None:
     cpu.A = int(cpu.A) | shifted
 
     # Set N and Z flags based on accumulator
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ay")
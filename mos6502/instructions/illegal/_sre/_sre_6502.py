@@ -55,8 +55,7 @@ def sre_zeropage_0x47(cpu: MOS6502CPU) -> None:
     cpu.A = int(cpu.A) ^ shifted
 
     # Set N and Z flags based on accumulator
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -92,8 +91,7 @@ def sre_zeropage_x_0x57(cpu: MOS6502CPU) -> None:
 
     cpu.A = int(cpu.A) ^ shifted
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -129,8 +127,7 @@ def sre_indexed_indirect_x_0x43(cpu: MOS6502CPU) -> None:
 
     cpu.A = int(cpu.A) ^ shifted
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -166,8 +163,7 @@ def sre_indirect_indexed_y_0x53(cpu: MOS6502CPU) -> None:
 
     cpu.A = int(cpu.A) ^ shifted
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -203,8 +199,7 @@ def sre_absolute_0x4f(cpu: MOS6502CPU) -> None:
 
     cpu.A = int(cpu.A) ^ shifted
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("i")
 
@@ -247,8 +242,7 @@ def sre_absolute_x_0x5f(cpu: MOS6502CPU) -> None:
 
     cpu.A = int(cpu.A) ^ shifted
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ax")
 
@@ -291,7 +285,6 @@ def sre_absolute_y_0x5b(cpu: MOS6502CPU) -> None:
 
     cpu.A = int(cpu.A) ^ shifted
 
-    cpu.flags[flags.Z] = 1 if cpu.A == 0 else 0
-    cpu.flags[flags.N] = 1 if (cpu.A & 0x80) else 0
+    cpu._flags.set_nz(cpu.A)
 
     cpu.log.info("ay")
@@ -33,8 +33,7 @@ def asl_accumulator_0x0a(cpu: MOS6502CPU) -> None:
     cpu.A = result
 
     # Set N and Z flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("i")
 
@@ -58,8 +57,7 @@ def asl_zeropage_0x06(cpu: MOS6502CPU) -> None:
     cpu.write_byte(address=address, data=result)
 
     # Set N and Z flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("z")
 
@@ -83,8 +81,7 @@ def asl_zeropage_x_0x16(cpu: MOS6502CPU) -> None:
     cpu.write_byte(address=address, data=result)
 
     # Set N and Z flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("zx")
 
@@ -111,8 +108,7 @@ def asl_absolute_0x0e(cpu: MOS6502CPU) -> None:
     cpu.write_byte(address=address & 0xFFFF, data=result)
 
     # Set N and Z flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("a")
 
@@ -143,7 +139,6 @@ def asl_absolute_x_0x1e(cpu: MOS6502CPU) -> None:
     cpu.write_byte(address=address & 0xFFFF, data=result)
 
     # Set N and Z flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("ax")
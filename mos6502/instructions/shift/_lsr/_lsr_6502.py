@@ -33,8 +33,7 @@ def lsr_accumulator_0x4a(cpu: MOS6502CPU) -> None:
     cpu.A = result
 
     # Set N and Z flags (N is always 0 for LSR since bit 7 becomes 0)
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("i")
 
@@ -58,8 +57,7 @@ def lsr_zeropage_0x46(cpu: MOS6502CPU) -> None:
     cpu.write_byte(address=address, data=result)
 
     # Set N and Z flags (N is always 0 for LSR since bit 7 becomes 0)
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("z")
 
@@ -83,8 +81,7 @@ def lsr_zeropage_x_0x56(cpu: MOS6502CPU) -> None:
     cpu.write_byte(address=address, data=result)
 
     # Set N and Z flags (N is always 0 for LSR since bit 7 becomes 0)
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("zx")
 
@@ -111,8 +108,7 @@ def lsr_absolute_0x4e(cpu: MOS6502CPU) -> None:
     cpu.write_byte(address=address & 0xFFFF, data=result)
 
     # Set N and Z flags (N is always 0 for LSR since bit 7 becomes 0)
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("a")
 
@@ -143,7 +139,6 @@ def lsr_absolute_x_0x5e(cpu: MOS6502CPU) -> None:
     cpu.write_byte(address=address & 0xFFFF, data=result)
 
     # Set N and Z flags (N is always 0 for LSR since bit 7 becomes 0)
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("ax")
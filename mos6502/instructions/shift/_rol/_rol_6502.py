@@ -35,8 +35,7 @@ def rol_accumulator_0x2a(cpu: MOS6502CPU) -> None:
     cpu.A = result
 
     # Set N and Z flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("i")
 
@@ -62,8 +61,7 @@ def rol_zeropage_0x26(cpu: MOS6502CPU) -> None:
     cpu.write_byte(address=address, data=result)
 
     # Set N and Z flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("z")
 
@@ -89,8 +87,7 @@ def rol_zeropage_x_0x36(cpu: MOS6502CPU) -> None:
     cpu.write_byte(address=address, data=result)
 
     # Set N and Z flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("zx")
 
@@ -119,8 +116,7 @@ def rol_absolute_0x2e(cpu: MOS6502CPU) -> None:
     cpu.write_byte(address=address & 0xFFFF, data=result)
 
     # Set N and Z flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("a")
 
@@ -153,7 +149,6 @@ def rol_absolute_x_0x3e(cpu: MOS6502CPU) -> None:
     cpu.write_byte(address=address & 0xFFFF, data=result)
 
     # Set N and Z flags
-    cpu.flags[flags.Z] = 1 if result == 0 else 0
-    cpu.flags[flags.N] = 1 if (result & 0x80) else 0
+    cpu._flags.set_nz(result)
 
     cpu.log.info("ax")
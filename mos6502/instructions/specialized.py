@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+"""Code-generated opcode handlers with the addressing mode baked in.
+
+The handlers in this package are written against the CPU's generic helpers:
+cpu.fetch_zeropage_mode_address(offset_register_name="X") resolves the index
+register with getattr() through the X/Y properties, fetch_byte() goes through
+the PC property and spend_cpu_cycles(), and every read goes through
+RAM.__getitem__ and its memory_handler check.
+
+specialize_handler() takes the release (logging-free) form of a handler and
+inlines those helpers at each call site, so the generated handler:
+- Reads the index register as cpu._registers._X / _Y directly
+- Reads memory through RAM's page tables inline: a direct index into the
+  page's memoryview for RAM/ROM pages, a call to the page's reader otherwise
+- Charges each access with a literal cpu.tick(1), and the page-crossing penalty
+  of absolute,X/Y and (indirect),Y behind an inline page check
+- Sets N/Z for loads from the register slot instead of getattr(cpu, "A")
+- Reads and writes cpu.A/X/Y/S/PC as register slots with the setter's masking
+  (and the pc_callback check for PC) instead of going through the properties
+
+Only statements of the form "name = cpu.helper(...)", "cpu.helper(...)" and
+"name = int(cpu.helper(...))" with constant register names are inlined; any
+other use of a helper is left as a method call. The inlined code performs the
+same memory accesses, PC updates (including pc_callback) and ticks (including
+tick callbacks) in the same order as the helpers it replaces.
+
+Handlers are generated once per process for every handler of every variant in
+variants.CPUVariant and shared by all CPU instances. The generated code relies
+on verbose_cycles being off, so MOS6502CPU only uses them in its release table.
+
+With batched_cycles=True the inlined ticks are summed in a local instead and
+added to cpu._pending_cycles once when the handler returns or raises; the CPU
+then charges the whole instruction with a single tick (see
+MOS6502CPU.batched_cycles).
+
+inline_handler() returns the inlined statements themselves, for the block
+engine to splice into its generated functions (see mos6502.block_cache).
+"""
+
+import ast
+import copy
+from typing import Callable
+
+from mos6502.release_handlers import compile_handler
+from mos6502.release_handlers import parse_handler
+from mos6502.release_handlers import release_handler
+from mos6502.release_handlers import strip_trace_calls
+
+# Positional parameter names of the inlined CPU helpers
+INLINED_HELPERS: dict[str, tuple[str, ...]] = {
+    "fetch_byte": (),
+    "fetch_word": (),
+    "fetch_immediate_mode_address": (),
+    "fetch_zeropage_mode_address": ("offset_register_name",),
+    "fetch_absolute_mode_address": ("offset_register_name",),
+    "fetch_indexed_indirect_mode_address": (),
+    "fetch_indirect_indexed_mode_address": (),
+    "read_byte": ("address",),
+    "write_byte": ("address", "data"),
+    "set_load_status_flags": ("register_name",),
+    "spend_cpu_cycles": ("cost",),
+}
+
+# CPU register properties read and written through the register storage,
+# with the masking each property setter applies
+INLINED_REGISTERS: dict[str, str] = {
+    "PC": "({value}) & 0xFFFF",
+    "S": "0x0100 | (({value}) & 0xFF)",
+    "A": "({value}) & 0xFF",
+    "X": "({value}) & 0xFF",
+    "Y": "({value}) & 0xFF",
+}
+
+# Registers an addressing helper may be asked to index by
+INDEX_REGISTERS: frozenset[str] = frozenset({"A", "X", "Y"})
+
+# Locals bound once at the top of every specialized handler
+PREAMBLE: str = """
+_sp_registers = {cpu}._registers
+_sp_ram = {cpu}.ram
+_sp_pages = _sp_ram.read_pages
+_sp_readers = _sp_ram.page_readers
+"""
+
+# Cycle accounting bound after PREAMBLE: per access, or summed per instruction
+PER_ACCESS_TICK: str = "_sp_tick = {cpu}.tick\n"
+BATCHED_TICK: str = "_sp_cycles = 0\n"
+BATCHED_FLUSH: str = "{cpu}._pending_cycles += _sp_cycles\n"
+
+# (handler, batched_cycles) -> specialized handler (shared by every CPU instance)
+_specialized_handler_cache: dict[tuple[Callable, bool], Callable] = {}
+
+# handler -> inlined statements (see inline_handler())
+_inlined_body_cache: dict[Callable, list[ast.stmt] | None] = {}
+
+
+def _read(address: str) -> str:
+    """Return an expression reading one byte through RAM's page tables.
+
+    address is evaluated once; the page's memoryview is indexed directly, or
+    the page's reader is called for pages without one (I/O, banked cartridge).
+    """
+    return (
+        "(_sp_view[_sp_at & 0xFF]"
+        f" if (_sp_view := _sp_pages[(_sp_at := {address}) >> 8]) is not None"
+        " else _sp_readers[_sp_at >> 8](_sp_at))"
+    )
+
+
+def _advance_pc(cpu: str) -> str:
+    """Return source incrementing PC the way the PC property setter does."""
+    return (
+        "_sp_registers._PC = (_sp_registers._PC + 1) & 0xFFFF\n"
+        f"if {cpu}._pc_callback is not None:\n"
+        f"    {cpu}._pc_callback(_sp_registers._PC)\n"
+    )
+
+
+def _fetch_byte(cpu: str, target: str | None) -> str:
+    """Inline MOS6502CPU.fetch_byte(): read at PC, advance PC, one cycle."""
+    read = _read("_sp_registers._PC")
+    return (
+        (f"{target} = {read}\n" if target else f"{read}\n")
+        + _advance_pc(cpu)
+        + "_sp_tick(1)\n"
+    )
+
+
+def _fetch_word(cpu: str, target: str | None) -> str:
+    """Inline MOS6502CPU.fetch_word(): two reads, each charged before PC advances."""
+    source = (
+        f"_sp_low = {_read('_sp_registers._PC')}\n"
+        "_sp_tick(1)\n"
+        + _advance_pc(cpu)
+        + f"_sp_high = {_read('_sp_registers._PC')}\n"
+        "_sp_tick(1)\n"
+        + _advance_pc(cpu)
+    )
+    if target:
+        source += f"{target} = (_sp_high << 8) | _sp_low\n"
+    return source
+
+
+def _zeropage(cpu: str, target: str | None, register: str | None) -> str:
+    """Inline fetch_zeropage_mode_address(): operand byte plus index, wrapped in page zero."""
+    if register is None:
+        return _fetch_byte(cpu, target)
+    return (
+        _fetch_byte(cpu, "_sp_zeropage")
+        + f"{target or '_sp_address'} = (_sp_zeropage + _sp_registers._{register}) & 0xFF\n"
+    )
+
+
+def _absolute(cpu: str, target: str | None, register: str | None) -> str:
+    """Inline fetch_absolute_mode_address(): operand word plus index, +1 cycle on page cross."""
+    if register is None:
+        return _fetch_word(cpu, target)
+    target = target or "_sp_address"
+    return (
+        _fetch_word(cpu, "_sp_base")
+        + f"{target} = (_sp_base + _sp_registers._{register}) & 0xFFFF\n"
+        f"if (_sp_base ^ {target}) & 0xFF00:\n"
+        "    _sp_tick(1)\n"
+    )
+
+
+def _zeropage_pointer(target: str, pointer: str) -> str:
+    """Inline read_word_zeropage(): little-endian pointer wrapping within page zero."""
+    return (
+        f"_sp_low = {_read(pointer)}\n"
+        "_sp_tick(1)\n"
+        f"_sp_high = {_read(f'({pointer} + 1) & 0xFF')}\n"
+        "_sp_tick(1)\n"
+        f"{target} = (_sp_high << 8) + _sp_low\n"
+    )
+
+
+def _indexed_indirect(cpu: str, target: str | None) -> str:
+    """Inline fetch_indexed_indirect_mode_address(): pointer at (operand + X) & 0xFF."""
+    return (
+        _fetch_byte(cpu, "_sp_zeropage")
+        + "_sp_zeropage = (_sp_zeropage + _sp_registers._X) & 0xFF\n"
+        + _zeropage_pointer(target or "_sp_address", "_sp_zeropage")
+    )
+
+
+def _indirect_indexed(cpu: str, target: str | None) -> str:
+    """Inline fetch_indirect_indexed_mode_address(): pointer plus Y, +1 cycle on page cross."""
+    target = target or "_sp_address"
+    return (
+        _fetch_byte(cpu, "_sp_zeropage")
+        + "_sp_index = _sp_registers._Y\n"
+        + _zeropage_pointer("_sp_base", "_sp_zeropage")
+        + f"{target} = (_sp_base + _sp_index) & 0xFFFF\n"
+        f"if (_sp_base ^ {target}) & 0xFF00:\n"
+        "    _sp_tick(1)\n"
+    )
+
+
+def _constant_register(node: ast.expr | None) -> tuple[bool, str | None]:
+    """Return (True, name) if node is a literal index register name or None."""
+    if node is None:
+        return True, None
+    if isinstance(node, ast.Constant) and (node.value is None or node.value in INDEX_REGISTERS):
+        return True, node.value
+    return False, None
+
+
+def _bind_arguments(call: ast.Call, parameters: tuple[str, ...]) -> dict[str, ast.expr] | None:
+    """Map a helper call's arguments to parameter names, or None if they cannot be."""
+    if len(call.args) > len(parameters):
+        return None
+    bound = dict(zip(parameters, call.args))
+    for keyword in call.keywords:
+        if keyword.arg is None or keyword.arg not in parameters or keyword.arg in bound:
+            return None
+        bound[keyword.arg] = keyword.value
+    return bound
+
+
+def _is_simple(node: ast.expr) -> bool:
+    """Return True if evaluating node has no side effects worth ordering (no calls)."""
+    return not any(isinstance(child, (ast.Call, ast.NamedExpr, ast.Await)) for child in ast.walk(node))
+
+
+def _inline_source(cpu: str, call: ast.Call, target: str | None) -> str | None:
+    """Return the inlined source for one helper call, or None to keep the call."""
+    helper = call.func.attr
+    arguments = _bind_arguments(call, INLINED_HELPERS[helper])
+    if arguments is None:
+        return None
+
+    if helper in ("fetch_byte", "fetch_immediate_mode_address"):
+        return _fetch_byte(cpu, target)
+    if helper == "fetch_word":
+        return _fetch_word(cpu, target)
+    if helper == "fetch_indexed_indirect_mode_address":
+        return _indexed_indirect(cpu, target)
+    if helper == "fetch_indirect_indexed_mode_address":
+        return _indirect_indexed(cpu, target)
+
+    if helper in ("fetch_zeropage_mode_address", "fetch_absolute_mode_address"):
+        if "offset_register_name" not in arguments:
+            return None
+        constant, register = _constant_register(arguments["offset_register_name"])
+        if not constant:
+            return None
+        if helper == "fetch_zeropage_mode_address":
+            return _zeropage(cpu, target, register)
+        return _absolute(cpu, target, register)
+
+    if helper == "read_byte":
+        address = arguments.get("address")
+        if address is None or not _is_simple(address):
+            return None
+        read = _read(f"({ast.unparse(address)})")
+        return (f"{target} = {read}\n" if target else f"{read}\n") + "_sp_tick(1)\n"
+
+    if helper == "write_byte":
+        address, data = arguments.get("address"), arguments.get("data")
+        if target or address is None or data is None or not (_is_simple(address) and _is_simple(data)):
+            return None
+        # RAM.__setitem__ is kept: it notifies the block cache's code watcher
+        return (
+            f"_sp_address = {ast.unparse(address)}\n"
+            f"_sp_ram[_sp_address] = ({ast.unparse(data)}) & 0xFF\n"
+            "_sp_tick(1)\n"
+        )
+
+    if helper == "set_load_status_flags":
+        constant, register = _constant_register(arguments.get("register_name"))
+        if target or not constant or register is None:
+            return None
+        return f"{cpu}._flags.set_nz(_sp_registers._{register})\n"
+
+    if helper == "spend_cpu_cycles":
+        cost = arguments.get("cost")
+        if target or not isinstance(cost, ast.Constant) or not isinstance(cost.value, int):
+            return None
+        return f"_sp_tick({cost.value})\n"
+
+    return None
+
+
+class _HelperInliner:
+    """Replace helper-call statements of one handler with inlined code."""
+
+    def __init__(self, cpu: str) -> None:
+        self.cpu = cpu
+        self.inlined = 0
+
+    def _helper_call(self, node: ast.expr | None) -> ast.Call | None:
+        """Return node (or the call wrapped by int()) if it calls an inlined cpu helper."""
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "int"
+                and len(node.args) == 1 and not node.keywords):
+            node = node.args[0]
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and node.func.attr in INLINED_HELPERS
+                and isinstance(node.func.value, ast.Name) and node.func.value.id == self.cpu):
+            return node
+        return None
+
+    def _inline_statement(self, statement: ast.stmt) -> list[ast.stmt] | None:
+        """Return the statements replacing statement, or None to keep it."""
+        if isinstance(statement, ast.Expr):
+            target = None
+            call = self._helper_call(statement.value)
+        elif isinstance(statement, ast.AnnAssign) and statement.value is not None and statement.simple:
+            target = statement.target.id
+            call = self._helper_call(statement.value)
+        elif (isinstance(statement, ast.Assign) and len(statement.targets) == 1
+                and isinstance(statement.targets[0], ast.Name)):
+            target = statement.targets[0].id
+            call = self._helper_call(statement.value)
+        else:
+            return None
+
+        if call is None:
+            return None
+        source = _inline_source(self.cpu, call, target)
+        if source is None:
+            return None
+
+        replacement = ast.parse(source).body
+        for node in replacement:
+            for child in ast.walk(node):
+                ast.copy_location(child, statement)
+        self.inlined += 1
+        return replacement
+
+    def rewrite(self, body: list[ast.stmt]) -> list[ast.stmt]:
+        """Return body with every inlinable statement replaced, recursing into blocks."""
+        rewritten = []
+        for statement in body:
+            replacement = self._inline_statement(statement)
+            if replacement is not None:
+                rewritten.extend(replacement)
+                continue
+            for field in ("body", "orelse", "finalbody"):
+                statements = getattr(statement, field, None)
+                if isinstance(statements, list) and statements and isinstance(statements[0], ast.stmt):
+                    setattr(statement, field, self.rewrite(statements))
+            for handler in getattr(statement, "handlers", []):
+                handler.body = self.rewrite(handler.body)
+            rewritten.append(statement)
+        return rewritten
+
+
+class _RegisterInliner(ast.NodeTransformer):
+    """Replace cpu.A/X/Y/S/PC property accesses with reads and writes of _sp_registers."""
+
+    def __init__(self, cpu: str) -> None:
+        self.cpu = cpu
+        self.inlined = 0
+
+    def _register(self, node: ast.expr) -> str | None:
+        """Return the register name if node is cpu.<register>."""
+        if (isinstance(node, ast.Attribute) and node.attr in INLINED_REGISTERS
+                and isinstance(node.value, ast.Name) and node.value.id == self.cpu):
+            return node.attr
+        return None
+
+    def _store(self, statement: ast.stmt, register: str, value: str) -> list[ast.stmt]:
+        """Return statements storing value the way the register's property setter does."""
+        source = f"_sp_registers._{register} = {INLINED_REGISTERS[register].format(value=value)}\n"
+        if register == "PC":
+            source += (
+                f"if {self.cpu}._pc_callback is not None:\n"
+                f"    {self.cpu}._pc_callback(_sp_registers._PC)\n"
+            )
+        replacement = ast.parse(source).body
+        for node in replacement:
+            for child in ast.walk(node):
+                ast.copy_location(child, statement)
+        self.inlined += 1
+        return replacement
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.expr:
+        """Read a register slot instead of the property."""
+        register = self._register(node)
+        if register is None or not isinstance(node.ctx, ast.Load):
+            return self.generic_visit(node)
+        self.inlined += 1
+        return ast.copy_location(
+            ast.Attribute(value=ast.Name(id="_sp_registers", ctx=ast.Load()), attr=f"_{register}", ctx=ast.Load()),
+            node,
+        )
+
+    def visit_Assign(self, node: ast.Assign) -> ast.stmt | list[ast.stmt]:
+        """Write a register slot for "cpu.<register> = value"."""
+        self.generic_visit(node)
+        register = self._register(node.targets[0]) if len(node.targets) == 1 else None
+        if register is None:
+            return node
+        return self._store(node, register, ast.unparse(node.value))
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> ast.stmt | list[ast.stmt]:
+        """Write a register slot for "cpu.<register> op= value"."""
+        self.generic_visit(node)
+        register = self._register(node.target)
+        if register is None:
+            return node
+        operation = ast.BinOp(
+            left=ast.Attribute(value=ast.Name(id="_sp_registers", ctx=ast.Load()), attr=f"_{register}", ctx=ast.Load()),
+            op=node.op,
+            right=node.value,
+        )
+        return self._store(node, register, ast.unparse(operation))
+
+
+class _TickBatcher(ast.NodeTransformer):
+    """Turn the inlined _sp_tick(n) statements into _sp_cycles += n."""
+
+    def visit_Expr(self, node: ast.Expr) -> ast.stmt:
+        """Replace a bare _sp_tick() call, leaving every other expression alone."""
+        call = node.value
+        if isinstance(call, ast.Call) and isinstance(call.func, ast.Name) and call.func.id == "_sp_tick":
+            return ast.copy_location(
+                ast.AugAssign(target=ast.Name(id="_sp_cycles", ctx=ast.Store()), op=ast.Add(), value=call.args[0]),
+                node,
+            )
+        return node
+
+
+def _inline_function(function: ast.FunctionDef) -> tuple[list[ast.stmt], int]:
+    """Strip a handler's trace calls and inline its helpers and register properties.
+
+    Returns the new body (without PREAMBLE) and the number of inlined uses.
+    """
+    strip_trace_calls(function)
+    inliner = _HelperInliner(cpu=function.args.args[0].arg)
+    body = inliner.rewrite(function.body)
+    registers = _RegisterInliner(cpu=inliner.cpu)
+    body = [registers.visit(statement) for statement in body]
+    body = [node for statement in body for node in (statement if isinstance(statement, list) else [statement])]
+    return body, inliner.inlined + registers.inlined
+
+
+def inline_handler(handler: Callable) -> list[ast.stmt] | None:
+    """Return an opcode handler's statements with the helpers and registers inlined.
+
+    This is the code specialize_handler() compiles, before PREAMBLE is added
+    and with one _sp_tick(n) statement per access; the block engine
+    (mos6502.block_cache) splices it into its generated functions.
+
+    Returns:
+    -------
+        A fresh copy of the statements, or None if the handler has no usable
+        source or its CPU parameter is not named cpu.
+    """
+    if handler not in _inlined_body_cache:
+        body = None
+        tree = parse_handler(handler)
+        if tree is not None and [arg.arg for arg in tree.body[0].args.args] == ["cpu"]:
+            body, _inlined = _inline_function(tree.body[0])
+        _inlined_body_cache[handler] = body
+    body = _inlined_body_cache[handler]
+    return copy.deepcopy(body) if body is not None else None
+
+
+def specialize_handler(handler: Callable, batched_cycles: bool = False) -> Callable:
+    """Return the specialized, logging-free variant of an opcode handler.
+
+    Arguments:
+    ---------
+        handler: An opcode handler function from mos6502.instructions
+        batched_cycles: If True, sum the inlined ticks and add them to
+            cpu._pending_cycles on exit instead of ticking per access
+
+    Returns:
+    -------
+        The specialized handler. Handlers that use none of the inlined helpers
+        get their release form (see mos6502.release_handlers.release_handler),
+        handlers without usable source are returned unchanged.
+    """
+    specialized = _specialized_handler_cache.get((handler, batched_cycles))
+    if specialized is not None:
+        return specialized
+
+    specialized = release_handler(handler)
+    tree = parse_handler(handler)
+    if tree is not None and tree.body[0].args.args:
+        function = tree.body[0]
+        cpu = function.args.args[0].arg
+        body, inlined = _inline_function(function)
+        if inlined:
+            tick = BATCHED_TICK if batched_cycles else PER_ACCESS_TICK
+            preamble = ast.parse((PREAMBLE + tick).format(cpu=cpu)).body
+            first = function.body[0]
+            for node in preamble:
+                for child in ast.walk(node):
+                    ast.copy_location(child, first)
+            if batched_cycles:
+                # try/finally also charges the cycles of handlers that raise (JAM)
+                flush = ast.parse(BATCHED_FLUSH.format(cpu=cpu)).body
+                for child in ast.walk(flush[0]):
+                    ast.copy_location(child, first)
+                body = [ast.copy_location(ast.Try(
+                    body=[_TickBatcher().visit(statement) for statement in body],
+                    handlers=[],
+                    orelse=[],
+                    finalbody=flush,
+                ), first)]
+            function.body = preamble + body
+            specialized = compile_handler(tree, handler)
+
+    _specialized_handler_cache[handler, batched_cycles] = specialized
+    return specialized
@@ -25,11 +25,10 @@ def plp_implied_0x28(cpu: MOS6502CPU) -> None:
     ---------
         cpu: The CPU instance to operate on
     """
-    from mos6502.flags import FlagsRegister
-
     cpu.S += 1
     status_byte: int = cpu.read_byte(address=cpu.S)
-    # Restore all flags from stack - must use FlagsRegister to preserve logging
-    cpu._flags = FlagsRegister(status_byte)
+    # Restore all flags from stack - keep the CPU's register class (logging or
+    # quiet, see verbose_cycles)
+    cpu._flags = type(cpu._flags)(status_byte)
     cpu.log.info("i")
     cpu.spend_cpu_cycles(2)
@@ -25,13 +25,12 @@ def rti_implied_0x40(cpu: MOS6502CPU) -> None:
     ---------
         cpu: The CPU instance to operate on
     """
-    from mos6502.flags import FlagsRegister
-
     # Pull status register from stack
     # S is incremented first, then we read from the new S location.
     # The S setter ensures S stays in page 1 ($0100-$01FF), so cpu.S is always valid.
     cpu.S += 1
-    cpu._flags = FlagsRegister(cpu.read_byte(address=cpu.S))
+    # Keep the CPU's register class (logging or quiet, see verbose_cycles)
+    cpu._flags = type(cpu._flags)(cpu.read_byte(address=cpu.S))
 
     # Pull PC from stack (2 bytes: low byte first, then high byte)
     # IMPORTANT: Stack always wraps within page 1 ($0100-$01FF)
@@ -6,7 +6,7 @@ Bitarray conversion only happens when explicitly needed for bit operations.
 """
 import logging
 from collections.abc import MutableSequence
-from typing import Literal, Self
+from typing import Callable, Literal, Self
 
 from mos6502.bitarray_factory import ba2int, bitarray, int2ba, is_bitarray
 
@@ -427,7 +427,18 @@ class RAM(MutableSequence):
         """Instantiate a mos6502 RAM bank."""
         super().__init__()
         self.endianness: str = endianness
-        self.memory_handler = None  # Optional external memory handler (for C64 banking, etc.)
+        self._memory_handler = None  # Optional external memory handler (for C64 banking, etc.)
+        # Single-byte read function bound to the current backing store (see _bind_read())
+        self.bound_read = None
+        # Page-mapped read tables (see _bind_read()): read_pages[page] is a 256-byte
+        # memoryview for pages that can be indexed directly, or None to call
+        # page_readers[page](addr) instead. Used by __getitem__ and the specialized
+        # opcode handlers so RAM/ROM reads need no Python call
+        self.read_pages: list[memoryview | None] = [None] * 256
+        self.page_readers: list[Callable[[int], int]] = []
+        # Optional code watcher (e.g., mos6502.block_cache.BlockCache) notified on writes
+        # to addresses flagged in its code_map, so translated code can be invalidated
+        self.code_watcher = None
         self._data: bytearray = bytearray()  # Will be initialized in initialize()
         self.initialize()
 
@@ -438,11 +449,64 @@ class RAM(MutableSequence):
 
         # If there's a memory handler (e.g., C64 banking), skip initialization
         # to preserve any ROM data that was written before the handler was installed
-        if self.memory_handler is not None:
+        if self._memory_handler is not None:
+            self._bind_read()
             return
 
         # Flat bytearray for performance - eliminates branching on every access
         self._data: bytearray = bytearray([0xFF] * 0x10000)
+        self._bind_read()
+
+        if self.code_watcher is not None:
+            self.code_watcher.invalidate_all()
+
+    @property
+    def memory_handler(self: Self):  # noqa: ANN201
+        """Return the external memory handler, or None for flat RAM."""
+        return self._memory_handler
+
+    @memory_handler.setter
+    def memory_handler(self: Self, handler) -> None:  # noqa: ANN001
+        """Install an external memory handler (an object with read(addr)/write(addr, value))."""
+        self._memory_handler = handler
+        self._bind_read()
+
+    def _bind_read(self: Self) -> None:
+        """Point bound_read and the read page tables at the current backing store.
+
+        Flat RAM maps every page to a view of the array. A memory handler may
+        provide its own read_pages/page_readers lists (same layout, updated in
+        place when its banking changes); otherwise every page calls its read().
+        """
+        handler = self._memory_handler
+        if handler is None:
+            self.bound_read = self._data.__getitem__
+            view = memoryview(self._data)
+            self.read_pages = [view[page << 8:(page + 1) << 8] for page in range(256)]
+            self.page_readers = [self._data.__getitem__] * 256
+            return
+
+        self.bound_read = handler.read
+        read_pages = getattr(handler, "read_pages", None)
+        if read_pages is not None:
+            self.read_pages = read_pages
+            self.page_readers = handler.page_readers
+        else:
+            self.read_pages = [None] * 256
+            self.page_readers = [handler.read] * 256
+
+    def __getstate__(self: Self) -> dict:
+        """Return the state for copy/pickle without the (uncopyable) memoryview page tables."""
+        state = self.__dict__.copy()
+        state["bound_read"] = None
+        state["read_pages"] = None
+        state["page_readers"] = None
+        return state
+
+    def __setstate__(self: Self, state: dict) -> None:
+        """Restore a copied/pickled RAM and rebuild its read tables."""
+        self.__dict__.update(state)
+        self._bind_read()
 
     @property
     def zeropage(self: Self) -> memoryview:
@@ -474,9 +538,13 @@ class RAM(MutableSequence):
 
     def __getitem__(self: Self, index: int) -> int:
         """Get the RAM item at index {index}."""
-        # Delegate to external memory handler if set (e.g., C64 banking)
-        if self.memory_handler is not None:
-            return self.memory_handler.read(index)
+        # Delegate to external memory handler if set (e.g., C64 banking),
+        # through its page tables
+        if self._memory_handler is not None:
+            view = self.read_pages[index >> 8]
+            if view is not None:
+                return view[index & 0xFF]
+            return self.page_readers[index >> 8](index)
 
         # Direct flat array access - no branching
         return self._data[index]
@@ -486,9 +554,14 @@ class RAM(MutableSequence):
 
     def __setitem__(self: Self, index: int, value: int, length: int = 8) -> None:
         """Set the RAM item at index {index} to value {value}."""
+        # Invalidate translated code covering this address (block engine only)
+        code_watcher = self.code_watcher
+        if code_watcher is not None and code_watcher.code_map[index]:
+            code_watcher.invalidate(index)
+
         # Delegate to external memory handler if set (e.g., C64 banking)
-        if self.memory_handler is not None:
-            self.memory_handler.write(index, value)
+        if self._memory_handler is not None:
+            self._memory_handler.write(index, value)
             return
 
         # Extract int value if passed a MemoryUnit
@@ -522,6 +595,8 @@ class RAM(MutableSequence):
     def fill(self: Self, data: int) -> None:
         """Fill the RAM with {data}."""
         int_data = data._value if isinstance(data, MemoryUnit) else int(data) & 0xFF  # noqa: SLF001
+        if self.code_watcher is not None:
+            self.code_watcher.invalidate_all()
         # Use efficient slice assignment instead of per-byte loop
         self._data[:] = bytes([int_data]) * 0x10000
 
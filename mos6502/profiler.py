@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Counting execution profiler for the mos6502 CPU.
+
+pre_instruction_callback/post_instruction_callback move execute() onto the
+slow path, so timing a workload through them measures the callbacks rather
+than the workload. ExecutionProfiler is instead updated inline by the
+interpreter's fast path with three flat counters:
+
+- opcode_counts: 256 entries, instructions executed per opcode
+- pc_hits: 64K entries, instructions executed per address
+- pc_cycles: 64K entries, cycles spent in the instruction at each address
+  (including page-crossing and branch penalties, excluding interrupt entry)
+
+The counters are array('Q') buffers so they can be summed by range or handed
+to NumPy (numpy.frombuffer) without copying.
+
+While a profiler is attached the block engine and idle-loop skipping are not
+used, so every executed instruction is counted at its own address.
+
+Usage:
+    profiler = ExecutionProfiler()
+    cpu.profiler = profiler
+    cpu.execute(cycles=1_000_000)
+    print(profiler.report(ranges={"KERNAL": range(0xE000, 0x10000)}))
+"""
+
+from array import array
+from typing import Callable, Mapping, NamedTuple, Self
+
+from mos6502 import instructions
+
+
+class HotSpot(NamedTuple):
+    """Execution totals of one instruction address."""
+
+    address: int
+    hits: int
+    cycles: int
+
+
+class ExecutionProfiler:
+    """Per-opcode and per-address instruction and cycle counters."""
+
+    __slots__ = ('opcode_counts', 'pc_hits', 'pc_cycles')
+
+    def __init__(self: Self) -> None:
+        self.opcode_counts: array = array('Q', bytes(256 * 8))
+        self.pc_hits: array = array('Q', bytes(0x10000 * 8))
+        self.pc_cycles: array = array('Q', bytes(0x10000 * 8))
+
+    def reset(self: Self) -> None:
+        """Clear all counters."""
+        self.opcode_counts[:] = array('Q', bytes(256 * 8))
+        self.pc_hits[:] = array('Q', bytes(0x10000 * 8))
+        self.pc_cycles[:] = array('Q', bytes(0x10000 * 8))
+
+    @property
+    def instructions(self: Self) -> int:
+        """Return the number of instructions counted."""
+        return sum(self.opcode_counts)
+
+    @property
+    def cycles(self: Self) -> int:
+        """Return the number of cycles attributed to instructions."""
+        return sum(self.pc_cycles)
+
+    def hot_spots(self: Self, limit: int = 20, key: str = "cycles") -> list[HotSpot]:
+        """Return the busiest instruction addresses.
+
+        Arguments:
+        ---------
+            limit: Maximum number of addresses to return
+            key: "cycles" or "hits" - what to sort by
+
+        Returns:
+        -------
+            HotSpot entries, busiest first
+        """
+        if key not in HotSpot._fields[1:]:
+            raise ValueError(f"Unknown hot spot key: {key}. Valid keys: hits, cycles")
+        counts = self.pc_cycles if key == "cycles" else self.pc_hits
+        addresses = sorted(
+            (address for address, count in enumerate(counts) if count),
+            key=counts.__getitem__,
+            reverse=True,
+        )[:limit]
+        return [HotSpot(address, self.pc_hits[address], self.pc_cycles[address]) for address in addresses]
+
+    def opcode_hot_spots(self: Self, limit: int = 20) -> list[tuple[int, str, int]]:
+        """Return the most executed opcodes as (opcode, mnemonic, count), busiest first."""
+        opcodes = sorted(
+            (opcode for opcode, count in enumerate(self.opcode_counts) if count),
+            key=self.opcode_counts.__getitem__,
+            reverse=True,
+        )[:limit]
+        result = []
+        for opcode in opcodes:
+            info = instructions.InstructionSet.map.get(opcode)
+            mnemonic = info["assembler"].split()[0] if info is not None else "???"
+            result.append((opcode, mnemonic, self.opcode_counts[opcode]))
+        return result
+
+    def range_cycles(self: Self, ranges: Mapping[str, range]) -> dict[str, int]:
+        """Return the cycles spent in each named address range."""
+        pc_cycles = self.pc_cycles
+        return {name: sum(pc_cycles[address_range.start:address_range.stop])
+                for name, address_range in ranges.items()}
+
+    def report(
+        self: Self,
+        limit: int = 20,
+        ranges: Mapping[str, range] | None = None,
+        disassemble: Callable[[int], str] | None = None,
+    ) -> str:
+        """Format a profile summary.
+
+        Arguments:
+        ---------
+            limit: Number of hot addresses and opcodes to list
+            ranges: Optional named address ranges to attribute cycles to
+            disassemble: Optional address -> disassembly text function
+
+        Returns:
+        -------
+            Multi-line report text
+        """
+        total_cycles = self.cycles or 1
+        lines = [f"Instructions: {self.instructions:,}  Cycles: {self.cycles:,}"]
+
+        if ranges:
+            lines.append("")
+            lines.append("Cycles by range:")
+            for name, cycles in sorted(self.range_cycles(ranges).items(), key=lambda item: -item[1]):
+                lines.append(f"  {name:<24} {cycles:>14,} {100 * cycles / total_cycles:6.2f}%")
+
+        lines.append("")
+        lines.append("Hot spots:")
+        for spot in self.hot_spots(limit):
+            text = disassemble(spot.address) if disassemble is not None else f"${spot.address:04X}"
+            lines.append(
+                f"  {spot.cycles:>14,} {100 * spot.cycles / total_cycles:6.2f}% "
+                f"{spot.hits:>12,}x  {text}",
+            )
+
+        lines.append("")
+        lines.append("Opcodes:")
+        for opcode, mnemonic, count in self.opcode_hot_spots(limit):
+            lines.append(f"  ${opcode:02X} {mnemonic:<4} {count:>14,}")
+
+        return "\n".join(lines)
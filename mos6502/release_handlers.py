@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Logging-free ("release") variants of the opcode handlers.
+
+Every handler in mos6502/instructions ends with a trace call such as
+cpu.log.info("i"). With logging disabled each one still costs a method call
+and a level check per instruction, and a few of them format an f-string first.
+
+release_handler() derives an equivalent handler with those calls removed:
+- The handler source is parsed and every cpu.log.debug()/cpu.log.info()
+  expression statement is dropped (warnings and errors are kept)
+- Function-local imports that are unused once the trace calls are gone
+  (mostly "from mos6502 import flags") are dropped as well, since each one
+  is a sys.modules lookup on every call
+- The result is compiled against the handler's own module globals, with the
+  original file name and line numbers so tracebacks still point at the source
+
+Handlers are transformed once per process and shared by all CPU instances.
+MOS6502CPU._build_opcode_handler_table() uses them whenever verbose_cycles is
+off; the original handlers remain the reference implementation.
+"""
+
+import __future__
+
+import ast
+import inspect
+import textwrap
+from typing import Callable
+
+# Log levels stripped from release handlers
+STRIPPED_LOG_LEVELS: frozenset[str] = frozenset({"debug", "info"})
+
+# handler -> release handler (shared by every CPU instance)
+_release_handler_cache: dict[Callable, Callable] = {}
+
+
+def _is_trace_call(statement: ast.stmt) -> bool:
+    """Return True if statement is a bare cpu.log.debug/info(...) call."""
+    if not isinstance(statement, ast.Expr) or not isinstance(statement.value, ast.Call):
+        return False
+    function = statement.value.func
+    return (
+        isinstance(function, ast.Attribute)
+        and function.attr in STRIPPED_LOG_LEVELS
+        and isinstance(function.value, ast.Attribute)
+        and function.value.attr == "log"
+        and isinstance(function.value.value, ast.Name)
+        and function.value.value.id == "cpu"
+    )
+
+
+class _TraceCallStripper(ast.NodeTransformer):
+    """Remove trace calls and imports they leave unused from a handler."""
+
+    def __init__(self, used_names: set[str]) -> None:
+        self.used_names = used_names
+        self.removed = 0
+
+    def _strip(self, body: list[ast.stmt]) -> list[ast.stmt]:
+        kept = []
+        for statement in body:
+            if _is_trace_call(statement):
+                self.removed += 1
+                continue
+            if isinstance(statement, ast.ImportFrom) and not any(
+                (alias.asname or alias.name) in self.used_names for alias in statement.names
+            ):
+                self.removed += 1
+                continue
+            kept.append(self.visit(statement))
+        # Keep the block syntactically valid (e.g. an if-body that only logged)
+        return kept or [ast.Pass()]
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        for field in ("body", "orelse", "finalbody"):
+            statements = getattr(node, field, None)
+            if isinstance(statements, list) and statements and isinstance(statements[0], ast.stmt):
+                setattr(node, field, self._strip(statements))
+        for handler in getattr(node, "handlers", []):
+            handler.body = self._strip(handler.body)
+        return node
+
+
+def _used_names(tree: ast.AST) -> set[str]:
+    """Return the names loaded anywhere in tree."""
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+            names.add(node.id)
+    return names
+
+
+def parse_handler(handler: Callable) -> ast.Module | None:
+    """Parse a handler's source into a module holding just its function definition.
+
+    The docstring is dropped and line numbers match the source file.
+
+    Arguments:
+    ---------
+        handler: An opcode handler function from mos6502.instructions
+
+    Returns:
+    -------
+        The parsed module, or None if the handler has no usable source (builtins,
+        closures, lambdas).
+    """
+    try:
+        source_lines, first_line = inspect.getsourcelines(handler)
+    except (OSError, TypeError):
+        return None
+
+    if handler.__code__.co_freevars:
+        return None
+
+    tree = ast.parse(textwrap.dedent("".join(source_lines)))
+    function = tree.body[0]
+    if not isinstance(function, ast.FunctionDef) or function.name != handler.__name__:
+        return None
+
+    # Docstrings are not needed at runtime
+    if (function.body and isinstance(function.body[0], ast.Expr)
+            and isinstance(function.body[0].value, ast.Constant)
+            and isinstance(function.body[0].value.value, str)):
+        function.body = function.body[1:]
+
+    function.decorator_list = []
+    ast.increment_lineno(tree, first_line - 1)
+    return tree
+
+
+def strip_trace_calls(function: ast.FunctionDef) -> int:
+    """Remove cpu.log.debug/info() calls and the imports they leave unused.
+
+    Arguments:
+    ---------
+        function: The handler definition, modified in place
+
+    Returns:
+    -------
+        The number of statements removed
+    """
+    stripper = _TraceCallStripper(_used_names(ast.Module(
+        body=[statement for statement in function.body if not _is_trace_call(statement)],
+        type_ignores=[],
+    )))
+    function.body = stripper._strip(function.body)
+    return stripper.removed
+
+
+def compile_handler(tree: ast.Module, handler: Callable) -> Callable:
+    """Compile a transformed handler tree in the original handler's module.
+
+    Arguments:
+    ---------
+        tree: The module returned by parse_handler(), after transformation
+        handler: The handler the tree was parsed from
+
+    Returns:
+    -------
+        The new function, carrying handler's name, docstring and __wrapped__
+    """
+    ast.fix_missing_locations(tree)
+    code = compile(
+        tree,
+        inspect.getsourcefile(handler) or "<release handler>",
+        "exec",
+        flags=__future__.annotations.compiler_flag,
+        dont_inherit=True,
+    )
+    namespace: dict = {}
+    exec(code, handler.__globals__, namespace)  # noqa: S102
+    compiled = namespace[handler.__name__]
+    compiled.__doc__ = handler.__doc__
+    compiled.__qualname__ = handler.__qualname__
+    compiled.__module__ = handler.__module__
+    compiled.__wrapped__ = handler
+    return compiled
+
+
+def release_handler(handler: Callable) -> Callable:
+    """Return the logging-free variant of an opcode handler.
+
+    Arguments:
+    ---------
+        handler: An opcode handler function from mos6502.instructions
+
+    Returns:
+    -------
+        The release handler, or handler itself if it cannot be transformed
+        (no source available, closures) or contains nothing to strip.
+    """
+    release = _release_handler_cache.get(handler)
+    if release is not None:
+        return release
+
+    release = handler
+    tree = parse_handler(handler)
+    if tree is not None and strip_trace_calls(tree.body[0]):
+        release = compile_handler(tree, handler)
+
+    _release_handler_cache[handler] = release
+    return release
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Cycle-ordered event scheduler for the mos6502 CPU.
+
+periodic_callback polls every peripheral at a fixed interval: a timer that
+underflows just after a poll is serviced up to one interval late, and polls
+where nothing is due still cost a call. EventScheduler instead keeps one
+heap of (cycle, event) entries. Each peripheral registers an Event and
+schedules it at the cycle its next state change is due (raster compare,
+timer underflow, TOD tick...). execute() compares cycles_executed with
+next_cycle at every instruction boundary and only leaves the fast path when
+an event is due. The block engine ends blocks and idle-loop skipping stops
+at next_cycle, so events run at the first boundary at or after their cycle.
+
+An Event has at most one pending cycle: schedule() replaces it, cancel()
+drops it. Replaced entries stay in the heap and are discarded when they
+reach the top (or when the heap is compacted).
+
+Usage:
+    scheduler = EventScheduler()
+    cpu.scheduler = scheduler
+
+    def underflow(cycle: int) -> None:
+        cpu.irq_pending = True
+        timer.schedule(cycle + 1000)
+
+    timer = scheduler.add(underflow, "timer")
+    timer.schedule(cpu.cycles_executed + 1000)
+"""
+
+from heapq import heapify, heappop, heappush
+from typing import Callable, Self
+
+# next_cycle while nothing is scheduled
+NEVER: int = 1 << 62
+
+# Compact the heap when it holds this many times more entries than events
+# are scheduled (and at least MIN_COMPACT entries)
+COMPACT_RATIO: int = 4
+MIN_COMPACT: int = 64
+
+
+class Event:
+    """A peripheral's pending state change, owned by an EventScheduler."""
+
+    __slots__ = ("scheduler", "callback", "name", "cycle", "_sequence")
+
+    def __init__(self: Self, scheduler: "EventScheduler", callback: Callable[[int], None], name: str) -> None:
+        self.scheduler = scheduler
+        self.callback = callback
+        self.name = name
+        self.cycle: int | None = None
+        self._sequence: int | None = None
+
+    def __repr__(self: Self) -> str:
+        return f"Event({self.name!r}, cycle={self.cycle})"
+
+    @property
+    def scheduled(self: Self) -> bool:
+        """Return True if the event is pending."""
+        return self._sequence is not None
+
+    def schedule(self: Self, cycle: int) -> None:
+        """Run the callback at the first instruction boundary at or after cycle.
+
+        Replaces any pending cycle of this event.
+        """
+        self.scheduler._push(self, cycle)
+
+    def cancel(self: Self) -> None:
+        """Drop the pending cycle, if any."""
+        if self._sequence is not None:
+            self._sequence = None
+            self.cycle = None
+            self.scheduler.pending -= 1
+
+
+class EventScheduler:
+    """Heap of peripheral events ordered by CPU cycle."""
+
+    def __init__(self: Self) -> None:
+        self._heap: list[tuple[int, int, Event]] = []
+        self._sequence = 0
+        # Cycle of the earliest entry (NEVER if none); may be a replaced or
+        # cancelled entry, in which case run() just discards it
+        self.next_cycle: int = NEVER
+        # Scheduled events and callbacks run so far
+        self.pending: int = 0
+        self.dispatched: int = 0
+
+    def __repr__(self: Self) -> str:
+        return f"EventScheduler(pending={self.pending}, next_cycle={self.next_cycle})"
+
+    def add(self: Self, callback: Callable[[int], None], name: str = "") -> Event:
+        """Register an event; callback(cycle) receives the cycle it was due at."""
+        return Event(self, callback, name)
+
+    def _push(self: Self, event: Event, cycle: int) -> None:
+        """Schedule event at cycle, replacing its pending entry."""
+        if event._sequence is None:
+            self.pending += 1
+        self._sequence += 1
+        event._sequence = self._sequence
+        event.cycle = cycle
+        heappush(self._heap, (cycle, self._sequence, event))
+        if cycle < self.next_cycle:
+            self.next_cycle = cycle
+        heap = self._heap
+        if len(heap) >= MIN_COMPACT and len(heap) > COMPACT_RATIO * self.pending:
+            self._heap = [entry for entry in heap if entry[2]._sequence == entry[1]]
+            heapify(self._heap)
+
+    def run(self: Self, now: int) -> None:
+        """Run every event due at or before cycle now, in cycle order.
+
+        Callbacks may schedule events, including ones already due; those run
+        in the same call.
+        """
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            cycle, sequence, event = heappop(heap)
+            if event._sequence != sequence:
+                continue  # Replaced or cancelled
+            event._sequence = None
+            event.cycle = None
+            self.pending -= 1
+            self.dispatched += 1
+            event.callback(cycle)
+            heap = self._heap
+        self._refresh()
+
+    def _refresh(self: Self) -> None:
+        """Drop stale entries from the top and update next_cycle."""
+        heap = self._heap
+        while heap and heap[0][2]._sequence != heap[0][1]:
+            heappop(heap)
+        self.next_cycle = heap[0][0] if heap else NEVER
+
+    def events(self: Self) -> list[Event]:
+        """Return the scheduled events in cycle order."""
+        return [event for _cycle, sequence, event in sorted(self._heap) if event._sequence == sequence]
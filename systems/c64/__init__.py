@@ -9,6 +9,8 @@ from typing import Optional
 from mos6502 import CPU, CPUVariant, errors, add_cpu_arguments
 from mos6502.core import INFINITE_CYCLES
 from mos6502.memory import Byte, Word
+from mos6502.profiler import ExecutionProfiler
+from mos6502.scheduler import EventScheduler
 
 from c64.cartridges import (
     Cartridge,
@@ -54,6 +56,8 @@ from c64.vic import (
     PAL,
     NTSC,
 )
+from c64.vic_render import LineRenderer, NUMPY_AVAILABLE
+from c64.frame_sink import FrameSink
 from c64.memory import (
     C64Memory,
     BASIC_ROM_START,
@@ -86,7 +90,10 @@ from c64.drive import (
     MultiprocessDrive1541,
     MultiprocessIECBus,
     SharedIECState,
+    SpeculativeIECBus,
+    VirtualDrive,
 )
+from c64.drive.gcr import default_cache_dir
 
 logging.basicConfig(level=logging.CRITICAL)
 log = logging.getLogger("c64")
@@ -139,6 +146,15 @@ class C64:
     # Cartridge auto-start signature location
     CART_SIGNATURE_ADDR = 0x8004  # "CBM80" signature for auto-start
 
+    # Address ranges used to attribute profiled cycles (as banked by default)
+    PROFILE_RANGES = {
+        "RAM $0000-$9FFF": range(0x0000, BASIC_ROM_START),
+        "BASIC $A000-$BFFF": range(BASIC_ROM_START, BASIC_ROM_END + 1),
+        "RAM $C000-$CFFF": range(BASIC_ROM_END + 1, CHAR_ROM_START),
+        "I/O $D000-$DFFF": range(CHAR_ROM_START, CHAR_ROM_END + 1),
+        "KERNAL $E000-$FFFF": range(KERNAL_ROM_START, KERNAL_ROM_END + 1),
+    }
+
     # CRT hardware type names (from VICE specification)
     # Type 0 is the only one we currently support
     # Source: http://rr.c64.org/wiki/CRT_ID
@@ -267,6 +283,14 @@ class C64:
             help="VIC-II chip variant: 6569 (PAL, default), 6567R8 (NTSC 1984+), "
                  "6567R56A (old NTSC 1982-1984). PAL/NTSC are aliases for 6569/6567R8.",
         )
+        core_group.add_argument(
+            "--renderer",
+            type=str,
+            choices=["classic", "numpy"],
+            default="classic",
+            help="Pygame frame renderer: classic (per-pixel, default) or numpy "
+                 "(vectorized, requires NumPy; falls back to classic if unavailable)",
+        )
         core_group.add_argument(
             "--no-irq",
             action="store_true",
@@ -392,10 +416,22 @@ class C64:
         )
         drive_group.add_argument(
             "--drive-runner",
-            choices=["threaded", "synchronous", "multiprocess"],
+            choices=["threaded", "synchronous", "speculative", "multiprocess", "virtual"],
             default="threaded",
             dest="drive_runner",
-            help="Drive emulation runner: threaded (default), synchronous, or multiprocess",
+            help="Drive emulation runner: threaded (default), synchronous, speculative, multiprocess, "
+                 "or virtual (KERNAL traps, no 1541 ROM needed)",
+        )
+        drive_group.add_argument(
+            "--gcr-cache",
+            type=Path,
+            nargs="?",
+            const=default_cache_dir(),
+            default=None,
+            dest="gcr_cache",
+            metavar="DIR",
+            help="Cache GCR-encoded disk tracks in DIR so reinserting an image skips encoding "
+                 f"(default DIR: {default_cache_dir()}; off unless given)",
         )
 
         # Execution control options
@@ -431,6 +467,38 @@ class C64:
             action="store_true",
             help="Display screen RAM after execution (40x25 character display)",
         )
+        output_group.add_argument(
+            "--capture",
+            metavar="TARGET",
+            help="Write every completed frame without a display (requires NumPy): "
+                 "a .raw/.rgb RGB24 stream, a PNG directory or %%-pattern, or an "
+                 "encoder command reading RGB24 on stdin (with --capture-format pipe)",
+        )
+        output_group.add_argument(
+            "--capture-format",
+            choices=["auto", "raw", "png", "pipe"],
+            default="auto",
+            help="Capture output format (default: auto - raw for .raw/.rgb targets, else png)",
+        )
+        output_group.add_argument(
+            "--capture-every",
+            type=int,
+            default=1,
+            metavar="N",
+            help="Capture every Nth frame (default: 1)",
+        )
+        output_group.add_argument(
+            "--capture-workers",
+            type=int,
+            default=2,
+            metavar="N",
+            help="Background threads rendering/encoding captured frames (default: 2)",
+        )
+        output_group.add_argument(
+            "--profile",
+            action="store_true",
+            help="Count instructions and cycles per address/opcode and print the hot spots after execution",
+        )
         output_group.add_argument(
             "--verbose",
             "-v",
@@ -511,7 +579,7 @@ class C64:
         Returns:
             Configured C64 instance
         """
-        return cls(
+        c64 = cls(
             rom_dir=args.rom_dir,
             display_mode=args.display,
             scale=args.scale,
@@ -520,6 +588,12 @@ class C64:
             cpu_variant=getattr(args, 'cpu', '6502'),
             verbose_cycles=getattr(args, 'verbose_cycles', False),
         )
+        c64.set_renderer(getattr(args, 'renderer', 'classic'))
+        if getattr(args, 'capture', None):
+            c64.start_capture(
+                args.capture, args.capture_format, every=args.capture_every, workers=args.capture_workers,
+            )
+        return c64
 
 
     def __init__(self, rom_dir: Path = Path("./roms"), display_mode: str = "pygame", scale: int = 2, enable_irq: bool = True, video_chip: str = "6569", cpu_variant: str = "6502", verbose_cycles: bool = False) -> None:
@@ -571,7 +645,9 @@ class C64:
         # Initialize CPU (6510 is essentially a 6502 with I/O ports)
         # Parse the cpu_variant string to get the enum
         self._cpu_variant = CPUVariant.from_string(cpu_variant)
-        self.cpu = CPU(cpu_variant=self._cpu_variant, verbose_cycles=verbose_cycles)
+        # Idle-loop skipping is exact and turns itself off while the drive runs
+        # in lockstep through post_tick_callback (see MOS6502CPU.idle_loop_skip)
+        self.cpu = CPU(cpu_variant=self._cpu_variant, verbose_cycles=verbose_cycles, idle_loop_skip=True)
 
         log.info(f"Initialized CPU: {self.cpu.variant_name}")
 
@@ -598,6 +674,10 @@ class C64:
         self.pygame_surface = None
         self.pygame_available = False
 
+        # Frame renderer for pygame/screenshots: "classic" or "numpy" (see set_renderer)
+        self.renderer: str = "classic"
+        self.frame_renderer: Optional[LineRenderer] = None
+
         # Screen dirty tracking for optimized rendering
         self.dirty_tracker = ScreenDirtyTracker()
 
@@ -605,12 +685,11 @@ class C64:
         self.basic_logging_enabled = False
         self.last_pc_region = None
 
-        # BASIC ready detection (set by pc_callback when PC enters BASIC ROM range)
+        # BASIC ready detection (set by a breakpoint when PC enters BASIC ROM range)
         self._basic_ready = False
         self._stop_on_basic = False
 
-        # KERNAL keyboard input detection (PC at $E5CF-$E5D6 = waiting for input)
-        self._kernal_waiting_for_input = False
+        # Stop when PC reaches the KERNAL keyboard input loop ($E5CF-$E5D6)
         self._stop_on_kernal_input = False
 
         # Execution timing for speedup calculation
@@ -742,6 +821,7 @@ class C64:
             vic=self.vic,
             sid=self.sid,
             dirty_tracker=self.dirty_tracker,
+            glyph_atlas=self.vic.glyph_atlas,
         )
         # Hook up the memory handler so CPU RAM accesses go through C64Memory
         self.cpu.ram.memory_handler = self.memory
@@ -749,25 +829,28 @@ class C64:
         # Give VIC access to C64Memory for VBlank snapshots
         self.vic.set_memory(self.memory)
 
-        # Set up periodic update callback for VIC, CIA1, CIA2, and disk drive
-        # VIC checks cycle count and triggers raster IRQs
-        # CIA1 counts down timers and triggers timer IRQs
-        # CIA2 counts down timers and triggers NMIs
+        # Peripheral events: execute() leaves its fast path only when one is due
+        # VIC: raster compare line and frame start (VBlank), see attach_scheduler
+        # CIA1/CIA2: next timer underflow or TOD tick, see next_event_cycle
         # IEC bus and drive: The bus updates happen immediately when CIA2 port A
-        # is written, and the drive CPU is synchronized at that time. The periodic
-        # callback just ensures regular updates for VIC/CIA timers.
-        def update_peripherals():
-            self.vic.update()
-            self.cia1.update()
-            self.cia2.update()
-            # Note: Drive CPU sync is now handled per-instruction via
-            # post_instruction_callback for cycle-accurate IEC timing
-            # In headless mode, clear frame_complete since there's no render thread
-            if self.display_mode == "headless" and self.vic.frame_complete.is_set():
+        # is written, and the drive CPU is synchronized at that time.
+        # Note: Drive CPU sync is handled per-instruction via
+        # post_instruction_callback for cycle-accurate IEC timing
+        self.scheduler = EventScheduler()
+        self.cpu.scheduler = self.scheduler
+        self.vic.attach_scheduler(self.scheduler)
+        self.cia1.attach_scheduler(self.scheduler)
+        self.cia2.attach_scheduler(self.scheduler)
+
+        if self.display_mode == "headless":
+            # No render thread consumes frame_complete: clear it one line after VBlank
+            def clear_frame_complete(cycle: int) -> None:
                 self.vic.frame_complete.clear()
+                frame_event.schedule(cycle + self.vic.cycles_per_frame)
 
-        self.cpu.periodic_callback = update_peripherals
-        self.cpu.periodic_callback_interval = self.vic.cycles_per_line   # Update every raster line
+            frame_event = self.scheduler.add(clear_frame_complete, "headless-frame")
+            next_frame = (self.cpu.cycles_executed // self.vic.cycles_per_frame + 1) * self.vic.cycles_per_frame
+            frame_event.schedule(next_frame + self.vic.cycles_per_line)
 
         log.info("All ROMs loaded into memory")
 
@@ -777,7 +860,7 @@ class C64:
         log.info(f"PC initialized to ${self.cpu.PC:04X} (from reset vector at ${self.RESET_VECTOR_ADDR:04X})")
 
     def attach_drive(self, drive_rom_path: Optional[Path] = None, disk_path: Optional[Path] = None,
-                      runner: str = "threaded") -> bool:
+                      runner: str = "threaded", gcr_cache_dir: Optional[Path] = None) -> bool:
         """Attach a 1541 disk drive to the IEC bus.
 
         Supports multiple ROM formats:
@@ -790,11 +873,36 @@ class C64:
             runner: Drive execution mode:
                     - "threaded" (default): Uses ThreadedIECBus for atomic state
                     - "synchronous": Cycle-accurate emulation
+                    - "speculative": Cycle-accurate, drive runs ahead and rolls back on IEC conflicts
                     - "multiprocess": Drive runs in separate process (bypasses GIL)
+                    - "virtual": No 1541 emulation, KERNAL file I/O is trapped
+                      and served from the D64 image (drive_rom_path is unused)
+            gcr_cache_dir: Optional directory for caching GCR-encoded tracks
+                between disk inserts (unused by the virtual runner)
 
         Returns:
             True if drive attached successfully, False otherwise
         """
+        if runner == "virtual":
+            # Virtual mode: no drive CPU or IEC bus, so no 1541 ROM either.
+            # Breakpoints on the KERNAL's LOAD/SAVE/OPEN/CHKIN/... routines
+            # serve device 8 straight from the disk image
+            self.drive_runner = runner
+            self.drive8 = VirtualDrive(device_number=8)
+            if disk_path is not None:
+                try:
+                    self.drive8.insert_disk(disk_path)
+                except Exception as e:
+                    log.error(f"Failed to insert disk: {e}")
+            self.drive8.install(
+                self.cpu, self.kernal_rom,
+                kernal_visible=lambda: bool(self.memory.port & 0x02),  # HIRAM
+            )
+            self.cpu.breakpoint_callback = self._breakpoint_hit
+            self.drive_enabled = True
+            log.info("1541 drive 8 attached in VIRTUAL mode (KERNAL traps)")
+            return True
+
         rom_path = drive_rom_path
         rom_path_e000 = None
 
@@ -872,6 +980,9 @@ class C64:
             self.iec_bus.connect_c64(self.cia2)
             self.cia2.set_iec_bus(self.iec_bus)
 
+            # The drive starts its clock at the published C64 clock
+            self._iec_shared_state.set_c64_cycles(self.cpu.cycles_executed)
+
             # Create and start drive subprocess
             self.drive8 = MultiprocessDrive1541(device_number=8)
             self.drive8.start_process(
@@ -879,56 +990,15 @@ class C64:
                 rom_path_e000=rom_path_e000,
                 disk_path=disk_path,
                 shared_state=self._iec_shared_state,
+                gcr_cache_dir=gcr_cache_dir,
             )
 
-            # Wire up tick synchronization Events
-            tick_request, tick_done = self.drive8.get_tick_events()
-            self.iec_bus.set_tick_events(tick_request, tick_done)
-
             self.drive_enabled = True
 
-            # Set up synchronous tick-based execution
-            # Similar to threaded mode but with batching to reduce IPC overhead
-            self._mp_accumulated_cycles = 0
-            self._mp_batch_size = 100  # Cycles per IPC call (balance timing vs overhead)
-
-            def sync_multiprocess(cpu, cycles):
-                """Accumulate cycles and sync with drive subprocess."""
-                if self.drive8 and self._iec_shared_state:
-                    # Update IEC bus state
-                    self.iec_bus.update()
-
-                    # Accumulate cycles
-                    self._mp_accumulated_cycles += cycles
-
-                    # When batch is full, sync with drive
-                    if self._mp_accumulated_cycles >= self._mp_batch_size:
-                        batch = self._mp_accumulated_cycles
-                        self._mp_accumulated_cycles = 0
-
-                        # Update C64 cycle counter
-                        self._iec_shared_state.set_c64_cycles(cpu.cycles_executed)
-
-                        # Wait for drive to catch up to our cycle count
-                        tick_request, tick_done = self.drive8.get_tick_events()
-                        target_cycles = cpu.cycles_executed
-
-                        # Signal drive and wait for it to process
-                        import time
-                        max_wait = 0.1  # seconds
-                        start = time.time()
-                        while time.time() - start < max_wait:
-                            tick_request.set()
-                            drive_cycles = self._iec_shared_state.get_drive_cycles()
-                            if drive_cycles >= target_cycles - 50:
-                                break
-                            time.sleep(0.00001)  # 10us
-
-                        # Read bus state after drive processed
-                        self.iec_bus.atn, self.iec_bus.clk, self.iec_bus.data = \
-                            self._iec_shared_state.get_bus_state(is_drive=False)
-
-            self.cpu.post_tick_callback = sync_multiprocess
+            # No per-tick sync: CIA2 port A accesses exchange cycle-stamped
+            # transitions with the drive, and a scheduler event keeps the
+            # drive's view of the C64 clock current
+            self.iec_bus.attach_scheduler(self.scheduler)
             log.info(f"1541 drive 8 attached in MULTIPROCESS mode (ROM: {rom_path.name})")
             return True
 
@@ -939,7 +1009,15 @@ class C64:
             self.cia2.set_iec_bus(self.iec_bus)
 
             # Create threaded drive 8
-            self.drive8 = ThreadedDrive1541(device_number=8)
+            self.drive8 = ThreadedDrive1541(device_number=8, gcr_cache_dir=gcr_cache_dir)
+        elif runner == "speculative":
+            # Speculative mode: Drive runs ahead in batches, rolled back on IEC conflicts
+            self.iec_bus = SpeculativeIECBus()
+            self.iec_bus.connect_c64(self.cia2)
+            self.cia2.set_iec_bus(self.iec_bus)
+
+            # Create standard drive 8
+            self.drive8 = Drive1541(device_number=8, gcr_cache_dir=gcr_cache_dir)
         else:
             # Synchronous mode: Cycle-accurate but slower
             self.iec_bus = IECBus()
@@ -947,7 +1025,7 @@ class C64:
             self.cia2.set_iec_bus(self.iec_bus)
 
             # Create standard drive 8
-            self.drive8 = Drive1541(device_number=8)
+            self.drive8 = Drive1541(device_number=8, gcr_cache_dir=gcr_cache_dir)
 
         # Create a separate CPU for the drive (for threaded/synchronous modes)
         # The 1541 uses a full 6502 (not 6510)
@@ -1005,6 +1083,12 @@ class C64:
             self.cpu.post_tick_callback = sync_drive_on_tick_threaded
             # Note: Not starting drive thread - running synchronously with ThreadedIECBus
             log.info(f"1541 drive 8 attached with ThreadedIECBus (ROM: {rom_path.name})")
+        elif runner == "speculative":
+            # Speculative mode: no per-tick hook, so the C64 keeps the block
+            # engine and idle-loop skipping; a scheduler event runs the drive
+            # ahead and CIA2 port A accesses resolve the bus at their cycle
+            self.iec_bus.attach_scheduler(self.scheduler)
+            log.info(f"1541 drive 8 attached in SPECULATIVE mode (ROM: {rom_path.name})")
         else:
             # Synchronous mode: Set up cycle-accurate IEC synchronization
             # using post_tick_callback. The tick() function is called every
@@ -1063,6 +1147,8 @@ class C64:
         # Stop multiprocess drive if running
         if self.drive8 is not None:
             if isinstance(self.drive8, MultiprocessDrive1541):
+                if isinstance(self.iec_bus, MultiprocessIECBus):
+                    self.iec_bus.close()
                 self.drive8.stop_process()
             elif isinstance(self.drive8, ThreadedDrive1541):
                 self.drive8.stop_thread()
@@ -1629,6 +1715,94 @@ class C64:
         self._last_sample_cycles = current_cycles
         return True
 
+    def set_renderer(self, renderer: str) -> None:
+        """Select the frame renderer used by the pygame display.
+
+        Arguments:
+            renderer: "classic" (per-pixel/glyph-cached) or "numpy" (vectorized).
+                      Falls back to classic if NumPy is not installed.
+        """
+        if renderer not in ("classic", "numpy"):
+            raise ValueError(f"Unknown renderer: {renderer}")
+        if renderer == "numpy" and not NUMPY_AVAILABLE:
+            log.warning("NumPy not available, falling back to classic renderer")
+            renderer = "classic"
+        self.renderer = renderer
+        self.frame_renderer = None
+
+    def render_vic_frame(self):
+        """Render the current VIC frame with the NumPy renderer.
+
+        Uses the VIC's VBlank snapshots when available (like the pygame
+        display), live RAM and color RAM otherwise. Once a frame has
+        completed, each line is drawn with the registers latched for its
+        raster line, and only changed lines are redrawn.
+
+        Returns:
+            uint8 array of shape (total_height, total_width) holding COLORS
+            indices (reused by the next call)
+        """
+        if self.frame_renderer is None:
+            self.frame_renderer = LineRenderer(self.vic)
+
+        vic = self.vic
+        ram = self.memory.snapshot_ram()
+        if vic.ram_snapshot is not None:
+            # The snapshot only covers the 16KB bank the VIC saw at VBlank
+            ram = bytearray(ram)
+            bank = vic.ram_snapshot_bank
+            ram[bank:bank + len(vic.ram_snapshot)] = vic.ram_snapshot
+        color_ram = vic.color_snapshot if vic.color_snapshot is not None else self.memory.ram_color
+        if vic.line_snapshot is not None:
+            return self.frame_renderer.render_lines(ram, color_ram, *vic.line_snapshot)
+        return self.frame_renderer.render(ram, color_ram)
+
+    def start_capture(self, target: str | Path, output_format: str = "auto", every: int = 1, workers: int = 2) -> None:
+        """Write completed frames to target in the background (see c64.frame_sink).
+
+        Arguments:
+            target: Raw RGB24 file, PNG directory or %-pattern, or encoder command
+            output_format: "raw", "png", "pipe" or "auto" (raw for .raw/.rgb, else png)
+            every: Capture every Nth frame
+            workers: Render/encode threads
+
+        Raises:
+            ImportError: NumPy is not installed
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("Frame capture requires NumPy (pip install numpy, or the 'video' extra)")
+        self.stop_capture()
+        if output_format == "auto":
+            output_format = "raw" if Path(target).suffix.lower() in (".raw", ".rgb") else "png"
+        self.vic.frame_sink = FrameSink(self.vic, target, output_format, every=every, workers=workers)
+
+    def stop_capture(self) -> None:
+        """Finish writing queued frames and close the capture output, if any."""
+        sink, self.vic.frame_sink = self.vic.frame_sink, None
+        if sink is not None:
+            sink.close()
+
+    def save_screenshot(self, path: Path) -> None:
+        """Save the current VIC frame as PNG, or raw RGB24 for .raw/.rgb paths.
+
+        Requires NumPy.
+        """
+        frame = self.render_vic_frame()
+        if Path(path).suffix.lower() in (".raw", ".rgb"):
+            self.frame_renderer.save_raw(path, frame)
+        else:
+            self.frame_renderer.save_png(path, frame)
+
+    @staticmethod
+    def _glyph_surface(pygame, charset, glyph_surfaces: dict, char_code: int, fg: int, bg: int):
+        """Render one atlas glyph in fg/bg to an 8x8 surface and cache it."""
+        glyph_surf = pygame.Surface((8, 8))
+        cell_colors = (COLORS[bg], COLORS[fg])
+        for i, bit in enumerate(charset.hires[char_code]):
+            glyph_surf.set_at((i & 7, i >> 3), cell_colors[bit])
+        glyph_surfaces[(char_code, fg, bg)] = glyph_surf
+        return glyph_surf
+
     def _update_pygame_title(self, pygame) -> None:
         """Update pygame window title with speed stats (rate-limited to once per second)."""
         if not self._record_speed_sample():
@@ -2085,33 +2259,35 @@ class C64:
         The KERNAL keyboard input loop is at $E5CF-$E5D6.
         When PC is in this range, the system is waiting for user input.
         """
-        return self._kernal_waiting_for_input
+        return 0xE5CF <= self.cpu.PC <= 0xE5D6
 
-    def _pc_callback(self, new_pc: int) -> None:
-        """PC change callback - detects when BASIC is ready or KERNAL is waiting for input.
+    def _breakpoint_hit(self, cpu, pc: int) -> None:
+        """Breakpoint callback - detects when BASIC is ready or KERNAL is waiting for input.
 
-        This is called by the CPU every time PC changes.
+        Called by the CPU at instruction boundaries when PC reaches one of the
+        ranges watched by _setup_breakpoints(), or one of the virtual drive's
+        KERNAL traps.
         """
-        # Check if PC is in BASIC ROM range
-        if BASIC_ROM_START <= new_pc <= BASIC_ROM_END:
+        # Served virtual drive calls have already returned to the caller
+        if isinstance(self.drive8, VirtualDrive) and self.drive8.trap(cpu, pc):
+            return
+
+        # PC entered BASIC ROM - latch and stop watching the range
+        if BASIC_ROM_START <= pc <= BASIC_ROM_END:
             self._basic_ready = True
+            cpu.remove_breakpoint(range(BASIC_ROM_START, BASIC_ROM_END + 1))
             if self._stop_on_basic:
                 raise StopIteration("BASIC is ready")
 
-        # Check if PC is in KERNAL keyboard input loop ($E5CF-$E5D6)
+        # PC reached the KERNAL keyboard input loop ($E5CF-$E5D6)
         # This is the GETIN routine that waits for keyboard input
-        if 0xE5CF <= new_pc <= 0xE5D6:
-            self._kernal_waiting_for_input = True
-            if self._stop_on_kernal_input:
-                raise StopIteration("KERNAL waiting for input")
-        else:
-            # Reset when PC leaves the input loop
-            self._kernal_waiting_for_input = False
+        if 0xE5CF <= pc <= 0xE5D6 and self._stop_on_kernal_input:
+            raise StopIteration("KERNAL waiting for input")
 
-    def _setup_pc_callback(
+    def _setup_breakpoints(
         self, stop_on_basic: bool = False, stop_on_kernal_input: bool = False
     ) -> None:
-        """Set up the PC callback for BASIC/KERNAL detection.
+        """Watch the BASIC ROM and KERNAL input loop with CPU breakpoints.
 
         Arguments:
             stop_on_basic: If True, raise StopIteration when BASIC is ready
@@ -2119,11 +2295,20 @@ class C64:
         """
         self._stop_on_basic = stop_on_basic
         self._stop_on_kernal_input = stop_on_kernal_input
-        self.cpu.pc_callback = self._pc_callback
-
-    def _clear_pc_callback(self) -> None:
-        """Remove the PC callback and reset detection flags."""
-        self.cpu.pc_callback = None
+        self.cpu.breakpoint_callback = self._breakpoint_hit
+        if not self._basic_ready:
+            self.cpu.add_breakpoint(range(BASIC_ROM_START, BASIC_ROM_END + 1))
+        if stop_on_kernal_input:
+            self.cpu.add_breakpoint(range(0xE5CF, 0xE5D7))
+
+    def _clear_breakpoints(self) -> None:
+        """Remove the BASIC/KERNAL breakpoints and reset detection flags."""
+        self.cpu.clear_breakpoints()
+        if isinstance(self.drive8, VirtualDrive):
+            # The virtual drive's KERNAL traps stay in place
+            self.drive8.add_traps()
+        else:
+            self.cpu.breakpoint_callback = None
         self._stop_on_basic = False
         self._stop_on_kernal_input = False
 
@@ -2199,9 +2384,9 @@ class C64:
         log.info(f"Starting execution at PC=${self.cpu.PC:04X}")
         log.info("Press Ctrl+C to stop")
 
-        # Set up PC callback for BASIC/KERNAL detection if requested
+        # Set up breakpoints for BASIC/KERNAL detection if requested
         if stop_on_basic or stop_on_kernal_input:
-            self._setup_pc_callback(
+            self._setup_breakpoints(
                 stop_on_basic=stop_on_basic, stop_on_kernal_input=stop_on_kernal_input
             )
 
@@ -2362,7 +2547,7 @@ class C64:
                 raise cpu_error
 
         except StopIteration as e:
-            # PC callback requested stop (e.g., BASIC is ready or KERNAL waiting for input)
+            # Breakpoint requested stop (e.g., BASIC is ready or KERNAL waiting for input)
             log.info(f"Execution stopped at PC=${self.cpu.PC:04X} ({e})")
         except errors.CPUCycleExhaustionError as e:
             log.info(f"CPU execution completed: {e}")
@@ -2393,8 +2578,10 @@ class C64:
             # Record execution end time for speedup calculation
             import time
             self._execution_end_time = time.perf_counter()
-            # Clean up PC callback
-            self._clear_pc_callback()
+            # Clean up breakpoints
+            self._clear_breakpoints()
+            # Flush captured frames
+            self.stop_capture()
             # Show screen buffer on termination
             self.show_screen()
             # Clean up drive subprocess if running
@@ -2684,6 +2871,43 @@ class C64:
         for line in self.disassemble_at(address, num_instructions):
             print(line)
 
+    def enable_profiler(self) -> ExecutionProfiler:
+        """Attach an execution profiler to the CPU (see mos6502.profiler).
+
+        Returns:
+            The attached ExecutionProfiler
+        """
+        if self.cpu.profiler is None:
+            self.cpu.profiler = ExecutionProfiler()
+        return self.cpu.profiler
+
+    def profile_report(self, limit: int = 20) -> str:
+        """Format the profile collected since enable_profiler().
+
+        Hot spots are disassembled with disassemble_at() using the current
+        memory banking.
+
+        Arguments:
+            limit: Number of hot addresses and opcodes to list
+
+        Returns:
+            Report text, or an empty string if no profiler is attached
+        """
+        profiler = self.cpu.profiler
+        if profiler is None:
+            return ""
+        return profiler.report(
+            limit=limit,
+            ranges=self.PROFILE_RANGES,
+            disassemble=lambda address: self.disassemble_at(address, 1)[0],
+        )
+
+    def show_profile(self, limit: int = 20) -> None:
+        """Display the execution profile."""
+        print("\nExecution profile:")
+        print("-" * 60)
+        print(self.profile_report(limit))
+
     def petscii_to_ascii(self, petscii_code: int) -> str:
         """Convert PETSCII code to displayable ASCII character.
 
@@ -2723,7 +2947,7 @@ class C64:
 
     def show_screen(self) -> None:
         """Display the C64 screen (40x25 characters from screen RAM at $0400)."""
-        screen_start = 0x0400
+        screen_start = self.dirty_tracker.screen_base
         screen_end = 0x07E7
         cols = 40
         rows = 25
@@ -2753,7 +2977,7 @@ class C64:
         """Render C64 screen to terminal with dirty region optimization."""
         import sys as _sys
 
-        screen_start = 0x0400
+        screen_start = self.dirty_tracker.screen_base
         cols = 40
         rows = 25
 
@@ -2826,7 +3050,7 @@ class C64:
         """
         import sys as _sys
 
-        screen_start = 0x0400
+        screen_start = self.dirty_tracker.screen_base
         cols = 40
         rows = 25
 
@@ -2899,7 +3123,7 @@ class C64:
         # Record speed sample for rolling average (once per second)
         self._record_speed_sample()
 
-        screen_start = 0x0400
+        screen_start = self.dirty_tracker.screen_base
         cols = 40
         rows = 25
 
@@ -3353,10 +3577,6 @@ class C64:
                         return wrapper_self.snapshot[index] & 0x0F
                     return wrapper_self.live_color[index] & 0x0F
 
-            # Initialize glyph cache if needed
-            if not hasattr(self, '_glyph_cache'):
-                self._glyph_cache = {}
-
             vic = self.vic
             ram_snapshot = vic.ram_snapshot
             ram_snapshot_bank = vic.ram_snapshot_bank
@@ -3396,9 +3616,14 @@ class C64:
             x_origin = vic.border_left - hscroll
             y_origin = vic.border_top - vscroll
 
-            if den and not bmm and not ecm and not mcm:
-                # Standard text mode - cached glyph rendering
-                char_rom = vic.char_rom
+            if self.renderer == "numpy":
+                # Whole frame (border, all modes, sprites) as one array blit
+                frame = self.render_vic_frame()
+                self.frame_renderer.blit(surface, frame)
+            elif den and not bmm and not ecm and not mcm:
+                # Standard text mode - glyph surfaces cached on the atlas charset
+                charset = vic.glyph_atlas.charset(self.cpu.ram, vic_bank, char_bank_offset)
+                glyph_surfaces = charset.cache.setdefault("pygame", {})
                 for row in range(25):
                     for col in range(40):
                         cell_addr = screen_base + row * 40 + col
@@ -3408,30 +3633,18 @@ class C64:
                         reverse = bool(char_code & 0x80)
                         char_code &= 0x7F
 
-                        glyph_addr = (char_code * 8) + char_bank_offset
-                        glyph_addr &= 0x0FFF
-                        glyph = char_rom[glyph_addr : glyph_addr + 8]
-
                         if reverse:
                             fg, bg = bg_color, color
                         else:
                             fg, bg = color, bg_color
 
-                        cache_key = (tuple(glyph), fg, bg)
-                        if cache_key not in self._glyph_cache:
-                            glyph_surf = pygame.Surface((8, 8))
-                            fg_rgb = COLORS[fg]
-                            bg_rgb = COLORS[bg]
-                            for y in range(8):
-                                line = glyph[y]
-                                for x in range(8):
-                                    bit = (line >> (7 - x)) & 0x01
-                                    glyph_surf.set_at((x, y), fg_rgb if bit else bg_rgb)
-                            self._glyph_cache[cache_key] = glyph_surf
+                        glyph_surf = glyph_surfaces.get((char_code, fg, bg))
+                        if glyph_surf is None:
+                            glyph_surf = self._glyph_surface(pygame, charset, glyph_surfaces, char_code, fg, bg)
 
                         base_x = x_origin + col * 8
                         base_y = y_origin + row * 8
-                        surface.blit(self._glyph_cache[cache_key], (base_x, base_y))
+                        surface.blit(glyph_surf, (base_x, base_y))
             elif den:
                 # Other modes - fall back to VIC for now
                 ram_wrapper = RAMWrapper(ram_snapshot, ram_snapshot_bank, self.cpu.ram)
@@ -3479,10 +3692,6 @@ class C64:
                 self.vic.frame_complete.clear()
                 self._frame_count = getattr(self, '_frame_count', 0) + 1
 
-            # Initialize glyph cache if needed
-            if not hasattr(self, '_glyph_cache'):
-                self._glyph_cache = {}
-
             # Get RAM snapshot or live RAM
             vic = self.vic
             ram_snapshot = vic.ram_snapshot
@@ -3531,9 +3740,14 @@ class C64:
             x_origin = vic.border_left - hscroll
             y_origin = vic.border_top - vscroll
 
-            if den and not bmm and not ecm and not mcm:
-                # Standard text mode - use cached glyph rendering
-                char_rom = vic.char_rom
+            if self.renderer == "numpy":
+                # Whole frame (border, all modes, sprites) as one array blit
+                frame = self.render_vic_frame()
+                self.frame_renderer.blit(surface, frame)
+            elif den and not bmm and not ecm and not mcm:
+                # Standard text mode - glyph surfaces cached on the atlas charset
+                charset = vic.glyph_atlas.charset(self.cpu.ram, vic_bank, char_bank_offset)
+                glyph_surfaces = charset.cache.setdefault("pygame", {})
 
                 for row in range(25):
                     for col in range(40):
@@ -3545,33 +3759,20 @@ class C64:
                         reverse = bool(char_code & 0x80)
                         char_code &= 0x7F
 
-                        glyph_addr = (char_code * 8) + char_bank_offset
-                        glyph_addr &= 0x0FFF
-                        glyph = char_rom[glyph_addr : glyph_addr + 8]
-
                         if reverse:
                             fg, bg = bg_color, color
                         else:
                             fg, bg = color, bg_color
 
                         # Cache lookup
-                        cache_key = (tuple(glyph), fg, bg)
-                        if cache_key not in self._glyph_cache:
-                            # Render glyph to cache
-                            glyph_surf = pygame.Surface((8, 8))
-                            fg_rgb = COLORS[fg]
-                            bg_rgb = COLORS[bg]
-                            for y in range(8):
-                                line = glyph[y]
-                                for x in range(8):
-                                    bit = (line >> (7 - x)) & 0x01
-                                    glyph_surf.set_at((x, y), fg_rgb if bit else bg_rgb)
-                            self._glyph_cache[cache_key] = glyph_surf
+                        glyph_surf = glyph_surfaces.get((char_code, fg, bg))
+                        if glyph_surf is None:
+                            glyph_surf = self._glyph_surface(pygame, charset, glyph_surfaces, char_code, fg, bg)
 
                         # Blit cached glyph
                         base_x = x_origin + col * 8
                         base_y = y_origin + row * 8
-                        surface.blit(self._glyph_cache[cache_key], (base_x, base_y))
+                        surface.blit(glyph_surf, (base_x, base_y))
 
             elif den:
                 # Other modes - fall back to VIC renderer for now
@@ -3597,10 +3798,9 @@ class C64:
             # Log render time periodically
             render_time = _time.perf_counter() - render_start
             if self._frame_count <= 5 or self._frame_count % 60 == 0:
-                cache_size = len(self._glyph_cache)
                 log.critical(
                     f"*** RENDER: {render_time*1000:.1f}ms "
-                    f"(frame {self._frame_count}, cache={cache_size}) ***"
+                    f"(frame {self._frame_count}, charsets={len(vic.glyph_atlas)}) ***"
                 )
 
         except Exception as e:
@@ -4573,6 +4773,8 @@ def main() -> int | None:
     parser = argparse.ArgumentParser(description="Commodore 64 Emulator")
     C64.args(parser)
     args = parser.parse_args()
+    if args.capture and not NUMPY_AVAILABLE:
+        parser.error("--capture requires NumPy (pip install numpy, or the 'video' extra)")
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -4600,6 +4802,9 @@ def main() -> int | None:
     try:
         # Initialize C64
         c64 = C64(rom_dir=args.rom_dir, display_mode=args.display, scale=args.scale, enable_irq=not args.no_irq, video_chip=args.video_chip)
+        c64.set_renderer(args.renderer)
+        if args.capture:
+            c64.start_capture(args.capture, args.capture_format, every=args.capture_every, workers=args.capture_workers)
         log.info(f"VIC-II chip: {c64.video_chip} ({c64.video_timing.refresh_hz:.2f}Hz, {c64.video_timing.cpu_freq/1e6:.3f}MHz)")
 
         # Start with minimal logging - will auto-enable when BASIC ROM is entered
@@ -4620,7 +4825,9 @@ def main() -> int | None:
         if disk_path and not getattr(args, 'no_drive', False):
             drive_rom = getattr(args, 'drive_rom', None)
             drive_runner = getattr(args, 'drive_runner', 'threaded')
-            if c64.attach_drive(drive_rom_path=drive_rom, disk_path=disk_path, runner=drive_runner):
+            gcr_cache = getattr(args, 'gcr_cache', None)
+            if c64.attach_drive(drive_rom_path=drive_rom, disk_path=disk_path, runner=drive_runner,
+                                gcr_cache_dir=gcr_cache):
                 log.info(f"Disk inserted: {disk_path.name} (runner: {drive_runner})")
             else:
                 log.info("No 1541 ROM found - disk drive disabled")
@@ -4709,6 +4916,9 @@ def main() -> int | None:
                 c64.dump_memory(args.dump_mem[0], args.dump_mem[1])
             return 0
 
+        if args.profile:
+            c64.enable_profiler()
+
         # Dump initial state if verbose
         if args.verbose:
             c64.dump_registers()
@@ -4755,6 +4965,9 @@ def main() -> int | None:
         if args.show_screen:
             c64.show_screen()
 
+        if args.profile:
+            c64.show_profile()
+
         return 0
 
     except Exception as e:
@@ -74,6 +74,99 @@ def benchmark_c64(rom_dir: str, max_cycles: int, video_chip: str = "6569", verbo
     return stats["elapsed_seconds"], stats["cycles_executed"]
 
 
+def benchmark_release_handlers(rom_dir: str, max_cycles: int, video_chip: str = "6569") -> dict[str, tuple[float, int]]:
+    """Compare release (logging-free) handlers against the logging handlers.
+
+    Both runs execute the same cycles from reset with logging disabled, so the
+    difference is the cost of the trace calls alone.
+
+    Args:
+        rom_dir: Path to ROM directory
+        max_cycles: Cycles to execute per run
+        video_chip: VIC-II chip variant ("6569", "6567R8", "6567R56A", "PAL", "NTSC")
+
+    Returns:
+        {"logging": (elapsed_seconds, cycles_executed), "release": (...)}
+    """
+    results = {}
+    for mode in ("logging", "release"):
+        c64 = C64(rom_dir=rom_dir, display_mode="headless", video_chip=video_chip)
+        c64.cpu.release_handlers = mode == "release"
+        c64.cpu.reset()
+
+        start_time = time.perf_counter()
+        try:
+            c64.cpu.execute(cycles=max_cycles)
+        except errors.CPUCycleExhaustionError:
+            pass
+        results[mode] = (time.perf_counter() - start_time, c64.cpu.cycles_executed)
+
+    return results
+
+
+# Registers hit by raster-polling and keyboard/timer loops
+IO_BENCHMARK_ADDRESSES = (0xD012, 0xD011, 0xD019, 0xDC01, 0xDC04, 0xDC0D, 0xDD00, 0xD800)
+
+# $C000: SEI / wait: LDA $D012 / CMP #$FF / BNE wait / LDA $DC0D / JMP wait
+IO_BENCHMARK_PROGRAM = bytes([
+    0x78,
+    0xAD, 0x12, 0xD0,
+    0xC9, 0xFF,
+    0xD0, 0xF9,
+    0xAD, 0x0D, 0xDC,
+    0x4C, 0x01, 0xC0,
+])
+
+
+def benchmark_io(rom_dir: str, accesses: int, max_cycles: int, video_chip: str = "6569") -> dict[str, tuple[float, int]]:
+    """Benchmark the $D000-$DFFF I/O path.
+
+    Times direct C64Memory reads and writes of common VIC/CIA/color RAM
+    registers, then a CPU raster-polling loop that spends nearly all of its
+    time reading $D012.
+
+    Args:
+        rom_dir: Path to ROM directory
+        accesses: Memory reads (and writes) per direct access run
+        max_cycles: Cycles to run the raster-polling loop
+        video_chip: VIC-II chip variant ("6569", "6567R8", "6567R56A", "PAL", "NTSC")
+
+    Returns:
+        {"read": (elapsed_seconds, accesses), "write": (...), "raster poll": (elapsed_seconds, cycles_executed)}
+    """
+    c64 = C64(rom_dir=rom_dir, display_mode="headless", video_chip=video_chip)
+    c64.cpu.reset()
+    memory = c64.memory
+    addresses = IO_BENCHMARK_ADDRESSES * (accesses // len(IO_BENCHMARK_ADDRESSES))
+
+    results = {}
+    read = memory.read
+    start_time = time.perf_counter()
+    for addr in addresses:
+        read(addr)
+    results["read"] = (time.perf_counter() - start_time, len(addresses))
+
+    # Color RAM and a harmless VIC register (border color)
+    write = memory.write
+    start_time = time.perf_counter()
+    for addr in addresses:
+        write(0xD800 | (addr & 0x3FF), 0x01)
+        write(0xD020, 0x0E)
+    results["write"] = (time.perf_counter() - start_time, 2 * len(addresses))
+
+    c64.cpu.ram.data[0xC000:0xC000 + len(IO_BENCHMARK_PROGRAM)] = IO_BENCHMARK_PROGRAM
+    c64.cpu.PC = 0xC000
+    cycles_before = c64.cpu.cycles_executed
+    start_time = time.perf_counter()
+    try:
+        c64.cpu.execute(cycles=max_cycles)
+    except errors.CPUCycleExhaustionError:
+        pass
+    results["raster poll"] = (time.perf_counter() - start_time, c64.cpu.cycles_executed - cycles_before)
+
+    return results
+
+
 def benchmark_boot(rom_dir: str, video_chip: str = "6569", debug: bool = False, verbose_cycles: bool = False, throttle: bool = False) -> tuple[float, int, int, str]:
     """Benchmark C64 boot time until BASIC is ready.
 
@@ -94,23 +187,22 @@ def benchmark_boot(rom_dir: str, video_chip: str = "6569", debug: bool = False,
     basic_entry_pc = [0]
     stop_requested = [False]
 
-    # Set up callback to detect first BASIC ROM entry
-    # For throttled mode, we use a flag; for non-throttled, we raise StopIteration
-    def detect_basic_throttled(pc: int) -> None:
-        if basic_entry_pc[0] == 0 and BASIC_ROM_START <= pc <= BASIC_ROM_END:
-            basic_entry_pc[0] = pc
-            stop_requested[0] = True
+    # Watch the BASIC ROM with a CPU breakpoint (checked at instruction boundaries)
+    # For throttled mode, a callback sets a flag; for non-throttled, the CPU
+    # raises CPUBreakpointError on the first hit
+    basic_rom = range(BASIC_ROM_START, BASIC_ROM_END + 1)
+    c64.cpu.add_breakpoint(basic_rom)
 
-    def detect_basic_immediate(pc: int) -> None:
-        if basic_entry_pc[0] == 0 and BASIC_ROM_START <= pc <= BASIC_ROM_END:
-            basic_entry_pc[0] = pc
-            raise StopIteration
+    def detect_basic_throttled(cpu, pc: int) -> None:
+        basic_entry_pc[0] = pc
+        stop_requested[0] = True
+        cpu.remove_breakpoint(basic_rom)
 
     start_time = time.perf_counter()
 
     if throttle:
         # Use frame governor to throttle to real-time
-        c64.cpu.pc_callback = detect_basic_throttled
+        c64.cpu.breakpoint_callback = detect_basic_throttled
         governor = FrameGovernor(
             fps=c64.video_timing.refresh_hz,
             enabled=True
@@ -126,17 +218,19 @@ def benchmark_boot(rom_dir: str, video_chip: str = "6569", debug: bool = False,
             governor.throttle()
     else:
         # Run at maximum speed until BASIC entry
-        c64.cpu.pc_callback = detect_basic_immediate
         try:
             c64.cpu.execute(cycles=INFINITE_CYCLES)
-        except (errors.CPUCycleExhaustionError, StopIteration):
+        except errors.CPUCycleExhaustionError:
             pass
+        except errors.CPUBreakpointError as e:
+            basic_entry_pc[0] = e.address
 
     boot_cycles = c64.cpu.cycles_executed
 
     # Run additional cycles to let screen render the BASIC prompt
     extra_cycles = 100_000
-    c64.cpu.pc_callback = None  # Disable callback
+    c64.cpu.clear_breakpoints()  # Disable detection
+    c64.cpu.breakpoint_callback = None
 
     if throttle:
         cycles_remaining = extra_cycles
@@ -237,19 +331,16 @@ def benchmark_disk_load(
 
     # First boot to BASIC
     print("Booting to BASIC...", flush=True)
-    def detect_basic_immediate(pc: int) -> None:
-        if BASIC_ROM_START <= pc <= BASIC_ROM_END:
-            raise StopIteration
-
-    c64.cpu.pc_callback = detect_basic_immediate
+    basic_rom = range(BASIC_ROM_START, BASIC_ROM_END + 1)
+    c64.cpu.add_breakpoint(basic_rom)
 
     # Boot to BASIC
     if throttle:
         stop_requested = [False]
-        def detect_basic_throttled(pc: int) -> None:
-            if BASIC_ROM_START <= pc <= BASIC_ROM_END:
-                stop_requested[0] = True
-        c64.cpu.pc_callback = detect_basic_throttled
+        def detect_basic_throttled(cpu, pc: int) -> None:
+            stop_requested[0] = True
+            cpu.remove_breakpoint(basic_rom)
+        c64.cpu.breakpoint_callback = detect_basic_throttled
         governor = FrameGovernor(fps=c64.video_timing.refresh_hz, enabled=True)
         cycles_per_frame = c64.video_timing.cycles_per_frame
         while not stop_requested[0]:
@@ -261,11 +352,12 @@ def benchmark_disk_load(
     else:
         try:
             c64.cpu.execute(cycles=INFINITE_CYCLES)
-        except (errors.CPUCycleExhaustionError, StopIteration):
+        except (errors.CPUCycleExhaustionError, errors.CPUBreakpointError):
             pass
 
     print(f"Booted after {c64.cpu.cycles_executed:,} cycles", flush=True)
-    c64.cpu.pc_callback = None
+    c64.cpu.clear_breakpoints()
+    c64.cpu.breakpoint_callback = None
 
     # Let screen render and wait for KERNAL to be ready for input
     print("Letting screen settle...", flush=True)
@@ -324,6 +416,16 @@ def main():
         action="store_true",
         help="Enable debug output for boot detection",
     )
+    parser.add_argument(
+        "--release-handlers",
+        action="store_true",
+        help="Compare release (logging-free) opcode handlers against the logging handlers",
+    )
+    parser.add_argument(
+        "--io",
+        action="store_true",
+        help="Benchmark the I/O register path ($D000-$DFFF reads, writes and a raster-polling loop)",
+    )
     args = parser.parse_args()
 
     if not args.rom_dir.exists():
@@ -352,6 +454,33 @@ def main():
     sync_drive = getattr(args, 'sync_drive', False)
     drive_rom = getattr(args, 'drive_rom', None)
 
+    if args.release_handlers:
+        cycles = 5_000_000
+        print(f"\nRelease handler benchmark ({impl} {py_version}, VIC-II {timing.chip_name} {region}, {cycles:,} cycles)\n")
+        results = benchmark_release_handlers(str(args.rom_dir), cycles, video_chip)
+        for mode, (elapsed, executed) in results.items():
+            cycles_per_sec = executed / elapsed if elapsed > 0 else 0
+            speed_ratio = cycles_per_sec / timing.cpu_freq
+            print(f"{mode:>8}: {executed:,} cycles in {elapsed:.2f}s ({cycles_per_sec:,.0f} cycles/sec, {speed_ratio:.1%})")
+        logging_elapsed = results["logging"][0]
+        release_elapsed = results["release"][0]
+        if release_elapsed > 0:
+            print(f"\nRelease handlers speedup: {logging_elapsed / release_elapsed:.2f}x")
+        return
+
+    if args.io:
+        accesses, cycles = 1_000_000, 5_000_000
+        print(f"\nI/O benchmark ({impl} {py_version}, VIC-II {timing.chip_name} {region})\n")
+        results = benchmark_io(str(args.rom_dir), accesses, cycles, video_chip)
+        for mode in ("read", "write"):
+            elapsed, count = results[mode]
+            per_access = elapsed / count * 1e9 if count else 0
+            print(f"{mode:>11}: {count:,} accesses in {elapsed:.2f}s ({per_access:.0f} ns/access)")
+        elapsed, executed = results["raster poll"]
+        cycles_per_sec = executed / elapsed if elapsed > 0 else 0
+        print(f"raster poll: {executed:,} cycles in {elapsed:.2f}s ({cycles_per_sec:,.0f} cycles/sec, {cycles_per_sec / timing.cpu_freq:.1%})")
+        return
+
     if disk_path:
         # Disk load benchmark mode
         drive_mode = "synchronous" if sync_drive else "threaded"
@@ -16,7 +16,7 @@ import struct
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Protocol
+from typing import Callable, Optional, Protocol
 
 log = logging.getLogger("c64.cartridge")
 
@@ -909,6 +909,10 @@ class Cartridge(ABC):
     # CRT hardware type ID (set by subclasses)
     HARDWARE_TYPE: int = -1
 
+    # Called with no arguments whenever EXROM or GAME changes. Set by
+    # C64Memory while attached so it can switch banking tables immediately.
+    lines_listener: Optional[Callable[[], None]] = None
+
     def __init__(self, rom_data: bytes, name: str = "", description: str = ""):
         """Initialize cartridge with ROM data.
 
@@ -932,6 +936,30 @@ class Cartridge(ABC):
         """
         return self._description if self._description else self.name
 
+    @property
+    def _exrom(self) -> bool:
+        """EXROM line state as set by the cartridge logic (see exrom)."""
+        return self._exrom_line
+
+    @_exrom.setter
+    def _exrom(self, value: bool) -> None:
+        changed = getattr(self, "_exrom_line", None) != value
+        self._exrom_line = value
+        if changed and self.lines_listener is not None:
+            self.lines_listener()
+
+    @property
+    def _game(self) -> bool:
+        """GAME line state as set by the cartridge logic (see game)."""
+        return self._game_line
+
+    @_game.setter
+    def _game(self, value: bool) -> None:
+        changed = getattr(self, "_game_line", None) != value
+        self._game_line = value
+        if changed and self.lines_listener is not None:
+            self.lines_listener()
+
     @property
     def exrom(self) -> bool:
         """EXROM line state (directly controls PLA memory mapping).
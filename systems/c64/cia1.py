@@ -195,6 +195,10 @@ class CIA1:
         # Track last CPU cycle count for timer updates
         self.last_cycle_count = 0
 
+        # Event on a mos6502.scheduler.EventScheduler (see attach_scheduler);
+        # None while update() is polled instead
+        self.timer_event = None
+
     def set_other_cia(self, other_cia) -> None:
         """Set reference to the other CIA for FLAG pin cross-triggering."""
         self.other_cia = other_cia
@@ -214,6 +218,10 @@ class CIA1:
     def read(self, addr) -> int:
         reg = addr & 0x0F
 
+        # Timers and TOD are counted lazily: catch up before reading them
+        if reg >= 0x04:
+            self.update()
+
         # Use cached keyboard matrix for registers that need it
         # The cache is invalidated when keys are pressed/released, avoiding
         # lock acquisition and copy on every read
@@ -304,6 +312,8 @@ class CIA1:
             result = (self.port_b & self.ddr_b) | (ext & ~self.ddr_b)
 
             # Apply timer outputs to PB6/PB7 when enabled
+            if (self.timer_a_pb6_mode | self.timer_b_pb7_mode) & 0x01:
+                self.update()
             # Timer A output to PB6 (if pb6_mode bit 0 is set = CRA bit 1)
             if self.timer_a_pb6_mode & 0x01:
                 # Timer output overrides normal port behavior on PB6
@@ -452,6 +462,10 @@ class CIA1:
         reg = addr & 0x0F
         self.regs[reg] = value
 
+        # Count up to this cycle with the settings before the write
+        if reg >= 0x04:
+            self.update()
+
         # Port A ($DC00) — keyboard row selection
         # KERNAL writes here to select which row(s) to scan (active low)
         if reg == 0x00:
@@ -621,15 +635,69 @@ class CIA1:
             self.tod_write_alarm = bool(value & 0x80)
             log.info(f"*** CIA1 Timer B Control: ${value:02X}, running={self.timer_b_running}, oneshot={self.timer_b_oneshot}, input_mode={self.timer_b_input_mode}, latch=${self.timer_b_latch:04X} ***")
 
+        # Latch, control and TOD writes move the next underflow or tick
+        if reg >= 0x04:
+            self._schedule()
+
+    def attach_scheduler(self, scheduler) -> None:
+        """Run update() from a scheduler event instead of polling it.
+
+        The event fires at the next cycle where a timer underflows or the
+        TOD ticks (see next_event_cycle). Register reads and writes call
+        update() first, so counters read back exactly in between.
+        """
+        self.timer_event = scheduler.add(self._on_timer_event, "cia1")
+        self._schedule()
+
+    def next_event_cycle(self) -> int | None:
+        """Return the CPU cycle of the next timer underflow or TOD tick.
+
+        Timer B counting Timer A underflows changes only when Timer A
+        underflows. Returns None when neither timer runs on the system
+        clock and the TOD is stopped.
+        """
+        last = self.last_cycle_count
+        cycle = None
+        # update() underflows a timer once counter + 1 cycles have elapsed
+        if self.timer_a_running and not self.timer_a_cnt_mode:
+            cycle = last + self.timer_a_counter + 1
+        if self.timer_b_running and self.timer_b_input_mode == 0:
+            timer_b = last + self.timer_b_counter + 1
+            cycle = timer_b if cycle is None else min(cycle, timer_b)
+        if self.tod_running:
+            tod = last + self.tod_cycles_per_tick - self.tod_cycles
+            cycle = tod if cycle is None else min(cycle, tod)
+        return cycle
+
+    def _on_timer_event(self, cycle: int) -> None:
+        """Scheduler callback: count up to the due cycle (update() reschedules)."""
+        self.update()
+
+    def _schedule(self) -> None:
+        """Move the timer event to next_event_cycle()."""
+        event = self.timer_event
+        if event is None:
+            return
+        cycle = self.next_event_cycle()
+        if cycle is None:
+            event.cancel()
+        elif cycle != event.cycle:
+            event.schedule(cycle)
+
     def update(self) -> None:
         """Update CIA timers and TOD based on CPU cycles.
 
-        Called periodically to count down timers and generate interrupts.
+        Called on register access and from the scheduler event at the next
+        underflow or TOD tick to count down timers and generate interrupts.
         """
         # Calculate cycles elapsed since last update
         cycles_elapsed = self.cpu.cycles_executed - self.last_cycle_count
         self.last_cycle_count = self.cpu.cycles_executed
+        self._count(cycles_elapsed)
+        self._schedule()
 
+    def _count(self, cycles_elapsed: int) -> None:
+        """Count timers and TOD down by cycles_elapsed cycles."""
         # Fast path: Both timers running with no underflow, TOD not running,
         # no PB6/PB7 pulse cycles, and timers not in special modes
         # This is the common case during normal operation
@@ -762,11 +830,10 @@ class CIA1:
         if self.pb7_pulse_cycles > 0:
             self.pb7_pulse_cycles = max(0, self.pb7_pulse_cycles - cycles_elapsed)
 
-        # Update TOD clock
+        # Update TOD clock (normally at most one tick: the event fires on each)
         if self.tod_running:
-            self.tod_cycles += cycles_elapsed
-            while self.tod_cycles >= self.tod_cycles_per_tick:
-                self.tod_cycles -= self.tod_cycles_per_tick
+            ticks, self.tod_cycles = divmod(self.tod_cycles + cycles_elapsed, self.tod_cycles_per_tick)
+            for _ in range(ticks):
                 self._tick_tod()
 
     def _tick_tod(self) -> None:
@@ -10,7 +10,8 @@ including:
 
 The 1541 communicates with the C64 via the IEC serial bus using the ATN, CLK,
 and DATA lines. This is a bit-banged protocol implemented in software on both
-the C64 (via CIA2) and the 1541 (via VIA1).
+the C64 (via CIA2) and the 1541 (via VIA1). VirtualDrive skips all of this and
+serves the KERNAL's file I/O calls straight from a D64 image.
 
 Reference:
 - https://www.c64-wiki.com/wiki/Commodore_1541
@@ -21,19 +22,23 @@ from .via6522 import VIA6522
 from .d64 import D64Image
 from .drive1541 import Drive1541
 from .iec_bus import IECBus
+from .speculative_iec_bus import SpeculativeIECBus
 from .threaded_iec_bus import ThreadedIECBus
 from .threaded_drive import ThreadedDrive1541
 from .multiprocess_iec_bus import MultiprocessIECBus, SharedIECState
 from .multiprocess_drive import MultiprocessDrive1541
+from .virtual_drive import VirtualDrive
 
 __all__ = [
     "VIA6522",
     "D64Image",
     "Drive1541",
     "IECBus",
+    "SpeculativeIECBus",
     "ThreadedIECBus",
     "ThreadedDrive1541",
     "MultiprocessIECBus",
     "SharedIECState",
     "MultiprocessDrive1541",
+    "VirtualDrive",
 ]
@@ -33,7 +33,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
 log = logging.getLogger("d64")
@@ -88,6 +88,38 @@ FILE_TYPE_MASK = 0x07
 FILE_LOCKED = 0x40
 FILE_CLOSED = 0x80
 
+# DOS allocation interleave (sectors skipped between consecutive blocks)
+DATA_INTERLEAVE = 10
+DIR_INTERLEAVE = 3
+
+# Data bytes per sector after the track/sector link
+BLOCK_DATA_SIZE = 254
+
+
+class DiskFullError(OSError):
+    """Raised when a file does not fit in the free blocks or directory."""
+
+
+def petscii_to_ascii(data: bytes) -> str:
+    """Convert a PETSCII filename to ASCII, stopping at the $A0 padding.
+
+    Lowercase letters are folded to uppercase; other unprintable codes
+    become "?".
+    """
+    name = ""
+    for b in data:
+        if b == 0xA0:
+            break
+        elif 0x41 <= b <= 0x5A:
+            name += chr(b)
+        elif 0x61 <= b <= 0x7A:
+            name += chr(b - 0x20)
+        elif 0x20 <= b <= 0x7E:
+            name += chr(b)
+        else:
+            name += "?"
+    return name
+
 
 @dataclass
 class DirectoryEntry:
@@ -121,10 +153,10 @@ class DirectoryEntry:
 class D64Image:
     """Parser and accessor for D64 disk image files.
 
-    This class provides read access to D64 disk images, including:
-    - Reading individual sectors
+    This class provides access to D64 disk images, including:
+    - Reading and writing individual sectors
     - Parsing the directory
-    - Reading file contents
+    - Reading, writing and deleting files
     - Access to BAM (Block Allocation Map)
     """
 
@@ -387,62 +419,49 @@ class D64Image:
             $1E-$1F: File size in sectors (low/high byte)
         """
         entries = []
+
+        for _track, _sector, data, base in self._directory_slots():
+            # File type is at offset 2 within each 32-byte entry
+            file_type = data[base + 2]
+
+            # Skip empty/deleted entries
+            if file_type == 0x00:
+                continue
+
+            # Parse entry - all entries use the same layout
+            entry = DirectoryEntry(
+                file_type=file_type & FILE_TYPE_MASK,
+                filename=petscii_to_ascii(data[base + 5:base + 21]),
+                track=data[base + 3],
+                sector=data[base + 4],
+                size_sectors=data[base + 30] | (data[base + 31] << 8),
+                locked=bool(file_type & FILE_LOCKED),
+                closed=bool(file_type & FILE_CLOSED),
+            )
+            entries.append(entry)
+
+        return entries
+
+    def _directory_slots(self) -> Iterator[Tuple[int, int, bytearray, int]]:
+        """Yield (track, sector, sector data, entry offset) for every directory slot.
+
+        Follows the directory sector chain; each sector has 8 entries of 32
+        bytes, and bytes 0-1 of the sector link to the next one.
+        """
         track = DIR_TRACK
         sector = DIR_SECTOR
+        seen = set()
 
-        while track != 0:
+        while track != 0 and (track, sector) not in seen:
+            seen.add((track, sector))
             data = self.read_sector(track, sector)
-
-            # Each sector has 8 directory entries of 32 bytes each
-            # Bytes 0-1 of sector are the link to next directory sector
             for i in range(8):
-                base = i * 32
-
-                # File type is at offset 2 within each 32-byte entry
-                file_type = data[base + 2]
-
-                # Skip empty/deleted entries
-                if file_type == 0x00:
-                    continue
-
-                # Parse entry - all entries use the same layout
-                file_track = data[base + 3]
-                file_sector = data[base + 4]
-                filename_bytes = data[base + 5:base + 21]
-                size_lo = data[base + 30]
-                size_hi = data[base + 31]
-
-                # Convert filename (PETSCII with $A0 padding)
-                filename = ""
-                for b in filename_bytes:
-                    if b == 0xA0:
-                        break
-                    elif 0x41 <= b <= 0x5A:
-                        filename += chr(b)
-                    elif 0x61 <= b <= 0x7A:
-                        filename += chr(b - 0x20)
-                    elif 0x20 <= b <= 0x7E:
-                        filename += chr(b)
-                    else:
-                        filename += "?"
-
-                entry = DirectoryEntry(
-                    file_type=file_type & FILE_TYPE_MASK,
-                    filename=filename,
-                    track=file_track,
-                    sector=file_sector,
-                    size_sectors=size_lo | (size_hi << 8),
-                    locked=bool(file_type & FILE_LOCKED),
-                    closed=bool(file_type & FILE_CLOSED),
-                )
-                entries.append(entry)
+                yield track, sector, data, i * 32
 
             # Follow chain to next directory sector
             track = data[0]
             sector = data[1]
 
-        return entries
-
     def read_file(self, entry: Union[DirectoryEntry, str]) -> bytes:
         """Read complete file data following the sector chain.
 
@@ -475,8 +494,8 @@ class D64Image:
             next_sector = sector_data[1]
 
             if next_track == 0:
-                # Last sector - next_sector indicates bytes used
-                bytes_used = next_sector
+                # Last sector - next_sector is the index of the last used byte
+                bytes_used = max(next_sector - 1, 0)
                 data.extend(sector_data[2:2 + bytes_used])
             else:
                 # Full sector
@@ -501,3 +520,190 @@ class D64Image:
             if entry.filename.upper() == filename_upper and entry.is_valid:
                 return entry
         return None
+
+    def write_file(self, filename: str, data: bytes, file_type: int = FILE_TYPE_PRG,
+                   replace: bool = False) -> DirectoryEntry:
+        """Write a file, allocating blocks and a directory entry like the DOS.
+
+        The first block goes on the free track nearest the directory track,
+        later blocks follow at DATA_INTERLEAVE on the same track and then on
+        the tracks further out.
+
+        Args:
+            filename: Filename (up to 16 characters)
+            data: Raw file data (for PRG, first 2 bytes are load address)
+            file_type: FILE_TYPE_* value
+            replace: Replace an existing file of the same name
+
+        Returns:
+            DirectoryEntry of the new file
+
+        Raises:
+            FileExistsError: If the file exists and replace is False
+            DiskFullError: If there are not enough free blocks or directory slots
+        """
+        name = filename.upper()[:16]
+        existing = self.find_file(name)
+        if existing is not None and not replace:
+            raise FileExistsError(f"File exists: {name}")
+
+        chunks = [data[i:i + BLOCK_DATA_SIZE] for i in range(0, len(data), BLOCK_DATA_SIZE)] or [b""]
+        free_blocks = self.get_free_blocks() + (existing.size_sectors if existing else 0)
+        if len(chunks) > free_blocks:
+            raise DiskFullError(f"Disk full: {name} needs {len(chunks)} blocks, {free_blocks} free")
+
+        if existing is not None:
+            self.delete_file(existing)
+
+        bam = self.read_sector(BAM_TRACK, BAM_SECTOR)
+        dir_track, dir_sector, dir_data, base = self._free_directory_slot(bam)
+
+        # Allocate the whole chain first so each block can link to the next
+        blocks = []
+        track, sector = None, 0
+        for _ in chunks:
+            track, sector = self._next_free_block(bam, track, sector)
+            self._bam_allocate(bam, track, sector)
+            blocks.append((track, sector))
+
+        for i, chunk in enumerate(chunks):
+            sector_data = bytearray(256)
+            if i + 1 < len(blocks):
+                sector_data[0], sector_data[1] = blocks[i + 1]
+            else:
+                # Last sector - index of the last used byte
+                sector_data[1] = len(chunk) + 1
+            sector_data[2:2 + len(chunk)] = chunk
+            self.write_sector(*blocks[i], bytes(sector_data))
+
+        encoded = name.encode("ascii", "replace").ljust(16, b"\xA0")
+        entry = bytearray(30)
+        entry[0] = FILE_CLOSED | (file_type & FILE_TYPE_MASK)
+        entry[1], entry[2] = blocks[0]
+        entry[3:19] = encoded
+        entry[28] = len(blocks) & 0xFF
+        entry[29] = len(blocks) >> 8
+        # Bytes 0-1 of the slot are the sector link in entry 0, leave them alone
+        dir_data[base + 2:base + 32] = entry
+        self.write_sector(dir_track, dir_sector, bytes(dir_data))
+        self.write_sector(BAM_TRACK, BAM_SECTOR, bytes(bam))
+
+        return DirectoryEntry(
+            file_type=file_type & FILE_TYPE_MASK,
+            filename=petscii_to_ascii(encoded),
+            track=blocks[0][0],
+            sector=blocks[0][1],
+            size_sectors=len(blocks),
+            locked=False,
+            closed=True,
+        )
+
+    def delete_file(self, entry: Union[DirectoryEntry, str]) -> bool:
+        """Scratch a file: free its sector chain and clear its directory entry.
+
+        Args:
+            entry: Directory entry for the file, or filename string
+
+        Returns:
+            True if the file was found and deleted
+        """
+        filename = entry.filename if isinstance(entry, DirectoryEntry) else entry.upper()
+
+        for dir_track, dir_sector, data, base in self._directory_slots():
+            if data[base + 2] == 0x00 or petscii_to_ascii(data[base + 5:base + 21]) != filename:
+                continue
+
+            bam = self.read_sector(BAM_TRACK, BAM_SECTOR)
+            track, sector = data[base + 3], data[base + 4]
+            seen = set()
+            while track != 0 and (track, sector) not in seen:
+                seen.add((track, sector))
+                try:
+                    link = self.read_sector(track, sector)
+                except ValueError:
+                    break  # Broken chain
+                self._bam_free(bam, track, sector)
+                track, sector = link[0], link[1]
+
+            data[base + 2] = 0x00
+            self.write_sector(dir_track, dir_sector, bytes(data))
+            self.write_sector(BAM_TRACK, BAM_SECTOR, bytes(bam))
+            return True
+
+        return False
+
+    def _free_directory_slot(self, bam: bytearray) -> Tuple[int, int, bytearray, int]:
+        """Find an empty directory slot, extending the directory chain if needed.
+
+        Returns:
+            (track, sector, sector data, entry offset) of the slot
+
+        Raises:
+            DiskFullError: If the directory track has no free sector left
+        """
+        last_sector = DIR_SECTOR
+        last_data = None
+        for track, sector, data, base in self._directory_slots():
+            if data[base + 2] == 0x00:
+                return track, sector, data, base
+            last_sector, last_data = sector, data
+
+        # All directory sectors are full: link a new one on the directory track
+        sectors = SECTORS_PER_TRACK[DIR_TRACK - 1]
+        for i in range(sectors):
+            sector = (last_sector + DIR_INTERLEAVE + i) % sectors
+            if self._bam_is_free(bam, DIR_TRACK, sector):
+                break
+        else:
+            raise DiskFullError("Directory full")
+
+        self._bam_allocate(bam, DIR_TRACK, sector)
+        last_data[0] = DIR_TRACK
+        last_data[1] = sector
+        self.write_sector(DIR_TRACK, last_sector, bytes(last_data))
+
+        data = bytearray(256)
+        data[1] = 0xFF  # End of directory chain
+        return DIR_TRACK, sector, data, 0
+
+    def _next_free_block(self, bam: bytearray, track: Optional[int], sector: int) -> Tuple[int, int]:
+        """Pick the block after (track, sector), or the first block of a file if track is None."""
+        last_track = min(self.num_tracks, 35)  # The standard BAM covers 35 tracks
+        order = sorted(
+            (t for t in range(1, last_track + 1) if t != DIR_TRACK),
+            key=lambda t: (abs(t - DIR_TRACK), t),
+        )
+        if track is not None:
+            # Stay on this side of the directory track while it has room
+            step = -1 if track < DIR_TRACK else 1
+            ahead = list(range(track, 0 if step < 0 else last_track + 1, step))
+            order = ahead + [t for t in order if t not in ahead]
+
+        for candidate in order:
+            if bam[4 * candidate] == 0:
+                continue
+            sectors = SECTORS_PER_TRACK[candidate - 1]
+            start = (sector + DATA_INTERLEAVE) % sectors if candidate == track else 0
+            for i in range(sectors):
+                s = (start + i) % sectors
+                if self._bam_is_free(bam, candidate, s):
+                    return candidate, s
+
+        raise DiskFullError("Disk full")
+
+    @staticmethod
+    def _bam_is_free(bam: bytearray, track: int, sector: int) -> bool:
+        """Check the BAM bitmap bit for a sector (1 = free)."""
+        return bool(bam[4 * track + 1 + (sector >> 3)] & (1 << (sector & 7)))
+
+    def _bam_allocate(self, bam: bytearray, track: int, sector: int) -> None:
+        """Mark a sector used in the BAM."""
+        if self._bam_is_free(bam, track, sector):
+            bam[4 * track + 1 + (sector >> 3)] &= ~(1 << (sector & 7))
+            bam[4 * track] -= 1
+
+    def _bam_free(self, bam: bytearray, track: int, sector: int) -> None:
+        """Mark a sector free in the BAM."""
+        if track <= 35 and not self._bam_is_free(bam, track, sector):
+            bam[4 * track + 1 + (sector >> 3)] |= 1 << (sector & 7)
+            bam[4 * track] += 1
@@ -70,6 +70,11 @@ ROM_START = 0xC000
 ROM_END = 0xFFFF
 ROM_SIZE = 0x4000  # 16KB
 
+# DOS 2.6 idle loop: the main loop at $EBFF waits for a command or an ATN
+# interrupt and ends with JMP $EBFF at $EC9B, where an idle drive can sleep
+IDLE_TRAP = 0xEC9B
+IDLE_TRAP_CODE = bytes([0x4C, 0xFF, 0xEB])  # JMP $EBFF
+
 # VIA1 Port B bit definitions (IEC bus accent)
 VIA1_DATA_IN = 0x01   # Bit 0: DATA line input (via inverter, active HIGH when bus LOW)
 VIA1_DATA_OUT = 0x02  # Bit 1: DATA line output (accent)
@@ -142,6 +147,20 @@ class Drive1541Memory:
         # Cache page table as instance variable for faster access
         self._page_table = Drive1541Memory._PAGE_TABLE
 
+        # Page-mapped read tables picked up by the drive CPU's RAM (see
+        # mos6502.memory.RAM._bind_read): RAM and ROM pages are read straight
+        # from 256-byte views, VIA and unmapped pages through read()
+        ram_view = memoryview(self.ram)
+        rom_view = memoryview(self.rom)
+        self.read_pages: list = [None] * 256
+        for page, page_type in enumerate(self._page_table):
+            if page_type == self.PAGE_RAM:
+                self.read_pages[page] = ram_view[page << 8:(page + 1) << 8]
+            elif page_type == self.PAGE_ROM:
+                offset = (page << 8) - ROM_START
+                self.read_pages[page] = rom_view[offset:offset + 0x100]
+        self.page_readers = [self.read] * 256
+
     def read(self, addr: int) -> int:
         """Read from 1541 memory.
 
@@ -189,6 +208,22 @@ class Drive1541Memory:
             self.drive.via1.write(addr, value)
         # ROM writes and unmapped writes are ignored
 
+    def is_volatile(self, addr: int) -> bool:
+        """Return True if reading addr may change without a CPU write.
+
+        The VIA registers are driven by the IEC bus, the disk mechanics and
+        their timers, so loops polling them are never skipped by the CPU's
+        idle-loop detection.
+
+        Args:
+            addr: 16-bit address
+
+        Returns:
+            True for the VIA1/VIA2 register pages
+        """
+        page_type = self._page_table[(addr & 0xFFFF) >> 8]
+        return page_type == self.PAGE_VIA1 or page_type == self.PAGE_VIA2
+
 
 class Drive1541:
     """Commodore 1541 Disk Drive Emulator.
@@ -197,11 +232,13 @@ class Drive1541:
     6502 CPU, RAM, ROM, two VIA chips, and disk mechanics.
     """
 
-    def __init__(self, device_number: int = 8) -> None:
+    def __init__(self, device_number: int = 8, gcr_cache_dir: Optional[Path] = None) -> None:
         """Initialize 1541 drive.
 
         Args:
             device_number: IEC device number (8-11, default 8)
+            gcr_cache_dir: Directory for caching encoded GCR tracks between
+                inserts, or None (default) for no on-disk cache
         """
         self.device_number = device_number
 
@@ -232,6 +269,9 @@ class Drive1541:
         # GCR-encoded disk data for low-level emulation
         self.gcr_disk: Optional[GCRDisk] = None
 
+        # Where encoded GCR tracks are cached between inserts (None disables)
+        self.gcr_cache_dir = gcr_cache_dir
+
         # IEC bus reference (set when connected to bus)
         self.iec_bus = None
 
@@ -298,6 +338,20 @@ class Drive1541:
         # take more cycles than the requested tick.
         self._pending_cycles = 0
 
+        # Idle sleep: when the CPU reaches idle_trap (the end of the DOS idle
+        # loop) with the motor off, ATN released and no interrupt pending,
+        # tick() stops executing it and only counts cycles. The VIAs are
+        # advanced in one step on wakeup: at the first cycle a timer raises
+        # an enabled interrupt (_wake_cycle), or on an ATN edge.
+        # None disables the trap (set by load_rom() for a known DOS).
+        self.idle_trap: Optional[int] = None
+        self._idle_trap_armed = False
+        self._at_idle_trap = False
+        self.asleep = False
+        self._sleep_cycles = 0  # Cycles the VIAs are behind while asleep
+        self._wake_cycle: Optional[int] = None
+        self.slept_cycles = 0
+
     def load_rom(self, rom_path: Path, rom_path_e000: Optional[Path] = None) -> None:
         """Load 1541 DOS ROM.
 
@@ -354,6 +408,13 @@ class Drive1541:
                 f"1541 ROM must be 16KB or 8KB, got {len(rom_data)} bytes"
             )
 
+        # Only trap the idle loop of a DOS known to have it there
+        trap = IDLE_TRAP - ROM_START
+        if bytes(self.memory.rom[trap:trap + len(IDLE_TRAP_CODE)]) == IDLE_TRAP_CODE:
+            self.idle_trap = IDLE_TRAP
+        else:
+            self.idle_trap = None
+
     def insert_disk(self, disk_path: Path) -> None:
         """Insert a disk image into the drive.
 
@@ -362,8 +423,8 @@ class Drive1541:
         """
         self.disk = D64Image(disk_path)
         self._d64_path = disk_path  # Save path for persistence
-        # Create GCR-encoded version for low-level emulation
-        self.gcr_disk = GCRDisk(self.disk)
+        # Create GCR-encoded version for low-level emulation (tracks encode on first read)
+        self.gcr_disk = GCRDisk(self.disk, cache_dir=self.gcr_cache_dir)
         log.info(f"Disk inserted: {self.disk.get_disk_name()} (ID: {self.disk.get_disk_id()})")
 
     def eject_disk(self) -> None:
@@ -385,6 +446,8 @@ class Drive1541:
         self.motor_on = False
         self.led_on = False
         self.stepper_phase = 0
+        self.asleep = False
+        self._sleep_cycles = 0
 
         if self.cpu:
             self.cpu.reset()
@@ -401,12 +464,26 @@ class Drive1541:
         cycles than a single tick (e.g., if C64 ticks us with 1 cycle but the
         next instruction takes 4 cycles).
 
+        While the drive sleeps in its idle loop (see idle_trap) the CPU is
+        not run: its cycle counter advances and the VIAs are left behind
+        until wake() catches them up.
+
         Args:
             cycles: Number of cycles to advance
         """
-        # Update VIA timers
-        self.via1.tick(cycles)
-        self.via2.tick(cycles)
+        if self.asleep:
+            self._sleep_cycles += cycles
+            if self._wake_cycle is None or self._sleep_cycles < self._wake_cycle:
+                self.cpu.cycles_executed += cycles
+                self.slept_cycles += cycles
+                return
+            # A timer interrupt is due: catch the VIAs up (including these
+            # cycles) and let the CPU service it
+            self.wake()
+        else:
+            # Update VIA timers
+            self.via1.tick(cycles)
+            self.via2.tick(cycles)
 
         # Update GCR byte-ready timing if motor is running
         if self.motor_on and self.gcr_disk:
@@ -414,11 +491,14 @@ class Drive1541:
 
         # Execute drive CPU if we have one
         if self.cpu:
+            if self.idle_trap is not None and not self._idle_trap_armed:
+                self._arm_idle_trap()
+
             # Add requested cycles to the pending budget
             self._pending_cycles += cycles
 
             # Only run if we have cycles to spend
-            if self._pending_cycles > 0:
+            while self._pending_cycles > 0:
                 # Record how many cycles we've used before executing
                 cycles_before = self.cpu.cycles_executed
 
@@ -434,6 +514,72 @@ class Drive1541:
                 cycles_used = self.cpu.cycles_executed - cycles_before
                 self._pending_cycles -= cycles_used
 
+                # Stopped at the idle trap: sleep through the rest of the
+                # budget, or carry on with it
+                if not self._at_idle_trap:
+                    break
+                self._at_idle_trap = False
+                if self._may_sleep():
+                    self._sleep()
+                    break
+
+    def _arm_idle_trap(self) -> None:
+        """Stop the CPU at idle_trap so tick() can put the drive to sleep.
+
+        Armed on the first tick(), so runners that drive the CPU without
+        tick() never stop there.
+        """
+        self.cpu.add_breakpoint(self.idle_trap)
+        self.cpu.breakpoint_callback = self._idle_trap_hit
+        self._idle_trap_armed = True
+
+    def _idle_trap_hit(self, cpu: MOS6502CPU, pc: int) -> None:
+        """Breakpoint callback: end execute() at the next instruction boundary."""
+        self._at_idle_trap = True
+        cpu.cycles = 0
+
+    def _may_sleep(self) -> bool:
+        """Return True if the idle drive has nothing to do until an ATN edge or timer interrupt."""
+        cpu = self.cpu
+        if self.motor_on or not self.iec_atn or cpu.irq_pending or cpu.nmi_pending:
+            return False
+        wake_cycle = self._next_timer_irq()
+        return wake_cycle is None or wake_cycle > 0
+
+    def _next_timer_irq(self) -> Optional[int]:
+        """Return the cycles until either VIA raises a timer interrupt (None: never)."""
+        via1_due = self.via1.cycles_until_irq()
+        via2_due = self.via2.cycles_until_irq()
+        if via1_due is None:
+            return via2_due
+        if via2_due is None:
+            return via1_due
+        return min(via1_due, via2_due)
+
+    def _sleep(self) -> None:
+        """Put the CPU to sleep at the idle trap, spending the rest of the budget."""
+        self.asleep = True
+        self._sleep_cycles = 0
+        self._wake_cycle = self._next_timer_irq()
+        if self._pending_cycles > 0:
+            self.cpu.cycles_executed += self._pending_cycles
+            self.slept_cycles += self._pending_cycles
+            self._pending_cycles = 0
+
+    def wake(self) -> None:
+        """Wake the CPU from idle sleep, advancing the VIAs over the slept cycles.
+
+        The CPU resumes at the idle trap on the next tick().
+        """
+        if not self.asleep:
+            return
+        self.asleep = False
+        cycles = self._sleep_cycles
+        self._sleep_cycles = 0
+        if cycles:
+            self.via1.tick(cycles)
+            self.via2.tick(cycles)
+
     def _update_gcr_read(self, cycles: int) -> None:
         """Update GCR byte-ready timing for disk read.
 
@@ -563,6 +709,10 @@ class Drive1541:
         old_state = self.iec_atn
         self.iec_atn = state
 
+        # An ATN edge wakes an idle drive (with its VIAs caught up first)
+        if state != old_state:
+            self.wake()
+
         # ATN is connected to VIA1 CA1 through a 7406 inverter
         # - Bus ATN LOW (asserted) → Inverter → CA1 HIGH
         # - Bus ATN HIGH (released) → Inverter → CA1 LOW
@@ -35,7 +35,11 @@ Reference:
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import tempfile
+from pathlib import Path
 from typing import List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -83,6 +87,15 @@ SYNC_LENGTH = 10  # Standard sync length in bytes
 # Gap filler byte (GCR encoded $55, produces pattern with no ambiguous clock)
 GAP_BYTE = 0x55
 
+# Bumped whenever the track layout changes, so stale cached tracks are never reused
+GCR_CACHE_VERSION = 1
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user directory for cached GCR tracks."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "mos6502" / "gcr"
+
 
 def gcr_encode_4_to_5(data: bytes) -> bytes:
     """Encode 4 bytes to 5 GCR bytes.
@@ -401,8 +414,7 @@ class GCRTrack:
         self.bit_position = 0
 
         # Initialize with gap bytes (no valid data yet)
-        for i in range(self.track_size):
-            self.data[i] = GAP_BYTE
+        self.data[:] = bytes([GAP_BYTE]) * self.track_size
 
     def build_from_d64(self, d64: D64Image, disk_id: bytes) -> None:
         """Build GCR track data from D64 image.
@@ -443,8 +455,7 @@ class GCRTrack:
         if len(track_data) <= self.track_size:
             self.data[:len(track_data)] = track_data
             # Fill remaining with gaps
-            for i in range(len(track_data), self.track_size):
-                self.data[i] = GAP_BYTE
+            self.data[len(track_data):] = bytes([GAP_BYTE]) * (self.track_size - len(track_data))
         else:
             log.warning(f"Track {self.track_num} data ({len(track_data)} bytes) exceeds buffer ({self.track_size} bytes)")
             self.data[:] = track_data[:self.track_size]
@@ -583,18 +594,23 @@ class GCRDisk:
 
     Manages all tracks and provides the interface for the drive emulation
     to read/write data.
+
+    Tracks are GCR-encoded on first access rather than when the disk is
+    inserted. With a cache directory, encoded tracks are also stored on disk
+    under a hash of their sector contents, so the same track of the same image
+    is only ever encoded once.
     """
 
-    def __init__(self, d64: Optional[D64Image] = None) -> None:
+    def __init__(self, d64: Optional[D64Image] = None, cache_dir: Optional[Path] = None) -> None:
         """Initialize GCR disk.
 
         Args:
             d64: D64 disk image to convert, or None for empty disk
+            cache_dir: Directory for cached encoded tracks, or None for no cache
         """
-        from .d64 import SECTORS_PER_TRACK, TRACK_SPEED_ZONE
-
-        self.tracks: List[Optional[GCRTrack]] = [None] * 40  # Tracks 1-40 (index 0 unused)
+        self.tracks: List[Optional[GCRTrack]] = [None] * 41  # Tracks 1-40 (index 0 unused)
         self.d64 = d64
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
         # Get disk ID from BAM
         if d64:
@@ -603,18 +619,8 @@ class GCRDisk:
         else:
             self.disk_id = b"00"
 
-        # Build GCR tracks from D64
-        if d64:
-            for track in range(1, d64.num_tracks + 1):
-                num_sectors = SECTORS_PER_TRACK[track - 1]
-                speed_zone = TRACK_SPEED_ZONE[track - 1]
-
-                gcr_track = GCRTrack(track, num_sectors, speed_zone)
-                gcr_track.build_from_d64(d64, self.disk_id)
-                self.tracks[track] = gcr_track
-
     def get_track(self, track_num: int) -> Optional[GCRTrack]:
-        """Get GCR track data.
+        """Get GCR track data, encoding the track on first access.
 
         Args:
             track_num: Track number (1-35/40)
@@ -623,9 +629,56 @@ class GCRDisk:
             GCRTrack object or None if track doesn't exist
         """
         if 1 <= track_num <= 40:
-            return self.tracks[track_num]
+            gcr_track = self.tracks[track_num]
+            if gcr_track is None and self.d64 and track_num <= self.d64.num_tracks:
+                gcr_track = self.tracks[track_num] = self._build_track(track_num)
+            return gcr_track
         return None
 
+    def _build_track(self, track_num: int) -> GCRTrack:
+        """Encode a track from the D64 image, or load it from the cache."""
+        from .d64 import SECTORS_PER_TRACK, TRACK_SPEED_ZONE
+
+        gcr_track = GCRTrack(track_num, SECTORS_PER_TRACK[track_num - 1], TRACK_SPEED_ZONE[track_num - 1])
+        if self.cache_dir is None:
+            gcr_track.build_from_d64(self.d64, self.disk_id)
+            return gcr_track
+
+        cache_path = self._cache_path(gcr_track)
+        try:
+            cached = cache_path.read_bytes()
+        except OSError:
+            cached = b""
+        if len(cached) == gcr_track.track_size:
+            gcr_track.data[:] = cached
+            return gcr_track
+
+        gcr_track.build_from_d64(self.d64, self.disk_id)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so other drives never see a partial track
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(gcr_track.data)
+                os.replace(temp_path, cache_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            log.debug(f"Could not cache GCR track {track_num}: {e}")
+        return gcr_track
+
+    def _cache_path(self, gcr_track: GCRTrack) -> Path:
+        """Return the cache file for a track, keyed by everything it is encoded from."""
+        digest = hashlib.blake2b(
+            bytes([GCR_CACHE_VERSION, gcr_track.track_num, gcr_track.num_sectors]), digest_size=16
+        )
+        digest.update(self.disk_id)
+        for sector in range(gcr_track.num_sectors):
+            digest.update(self.d64.read_sector(gcr_track.track_num, sector))
+        return self.cache_dir / f"{digest.hexdigest()}.gcr"
+
     def read_byte_at(self, track: int) -> int:
         """Read a byte from the specified track.
 
@@ -658,12 +711,14 @@ class GCRDisk:
         """Update a sector's GCR data from the D64 image.
 
         Call this after modifying a sector in the D64 to keep GCR in sync.
+        Tracks that have not been encoded yet are left alone, as they will
+        pick up the change when they are first read.
 
         Args:
             track: Track number (1-35)
             sector: Sector number
         """
-        gcr_track = self.get_track(track)
+        gcr_track = self.tracks[track] if 1 <= track <= 40 else None
         if gcr_track and self.d64:
             gcr_track.update_sector_from_d64(self.d64, sector, self.disk_id)
 
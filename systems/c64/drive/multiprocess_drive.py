@@ -20,6 +20,18 @@ import time
 from pathlib import Path
 from typing import Optional
 
+from .drive1541 import VIA1_ATN_ACK, VIA1_CLK_OUT, VIA1_DATA_OUT
+from .multiprocess_iec_bus import (
+    C64_ATN_OUT_BIT,
+    DRIVE_ATNA_OUT_BIT,
+    DRIVE_CLK_OUT_BIT,
+    DRIVE_DATA_OUT_BIT,
+    MAX_SKEW,
+    SharedIECState,
+    resolve_bus,
+    spin_until,
+)
+
 # Use fork context on POSIX for better performance
 # (spawn has overhead of reimporting modules)
 if sys.platform != 'win32':
@@ -30,18 +42,108 @@ else:
 Process = mp_context.Process
 Queue = mp_context.Queue
 
-from .multiprocess_iec_bus import (
-    SharedIECState,
-    FLAG_SHUTDOWN,
-    FLAG_DRIVE_READY,
-)
-
 log = logging.getLogger("drive1541")
 
-# How many cycles to run per tick batch
-# Larger values reduce overhead but may delay IEC responses
+# Most cycles to run per batch (batches also end MAX_SKEW past the C64
+# clock and at the next pending C64 transition)
 CYCLES_PER_BATCH = 1000
 
+# Check the command queue every this many batches
+COMMAND_CHECK_BATCHES = 1000
+
+
+class DriveIECPort:
+    """Drive side of the multiprocess IEC bus (runs in the drive process).
+
+    Installed as the drive's iec_bus and VIA1 port B read callback. Keeps the
+    drive clock in C64 cycles: the drive starts at the C64 clock published
+    when the process was launched.
+    """
+
+    def __init__(self, drive, shared_state: SharedIECState) -> None:
+        """Connect the drive to the shared IEC state.
+
+        Args:
+            drive: Drive1541 with its CPU attached and reset
+            shared_state: SharedIECState attached to the C64's segment
+        """
+        self.drive = drive
+        self._shared = shared_state
+        self._origin = shared_state.get_c64_cycles() - drive.cpu.cycles_executed
+
+        # Our outputs as last pushed, and the C64's as of the last apply()
+        self._drive_lines = 0
+        self._c64_lines = 0
+
+        drive.iec_bus = self
+        drive.via1.port_b_read_callback = self.read_port_b
+        self._resolve()
+
+    def now(self) -> int:
+        """Return the drive clock in C64 cycles."""
+        return self._origin + self.drive.cpu.cycles_executed
+
+    def next_transition(self) -> Optional[int]:
+        """Return the cycle of the oldest unapplied C64 transition, if any."""
+        entry = self._shared.c64_ring.peek()
+        return entry[0] if entry is not None else None
+
+    def apply(self, now: int) -> None:
+        """Apply the C64 transitions stamped <= now; an ATN edge raises VIA1 CA1."""
+        lines = self._shared.c64_ring.pop_until(now)
+        if lines is None:
+            return
+        atn_changed = (lines ^ self._c64_lines) & C64_ATN_OUT_BIT
+        self._c64_lines = lines
+        self._resolve()
+        if atn_changed:
+            self.drive.set_iec_atn(self.drive.iec_atn)
+
+    def _resolve(self) -> None:
+        """Recompute the bus lines as seen by the drive."""
+        drive = self.drive
+        drive.iec_atn, drive.iec_clk, drive.iec_data = resolve_bus(self._c64_lines, self._drive_lines)
+
+    def update(self) -> None:
+        """Push a change of the drive's IEC outputs (VIA1 port B or DDRB write)."""
+        via1 = self.drive.via1
+        outputs = via1.orb & via1.ddrb
+        lines = (
+            (DRIVE_CLK_OUT_BIT if outputs & VIA1_CLK_OUT else 0)
+            | (DRIVE_DATA_OUT_BIT if outputs & VIA1_DATA_OUT else 0)
+            | (DRIVE_ATNA_OUT_BIT if outputs & VIA1_ATN_ACK else 0)
+        )
+        if lines == self._drive_lines:
+            return
+
+        now = self.now()
+        shared = self._shared
+        ring = shared.drive_ring
+        if not ring.push(now, lines):
+            shared.set_drive_cycles(now)
+            spin_until(lambda: ring.push(now, lines), shared.is_shutdown_requested, timeout=None)
+        shared.set_drive_cycles(now)
+        shared.set_drive_outputs(
+            bool(lines & DRIVE_CLK_OUT_BIT), bool(lines & DRIVE_DATA_OUT_BIT), bool(lines & DRIVE_ATNA_OUT_BIT)
+        )
+        self._drive_lines = lines
+        self._resolve()
+
+    def read_port_b(self) -> int:
+        """VIA1 port B read: wait until the C64 clock reaches ours, then read the bus."""
+        now = self.now()
+        shared = self._shared
+        shared.set_drive_cycles(now)
+        if shared.get_c64_cycles() < now:
+
+            def caught_up() -> bool:
+                self.apply(now)
+                return shared.get_c64_cycles() >= now
+
+            spin_until(caught_up, shared.is_shutdown_requested, timeout=None)
+        self.apply(now)
+        return self.drive._via1_port_b_read()
+
 
 def drive_process_main(
     shared_mem_name: str,
@@ -50,8 +152,7 @@ def drive_process_main(
     disk_path: Optional[str],
     device_number: int,
     command_queue: Queue,
-    tick_request_event,  # multiprocessing.Event
-    tick_done_event,     # multiprocessing.Event
+    gcr_cache_dir: Optional[str] = None,
 ) -> None:
     """Main function for drive subprocess.
 
@@ -67,9 +168,10 @@ def drive_process_main(
         disk_path: Optional path to D64 disk image
         device_number: IEC device number (8-11)
         command_queue: Queue for receiving commands from main process
+        gcr_cache_dir: Optional directory for caching encoded GCR tracks
     """
     # Import here to avoid issues with multiprocessing on some platforms
-    from .drive1541 import Drive1541, VIA1_DATA_OUT, VIA1_CLK_OUT, VIA1_ATN_ACK
+    from .drive1541 import Drive1541
     from mos6502 import CPU, CPUVariant
     from mos6502.errors import CPUCycleExhaustionError
 
@@ -77,12 +179,16 @@ def drive_process_main(
     subprocess_log = logging.getLogger(f"drive1541.subprocess.{device_number}")
     subprocess_log.info(f"Drive {device_number} subprocess starting (PID: {os.getpid()})")
 
+    shared_state = None
     try:
         # Attach to shared memory
         shared_state = SharedIECState(name=shared_mem_name, create=False)
 
         # Create drive instance
-        drive = Drive1541(device_number=device_number)
+        drive = Drive1541(
+            device_number=device_number,
+            gcr_cache_dir=Path(gcr_cache_dir) if gcr_cache_dir else None,
+        )
 
         # Create CPU for the drive (1541 uses standard 6502)
         drive_cpu = CPU(cpu_variant=CPUVariant.NMOS_6502, verbose_cycles=False)
@@ -104,32 +210,28 @@ def drive_process_main(
         # Reset drive
         drive.reset()
 
-        # Pre-compute address switch bits for Port B reads
-        addr_offset = device_number - 8
-        address_switch_mask = 0
-        if addr_offset & 0x01:
-            address_switch_mask |= 0x20  # Bit 5
-        if addr_offset & 0x02:
-            address_switch_mask |= 0x40  # Bit 6
-
-        # Track cycles
-        drive_cycles = 0
+        # Exchange IEC transitions through the shared rings
+        port = DriveIECPort(drive, shared_state)
+        is_shutdown_requested = shared_state.is_shutdown_requested
 
-        # Cache ATN state for edge detection
-        last_atn = True
+        # VIA timers and GCR timing run up to via_clock; the CPU may overshoot it
+        via_clock = port.now()
 
         # Signal that we're ready
+        shared_state.set_drive_cycles(via_clock)
         shared_state.set_drive_ready(True)
         subprocess_log.info(f"Drive {device_number} subprocess ready")
 
-        # Main execution loop - cycle-counter based synchronization
-        # Drive runs until it catches up to C64's cycle count
+        # Main execution loop: run ahead of the C64 by at most MAX_SKEW cycles
         command_check_counter = 0
 
-        while not shared_state.is_shutdown_requested():
-            # Check for commands periodically (every ~1000 iterations)
+        while not is_shutdown_requested():
+            now = port.now()
+            port.apply(now)
+            limit = shared_state.get_c64_cycles() + MAX_SKEW
+
             command_check_counter += 1
-            if command_check_counter >= 1000:
+            if now >= limit or command_check_counter >= COMMAND_CHECK_BATCHES:
                 command_check_counter = 0
                 try:
                     while not command_queue.empty():
@@ -148,77 +250,38 @@ def drive_process_main(
                 except Exception:
                     pass
 
-            # Get C64's current cycle count
-            c64_cycles = shared_state.get_c64_cycles()
-
-            # Calculate how many cycles we need to run to catch up
-            cycles_behind = c64_cycles - drive_cycles
-            if cycles_behind <= 0:
-                # We're caught up or ahead - wait briefly for C64 to advance
-                tick_request_event.wait(timeout=0.001)
-                tick_request_event.clear()
+            if now >= limit:
+                # Too far ahead: wait for the C64 clock to advance
+                shared_state.set_drive_cycles(now)
+                spin_until(
+                    lambda: shared_state.get_c64_cycles() + MAX_SKEW > now,
+                    is_shutdown_requested,
+                    timeout=0.01,
+                )
                 continue
 
-            # Run a batch of cycles to catch up (limit batch size)
-            cycles_to_run = min(cycles_behind, CYCLES_PER_BATCH)
-
-            # Read IEC bus state from shared memory
-            c64_atn_out, c64_clk_out, c64_data_out = shared_state.get_c64_outputs()
-
-            # Compute bus state (open-collector logic)
-            atn = not c64_atn_out
-
-            # Check for ATN edge and trigger interrupt
-            if atn != last_atn:
-                drive.via1.set_ca1(not atn)
-                last_atn = atn
-
-            # Update drive's cached IEC state
-            drive.iec_atn = atn
-
-            # Read our own VIA1 outputs for open-collector logic
-            orb = drive.via1.orb
-            ddrb = drive.via1.ddrb
-            our_clk_out = bool(ddrb & VIA1_CLK_OUT) and bool(orb & VIA1_CLK_OUT)
-            our_data_out = bool(ddrb & VIA1_DATA_OUT) and bool(orb & VIA1_DATA_OUT)
-            our_atna = bool(ddrb & VIA1_ATN_ACK) and bool(orb & VIA1_ATN_ACK)
-
-            # Combined bus state
-            clk = not (c64_clk_out or our_clk_out)
-            data = not (c64_data_out or our_data_out)
-
-            # ATN ACK XOR logic
-            if our_atna != (not atn):
-                data = False
-
-            drive.iec_clk = clk
-            drive.iec_data = data
-
-            # Update VIA timers
-            drive.via1.tick(cycles_to_run)
-            drive.via2.tick(cycles_to_run)
-
-            # Update GCR byte-ready timing if motor is running
-            if drive.motor_on and drive.gcr_disk:
-                drive._update_gcr_read(cycles_to_run)
+            # End the batch at the next C64 transition so it lands on time
+            end = min(limit, now + CYCLES_PER_BATCH)
+            pending = port.next_transition()
+            if pending is not None and pending < end:
+                end = max(pending, now + 1)
+
+            # Update VIA timers and GCR byte-ready timing
+            if end > via_clock:
+                cycles_to_run = end - via_clock
+                via_clock = end
+                drive.via1.tick(cycles_to_run)
+                drive.via2.tick(cycles_to_run)
+                if drive.motor_on and drive.gcr_disk:
+                    drive._update_gcr_read(cycles_to_run)
 
             # Execute CPU
             try:
-                drive_cpu.execute(cycles=cycles_to_run)
+                drive_cpu.execute(cycles=end - now)
             except CPUCycleExhaustionError:
                 pass
 
-            # Track cycles executed
-            drive_cycles += cycles_to_run
-            shared_state.set_drive_cycles(drive_cycles)
-
-            # Update shared memory with drive outputs
-            orb = drive.via1.orb
-            ddrb = drive.via1.ddrb
-            clk_out = bool(ddrb & VIA1_CLK_OUT) and bool(orb & VIA1_CLK_OUT)
-            data_out = bool(ddrb & VIA1_DATA_OUT) and bool(orb & VIA1_DATA_OUT)
-            atna_out = bool(ddrb & VIA1_ATN_ACK) and bool(orb & VIA1_ATN_ACK)
-            shared_state.set_drive_outputs(clk_out, data_out, atna_out)
+            shared_state.set_drive_cycles(port.now())
 
         subprocess_log.info(f"Drive {device_number} subprocess exiting normally")
 
@@ -228,11 +291,13 @@ def drive_process_main(
         traceback.print_exc()
 
     finally:
-        # Clean up
-        try:
-            shared_state.close()
-        except Exception:
-            pass
+        # Clean up; a C64 waiting on us stops when ready drops
+        if shared_state is not None:
+            try:
+                shared_state.set_drive_ready(False)
+                shared_state.close()
+            except Exception:
+                pass
 
 
 class MultiprocessDrive1541:
@@ -255,8 +320,6 @@ class MultiprocessDrive1541:
         self._process: Optional[Process] = None
         self._shared_state: Optional[SharedIECState] = None
         self._command_queue: Optional[Queue] = None
-        self._tick_request_event = None
-        self._tick_done_event = None
 
         # For compatibility with code that checks these
         self.cpu = None  # CPU is in subprocess
@@ -268,6 +331,7 @@ class MultiprocessDrive1541:
         rom_path_e000: Optional[Path] = None,
         disk_path: Optional[Path] = None,
         shared_state: Optional[SharedIECState] = None,
+        gcr_cache_dir: Optional[Path] = None,
     ) -> None:
         """Start the drive subprocess.
 
@@ -276,6 +340,7 @@ class MultiprocessDrive1541:
             rom_path_e000: Optional path to E000 ROM (for split ROMs)
             disk_path: Optional D64 disk image to insert
             shared_state: SharedIECState instance (creates new one if None)
+            gcr_cache_dir: Optional directory for caching encoded GCR tracks
         """
         if self._process is not None and self._process.is_alive():
             log.warning("Drive process already running")
@@ -293,10 +358,6 @@ class MultiprocessDrive1541:
         # Create command queue
         self._command_queue = Queue()
 
-        # Create Events for tick synchronization
-        self._tick_request_event = mp_context.Event()
-        self._tick_done_event = mp_context.Event()
-
         # Start subprocess
         self._process = Process(
             target=drive_process_main,
@@ -307,8 +368,7 @@ class MultiprocessDrive1541:
                 str(disk_path) if disk_path else None,
                 self.device_number,
                 self._command_queue,
-                self._tick_request_event,
-                self._tick_done_event,
+                str(gcr_cache_dir) if gcr_cache_dir else None,
             ),
             name=f"1541-Drive-{self.device_number}",
             daemon=True,
@@ -407,11 +467,3 @@ class MultiprocessDrive1541:
     def get_shared_state(self) -> Optional[SharedIECState]:
         """Get the shared state object for IEC bus communication."""
         return self._shared_state
-
-    def get_tick_events(self):
-        """Get the tick synchronization Events.
-
-        Returns:
-            Tuple of (tick_request_event, tick_done_event)
-        """
-        return self._tick_request_event, self._tick_done_event
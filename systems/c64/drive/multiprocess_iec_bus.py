@@ -4,14 +4,35 @@ This module provides a multiprocess version of the IEC bus that allows the
 C64 and 1541 drive to run in separate processes, bypassing the Python GIL
 for true parallel execution.
 
-Shared Memory Layout (64 bytes):
-    Bytes 0:     C64 outputs (ATN, CLK, DATA as bits 0-2)
-    Bytes 1:     Drive outputs (CLK, DATA, ATNA as bits 0-2)
-    Bytes 2:     Reserved
-    Bytes 3:     Control flags (ready, shutdown, disk-change)
-    Bytes 4-7:   C64 cycle counter (uint32, little-endian)
-    Bytes 8-11:  Drive cycle counter (uint32, little-endian)
-    Bytes 12-63: Reserved for future use
+Synchronization Protocol:
+    Each side publishes its clock (in CPU cycles) and pushes every change of
+    its IEC outputs, stamped with the cycle it happened at, into a
+    single-producer/single-consumer ring read by the other side. Neither side
+    waits for the other to run a batch; a side blocks only when it needs the
+    other side's bus state:
+
+    - C64 reads CIA2 port A at cycle t: wait until the drive clock reaches t,
+      then apply the drive transitions stamped <= t
+    - Drive reads VIA1 port B at cycle t: wait until the C64 clock reaches t,
+      then apply the C64 transitions stamped <= t
+
+    Apart from that the drive runs ahead of the published C64 clock by at
+    most MAX_SKEW cycles, which bounds how late it can see an ATN edge (the
+    only C64 line change that acts without a read: it raises the VIA1 CA1
+    interrupt). The C64 publishes its clock at least every SYNC_INTERVAL
+    cycles. The side with the smaller clock can always proceed, so the
+    protocol cannot deadlock.
+
+Shared Memory Layout:
+    Byte 0:        C64 outputs (ATN, CLK, DATA as bits 0-2), latest value
+    Byte 1:        Drive outputs (CLK, DATA, ATNA as bits 0-2), latest value
+    Byte 2:        Reserved
+    Byte 3:        Control flags (ready, shutdown, disk-change)
+    Bytes 64-71:   C64 clock (uint64): transitions before it are published
+    Bytes 128-135: Drive clock (uint64)
+    Bytes 192-:    C64 -> drive ring, then drive -> C64 ring (see
+                   TransitionRing). Producer and consumer indexes sit on
+                   separate cache lines.
 
 Signal Logic:
     - All lines are active-low (0 = asserted, 1 = released)
@@ -22,9 +43,9 @@ Signal Logic:
 from __future__ import annotations
 
 import logging
-import struct
+import time
 from multiprocessing import shared_memory
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 if TYPE_CHECKING:
     from ..cia2 import CIA2
@@ -36,14 +57,27 @@ OFFSET_C64_OUTPUTS = 0      # C64 ATN/CLK/DATA output bits
 OFFSET_DRIVE_OUTPUTS = 1    # Drive CLK/DATA/ATNA output bits
 OFFSET_RESERVED1 = 2        # Reserved
 OFFSET_CONTROL_FLAGS = 3    # Control flags
-OFFSET_C64_CYCLES = 4       # C64 cycle counter (4 bytes)
-OFFSET_DRIVE_CYCLES = 8     # Drive cycle counter (4 bytes)
-OFFSET_PENDING_TICKS = 12   # Pending tick cycles for drive to execute (4 bytes)
-OFFSET_TICK_DONE = 16       # Flag: drive has finished pending ticks (1 byte)
-SHARED_MEMORY_SIZE = 64     # Total size in bytes
+OFFSET_C64_CLOCK = 64       # C64 clock (8 bytes, own cache line)
+OFFSET_DRIVE_CLOCK = 128    # Drive clock (8 bytes, own cache line)
+OFFSET_C64_RING = 192       # C64 -> drive transition ring
 
-# Import multiprocessing Event for synchronization
-import multiprocessing
+# Transition rings: head word, tail word (next cache line), then slots of
+# (cycle, lines) words
+RING_SLOTS = 256
+RING_TAIL_WORD = 8
+RING_SLOT_WORD = 16
+RING_BYTES = (RING_SLOT_WORD + 2 * RING_SLOTS) * 8
+OFFSET_DRIVE_RING = OFFSET_C64_RING + RING_BYTES
+SHARED_MEMORY_SIZE = OFFSET_DRIVE_RING + RING_BYTES
+
+# The C64 publishes its clock at least this often (cycles)
+SYNC_INTERVAL = 64
+
+# How far the drive may run ahead of the published C64 clock (cycles)
+MAX_SKEW = 128
+
+# A blocked side gives up on a stalled peer after this long (seconds)
+SYNC_TIMEOUT = 1.0
 
 # C64 output bits (byte 0)
 C64_ATN_OUT_BIT = 0x01      # Bit 0: ATN output (True = driving low)
@@ -61,12 +95,124 @@ FLAG_SHUTDOWN = 0x02        # Bit 1: Shutdown requested
 FLAG_DISK_CHANGE = 0x04     # Bit 2: Disk change pending
 
 
+def resolve_bus(c64_lines: int, drive_lines: int) -> tuple[bool, bool, bool]:
+    """Combine both sides' output bits using open-collector logic.
+
+    Args:
+        c64_lines: C64_*_OUT_BIT bits
+        drive_lines: DRIVE_*_OUT_BIT bits
+
+    Returns:
+        Tuple of (atn, clk, data) where True = released/high, False = asserted/low
+    """
+    # ATN: Only C64 can drive ATN
+    atn_asserted = bool(c64_lines & C64_ATN_OUT_BIT)
+    clk_low = bool(c64_lines & C64_CLK_OUT_BIT) or bool(drive_lines & DRIVE_CLK_OUT_BIT)
+    data_low = bool(c64_lines & C64_DATA_OUT_BIT) or bool(drive_lines & DRIVE_DATA_OUT_BIT)
+    # ATN ACK XOR logic: if ATNA differs from ATN, pull DATA low
+    if bool(drive_lines & DRIVE_ATNA_OUT_BIT) != atn_asserted:
+        data_low = True
+    return (not atn_asserted, not clk_low, not data_low)
+
+
+def spin_until(ready: Callable[[], bool], give_up: Callable[[], bool],
+               timeout: Optional[float] = SYNC_TIMEOUT) -> bool:
+    """Wait for ready() to become true, spinning first and then backing off.
+
+    Args:
+        ready: Condition to wait for (reads shared memory)
+        give_up: Checked while waiting; True stops the wait (peer gone, shutdown)
+        timeout: Seconds before giving up, None to wait indefinitely
+
+    Returns:
+        True if ready() became true
+    """
+    for _ in range(200):
+        if ready():
+            return True
+    start = time.monotonic()
+    spins = 0
+    while not ready():
+        if give_up():
+            return False
+        spins += 1
+        if spins < 1000:
+            time.sleep(0)         # Yield, stay responsive
+        else:
+            time.sleep(0.0001)    # Peer is busy for a while (or idle)
+            if timeout is not None and time.monotonic() - start > timeout:
+                return False
+    return True
+
+
+class TransitionRing:
+    """Single-producer/single-consumer ring of cycle-stamped IEC line states.
+
+    One process only calls push(), the other only peek() and pop(). The
+    producer writes a slot before publishing the head index; the consumer
+    reads a slot before publishing the tail index. Each index is an aligned
+    8-byte word written by one side only, so no lock is needed.
+    """
+
+    def __init__(self, buf: memoryview, offset: int) -> None:
+        self._words = buf[offset:offset + RING_BYTES].cast("Q")
+
+    def release(self) -> None:
+        """Release the view of the shared memory (required before closing it)."""
+        self._words.release()
+
+    def __len__(self) -> int:
+        words = self._words
+        return words[0] - words[RING_TAIL_WORD]
+
+    def push(self, cycle: int, lines: int) -> bool:
+        """Append a transition; returns False if the ring is full."""
+        words = self._words
+        head = words[0]
+        if head - words[RING_TAIL_WORD] >= RING_SLOTS:
+            return False
+        slot = RING_SLOT_WORD + 2 * (head % RING_SLOTS)
+        words[slot] = cycle
+        words[slot + 1] = lines
+        words[0] = head + 1
+        return True
+
+    def peek(self) -> Optional[tuple[int, int]]:
+        """Return the oldest (cycle, lines) transition without consuming it."""
+        words = self._words
+        tail = words[RING_TAIL_WORD]
+        if words[0] == tail:
+            return None
+        slot = RING_SLOT_WORD + 2 * (tail % RING_SLOTS)
+        return words[slot], words[slot + 1]
+
+    def pop(self) -> None:
+        """Consume the oldest transition (after peek() returned it)."""
+        words = self._words
+        words[RING_TAIL_WORD] = words[RING_TAIL_WORD] + 1
+
+    def pop_until(self, cycle: int) -> Optional[int]:
+        """Consume the transitions stamped <= cycle.
+
+        Returns:
+            The lines of the last one consumed, or None if none was due
+        """
+        lines = None
+        while True:
+            entry = self.peek()
+            if entry is None or entry[0] > cycle:
+                return lines
+            lines = entry[1]
+            self.pop()
+
+
 class SharedIECState:
     """Manages shared memory for IEC bus state between processes.
 
-    This class provides atomic read/write operations for IEC bus signals
-    and cycle counters. Single-byte operations are inherently atomic on
-    modern CPUs, so no explicit locking is needed for the signal bytes.
+    Holds the two transition rings and the two clocks of the synchronization
+    protocol (see module docstring), plus the latest output bytes and control
+    flags. Single-byte and aligned 8-byte stores are atomic on the platforms
+    we run on, so no explicit locking is needed.
     """
 
     def __init__(self, name: str, create: bool = True) -> None:
@@ -103,6 +249,12 @@ class SharedIECState:
             self._shm = shared_memory.SharedMemory(name=name, create=False)
             log.debug(f"Attached to shared memory '{name}'")
 
+        buf = self._shm.buf
+        self._clocks = buf[OFFSET_C64_CLOCK:OFFSET_C64_RING].cast("Q")
+        self._drive_clock_word = (OFFSET_DRIVE_CLOCK - OFFSET_C64_CLOCK) // 8
+        self.c64_ring = TransitionRing(buf, OFFSET_C64_RING)
+        self.drive_ring = TransitionRing(buf, OFFSET_DRIVE_RING)
+
     @property
     def name(self) -> str:
         """Get the shared memory segment name."""
@@ -111,6 +263,9 @@ class SharedIECState:
     def close(self) -> None:
         """Close the shared memory handle (does not destroy it)."""
         if self._shm is not None:
+            self.c64_ring.release()
+            self.drive_ring.release()
+            self._clocks.release()
             self._shm.close()
             self._shm = None
 
@@ -189,7 +344,10 @@ class SharedIECState:
     # --- Bus State Computation ---
 
     def get_bus_state(self, is_drive: bool = False) -> tuple[bool, bool, bool]:
-        """Compute combined bus state using open-collector logic.
+        """Compute combined bus state from the latest outputs.
+
+        This is the current state as last written by each side, not the
+        state at a particular cycle (see MultiprocessIECBus.sync).
 
         Args:
             is_drive: If True, exclude drive's own outputs from calculation
@@ -197,63 +355,47 @@ class SharedIECState:
         Returns:
             Tuple of (atn, clk, data) where True = released/high, False = asserted/low
         """
-        c64_atn_out, c64_clk_out, c64_data_out = self.get_c64_outputs()
-
-        # ATN: Only C64 can drive ATN
-        atn = not c64_atn_out
-
-        # CLK and DATA: Open-collector - start with C64's contribution
-        clk_low = c64_clk_out
-        data_low = c64_data_out
-
-        if not is_drive:
-            # C64 reading: include drive outputs
-            drive_clk_out, drive_data_out, drive_atna_out = self.get_drive_outputs()
-            if drive_clk_out:
-                clk_low = True
-            if drive_data_out:
-                data_low = True
-
-            # ATN ACK XOR logic: if ATNA differs from ATN, pull DATA low
-            atn_asserted = not atn
-            if drive_atna_out != atn_asserted:
-                data_low = True
-
-        return (atn, not clk_low, not data_low)
+        c64_lines = self._shm.buf[OFFSET_C64_OUTPUTS]
+        if is_drive:
+            atn, clk, _data = resolve_bus(c64_lines, 0)
+            return (atn, clk, not (c64_lines & C64_DATA_OUT_BIT))
+        return resolve_bus(c64_lines, self._shm.buf[OFFSET_DRIVE_OUTPUTS])
 
-    # --- Cycle Counter Methods ---
+    # --- Clock Methods ---
 
     def set_c64_cycles(self, cycles: int) -> None:
-        """Update C64 cycle counter.
+        """Publish the C64 clock.
+
+        All C64 transitions stamped before it must already be pushed.
 
         Args:
             cycles: Current C64 CPU cycle count
         """
-        struct.pack_into('<I', self._shm.buf, OFFSET_C64_CYCLES, cycles & 0xFFFFFFFF)
+        self._clocks[0] = cycles
 
     def get_c64_cycles(self) -> int:
-        """Get C64 cycle counter.
+        """Get the published C64 clock.
 
         Returns:
-            Current C64 CPU cycle count
+            C64 CPU cycle count
         """
-        return struct.unpack_from('<I', self._shm.buf, OFFSET_C64_CYCLES)[0]
+        return self._clocks[0]
 
     def set_drive_cycles(self, cycles: int) -> None:
-        """Update drive cycle counter.
+        """Publish the drive clock (in C64 cycles, see DriveIECPort).
 
         Args:
-            cycles: Current drive CPU cycle count
+            cycles: Current drive cycle count
         """
-        struct.pack_into('<I', self._shm.buf, OFFSET_DRIVE_CYCLES, cycles & 0xFFFFFFFF)
+        self._clocks[self._drive_clock_word] = cycles
 
     def get_drive_cycles(self) -> int:
-        """Get drive cycle counter.
+        """Get the published drive clock.
 
         Returns:
-            Current drive CPU cycle count
+            Drive cycle count
         """
-        return struct.unpack_from('<I', self._shm.buf, OFFSET_DRIVE_CYCLES)[0]
+        return self._clocks[self._drive_clock_word]
 
     # --- Control Flag Methods ---
 
@@ -297,47 +439,6 @@ class SharedIECState:
         """Check if drive process is ready."""
         return self.get_flag(FLAG_DRIVE_READY)
 
-    # --- Tick Synchronization Methods ---
-
-    def set_pending_ticks(self, cycles: int) -> None:
-        """Set number of cycles for drive to execute.
-
-        Args:
-            cycles: Number of cycles to run
-        """
-        struct.pack_into('<I', self._shm.buf, OFFSET_PENDING_TICKS, cycles & 0xFFFFFFFF)
-        # Clear done flag when setting new ticks
-        self._shm.buf[OFFSET_TICK_DONE] = 0
-
-    def get_pending_ticks(self) -> int:
-        """Get pending tick count.
-
-        Returns:
-            Number of cycles still pending
-        """
-        return struct.unpack_from('<I', self._shm.buf, OFFSET_PENDING_TICKS)[0]
-
-    def clear_pending_ticks(self) -> None:
-        """Clear pending ticks (drive consumed them)."""
-        struct.pack_into('<I', self._shm.buf, OFFSET_PENDING_TICKS, 0)
-
-    def set_tick_done(self) -> None:
-        """Signal that drive finished processing ticks."""
-        self._shm.buf[OFFSET_TICK_DONE] = 1
-
-    def is_tick_done(self) -> bool:
-        """Check if drive finished processing ticks."""
-        return self._shm.buf[OFFSET_TICK_DONE] != 0
-
-    def add_ticks(self, cycles: int) -> None:
-        """Add cycles to pending ticks (atomic increment).
-
-        Args:
-            cycles: Number of cycles to add
-        """
-        current = self.get_pending_ticks()
-        struct.pack_into('<I', self._shm.buf, OFFSET_PENDING_TICKS, (current + cycles) & 0xFFFFFFFF)
-
 
 class MultiprocessIECBus:
     """IEC Bus implementation for C64 side of multiprocess mode.
@@ -355,11 +456,22 @@ class MultiprocessIECBus:
         self._shared = shared_state
         self.cia2: Optional[CIA2] = None
 
+        # Our outputs as last pushed, and the drive's as of the last sync
+        self._c64_lines = 0
+        self._drive_lines = 0
+
         # Cached bus state for get_c64_input() speed
         self.atn = True
         self.clk = True
         self.data = True
 
+        # Scheduler event publishing the C64 clock (see attach_scheduler)
+        self.clock_event = None
+
+        # Reads that had to wait for the drive, and waits that timed out
+        self.waits = 0
+        self.timeouts = 0
+
     def connect_c64(self, cia2: CIA2) -> None:
         """Connect C64's CIA2 to the bus.
 
@@ -369,11 +481,31 @@ class MultiprocessIECBus:
         self.cia2 = cia2
         log.info("C64 connected to multiprocess IEC bus")
 
+    def attach_scheduler(self, scheduler) -> None:
+        """Publish the C64 clock every SYNC_INTERVAL cycles from a scheduler event.
+
+        Without it the drive only learns the C64 clock on IEC register access
+        and stops MAX_SKEW cycles past it.
+        """
+        self.clock_event = scheduler.add(self._on_clock_event, "iec-clock")
+        self.clock_event.schedule(self.cia2.cpu.cycles_executed + SYNC_INTERVAL)
+
+    def _on_clock_event(self, cycle: int) -> None:
+        """Scheduler callback: publish the clock and schedule the next one."""
+        self.set_c64_cycles(self.cia2.cpu.cycles_executed)
+        self.clock_event.schedule(cycle + SYNC_INTERVAL)
+
+    def close(self) -> None:
+        """Stop publishing the clock (before the shared memory is closed)."""
+        if self.clock_event is not None:
+            self.clock_event.cancel()
+            self.clock_event = None
+
     def update(self) -> None:
-        """Update bus state by reading CIA2 and writing to shared memory.
+        """Push a change of the C64's IEC outputs, stamped with the current cycle.
 
-        This should be called after each C64 instruction to keep the
-        drive process informed of C64's IEC outputs.
+        Called when CIA2 port A or its DDR is written (and before port A
+        reads). Never waits for the drive unless the ring is full.
         """
         if self.cia2 is None:
             return
@@ -383,83 +515,87 @@ class MultiprocessIECBus:
         c64_ddr_a = self.cia2.ddr_a
 
         # Only consider bits that are configured as outputs
-        atn_out = bool(c64_ddr_a & 0x08) and bool(c64_port_a & 0x08)
-        clk_out = bool(c64_ddr_a & 0x10) and bool(c64_port_a & 0x10)
-        data_out = bool(c64_ddr_a & 0x20) and bool(c64_port_a & 0x20)
+        outputs = c64_port_a & c64_ddr_a
+        lines = (
+            (C64_ATN_OUT_BIT if outputs & 0x08 else 0)
+            | (C64_CLK_OUT_BIT if outputs & 0x10 else 0)
+            | (C64_DATA_OUT_BIT if outputs & 0x20 else 0)
+        )
+        if lines == self._c64_lines:
+            return
+
+        now = self.cia2.cpu.cycles_executed
+        shared = self._shared
+        ring = shared.c64_ring
+        if not ring.push(now, lines):
+            # Full: let the drive run up to now and consume
+            shared.set_c64_cycles(now)
+            if not spin_until(lambda: ring.push(now, lines), lambda: not shared.is_drive_ready()):
+                self.timeouts += 1
+        shared.set_c64_cycles(now)
+        shared.set_c64_outputs(
+            bool(lines & C64_ATN_OUT_BIT), bool(lines & C64_CLK_OUT_BIT), bool(lines & C64_DATA_OUT_BIT)
+        )
+        self._c64_lines = lines
+        self.atn, self.clk, self.data = resolve_bus(lines, self._drive_lines)
 
-        # Write to shared memory
-        self._shared.set_c64_outputs(atn_out, clk_out, data_out)
+    def sync(self, now: int) -> None:
+        """Bring the drive's outputs up to cycle now.
 
-        # Read bus state (includes drive outputs)
-        self.atn, self.clk, self.data = self._shared.get_bus_state(is_drive=False)
+        Publishes the C64 clock, waits until the drive clock reaches now and
+        applies the drive transitions stamped <= now.
+        """
+        shared = self._shared
+        ring = shared.drive_ring
+        shared.set_c64_cycles(now)
+
+        if shared.get_drive_cycles() < now and shared.is_drive_ready():
+            self.waits += 1
+
+            def caught_up() -> bool:
+                # Drain while waiting: a drive blocked on a full ring needs the space
+                lines = ring.pop_until(now)
+                if lines is not None:
+                    self._drive_lines = lines
+                return shared.get_drive_cycles() >= now
+
+            if not spin_until(caught_up, lambda: not shared.is_drive_ready()):
+                self.timeouts += 1
+                if self.timeouts == 1:
+                    log.warning("Drive process did not keep up; continuing with stale bus state")
+
+        lines = ring.pop_until(now)
+        if lines is not None:
+            self._drive_lines = lines
+        self.atn, self.clk, self.data = resolve_bus(self._c64_lines, self._drive_lines)
 
     def get_c64_input(self) -> int:
-        """Get the bus state for CIA2 Port A input bits.
+        """Get the bus state for CIA2 Port A input bits at the current cycle.
 
         Returns:
             Port A input value (bits 6-7: CLK IN, DATA IN)
         """
-        # Use cached values from last update() call
+        if self.cia2 is not None:
+            self.sync(self.cia2.cpu.cycles_executed)
         # CLK on bit 6, DATA on bit 7 - set means line is HIGH (released)
         return 0x3F | (0x40 if self.clk else 0) | (0x80 if self.data else 0)
 
     def set_c64_cycles(self, cycles: int) -> None:
-        """Update the C64 cycle counter for drive synchronization.
+        """Publish the C64 clock and consume the drive transitions it passed.
 
         Args:
             cycles: Current C64 CPU cycle count
         """
         self._shared.set_c64_cycles(cycles)
+        lines = self._shared.drive_ring.pop_until(cycles)
+        if lines is not None:
+            self._drive_lines = lines
+            self.atn, self.clk, self.data = resolve_bus(self._c64_lines, lines)
 
     def sync_drives(self) -> None:
         """No-op in multiprocess mode - drive runs independently."""
         pass
 
-    def set_tick_events(self, tick_request: multiprocessing.Event,
-                        tick_done: multiprocessing.Event) -> None:
-        """Set the Events used for tick synchronization.
-
-        Args:
-            tick_request: Event to signal drive that ticks are pending
-            tick_done: Event drive sets when ticks are processed
-        """
-        self._tick_request = tick_request
-        self._tick_done = tick_done
-
-    def tick(self, cycles: int) -> None:
-        """Send tick cycles to drive and wait for completion.
-
-        This provides synchronous tick-based execution similar to threaded mode.
-        The method blocks until the drive has processed the ticks.
-
-        Args:
-            cycles: Number of cycles to execute
-        """
-        # Add cycles to pending ticks
-        self._shared.add_ticks(cycles)
-
-        # Signal drive that ticks are pending
-        if hasattr(self, '_tick_request') and self._tick_request:
-            self._tick_done.clear()
-            self._tick_request.set()
-
-            # Wait for drive to process the ticks (with timeout)
-            if not self._tick_done.wait(timeout=0.1):
-                # Timeout - clear pending and continue
-                self._shared.clear_pending_ticks()
-        else:
-            # Fallback: spin-wait if Events not set up
-            max_spins = 10000
-            spins = 0
-            while self._shared.get_pending_ticks() > 0:
-                spins += 1
-                if spins >= max_spins:
-                    self._shared.clear_pending_ticks()
-                    break
-
-        # Read updated bus state after drive processed ticks
-        self.atn, self.clk, self.data = self._shared.get_bus_state(is_drive=False)
-
     @property
     def drives(self) -> list:
         """Get list of connected drives (empty in multiprocess mode)."""
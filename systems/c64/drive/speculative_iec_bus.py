@@ -0,0 +1,415 @@
+"""Speculative IEC Serial Bus Emulation.
+
+The synchronous runner ticks the drive from the C64's post_tick_callback, a
+few cycles at a time. That costs a call per C64 instruction and, since any
+per-tick hook turns them off, keeps the C64 off the block engine and
+idle-loop skipping.
+
+SpeculativeIECBus instead runs the drive from a scheduler event, up to
+`window` cycles ahead of the C64, assuming the C64's IEC outputs stay as
+they are. A checkpoint of the drive (CPU registers, RAM, both VIAs, head
+and GCR state) is taken at the start of each run-ahead batch. The drive's
+output changes are recorded with the cycle they happened at, so a C64 read
+of CIA2 port A at cycle t resolves the bus exactly as it was at t, even
+though the drive has already run past t.
+
+When the C64 changes a line at cycle t and the drive has already run past t,
+the speculation is checked against it:
+
+    - ATN changed: conflict (it raises VIA1 CA1 at t)
+    - CLK/DATA changed: conflict if the drive read VIA1 port B at or after t
+
+With no conflict the change is simply applied: nothing the drive did
+depended on it. On a conflict the drive is restored to the checkpoint and
+replayed to t, applying the C64 changes recorded since the checkpoint at
+their cycles, so timing stays exact. The window halves on each rollback
+and grows by a quarter after each batch that ran without one: between
+transfers the bus is quiet and the drive runs in large batches; during a
+transfer it stays close behind the C64.
+
+Disk writes are not undone: while the drive is in write mode it does not
+run ahead, and entering write mode during a run-ahead batch ends the batch.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from .drive1541 import Drive1541, VIA1_ATN_ACK, VIA1_CLK_OUT, VIA1_DATA_OUT
+from .iec_bus import IECBus
+
+if TYPE_CHECKING:
+    from .gcr import GCRTrack
+
+log = logging.getLogger("iec_bus")
+
+# Run-ahead window bounds (cycles past the C64)
+MIN_RUN_AHEAD = 64
+MAX_RUN_AHEAD = 8192
+
+# Drive cycles per Drive1541.tick() call: the VIA timers and the GCR byte
+# clock advance in steps of this size (below the fastest byte time of 26)
+DRIVE_STEP = 16
+
+# Recorded drive outputs: VIA1 port B output bits, plus this bit while the
+# ATN acknowledge bit is configured as an output
+ATNA_DRIVEN = 0x100
+
+# Drive1541 attributes saved in a checkpoint
+DRIVE_FIELDS = (
+    "iec_atn", "iec_clk", "iec_data",
+    "current_track", "current_sector", "motor_on", "led_on", "stepper_phase",
+    "_byte_ready_counter", "_last_gcr_byte", "_sync_detected", "_consecutive_ff_count",
+    "_write_mode", "_write_track", "_pending_cycles",
+    "asleep", "_sleep_cycles", "_wake_cycle",
+)
+
+
+@dataclass
+class DriveCheckpoint:
+    """Drive state at the start of a run-ahead batch."""
+
+    cycle: int
+    registers: tuple
+    cpu_cycles: int
+    irq_pending: bool
+    nmi_pending: bool
+    nmi_line_previous: bool
+    ram: bytes
+    via1: dict
+    via2: dict
+    fields: tuple
+    write_buffer: list
+    tracks: list
+
+    @classmethod
+    def take(cls, drive: Drive1541, cycle: int) -> DriveCheckpoint:
+        """Capture the drive's state at (C64) cycle."""
+        cpu = drive.cpu
+        gcr_disk = drive.gcr_disk
+        tracks = []
+        if gcr_disk is not None:
+            tracks = [
+                (track, track.byte_position, track.bit_position)
+                for track in gcr_disk.tracks if track is not None
+            ]
+        return cls(
+            cycle=cycle,
+            registers=(cpu.PC, cpu.A, cpu.X, cpu.Y, cpu.S, cpu._flags.value),
+            cpu_cycles=cpu.cycles_executed,
+            irq_pending=cpu.irq_pending,
+            nmi_pending=cpu.nmi_pending,
+            nmi_line_previous=cpu._nmi_line_previous,
+            ram=bytes(drive.memory.ram),
+            via1=drive.via1.__dict__.copy(),
+            via2=drive.via2.__dict__.copy(),
+            fields=tuple(getattr(drive, name) for name in DRIVE_FIELDS),
+            write_buffer=list(drive._gcr_write_buffer),
+            tracks=tracks,
+        )
+
+    def restore(self, drive: Drive1541) -> None:
+        """Put the drive back into the captured state."""
+        cpu = drive.cpu
+        cpu.PC, cpu.A, cpu.X, cpu.Y, cpu.S, flags = self.registers
+        cpu._flags.value = flags
+        cpu.cycles_executed = self.cpu_cycles
+        cpu.irq_pending = self.irq_pending
+        cpu.nmi_pending = self.nmi_pending
+        cpu._nmi_line_previous = self.nmi_line_previous
+        drive.memory.ram[:] = self.ram
+        drive.via1.__dict__.update(self.via1)
+        drive.via2.__dict__.update(self.via2)
+        for name, value in zip(DRIVE_FIELDS, self.fields):
+            setattr(drive, name, value)
+        drive._gcr_write_buffer[:] = self.write_buffer
+        track: GCRTrack
+        for track, byte_position, bit_position in self.tracks:
+            track.byte_position = byte_position
+            track.bit_position = bit_position
+        # Tracks first encoded after the checkpoint go back to their initial position
+        if drive.gcr_disk is not None:
+            checkpointed = {track for track, _byte_position, _bit_position in self.tracks}
+            for track in drive.gcr_disk.tracks:
+                if track is not None and track not in checkpointed:
+                    track.byte_position = 0
+                    track.bit_position = 0
+
+
+class SpeculativeIECBus(IECBus):
+    """IEC bus that runs one Drive1541 ahead of the C64 and rolls back on conflicts.
+
+    The drive's clock is kept in C64 cycles, starting at the C64's cycle when
+    attach_scheduler() is called.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the speculative IEC bus."""
+        super().__init__()
+        self.drive: Optional[Drive1541] = None
+        self.drive_event = None
+
+        # C64 outputs (port A bits 3-5 as driven) and the changes applied
+        # since the checkpoint, as (cycle, outputs)
+        self._c64_outputs = 0
+        self._c64_changes: list[tuple[int, int]] = []
+
+        # Drive clock (cycles its VIAs have been ticked to) and the offset
+        # from its CPU's cycles_executed; equal between instructions apart
+        # from the CPU's tick budget (see Drive1541.tick)
+        self.drive_cycle = 0
+        self._cpu_origin = 0
+
+        # Drive outputs at the checkpoint, and the changes since as
+        # parallel lists of cycles and outputs
+        self._drive_outputs_base = 0
+        self._drive_output_cycles: list[int] = []
+        self._drive_outputs: list[int] = []
+
+        # Last cycle the drive read VIA1 port B (-1: never)
+        self._last_port_b_read = -1
+
+        # Checkpoint of the current batch (None while writing), the C64
+        # outputs, drive output changes and last port B read at it, and
+        # whether the batch was rolled back
+        self._checkpoint: Optional[DriveCheckpoint] = None
+        self._checkpoint_c64_outputs = 0
+        self._checkpoint_outputs: tuple[list[int], list[int]] = ([], [])
+        self._checkpoint_port_b_read = -1
+        self._rolled_back = False
+
+        self._stop = False
+        self._in_drive = False
+        self.window = MAX_RUN_AHEAD
+
+        # Statistics
+        self.batches = 0
+        self.rollbacks = 0
+        self.discarded_cycles = 0
+        self.replayed_cycles = 0
+        self.late_changes = 0
+
+    def connect_drive(self, drive: Drive1541) -> None:
+        """Connect the drive (only one drive is supported).
+
+        Args:
+            drive: 1541 drive to connect
+
+        Raises:
+            ValueError: If a drive is already connected
+        """
+        if self.drive is not None and self.drive is not drive:
+            raise ValueError("SpeculativeIECBus supports a single drive")
+        super().connect_drive(drive)
+        self.drive = drive
+
+        # Record port B reads and stop run-ahead on entering write mode
+        read_port_b = drive._via1_port_b_read
+
+        def port_b_read() -> int:
+            self._last_port_b_read = self._cpu_cycle()
+            return read_port_b()
+
+        pcr_write = drive._via2_pcr_write
+
+        def via2_pcr_write(value: int) -> None:
+            pcr_write(value)
+            if drive._write_mode and self._cpu_cycle() > self._c64_cycle():
+                self._stop = True
+                drive.cpu.cycles = 0  # Leave execute() at the next instruction
+
+        drive.via1.port_b_read_callback = port_b_read
+        drive.via2.pcr_write_callback = via2_pcr_write
+
+    def attach_scheduler(self, scheduler) -> None:
+        """Run the drive from a scheduler event, starting at the C64's current cycle."""
+        now = self._c64_cycle()
+        self.drive_cycle = now
+        self._cpu_origin = now - self.drive.cpu.cycles_executed - self.drive._pending_cycles
+        self._drive_outputs_base = self._read_drive_outputs()
+        self.update()
+        self.drive_event = scheduler.add(self._on_drive_event, "drive")
+        self.drive_event.schedule(now)
+
+    def _on_drive_event(self, cycle: int) -> None:
+        """Scheduler callback: start the next batch once the C64 has caught up."""
+        if self.drive_cycle <= cycle:
+            self._run_ahead(cycle)
+        self.drive_event.schedule(max(self.drive_cycle, cycle + 1))
+
+    def _c64_cycle(self) -> int:
+        """Return the C64 CPU's cycle."""
+        return self.cia2.cpu.cycles_executed
+
+    def _cpu_cycle(self) -> int:
+        """Return the drive CPU's position in C64 cycles."""
+        return self._cpu_origin + self.drive.cpu.cycles_executed
+
+    def _read_drive_outputs(self) -> int:
+        """Return the drive's current outputs (VIA1 port B bits, plus ATNA_DRIVEN)."""
+        via1 = self.drive.via1
+        outputs = via1.orb & via1.ddrb & (VIA1_CLK_OUT | VIA1_DATA_OUT | VIA1_ATN_ACK)
+        if via1.ddrb & VIA1_ATN_ACK:
+            outputs |= ATNA_DRIVEN
+        return outputs
+
+    def _drive_outputs_at(self, cycle: int) -> int:
+        """Return the drive's outputs as they were at cycle."""
+        index = bisect.bisect_right(self._drive_output_cycles, cycle)
+        return self._drive_outputs[index - 1] if index else self._drive_outputs_base
+
+    @staticmethod
+    def _resolve(c64_outputs: int, drive_outputs: int) -> tuple[bool, bool, bool]:
+        """Return (atn, clk, data) from both sides' outputs (True = released)."""
+        atn_asserted = bool(c64_outputs & 0x08)
+        clk_low = bool(c64_outputs & 0x10) or bool(drive_outputs & VIA1_CLK_OUT)
+        data_low = bool(c64_outputs & 0x20) or bool(drive_outputs & VIA1_DATA_OUT)
+        # ATN ACK XOR: differing states pull DATA low
+        if drive_outputs & ATNA_DRIVEN and bool(drive_outputs & VIA1_ATN_ACK) != atn_asserted:
+            data_low = True
+        return (not atn_asserted, not clk_low, not data_low)
+
+    def _set_drive_lines(self) -> None:
+        """Update the lines the drive sees from the current outputs of both sides."""
+        drive = self.drive
+        atn, drive.iec_clk, drive.iec_data = self._resolve(self._c64_outputs, self._read_drive_outputs())
+        if atn != drive.iec_atn:
+            drive.set_iec_atn(atn)
+
+    # --- Drive execution ---
+
+    def _advance(self, target: int) -> None:
+        """Run the drive to target unless a write-mode barrier stops it."""
+        drive = self.drive
+        tick = Drive1541.tick
+        self._in_drive = True
+        try:
+            while self.drive_cycle < target and not self._stop:
+                step = min(DRIVE_STEP, target - self.drive_cycle)
+                tick(drive, step)
+                self.drive_cycle += step
+        finally:
+            self._in_drive = False
+            self._stop = False
+
+    def _run_ahead(self, now: int) -> None:
+        """Checkpoint the drive (at or before now) and run it past now."""
+        if self.drive is None or self.drive.cpu is None:
+            return
+        self._commit(now)
+        window = 0 if self.drive._write_mode else self.window
+        self.batches += 1
+        self._advance(now + window)
+        if self.drive_cycle < now:
+            self._advance(now)
+
+    def _commit(self, now: int) -> None:
+        """Take a checkpoint at the drive's position (which the C64 has reached)."""
+        drive = self.drive
+        if not self._rolled_back:
+            self.window = min(MAX_RUN_AHEAD, self.window + self.window // 4)
+        self._rolled_back = False
+        self._checkpoint = None if drive._write_mode else DriveCheckpoint.take(drive, self.drive_cycle)
+        self._checkpoint_c64_outputs = self._c64_outputs
+        self._c64_changes.clear()
+
+        # Fold the drive outputs the C64 has passed into the base; the last
+        # instruction may have overshot now, so later ones stay recorded
+        index = bisect.bisect_right(self._drive_output_cycles, now)
+        if index:
+            self._drive_outputs_base = self._drive_outputs[index - 1]
+            del self._drive_output_cycles[:index]
+            del self._drive_outputs[:index]
+        self._checkpoint_outputs = (list(self._drive_output_cycles), list(self._drive_outputs))
+        self._checkpoint_port_b_read = self._last_port_b_read
+
+    def _rollback(self, now: int) -> bool:
+        """Restore the checkpoint and replay the recorded C64 changes up to now.
+
+        Returns:
+            False if there is no checkpoint at or before now
+        """
+        checkpoint = self._checkpoint
+        if checkpoint is None or checkpoint.cycle > now:
+            return False
+        self.rollbacks += 1
+        self.discarded_cycles += self.drive_cycle - checkpoint.cycle
+        self.replayed_cycles += now - checkpoint.cycle
+        self._rolled_back = True
+        self.window = max(MIN_RUN_AHEAD, self.window // 2)
+
+        checkpoint.restore(self.drive)
+        self.drive_cycle = checkpoint.cycle
+        cycles, outputs = self._checkpoint_outputs
+        self._drive_output_cycles[:] = cycles
+        self._drive_outputs[:] = outputs
+        self._last_port_b_read = self._checkpoint_port_b_read
+
+        self._c64_outputs = self._checkpoint_c64_outputs
+        self._set_drive_lines()
+        for cycle, outputs in self._c64_changes:
+            self._advance(cycle)
+            self._c64_outputs = outputs
+            self._set_drive_lines()
+        self._advance(now)
+        return True
+
+    def sync_drives(self) -> None:
+        """Run the drive up to the current C64 cycle."""
+        if self.cia2 is not None and self.drive is not None and self.drive_cycle < self._c64_cycle():
+            self._run_ahead(self._c64_cycle())
+
+    # --- Bus interface ---
+
+    def update(self) -> None:
+        """Apply a change of either side's outputs.
+
+        From the drive (VIA1 port B write), records the new outputs at the
+        drive's cycle. From the C64 (CIA2 port A write), applies the new
+        outputs at the C64's cycle, rolling the drive back if it already ran
+        past that cycle depending on the old ones.
+        """
+        cia2 = self.cia2
+        drive = self.drive
+        if cia2 is None or drive is None:
+            return
+
+        if self._in_drive:
+            outputs = self._read_drive_outputs()
+            if outputs != (self._drive_outputs[-1] if self._drive_outputs else self._drive_outputs_base):
+                self._drive_output_cycles.append(self._cpu_cycle())
+                self._drive_outputs.append(outputs)
+            self._set_drive_lines()
+            return
+
+        outputs = cia2.port_a & cia2.ddr_a & 0x38
+        if outputs == self._c64_outputs:
+            return
+        now = self._c64_cycle()
+        if self.drive_cycle < now:
+            self._advance(now)
+        elif (outputs ^ self._c64_outputs) & 0x08 or self._last_port_b_read >= now:
+            # The drive ran past now depending on the old outputs
+            if not self._rollback(now):
+                self.late_changes += 1
+
+        self._c64_changes.append((now, outputs))
+        self._c64_outputs = outputs
+        self._set_drive_lines()
+        self.atn, self.clk, self.data = self._resolve(outputs, self._drive_outputs_at(now))
+
+    def get_c64_input(self) -> int:
+        """Get the bus state for CIA2 Port A input bits at the current cycle.
+
+        Returns:
+            Port A input value (bits 6-7: CLK IN, DATA IN)
+        """
+        if self.cia2 is not None and self.drive is not None:
+            now = self._c64_cycle()
+            if self.drive_cycle < now:
+                self._run_ahead(now)
+            self.atn, self.clk, self.data = self._resolve(self._c64_outputs, self._drive_outputs_at(now))
+        return 0x3F | (0x40 if self.clk else 0) | (0x80 if self.data else 0)
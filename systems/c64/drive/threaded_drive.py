@@ -25,6 +25,8 @@ from .threaded_iec_bus import ThreadedIECBus
 from mos6502.errors import CPUCycleExhaustionError
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from mos6502.core import MOS6502CPU
 
 log = logging.getLogger("drive1541")
@@ -46,13 +48,14 @@ class ThreadedDrive1541(Drive1541):
     # Disabled (0) for maximum IEC responsiveness
     MIN_SLEEP_TIME = 0
 
-    def __init__(self, device_number: int = 8) -> None:
+    def __init__(self, device_number: int = 8, gcr_cache_dir: Optional[Path] = None) -> None:
         """Initialize threaded 1541 drive.
 
         Args:
             device_number: IEC device number (8-11, default 8)
+            gcr_cache_dir: Directory for caching encoded GCR tracks, or None
         """
-        super().__init__(device_number)
+        super().__init__(device_number, gcr_cache_dir=gcr_cache_dir)
 
         # Re-set VIA callbacks to point to our overridden methods
         # (super().__init__ sets them to the base class methods)
@@ -413,6 +413,23 @@ class VIA6522:
             else:
                 self._handle_t2_underflow(cycles)
 
+    def cycles_until_irq(self) -> Optional[int]:
+        """Return the cycles until a timer raises an enabled interrupt.
+
+        tick(n) sets the flag once n reaches the returned count, so a caller
+        can defer ticking until then and advance the timers in one call.
+
+        Returns:
+            Cycle count, or None if no running timer has its interrupt enabled
+        """
+        due = None
+        if self.t1_running and self.ier & IRQ_T1:
+            due = self.t1_counter
+        if self.t2_running and self.ier & IRQ_T2 and not (self.acr & ACR_T2_COUNT_PB6):
+            if due is None or self.t2_counter < due:
+                due = self.t2_counter
+        return due
+
     def _handle_t1_underflow(self, cycles: int) -> None:
         """Handle Timer 1 underflow (slow path).
 
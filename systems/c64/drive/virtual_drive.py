@@ -0,0 +1,571 @@
+"""Virtual 1541: KERNAL trap-based disk access for D64 images.
+
+Instead of emulating the 1541's CPU, VIAs and the bit-banged IEC protocol,
+the virtual drive puts CPU breakpoints on the KERNAL's file I/O routines and
+serves LOAD, SAVE, OPEN, CLOSE, CHKIN, CHRIN/GETIN and CLRCHN for its device
+number straight from a D64Image. The C64 ends up with the same memory, status
+byte ($90), file tables and end address (X/Y and $AE/$AF) as after the real
+serial routine, but the transfer takes no emulated time.
+
+The traps sit on the default targets of the $031A-$0333 vectors, read from
+the KERNAL's RESTOR table, and only fire while the KERNAL ROM is banked in.
+Anything the virtual drive does not serve (other devices, missing filenames,
+write channels) falls through to the KERNAL unchanged.
+
+Limitations:
+- There is no drive CPU, so drive code (fast loaders, M-W/M-E) does not run
+- Files can be written with SAVE only, not through OPEN/CHKOUT/CHROUT
+- The "SEARCHING FOR"/"LOADING" messages are not printed
+
+Reference:
+- https://www.pagetable.com/c64ref/kernal/
+- https://www.pagetable.com/c64ref/c64disasm/
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from .d64 import (
+    BAM_SECTOR,
+    BAM_TRACK,
+    D64Image,
+    DiskFullError,
+    FILE_TYPE_PRG,
+    FILE_TYPE_SEQ,
+    FILE_TYPE_USR,
+    petscii_to_ascii,
+)
+
+if TYPE_CHECKING:
+    from mos6502.core import MOS6502CPU
+
+log = logging.getLogger("virtual_drive")
+
+
+# KERNAL ROM layout
+KERNAL_START = 0xE000
+# RESTOR's table of the default $0314-$0333 vectors (16 words)
+KERNAL_VECTOR_TABLE = 0xFD30
+
+# Indices of the trapped vectors in that table
+VECTOR_IOPEN = 3     # $031A -> OPEN ($F34A)
+VECTOR_ICLOSE = 4    # $031C -> CLOSE ($F291)
+VECTOR_ICHKIN = 5    # $031E -> CHKIN ($F20E)
+VECTOR_ICLRCH = 7    # $0322 -> CLRCHN ($F333)
+VECTOR_IBASIN = 8    # $0324 -> CHRIN ($F157)
+VECTOR_IGETIN = 11   # $032A -> GETIN ($F13E)
+VECTOR_ILOAD = 14    # $0330 -> LOAD ($F4A5)
+VECTOR_ISAVE = 15    # $0332 -> SAVE ($F5ED)
+
+# KERNAL zero page
+STATUS = 0x90        # ST: I/O status byte
+VERCK = 0x93         # LOAD/VERIFY flag
+LDTND = 0x98         # Number of open files
+DFLTN = 0x99         # Current input device
+EAL = 0xAE           # End address of LOAD/SAVE (2 bytes)
+FNLEN = 0xB7         # Filename length
+LA = 0xB8            # Logical file number
+SA = 0xB9            # Secondary address
+FA = 0xBA            # Device number
+FNADR = 0xBB         # Filename address (2 bytes)
+STAL = 0xC1          # Start address of SAVE (2 bytes)
+MEMUSS = 0xC3        # LOAD address when the secondary address is 0 (2 bytes)
+
+# KERNAL file tables
+LAT = 0x0259         # Logical file numbers
+FAT = 0x0263         # Device numbers
+SAT = 0x026D         # Secondary addresses
+MAX_OPEN_FILES = 10
+
+# Status byte bits
+ST_TIMEOUT_READ = 0x02
+ST_VERIFY_ERROR = 0x10
+ST_EOF = 0x40
+
+# KERNAL error numbers (returned in A with carry set)
+KERNAL_FILE_NOT_FOUND = 4
+
+# Drive channels
+LOAD_CHANNEL = 0
+SAVE_CHANNEL = 1
+COMMAND_CHANNEL = 15
+
+# DOS error channel messages
+DOS_MESSAGES = {
+    0: " OK",
+    1: " FILES SCRATCHED",
+    31: "SYNTAX ERROR",
+    33: "SYNTAX ERROR",
+    62: "FILE NOT FOUND",
+    63: "FILE EXISTS",
+    72: "DISK FULL",
+    73: "CBM DOS V2.6 1541",
+    74: "DRIVE NOT READY",
+}
+
+# File type letters in "NAME,S,R" style filenames
+FILE_TYPE_LETTERS = {
+    "P": FILE_TYPE_PRG,
+    "S": FILE_TYPE_SEQ,
+    "U": FILE_TYPE_USR,
+}
+
+# Directory listings load at the PET/VIC-20 BASIC start like on the 1541
+DIRECTORY_LOAD_ADDRESS = 0x0401
+
+
+@dataclass
+class Channel:
+    """Data being read from an open drive channel."""
+    data: bytes
+    position: int = 0
+
+
+def parse_filename(filename: str) -> Tuple[str, List[str], bool]:
+    """Split a DOS filename like "@0:NAME,S,R" into its parts.
+
+    Returns:
+        (name, options, replace) where options are the comma-separated
+        type/mode letters and replace is set by a leading "@"
+    """
+    replace = filename.startswith("@")
+    if replace:
+        filename = filename[1:]
+    if ":" in filename:
+        filename = filename.split(":", 1)[1]
+    name, *options = filename.split(",")
+    return name, options, replace
+
+
+def filename_matches(pattern: str, filename: str) -> bool:
+    """Match a filename against a DOS pattern ("?" any character, "*" the rest)."""
+    for i, char in enumerate(pattern):
+        if char == "*":
+            return True
+        if i >= len(filename) or (char != "?" and char != filename[i]):
+            return False
+    return len(pattern) == len(filename)
+
+
+class VirtualDrive:
+    """A disk drive served from a D64 image through KERNAL traps.
+
+    Call install() with the C64 CPU and KERNAL ROM, and route the CPU's
+    breakpoint_callback to trap().
+    """
+
+    def __init__(self, device_number: int = 8) -> None:
+        """Initialize the virtual drive.
+
+        Args:
+            device_number: IEC device number (8-11)
+        """
+        self.device_number = device_number
+        # No drive CPU: code that inspects a drive's CPU skips the virtual drive
+        self.cpu = None
+        self.disk: Optional[D64Image] = None
+
+        self.channels: Dict[int, Channel] = {}
+        self.talk_channel = LOAD_CHANNEL
+        self._status: Tuple[int, int, int] = (73, 0, 0)
+
+        self._host_cpu: Optional[MOS6502CPU] = None
+        self._kernal_visible: Optional[Callable[[], bool]] = None
+        self._traps: Dict[int, Callable[[MOS6502CPU], bool]] = {}
+
+    def install(self, cpu: MOS6502CPU, kernal_rom: bytes,
+                kernal_visible: Optional[Callable[[], bool]] = None) -> None:
+        """Put breakpoints on the KERNAL routines the drive serves.
+
+        Args:
+            cpu: The C64 CPU
+            kernal_rom: 8KB KERNAL ROM, used to find the routine addresses
+            kernal_visible: Returns False while the KERNAL ROM is banked out
+        """
+        def vector(index: int) -> int:
+            offset = KERNAL_VECTOR_TABLE - KERNAL_START + 2 * index
+            return kernal_rom[offset] | (kernal_rom[offset + 1] << 8)
+
+        self._host_cpu = cpu
+        self._kernal_visible = kernal_visible
+        traps = {
+            vector(VECTOR_IOPEN): self._open,
+            vector(VECTOR_ICLOSE): self._close,
+            vector(VECTOR_ICHKIN): self._chkin,
+            vector(VECTOR_ICLRCH): self._clrchn,
+            vector(VECTOR_IBASIN): self._chrin,
+            vector(VECTOR_IGETIN): self._chrin,
+            vector(VECTOR_ILOAD): self._load,
+            vector(VECTOR_ISAVE): self._save,
+        }
+        # A KERNAL without the table (e.g. a test stub) gets no traps
+        self._traps = {address: handler for address, handler in traps.items() if address >= KERNAL_START}
+        self.add_traps()
+
+    def add_traps(self) -> None:
+        """(Re-)add the trap breakpoints, e.g. after the CPU's were cleared."""
+        for address in self._traps:
+            self._host_cpu.add_breakpoint(address)
+
+    def trap(self, cpu: MOS6502CPU, pc: int) -> bool:
+        """Serve a trapped KERNAL call.
+
+        Returns:
+            True if the call was served and the CPU returned to the caller,
+            False to let the KERNAL routine run
+        """
+        handler = self._traps.get(pc)
+        if handler is None or (self._kernal_visible is not None and not self._kernal_visible()):
+            return False
+        return handler(cpu)
+
+    def reset(self) -> None:
+        """Close all channels and show the power-on message."""
+        self.channels.clear()
+        self.talk_channel = LOAD_CHANNEL
+        self._set_status(73)
+
+    def insert_disk(self, disk_path: Path) -> None:
+        """Insert a disk image into the drive.
+
+        Args:
+            disk_path: Path to D64 disk image
+        """
+        self.disk = D64Image(disk_path)
+        self.channels.clear()
+        log.info(f"Disk inserted: {self.disk.get_disk_name()} (ID: {self.disk.get_disk_id()})")
+
+    def eject_disk(self) -> None:
+        """Eject the current disk."""
+        if self.disk:
+            log.info(f"Disk ejected: {self.disk.get_disk_name()}")
+        self.disk = None
+        self.channels.clear()
+
+    # =========================================================================
+    # KERNAL traps
+    # =========================================================================
+
+    def _load(self, cpu: MOS6502CPU) -> bool:
+        """LOAD/VERIFY: A = 0 load, else verify; the KERNAL has set MEMUSS from X/Y."""
+        ram = cpu.ram
+        if ram[FA] != self.device_number or ram[FNLEN] == 0:
+            return False
+
+        ram[VERCK] = cpu.A
+        verify = cpu.A != 0
+        ram[STATUS] = 0
+
+        data = self._open_file(self._filename(ram))
+        if data is None:
+            ram[STATUS] = ST_EOF | ST_TIMEOUT_READ
+            return self._return(cpu, error=KERNAL_FILE_NOT_FOUND)
+
+        # Secondary address 0 relocates to MEMUSS, otherwise the file header is used
+        if ram[SA] == 0 or len(data) < 2:
+            address = ram[MEMUSS] | (ram[MEMUSS + 1] << 8)
+        else:
+            address = data[0] | (data[1] << 8)
+
+        status = ST_EOF
+        for value in data[2:]:
+            if verify:
+                if ram[address] != value:
+                    status |= ST_VERIFY_ERROR
+            else:
+                ram[address] = value
+            address = (address + 1) & 0xFFFF
+
+        ram[STATUS] = status
+        ram[EAL] = address & 0xFF
+        ram[EAL + 1] = address >> 8
+        cpu.X = address & 0xFF
+        cpu.Y = address >> 8
+        return self._return(cpu)
+
+    def _save(self, cpu: MOS6502CPU) -> bool:
+        """SAVE: STAL up to (not including) EAL, written as a new file."""
+        ram = cpu.ram
+        if ram[FA] != self.device_number or ram[FNLEN] == 0:
+            return False
+
+        start = ram[STAL] | (ram[STAL + 1] << 8)
+        end = ram[EAL] | (ram[EAL + 1] << 8)
+        data = bytearray([start & 0xFF, start >> 8])
+        data += bytes(ram[address] for address in range(start, end))
+
+        self._write_file(self._filename(ram), bytes(data))
+        ram[STATUS] = 0
+        return self._return(cpu)
+
+    def _open(self, cpu: MOS6502CPU) -> bool:
+        """OPEN: add the file to the KERNAL tables and open the drive channel."""
+        ram = cpu.ram
+        logical = ram[LA]
+        count = ram[LDTND]
+        if (
+            ram[FA] != self.device_number
+            or logical == 0
+            or count >= MAX_OPEN_FILES
+            or self._file_index(ram, logical) is not None
+        ):
+            return False  # The KERNAL reports the error
+
+        secondary = ram[SA]
+        channel = secondary & 0x0F
+        filename = self._filename(ram) if ram[FNLEN] else ""
+
+        if channel == COMMAND_CHANNEL:
+            self._command(filename)
+        elif filename:
+            _name, options, _replace = parse_filename(filename)
+            if channel == SAVE_CHANNEL or any(option[:1] in ("W", "A") for option in options):
+                return False  # Write channels are not served
+            data = self._open_file(filename)
+            if data is not None:
+                self.channels[channel] = Channel(data)
+            else:
+                self.channels.pop(channel, None)
+
+        # The KERNAL's file table insert
+        ram[SA] = secondary | 0x60
+        ram[LAT + count] = logical
+        ram[FAT + count] = self.device_number
+        ram[SAT + count] = secondary | 0x60
+        ram[LDTND] = count + 1
+        ram[STATUS] = 0
+        return self._return(cpu)
+
+    def _close(self, cpu: MOS6502CPU) -> bool:
+        """CLOSE: A = logical file number."""
+        ram = cpu.ram
+        index = self._file_index(ram, cpu.A)
+        if index is None or ram[FAT + index] != self.device_number:
+            return False
+
+        channel = ram[SAT + index] & 0x0F
+        if channel == COMMAND_CHANNEL:
+            # Closing the command channel closes every channel
+            self.channels.clear()
+        else:
+            self.channels.pop(channel, None)
+
+        # The KERNAL's file table removal: the last entry fills the hole
+        last = ram[LDTND] - 1
+        ram[LDTND] = last
+        if index != last:
+            ram[LAT + index] = ram[LAT + last]
+            ram[FAT + index] = ram[FAT + last]
+            ram[SAT + index] = ram[SAT + last]
+        return self._return(cpu)
+
+    def _chkin(self, cpu: MOS6502CPU) -> bool:
+        """CHKIN: X = logical file number."""
+        ram = cpu.ram
+        index = self._file_index(ram, cpu.X)
+        if index is None or ram[FAT + index] != self.device_number:
+            return False
+
+        ram[LA] = ram[LAT + index]
+        ram[FA] = ram[FAT + index]
+        ram[SA] = ram[SAT + index]
+        ram[DFLTN] = self.device_number
+        self.talk_channel = ram[SA] & 0x0F
+        return self._return(cpu)
+
+    def _chrin(self, cpu: MOS6502CPU) -> bool:
+        """CHRIN/GETIN: read a byte from the talking channel."""
+        ram = cpu.ram
+        if ram[DFLTN] != self.device_number:
+            return False
+
+        if ram[STATUS]:
+            # Like the KERNAL: after EOF or an error, return RETURN
+            value = 0x0D
+        else:
+            value, status = self._next_byte()
+            ram[STATUS] = status
+        cpu.A = value
+        cpu.set_load_status_flags("A")
+        return self._return(cpu)
+
+    def _clrchn(self, cpu: MOS6502CPU) -> bool:
+        """CLRCHN: drop our input device, then let the KERNAL restore the defaults."""
+        ram = cpu.ram
+        if ram[DFLTN] == self.device_number:
+            # Keeps the KERNAL from sending UNTALK on the empty serial bus
+            ram[DFLTN] = 0
+        return False
+
+    @staticmethod
+    def _return(cpu: MOS6502CPU, error: int = 0) -> bool:
+        """Return to the caller (RTS) with carry set and A = error on failure."""
+        if error:
+            cpu.A = error
+        cpu.C = 1 if error else 0
+        cpu.S += 1
+        low = cpu.ram[cpu.S]
+        cpu.S += 1
+        high = cpu.ram[cpu.S]
+        cpu.PC = ((high << 8) | low) + 1
+        return True
+
+    @staticmethod
+    def _filename(ram) -> str:
+        """Read the filename at FNADR."""
+        address = ram[FNADR] | (ram[FNADR + 1] << 8)
+        return petscii_to_ascii(bytes(ram[(address + i) & 0xFFFF] for i in range(ram[FNLEN])))
+
+    @staticmethod
+    def _file_index(ram, logical: int) -> Optional[int]:
+        """Find a logical file in the KERNAL tables."""
+        for index in range(min(ram[LDTND], MAX_OPEN_FILES)):
+            if ram[LAT + index] == logical:
+                return index
+        return None
+
+    # =========================================================================
+    # Drive side
+    # =========================================================================
+
+    def _open_file(self, filename: str) -> Optional[bytes]:
+        """Return the contents of a file or "$" directory, or None with the error set."""
+        if self.disk is None:
+            self._set_status(74)
+            return None
+
+        if filename.startswith("$"):
+            self._set_status(0)
+            return self._directory_listing()
+
+        name, _options, _replace = parse_filename(filename)
+        for entry in self.disk.read_directory():
+            if entry.is_valid and filename_matches(name, entry.filename):
+                self._set_status(0)
+                return self.disk.read_file(entry)
+
+        self._set_status(62)
+        return None
+
+    def _write_file(self, filename: str, data: bytes) -> None:
+        """Write a file to the disk and save the image, setting the DOS status."""
+        if self.disk is None:
+            self._set_status(74)
+            return
+
+        name, options, replace = parse_filename(filename)
+        if not name or "*" in name or "?" in name:
+            self._set_status(33)
+            return
+
+        file_type = FILE_TYPE_LETTERS.get(options[0][:1], FILE_TYPE_PRG) if options else FILE_TYPE_PRG
+        try:
+            entry = self.disk.write_file(name, data, file_type=file_type, replace=replace)
+        except FileExistsError:
+            self._set_status(63)
+            return
+        except DiskFullError:
+            self._set_status(72)
+            return
+
+        self._set_status(0)
+        self._persist_disk()
+        log.info(f"Saved {entry.filename} ({len(data)} bytes, {entry.size_sectors} blocks)")
+
+    def _command(self, command: str) -> None:
+        """Execute a command sent as the filename when opening the command channel."""
+        if not command:
+            return
+        if command.startswith("UI") or command.startswith("UJ"):
+            self.reset()
+            return
+        if self.disk is None:
+            self._set_status(74)
+            return
+
+        if command.startswith("I"):
+            self._set_status(0)
+        elif command.startswith("S") and ":" in command:
+            patterns = command.split(":", 1)[1].split(",")
+            scratched = 0
+            for entry in self.disk.read_directory():
+                if entry.locked or not any(filename_matches(p, entry.filename) for p in patterns):
+                    continue
+                if self.disk.delete_file(entry):
+                    scratched += 1
+            self._set_status(1, scratched)
+            if scratched:
+                self._persist_disk()
+        else:
+            self._set_status(31)
+
+    def _next_byte(self) -> Tuple[int, int]:
+        """Return (byte, status bits) for the next byte of the talking channel."""
+        channel = self.talk_channel
+        if channel == COMMAND_CHANNEL and channel not in self.channels:
+            # Reading the error channel sends the status once, then clears it
+            self.channels[channel] = Channel(self._status_message())
+            self._set_status(0)
+
+        stream = self.channels.get(channel)
+        if stream is None or stream.position >= len(stream.data):
+            return 0x0D, ST_EOF | ST_TIMEOUT_READ
+
+        value = stream.data[stream.position]
+        stream.position += 1
+        if stream.position < len(stream.data):
+            return value, 0
+
+        if channel == COMMAND_CHANNEL:
+            del self.channels[channel]
+        return value, ST_EOF
+
+    def _set_status(self, code: int, track: int = 0, sector: int = 0) -> None:
+        """Set the error channel status."""
+        self._status = (code, track, sector)
+
+    def _status_message(self) -> bytes:
+        """Format the status as the error channel sends it."""
+        code, track, sector = self._status
+        return f"{code:02d},{DOS_MESSAGES[code]},{track:02d},{sector:02d}\r".encode("ascii")
+
+    def _directory_listing(self) -> bytes:
+        """Build the "$" file: a BASIC program listing the directory."""
+        bam = self.disk.read_sector(BAM_TRACK, BAM_SECTOR)
+        header = b'\x12"' + bytes(bam[0x90:0xA0]) + b'" ' + bytes(bam[0xA2:0xA7])
+        lines = [(0, header.replace(b"\xA0", b" "))]
+
+        for entry in self.disk.read_directory():
+            blocks = entry.size_sectors
+            name = entry.filename.encode("ascii", "replace")
+            text = (
+                b" " * max(4 - len(str(blocks)), 1)
+                + b'"' + name + b'"'
+                + b" " * (16 - len(name))
+                + (b" " if entry.closed else b"*")
+                + entry.type_name.encode("ascii")
+                + (b"<" if entry.locked else b" ")
+            )
+            lines.append((blocks, text))
+
+        lines.append((self.disk.get_free_blocks(), b"BLOCKS FREE.".ljust(25)))
+
+        # Line links are dummies, LOAD relinks the program
+        program = bytearray([DIRECTORY_LOAD_ADDRESS & 0xFF, DIRECTORY_LOAD_ADDRESS >> 8])
+        for number, text in lines:
+            program += bytes([0x01, 0x01, number & 0xFF, (number >> 8) & 0xFF]) + text + b"\x00"
+        program += b"\x00\x00"
+        return bytes(program)
+
+    def _persist_disk(self) -> None:
+        """Persist D64 changes to the disk file."""
+        if self.disk and self.disk.path:
+            try:
+                self.disk.save()
+                log.debug(f"Virtual drive: Saved disk to {self.disk.path}")
+            except OSError as e:
+                log.error(f"Virtual drive: Failed to save disk: {e}")
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Headless frame capture for the VIC-II.
+
+FrameSink receives every frame the VIC completes (the VBlank snapshot that
+also drives frame_complete) and writes it without pygame, as:
+
+- raw:  one stream of RGB24 frames (width*height*3 bytes each, row-major)
+- png:  a PNG sequence ("frames/" or "frames/shot_%05d.png")
+- pipe: raw RGB24 frames on the stdin of an external encoder, e.g.
+        ffmpeg -f rawvideo -pix_fmt rgb24 -s 384x270 -r 50 -i - out.mp4
+
+The VIC calls capture() from the CPU thread at VBlank. capture() only
+takes references to the snapshot (immutable bytes) and queues it, so the
+CPU thread never blocks on rendering or I/O. The renderer has its own
+unattached glyph atlas, so RAM charsets are read from the snapshot too,
+never from live memory:
+
+- frames are rendered and encoded (PNG deflate) in a thread pool
+- one writer thread writes them in frame order
+- every Nth frame is kept (decimation); when max_pending frames are already
+  queued the frame is dropped and counted instead of waiting
+
+Requires NumPy (see c64.vic_render).
+
+Usage:
+    sink = FrameSink(c64.vic, "frames/", "png", every=5)
+    c64.vic.frame_sink = sink
+    ...
+    sink.close()
+"""
+
+from __future__ import annotations
+
+import logging
+import shlex
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from c64.vic import GlyphAtlas
+from c64.vic_render import LineRenderer
+
+if TYPE_CHECKING:
+    from c64.vic import C64VIC
+
+log = logging.getLogger("c64.frame_sink")
+
+FORMATS = ("raw", "png", "pipe")
+
+
+class FrameSink:
+    """Render completed VIC frames to a raw stream, PNG sequence or encoder pipe."""
+
+    def __init__(
+        self,
+        vic: C64VIC,
+        target: str | Path,
+        output_format: str = "png",
+        every: int = 1,
+        workers: int = 2,
+        max_pending: int | None = None,
+    ) -> None:
+        """Open the output.
+
+        Arguments:
+            vic: The VIC whose frames are captured
+            target: Output file (raw), directory or %-pattern (png), or
+                    encoder command line (pipe)
+            output_format: "raw", "png" or "pipe"
+            every: Capture every Nth completed frame
+            workers: Render/encode threads
+            max_pending: Frames queued before new ones are dropped
+                         (default: 4 per worker)
+
+        Raises:
+            ValueError: Unknown format or every/workers below 1
+            ImportError: NumPy is not installed
+        """
+        if output_format not in FORMATS:
+            raise ValueError(f"Unknown capture format: {output_format}")
+        if every < 1 or workers < 1:
+            raise ValueError("every and workers must be at least 1")
+
+        self.vic = vic
+        self.format = output_format
+        self.every = every
+        self.max_pending = max_pending if max_pending is not None else workers * 4
+        # Own atlas: the VIC's reads RAM charsets from live memory
+        self.renderer = LineRenderer(vic, GlyphAtlas(vic.char_rom))
+
+        self.frames_seen = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self._queued = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._render_lock = threading.Lock()
+        self._broken = False
+
+        self._file = None
+        self._process = None
+        self._pattern = None
+        if output_format == "raw":
+            self._file = open(target, "wb")
+        elif output_format == "pipe":
+            self._process = subprocess.Popen(shlex.split(str(target)), stdin=subprocess.PIPE)
+            self._file = self._process.stdin
+        elif "%" in str(target):
+            self._pattern = str(target)
+            Path(self._pattern).parent.mkdir(parents=True, exist_ok=True)
+        else:
+            Path(target).mkdir(parents=True, exist_ok=True)
+            self._pattern = str(Path(target) / "frame_%06d.png")
+
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="frame-encode")
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="frame-write")
+        log.info(
+            "Capturing %s frames (%dx%d, every %d) to %s",
+            output_format, vic.total_width, vic.total_height, every, target,
+        )
+
+    def capture(self, vic: C64VIC) -> None:
+        """Queue the frame the VIC just completed (called at VBlank)."""
+        self.frames_seen += 1
+        if (self.frames_seen - 1) % self.every or vic.ram_snapshot is None or self._broken:
+            return
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.frames_dropped += 1
+                return
+            self._pending += 1
+            index = self._queued
+            self._queued += 1
+
+        snapshot = (
+            vic.ram_snapshot, vic.ram_snapshot_bank, vic.color_snapshot,
+            vic.line_snapshot, vic.regs_snapshot, vic.vic_bank_snapshot,
+        )
+        encoded = self._pool.submit(self._encode, snapshot)
+        self._writer.submit(self._write, index, encoded)
+
+    def _encode(self, snapshot) -> bytes:
+        """Render a snapshot and encode it for the output format."""
+        bank_ram, bank, color_ram, lines, regs, vic_bank = snapshot
+        ram = bytearray(0x10000)
+        ram[bank:bank + len(bank_ram)] = bank_ram
+        # The line renderer keeps state between frames: render one at a time
+        with self._render_lock:
+            if lines is not None:
+                frame = self.renderer.render_lines(ram, color_ram, *lines).copy()
+            else:
+                frame = self.renderer.render(ram, color_ram, regs, vic_bank)
+        if self.format == "png":
+            return self.renderer.encode_png(frame)
+        return self.renderer.to_rgb(frame).tobytes()
+
+    def _write(self, index: int, encoded) -> None:
+        """Write one encoded frame (runs on the writer thread, in frame order)."""
+        try:
+            data = encoded.result()
+            if self._broken:
+                return
+            if self._pattern is not None:
+                Path(self._pattern % index).write_bytes(data)
+            else:
+                self._file.write(data)
+            self.frames_written += 1
+        except (BrokenPipeError, OSError) as e:
+            log.error(f"Frame capture stopped: {e}")
+            self._broken = True
+        except Exception:
+            log.exception("Frame capture failed")
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def close(self) -> None:
+        """Write the queued frames and close the output."""
+        self._pool.shutdown(wait=True)
+        self._writer.shutdown(wait=True)
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+        if self._process is not None:
+            self._process.wait()
+        log.info(
+            "Frame capture: %d frames written, %d dropped (%d seen)",
+            self.frames_written, self.frames_dropped, self.frames_seen,
+        )
@@ -18,8 +18,6 @@ from c64.cartridges import (
     ROMH_START,
     ROMH_END,
     IO1_START,
-    IO1_END,
-    IO2_START,
     IO2_END,
 )
 
@@ -27,7 +25,7 @@ if TYPE_CHECKING:
     from c64.cia1 import CIA1
     from c64.cia2 import CIA2
     from c64.sid import SID
-    from c64.vic import C64VIC, ScreenDirtyTracker
+    from c64.vic import C64VIC, GlyphAtlas, ScreenDirtyTracker
 
 log = logging.getLogger("c64")
 
@@ -81,7 +79,7 @@ class C64Memory:
     - Cartridge ROM support (ROML, ROMH, Ultimax mode)
     """
 
-    def __init__(self, ram, *, basic_rom, kernal_rom, char_rom, cia1, cia2, vic, sid, dirty_tracker=None) -> None:
+    def __init__(self, ram, *, basic_rom, kernal_rom, char_rom, cia1, cia2, vic, sid, dirty_tracker=None, glyph_atlas=None) -> None:
         # Store reference to flat RAM array for direct access (avoids delegation loop)
         # This eliminates branching on every RAM access
         self._ram = ram.data  # Direct reference to flat bytearray
@@ -93,121 +91,247 @@ class C64Memory:
         self.vic = vic
         self.sid = sid
         self.dirty_tracker = dirty_tracker
+        self.glyph_atlas: Optional[GlyphAtlas] = glyph_atlas
 
         # Color RAM - 1000 bytes ($D800-$DBE7), only low 4 bits used
         self.ram_color = bytearray(1024)
 
         # CPU I/O port
         self.ddr = 0x00  # $0000
-        self.port = 0x37  # $0001 default value
+        self._port = 0x37  # $0001 default value (see port)
 
         # Cartridge support - set by C64.load_cartridge()
         # The Cartridge object handles all banking logic and provides
         # EXROM/GAME signals and read methods for ROML/ROMH/IO regions
-        self.cartridge: Optional[Cartridge] = None
-
-        # Build read dispatch table indexed by top 4 bits of address (addr >> 12)
-        # This eliminates linear if-chain for memory region detection
-        self._read_dispatch = (
-            self._read_region_0,    # $0xxx - CPU port + RAM
-            self._read_ram_direct,  # $1xxx - RAM
-            self._read_ram_direct,  # $2xxx - RAM
-            self._read_ram_direct,  # $3xxx - RAM
-            self._read_ram_direct,  # $4xxx - RAM
-            self._read_ram_direct,  # $5xxx - RAM
-            self._read_ram_direct,  # $6xxx - RAM
-            self._read_ram_direct,  # $7xxx - RAM
-            self._read_region_8_9,  # $8xxx - ROML or RAM
-            self._read_region_8_9,  # $9xxx - ROML or RAM
-            self._read_region_A_B,  # $Axxx - BASIC/ROMH or RAM
-            self._read_region_A_B,  # $Bxxx - BASIC/ROMH or RAM
-            self._read_ram_direct,  # $Cxxx - RAM
-            self._read_region_D,    # $Dxxx - I/O or CHAR ROM
-            self._read_region_E_F,  # $Exxx - KERNAL or RAM
-            self._read_region_E_F,  # $Fxxx - KERNAL or RAM
-        )
-
-    def _read_region_0(self, addr: int) -> int:
-        """Read from $0xxx region - CPU port or RAM."""
-        if addr == 0x0000:
-            return self.ddr
-        if addr == 0x0001:
-            return (self.port | (~self.ddr)) & 0xFF
-        return self._ram[addr]
-
-    def _read_region_8_9(self, addr: int) -> int:
-        """Read from $8xxx-$9xxx - ROML cartridge or RAM.
-
-        ROML visibility depends on cartridge EXROM/GAME signals AND CPU port:
-        - Ultimax mode (EXROM=1, GAME=0): ROML always visible
-        - 8K/16K mode (EXROM=0): ROML visible only when LORAM=1 AND HIRAM=1
-          Setting LORAM=0 or HIRAM=0 exposes underlying RAM (used by diagnostics)
+        self._cartridge: Optional[Cartridge] = None
+
+        # Read tables picked up by the CPU's RAM (see mos6502.memory.RAM._bind_read):
+        # per 256-byte page, a view that maps straight to RAM or ROM (or None)
+        # and the function that reads the page. All 32 PLA configurations
+        # (LORAM/HIRAM/CHAREN + EXROM/GAME) are precomputed by
+        # _build_bank_tables(); _select_bank_table() copies the matching one
+        # into these lists in place when the CPU port or a cartridge line changes
+        ram_view = memoryview(self._ram)
+        self._ram_pages = [ram_view[page << 8:(page + 1) << 8] for page in range(256)]
+        self._basic_pages = self._rom_pages(basic_rom, BASIC_ROM_START, BASIC_ROM_SIZE)
+        self._kernal_pages = self._rom_pages(kernal_rom, KERNAL_ROM_START, KERNAL_ROM_SIZE)
+        self._char_pages = self._rom_pages(char_rom, CHAR_ROM_START, CHAR_ROM_SIZE)
+        self.read_pages: list[memoryview | None] = [None] * 256
+        self.page_readers: list = [None] * 256
+        self._bank_config = -1
+
+        # Write dispatch per 256-byte page (see _update_write_pages). Screen
+        # RAM pages are "watched" and notify the dirty tracker; they follow
+        # the VIC bank (CIA2 $DD00) and $D018. RAM character sets selected
+        # through the same registers are watched by the glyph atlas too and
+        # invalidated when written. Only this (the CPU) thread changes the tables
+        self._page_writers: list = [self._write_ram_direct] * 256
+        self._unwatched_writers: list = list(self._page_writers)
+        self._screen_base = self._vic_screen_base()
+        if dirty_tracker is not None:
+            dirty_tracker.set_screen_base(self._screen_base)
+        if glyph_atlas is not None:
+            glyph_atlas.attach(self._ram)
+            self._watch_charset()
+        self._build_bank_tables()
+
+    @staticmethod
+    def _rom_pages(rom, start: int, size: int) -> tuple[list, list]:
+        """Return the (views, readers) page entries that map a ROM image at start.
+
+        Missing or short images get no views, so reads go through a reader
+        that indexes the image exactly like direct ROM access would.
         """
-        if self.cartridge is not None:
-            # Ultimax mode: ROML always visible regardless of CPU port
-            if self.cartridge.exrom and not self.cartridge.game:
-                return self.cartridge.read_roml(addr)
-            # 8K/16K mode (EXROM=0): Check CPU port bits
-            if not self.cartridge.exrom:
-                # ROML visible only when both LORAM=1 and HIRAM=1
-                loram = self.port & 0b00000001
-                hiram = self.port & 0b00000010
-                if loram and hiram:
-                    return self.cartridge.read_roml(addr)
-        return self._ram[addr]
-
-    def _read_region_A_B(self, addr: int) -> int:
-        """Read from $Axxx-$Bxxx - ROMH cartridge, BASIC ROM, or RAM.
-
-        Visibility depends on cartridge EXROM/GAME signals AND CPU port:
-        - 16K mode (EXROM=0, GAME=0): ROMH visible only when LORAM=1 AND HIRAM=1
-        - Without 16K cartridge: BASIC ROM visible only when LORAM=1 AND HIRAM=1
-        - Setting LORAM=0 or HIRAM=0 exposes underlying RAM
+        def read_rom(addr: int) -> int:
+            return rom[addr - start]
+
+        page_count = size >> 8
+        if rom is None or len(rom) < size:
+            return [None] * page_count, [read_rom] * page_count
+        view = memoryview(rom)
+        return [view[offset:offset + 0x100] for offset in range(0, size, 0x100)], [read_rom] * page_count
+
+    def _bank_table(self, config: int) -> tuple[tuple, tuple]:
+        """Compute the (read_pages, page_readers) entries for one PLA configuration.
+
+        config bits: 0 LORAM, 1 HIRAM, 2 CHAREN, 3 EXROM, 4 GAME (lines are
+        active-low, so no cartridge is EXROM=1, GAME=1).
+
+        - $8000-$9FFF: ROML in Ultimax mode (EXROM=1, GAME=0), or with EXROM=0
+          when LORAM=1 AND HIRAM=1; otherwise RAM (used by diagnostics)
+        - $A000-$BFFF: 16K cartridge (EXROM=0, GAME=0) shows ROMH when LORAM=1
+          AND HIRAM=1; otherwise BASIC ROM when LORAM=1 AND HIRAM=1; else RAM
+        - $D000-$DFFF: I/O when CHAREN=1; Character ROM when LORAM=1 OR
+          HIRAM=1; RAM when all ROMs are banked out
+        - $E000-$FFFF: Ultimax ROMH replaces the KERNAL; KERNAL ROM when
+          HIRAM=1; otherwise RAM
         """
-        loram = self.port & 0b00000001
-        hiram = self.port & 0b00000010
-
-        # Check for 16K cartridge ROMH (EXROM=0, GAME=0)
-        if self.cartridge is not None and not self.cartridge.exrom and not self.cartridge.game:
-            # ROMH visible only when both LORAM=1 and HIRAM=1
-            if loram and hiram:
-                return self.cartridge.read_romh(addr)
-            # LORAM=0 or HIRAM=0: RAM visible instead of ROMH
-            return self._ram[addr]
-        # No 16K cartridge: BASIC ROM visible only when LORAM=1 AND HIRAM=1
+        loram = config & 0b00001
+        hiram = config & 0b00010
+        charen = config & 0b00100
+        exrom = config & 0b01000
+        game = config & 0b10000
+        ultimax = exrom and not game
+        cartridge = self._cartridge
+
+        pages = list(self._ram_pages)
+        readers = [self._read_ram_direct] * 256
+
+        # $0000-$00FF: CPU port at $00/$01
+        pages[0x00] = None
+        readers[0x00] = self._read_region_0
+
+        # $8000-$9FFF
+        if ultimax or (not exrom and loram and hiram):
+            pages[0x80:0xA0] = [None] * 0x20
+            readers[0x80:0xA0] = [cartridge.read_roml] * 0x20
+
+        # $A000-$BFFF
         if loram and hiram:
-            return self.basic[addr - BASIC_ROM_START]
-        return self._ram[addr]
-
-    def _read_region_D(self, addr: int) -> int:
-        """Read from $Dxxx - I/O area, CHAR ROM, or RAM.
+            if not exrom and not game:
+                pages[0xA0:0xC0] = [None] * 0x20
+                readers[0xA0:0xC0] = [cartridge.read_romh] * 0x20
+            else:
+                pages[0xA0:0xC0], readers[0xA0:0xC0] = self._basic_pages
 
-        The visibility of this region depends on CPU port bits:
-        - CHAREN=1 (bit 2): I/O visible ($D000-$DFFF)
-        - CHAREN=0 AND (LORAM=1 OR HIRAM=1): Character ROM visible
-        - CHAREN=0 AND LORAM=0 AND HIRAM=0: RAM visible (all ROMs banked out)
-        """
-        charen = self.port & 0b00000100
+        # $D000-$DFFF
         if charen:
-            # CHAREN=1: I/O area visible
-            return self._read_io_area(addr)
-        # CHAREN=0: Check if we see Character ROM or RAM
-        loram = self.port & 0b00000001
-        hiram = self.port & 0b00000010
-        if loram or hiram:
-            # At least one ROM bit set: Character ROM visible
-            return self.char[addr - CHAR_ROM_START]
-        # Both LORAM=0 and HIRAM=0: All ROMs banked out, RAM visible
-        return self._ram[addr]
+            pages[0xD0:0xE0] = [None] * 0x10
+            readers[0xD0:0xE0] = self._io_readers
+        elif loram or hiram:
+            pages[0xD0:0xE0], readers[0xD0:0xE0] = self._char_pages
+
+        # $E000-$FFFF
+        if ultimax:
+            pages[0xE0:0x100] = [None] * 0x20
+            readers[0xE0:0x100] = [cartridge.read_ultimax_romh] * 0x20
+        elif hiram:
+            pages[0xE0:0x100], readers[0xE0:0x100] = self._kernal_pages
+
+        return tuple(pages), tuple(readers)
+
+    def _build_bank_tables(self) -> None:
+        """Precompute the read tables of all 32 PLA configurations and select the current one.
+
+        Cartridge ROML/ROMH/IO1/IO2 are read through the cartridge's bound
+        methods, so tables are rebuilt only when a cartridge is attached;
+        cartridge bank switching needs no rebuild.
+        """
+        self._build_io_tables()
+        if self._cartridge is None:
+            # No cartridge: EXROM and GAME are pulled high
+            table = [None] * 0b11000 + [self._bank_table(0b11000 | port) for port in range(8)]
+        else:
+            table = [self._bank_table(config) for config in range(32)]
+        self._bank_tables = table
+        self._bank_config = -1
+        self._select_bank_table()
+        self._update_write_pages()
+
+    def _select_bank_table(self) -> None:
+        """Switch read_pages/page_readers to the table for the current PLA inputs."""
+        cartridge = self._cartridge
+        config = self._port & 0b00111
+        if cartridge is None:
+            config |= 0b11000
+        else:
+            config |= (0b01000 if cartridge.exrom else 0) | (0b10000 if cartridge.game else 0)
+        if config != self._bank_config:
+            self._bank_config = config
+            pages, readers = self._bank_tables[config]
+            # In place: RAM and the specialized handlers hold these lists
+            self.read_pages[:] = pages
+            self.page_readers[:] = readers
+
+    def _update_write_pages(self) -> None:
+        """Rebuild the page write table for the current banking, cartridge and screen.
+
+        Writes always land in RAM except for the CPU port, cartridge RAM in
+        ROML and visible I/O (CHAREN=1). The four pages holding the screen
+        matrix additionally notify the dirty tracker, and the eight pages of
+        each RAM charset watched by the glyph atlas invalidate it.
+        """
+        writers = [self._write_ram_direct] * 256
+        writers[0x00] = self._write_page_0
+        if self._cartridge is not None:
+            writers[0x80:0xA0] = [self._write_roml] * 0x20
+        if self._port & 0b00000100:
+            writers[0xD0:0xE0] = self._io_writers
+        self._unwatched_writers[:] = writers
+
+        if self.dirty_tracker is not None:
+            first_page = self._screen_base >> 8
+            for page in range(first_page, first_page + 4):
+                writers[page] = self._write_screen
+        if self.glyph_atlas is not None:
+            for charset_base in self.glyph_atlas.watched:
+                first_page = charset_base >> 8
+                writers[first_page:first_page + 8] = [self._write_charset] * 8
+        self._page_writers[:] = writers
+
+    def _vic_screen_base(self) -> int:
+        """Return the screen matrix address from the VIC bank and $D018 bits 4-7."""
+        return self.cia2.get_vic_bank() + ((self.vic.regs[0x18] & 0xF0) >> 4) * 0x0400
+
+    def _watch_charset(self) -> bool:
+        """Have the glyph atlas watch the charset selected by the VIC bank and $D018 bits 1-3.
+
+        Returns True if a new RAM charset is watched and the write table needs rebuilding.
+        """
+        return self.glyph_atlas.watch(self.cia2.get_vic_bank(), (self.vic.regs[0x18] & 0x0E) << 10)
+
+    def _update_screen_watch(self) -> None:
+        """Move the watched screen pages and charset after a $D018 or $DD00 write, if needed."""
+        changed = False
+        screen_base = self._vic_screen_base()
+        if screen_base != self._screen_base:
+            self._screen_base = screen_base
+            if self.dirty_tracker is not None:
+                self.dirty_tracker.set_screen_base(screen_base)
+            changed = True
+        if self.glyph_atlas is not None and self._watch_charset():
+            changed = True
+        if changed:
+            self._update_write_pages()
+
+    @property
+    def port(self) -> int:
+        """Return the CPU port ($0001) value."""
+        return self._port
+
+    @port.setter
+    def port(self, value: int) -> None:
+        """Set the CPU port ($0001), switching read/write tables if banking changed."""
+        changed = (self._port ^ value) & 0b00000111
+        self._port = value
+        if changed:
+            self._select_bank_table()
+            if changed & 0b00000100:
+                self._update_write_pages()
+
+    @property
+    def cartridge(self) -> Optional[Cartridge]:
+        """Return the attached cartridge (None if none)."""
+        return self._cartridge
+
+    @cartridge.setter
+    def cartridge(self, cartridge: Optional[Cartridge]) -> None:
+        """Attach or detach a cartridge and rebuild the read tables for it."""
+        if self._cartridge is not None:
+            self._cartridge.lines_listener = None
+        self._cartridge = cartridge
+        if cartridge is not None:
+            # EXROM/GAME changes (bank registers, timeouts, freeze buttons)
+            # switch tables as they happen
+            cartridge.lines_listener = self._select_bank_table
+        self._build_bank_tables()
 
-    def _read_region_E_F(self, addr: int) -> int:
-        """Read from $Exxx-$Fxxx - KERNAL ROM, Ultimax cartridge, or RAM."""
-        # Ultimax mode: cartridge replaces KERNAL
-        if self.cartridge is not None and self.cartridge.exrom and not self.cartridge.game:
-            return self.cartridge.read_ultimax_romh(addr)
-        # KERNAL ROM enabled?
-        if self.port & 0b00000010:
-            return self.kernal[addr - KERNAL_ROM_START]
+    def _read_region_0(self, addr: int) -> int:
+        """Read from page $00 - CPU port or RAM."""
+        if addr == 0x0000:
+            return self.ddr
+        if addr == 0x0001:
+            return (self._port | (~self.ddr)) & 0xFF
         return self._ram[addr]
 
     def _read_ram_direct(self, addr) -> int:
@@ -220,6 +344,39 @@ class C64Memory:
         # Direct flat array access - no branching
         self._ram[addr] = int(value) & 0xFF
 
+    def bank_fingerprint(self) -> int:
+        """Return a small int identifying the current CPU-visible memory layout.
+
+        Used by the CPU block engine (mos6502.block_cache) to key translated code:
+        LORAM/HIRAM/CHAREN from the CPU port plus the cartridge EXROM/GAME lines.
+        """
+        fingerprint = self._port & 0b00000111
+        if self._cartridge is not None:
+            fingerprint |= 0b00001000 | (int(self._cartridge.exrom) << 4) | (int(self._cartridge.game) << 5)
+        return fingerprint
+
+    def bank_switch_addresses(self) -> list[int]:
+        """Return the addresses whose writes may change bank_fingerprint().
+
+        Covers the CPU port and the cartridge bank-switching registers in I/O1/I/O2.
+        """
+        return [0x0000, 0x0001, *range(IO1_START, IO2_END + 1)]
+
+    def is_volatile(self, addr: int) -> bool:
+        """Return True if reading addr as code must not be cached.
+
+        The CPU port and visible I/O registers can change without a CPU write,
+        and cartridge ROM contents depend on cartridge-specific bank registers
+        that are not part of bank_fingerprint().
+        """
+        if addr < 0x0002:
+            return True
+        if CHAR_ROM_START <= addr <= CHAR_ROM_END:
+            return bool(self._port & 0b00000100)
+        if self._cartridge is not None:
+            return ROML_START <= addr <= ROMH_END or addr >= KERNAL_ROM_START
+        return False
+
     def snapshot_ram(self) -> bytes:
         """Create a fast RAM snapshot by directly accessing underlying storage.
 
@@ -284,122 +441,117 @@ class C64Memory:
         # Direct slice of flat RAM array - simple and fast
         return bytes(self._ram[start:start + size])
 
+    def _build_io_tables(self) -> None:
+        """Build the $D000-$DFFF I/O dispatch, one entry per page ((addr >> 8) & 0x0F).
+
+        Entries are the chips' own read/write methods; each chip decodes its
+        register mirrors from the address (VIC-II every $40, SID every $20,
+        CIAs every $10).
+        """
+        cartridge = self._cartridge
+        vic, sid, cia1, cia2 = self.vic, self.sid, self.cia1, self.cia2
+        self._io_readers = (
+            (vic.read,) * 4                               # $D000-$D3FF
+            + (sid.read,) * 4                             # $D400-$D7FF
+            + (self._read_color_ram,) * 4                 # $D800-$DBFF
+            + (cia1.read, cia2.read)                      # $DC00, $DD00
+            + ((cartridge.read_io1, cartridge.read_io2)   # $DE00, $DF00
+               if cartridge is not None else (self._read_unmapped_io,) * 2)
+        )
+        self._io_writers = (
+            (self._write_vic,) * 4
+            + (sid.write,) * 4
+            + (self._write_color_ram,) * 4
+            + (cia1.write, self._write_cia2)
+            + ((cartridge.write_io1, cartridge.write_io2)
+               if cartridge is not None else (self._write_unmapped_io,) * 2)
+        )
+
+    def _read_color_ram(self, addr: int) -> int:
+        """Read color RAM ($D800-$DBFF); the upper nybble floats high."""
+        return self.ram_color[addr & 0x3FF] | 0xF0
+
+    def _write_color_ram(self, addr: int, value: int) -> None:
+        """Write color RAM ($D800-$DBFF), only 4 bits are stored."""
+        self.ram_color[addr & 0x3FF] = value & 0x0F
+        # Track color RAM changes
+        if self.dirty_tracker is not None:
+            self.dirty_tracker.mark_color_dirty(addr)
+
+    def _write_vic(self, addr: int, value: int) -> None:
+        """Write a VIC-II register ($D000-$D3FF, mirrored every $40)."""
+        self.vic.write(addr, value)
+        # Track VIC register changes (may affect global rendering)
+        if self.dirty_tracker is not None and addr & 0x3F <= 0x2E:
+            self.dirty_tracker.mark_vic_dirty()
+        # $D018: screen matrix and charset location
+        if addr & 0x3F == 0x18:
+            self._update_screen_watch()
+
+    def _write_cia2(self, addr: int, value: int) -> None:
+        """Write a CIA2 register ($DD00-$DDFF, mirrored every $10)."""
+        # Port A/DDR A select the VIC bank: latch the lines crossed so far first
+        if addr & 0x0F in (0x00, 0x02):
+            self.vic.update()
+        self.cia2.write(addr, value)
+        # $DD00: VIC bank
+        if addr & 0x0F == 0x00:
+            self._update_screen_watch()
+
+    def _read_unmapped_io(self, addr: int) -> int:
+        """Read I/O1/I/O2 without a cartridge (open bus)."""
+        return 0xFF
+
+    def _write_unmapped_io(self, addr: int, value: int) -> None:
+        """Write I/O1/I/O2 without a cartridge (ignored)."""
+
     def _read_io_area(self, addr: int) -> int:
         """Read from I/O area ($D000-$DFFF)."""
-        # VIC registers
-        if VIC_START <= addr <= VIC_END:
-            return self.vic.read(addr)
-        # SID registers
-        if SID_START <= addr <= SID_END:
-            return self.sid.read(addr)
-        # Color RAM
-        if COLOR_RAM_START <= addr <= COLOR_RAM_END:
-            return self.ram_color[addr - COLOR_RAM_START] | 0xF0
-        # CIA1
-        if CIA1_START <= addr <= CIA1_END:
-            return self.cia1.read(addr)
-        # CIA2
-        if CIA2_START <= addr <= CIA2_END:
-            return self.cia2.read(addr)
-        # Cartridge I/O1 ($DE00-$DEFF)
-        if IO1_START <= addr <= IO1_END:
-            if self.cartridge is not None:
-                return self.cartridge.read_io1(addr)
-            return 0xFF
-        # Cartridge I/O2 ($DF00-$DFFF)
-        if IO2_START <= addr <= IO2_END:
-            if self.cartridge is not None:
-                return self.cartridge.read_io2(addr)
-            return 0xFF
-        return 0xFF
+        return self._io_readers[(addr >> 8) & 0x0F](addr)
 
     def read(self, addr) -> int:
-        """Read from C64 memory using dispatch table for fast region lookup."""
-        # Single table lookup replaces 8+ conditional checks
-        # addr >> 12 gives top 4 bits (0-15), indexing into 16-entry dispatch table
-        return self._read_dispatch[addr >> 12](addr)
+        """Read from C64 memory through the current banking table."""
+        # One page lookup: a RAM/ROM view to index, or the page's read function
+        view = self.read_pages[addr >> 8]
+        if view is not None:
+            return view[addr & 0xFF]
+        return self.page_readers[addr >> 8](addr)
 
     def _write_io_area(self, addr: int, value: int) -> None:
         """Write to I/O area ($D000-$DFFF)."""
-        # VIC registers
-        if 0xD000 <= addr <= 0xD3FF:
-            self.vic.write(addr, value)
-            # Track VIC register changes (may affect global rendering)
-            if self.dirty_tracker is not None and addr <= 0xD02E:
-                self.dirty_tracker.mark_vic_dirty()
-            return
-        # SID registers
-        if 0xD400 <= addr <= 0xD7FF:
-            self.sid.write(addr, value)
-            return
-        # Color RAM
-        if 0xD800 <= addr <= 0xDBFF:
-            self.ram_color[addr - 0xD800] = value & 0x0F  # Only 4 bits
-            # Track color RAM changes
-            if self.dirty_tracker is not None:
-                self.dirty_tracker.mark_color_dirty(addr)
-            return
-        # CIA1
-        if 0xDC00 <= addr <= 0xDCFF:
-            self.cia1.write(addr, value)
-            return
-        # CIA2
-        if 0xDD00 <= addr <= 0xDDFF:
-            self.cia2.write(addr, value)
-            return
-        # Cartridge I/O1 ($DE00-$DEFF) - bank switching registers for many cartridge types
-        if IO1_START <= addr <= IO1_END:
-            if self.cartridge is not None:
-                self.cartridge.write_io1(addr, value)
-            return
-        # Cartridge I/O2 ($DF00-$DFFF)
-        if IO2_START <= addr <= IO2_END:
-            if self.cartridge is not None:
-                self.cartridge.write_io2(addr, value)
-            return
+        self._io_writers[(addr >> 8) & 0x0F](addr, value)
 
-    def write(self, addr, value) -> None:
-        """Write to C64 memory with banking logic."""
-        # Temporary debug: log ALL write calls
-        if DEBUG_SCREEN and 0x0400 <= addr <= 0x07E7:
-            log.info(f"*** C64Memory.write() CALLED: addr=${addr:04X}, value=${value:02X} ***")
-        # CPU internal port
+    def _write_page_0(self, addr: int, value: int) -> None:
+        """Write page $00 - CPU internal port or RAM."""
         if addr == 0x0000:
             self.ddr = value & 0xFF
             return
         if addr == 0x0001:
             self.port = value & 0xFF
             return
+        self._write_ram_direct(addr, value)
+
+    def _write_roml(self, addr: int, value: int) -> None:
+        """Write $8000-$9FFF with a cartridge attached."""
+        # Some cartridges (like Action Replay) have writable RAM here
+        if not self._cartridge.write_roml(addr, value):
+            self._write_ram_direct(addr, value)
+
+    def _write_screen(self, addr: int, value: int) -> None:
+        """Write a screen RAM page and mark the cell dirty for the renderers."""
+        if DEBUG_SCREEN:
+            log.info(f"*** SCREEN WRITE: addr=${addr:04X}, value=${value:02X} (char={chr(value) if 32 <= value < 127 else '?'}) ***")
+        self._unwatched_writers[addr >> 8](addr, value)
+        self.dirty_tracker.mark_screen_dirty(addr)
+
+    def _write_charset(self, addr: int, value: int) -> None:
+        """Write a page of a watched RAM charset and invalidate it in the glyph atlas."""
+        self._unwatched_writers[addr >> 8](addr, value)
+        self.glyph_atlas.invalidate(addr)
+        # A charset may share pages with the screen matrix
+        if self.dirty_tracker is not None:
+            self.dirty_tracker.mark_screen_dirty(addr)
 
-        # $0002-$7FFF is always RAM (includes screen RAM at $0400-$07E7)
-        if 0x0002 <= addr <= 0x7FFF:
-            # Log writes to screen RAM ($0400-$07E7)
-            if 0x0400 <= addr <= 0x07E7:
-                if DEBUG_SCREEN:
-                    log.info(f"*** SCREEN WRITE: addr=${addr:04X}, value=${value:02X} (char={chr(value) if 32 <= value < 127 else '?'}) ***")
-                # Track dirty screen cells for optimized rendering
-                if self.dirty_tracker is not None:
-                    self.dirty_tracker.mark_screen_dirty(addr)
-            self._write_ram_direct(addr, value & 0xFF)
-            return
-
-        # ROML region ($8000-$9FFF) - check for cartridge RAM first
-        if 0x8000 <= addr <= 0x9FFF:
-            # Some cartridges (like Action Replay) have writable RAM here
-            if self.cartridge is not None and self.cartridge.write_roml(addr, value):
-                return  # Cartridge handled the write
-            # Otherwise fall through to C64 RAM
-            self._write_ram_direct(addr, value & 0xFF)
-            return
-
-        # Memory banking logic (only applies to $A000-$FFFF)
-        io_enabled = self.port & 0b00000100
-
-        # I/O area ($D000-$DFFF)
-        if CHAR_ROM_START <= addr <= CHAR_ROM_END and io_enabled:
-            self._write_io_area(addr, value)
-            return
-
-        # Writes to $A000-$FFFF always go to underlying RAM
-        # (Even if ROM/I/O is visible for reads, writes always go to RAM)
-        self._write_ram_direct(addr, value & 0xFF)
+    def write(self, addr, value) -> None:
+        """Write to C64 memory through the page write table."""
+        self._page_writers[addr >> 8](addr, value)
@@ -4,6 +4,7 @@
 This module contains:
 - VideoTiming: Timing parameters for different VIC-II chip variants
 - ScreenDirtyTracker: Tracks which screen cells need redrawing
+- GlyphAtlas: Decoded character sets shared by the renderers
 - C64VIC: The main VIC-II chip emulation class
 - Color constants and ANSI conversion utilities
 """
@@ -148,8 +149,9 @@ class ScreenDirtyTracker:
     """Track which screen cells have changed since last render.
 
     Optimizes rendering by only updating cells that have been modified.
-    Tracks both screen RAM ($0400-$07E7) and color RAM ($D800-$DBE7).
-    Also tracks VIC register changes that affect global rendering.
+    Tracks both screen RAM (1000 bytes at screen_base, $0400 after reset)
+    and color RAM ($D800-$DBE7). Also tracks VIC register changes that
+    affect global rendering.
     """
 
     SCREEN_RAM_START = 0x0400
@@ -175,11 +177,21 @@ class ScreenDirtyTracker:
         # Previous screen state for comparison (optional optimization)
         self._prev_screen = None
         self._prev_color = None
+        # Current screen RAM location (VIC bank + $D018 bits 4-7), kept up
+        # to date by C64Memory
+        self.screen_base = self.SCREEN_RAM_START
+
+    def set_screen_base(self, screen_base: int) -> None:
+        """Move the tracked screen RAM, forcing a full redraw if it changed."""
+        if screen_base != self.screen_base:
+            self.screen_base = screen_base
+            self._dirty_cells.clear()
+            self._force_full_redraw = True
 
     def mark_screen_dirty(self, addr: int) -> None:
         """Mark a screen RAM address as dirty."""
-        if self.SCREEN_RAM_START <= addr <= self.SCREEN_RAM_END:
-            offset = addr - self.SCREEN_RAM_START
+        offset = addr - self.screen_base
+        if 0 <= offset < self.SCREEN_SIZE:
             row = offset // self.SCREEN_COLS
             col = offset % self.SCREEN_COLS
             self._dirty_cells.add((row, col))
@@ -199,7 +211,7 @@ class ScreenDirtyTracker:
 
     def mark_address_dirty(self, addr: int) -> None:
         """Mark any address as dirty (routes to appropriate tracker)."""
-        if self.SCREEN_RAM_START <= addr <= self.SCREEN_RAM_END:
+        if 0 <= addr - self.screen_base < self.SCREEN_SIZE:
             self.mark_screen_dirty(addr)
         elif self.COLOR_RAM_START <= addr <= self.COLOR_RAM_END:
             self.mark_color_dirty(addr)
@@ -238,6 +250,156 @@ class ScreenDirtyTracker:
         self._force_full_redraw = True
 
 
+# =============================================================================
+# Glyph Atlas
+# =============================================================================
+
+# Per glyph row byte: 8 pixels of 0/1 (hires) or 0-3 (multicolor, each
+# 2-bit pair doubled to two pixels)
+_HIRES_ROWS = [bytes((byte >> (7 - x)) & 0x01 for x in range(8)) for byte in range(256)]
+_MULTICOLOR_ROWS = [bytes((byte >> (6 - (x & 0x06))) & 0x03 for x in range(8)) for byte in range(256)]
+
+
+class CharsetGlyphs:
+    """One character set (256 glyphs) and its pre-expanded pixel forms.
+
+    hires and multicolor hold, per character code, 64 row-major pixel
+    values (bytes) and are expanded on first use. Renderers keep their own
+    derived forms (glyph surfaces, arrays) in cache, which is dropped with
+    the charset when its memory is written.
+    """
+
+    __slots__ = ("key", "data", "glyphs", "_hires", "_multicolor", "cache", "generation")
+
+    def __init__(self, key: tuple[str, int], data: bytes) -> None:
+        self.key = key
+        self.data = data
+        self.glyphs = [data[code * 8:code * 8 + 8] for code in range(256)]
+        self._hires: list[bytes] | None = None
+        self._multicolor: list[bytes] | None = None
+        self.cache: dict = {}
+        # GlyphAtlas write count of the block when data was read
+        self.generation = 0
+
+    @property
+    def hires(self) -> list[bytes]:
+        """Return 64 pixels (0/1) per character code."""
+        if self._hires is None:
+            self._hires = [b"".join([_HIRES_ROWS[row] for row in glyph]) for glyph in self.glyphs]
+        return self._hires
+
+    @property
+    def multicolor(self) -> list[bytes]:
+        """Return 64 pixels (bit pair 0-3, doubled horizontally) per character code."""
+        if self._multicolor is None:
+            self._multicolor = [b"".join([_MULTICOLOR_ROWS[row] for row in glyph]) for glyph in self.glyphs]
+        return self._multicolor
+
+
+class GlyphAtlas:
+    """Cache of decoded character sets shared by the renderers.
+
+    Charsets are keyed by where the VIC fetches them: ("rom", offset) for
+    the character ROM window in banks 0/2, ("ram", address) otherwise.
+
+    Once attached to the memory write path (see C64Memory), the memory calls
+    watch() from the CPU thread whenever $D018 or $DD00 select a charset;
+    watched lists those 2KB RAM blocks and their pages count writes into
+    invalidate(). Renderers on other threads only read: a watched charset is
+    decoded from live RAM and reused until its block is written again.
+    Unwatched RAM charsets (and all of them when unattached) are re-read on
+    each lookup and their cached expansions are reused while the bytes are
+    unchanged.
+    """
+
+    CHARSET_SIZE = 0x0800
+
+    def __init__(self, char_rom) -> None:
+        self.char_rom = char_rom
+        self._charsets: dict[tuple[str, int], CharsetGlyphs] = {}
+        # Write path (set by attach())
+        self.source: bytearray | None = None
+        self.watched: frozenset[int] = frozenset()
+        # Writes seen per 2KB block, bumped by invalidate() on the CPU thread
+        self._generations = [0] * 32
+
+    def attach(self, source: bytearray) -> None:
+        """Read watched RAM charsets from source."""
+        self.source = source
+        self.watched = frozenset()
+        self.clear()
+
+    def watch(self, vic_bank: int, char_offset: int) -> bool:
+        """Watch the RAM charset at char_offset within vic_bank.
+
+        Called from the memory write path. Returns True if the block was not
+        watched yet, i.e. its pages need the invalidating writer.
+        """
+        if vic_bank in (0x0000, 0x8000) and 0x1000 <= char_offset < 0x2000:
+            return False
+        address = vic_bank + char_offset
+        if address in self.watched:
+            return False
+        self.watched = self.watched | {address}
+        return True
+
+    def charset(self, ram, vic_bank: int, char_offset: int) -> CharsetGlyphs:
+        """Return the character set the VIC sees at char_offset within vic_bank.
+
+        The VIC-II can see character ROM at offset $1000-$1FFF within banks 0 and 2:
+        - Bank 0 ($0000): Char ROM at VIC address $1000-$1FFF (CPU $1000-$1FFF)
+        - Bank 1 ($4000): No char ROM - always RAM
+        - Bank 2 ($8000): Char ROM at VIC address $1000-$1FFF (CPU $9000-$9FFF)
+        - Bank 3 ($C000): No char ROM - always RAM
+        The 2KB-aligned charset is either entirely inside that window or not.
+
+        Args:
+            ram: RAM as seen by the VIC (only read for unwatched RAM charsets)
+            vic_bank: VIC bank base address ($0000, $4000, $8000, or $C000)
+            char_offset: Character base offset within VIC bank (from D018 bits 1-3)
+        """
+        if vic_bank in (0x0000, 0x8000) and 0x1000 <= char_offset < 0x2000:
+            key = ("rom", char_offset - 0x1000)
+            charset = self._charsets.get(key)
+            if charset is None:
+                offset = key[1]
+                charset = self._charsets[key] = CharsetGlyphs(key, bytes(self.char_rom[offset:offset + self.CHARSET_SIZE]))
+            return charset
+
+        address = vic_bank + char_offset
+        key = ("ram", address)
+        charset = self._charsets.get(key)
+        if self.source is not None and address in self.watched:
+            # Read the generation first: a write racing the copy below bumps
+            # it again, so the next lookup decodes the block afresh
+            generation = self._generations[address >> 11]
+            if charset is None or charset.generation != generation:
+                charset = CharsetGlyphs(key, bytes(self.source[address:address + self.CHARSET_SIZE]))
+                charset.generation = generation
+                self._charsets[key] = charset
+            return charset
+
+        if isinstance(ram, (bytes, bytearray, memoryview)):
+            data = bytes(ram[address:address + self.CHARSET_SIZE])
+        else:
+            data = bytes([ram[address + i] for i in range(self.CHARSET_SIZE)])
+        if charset is None or charset.data != data:
+            charset = self._charsets[key] = CharsetGlyphs(key, data)
+        return charset
+
+    def invalidate(self, addr: int) -> None:
+        """Mark the RAM charset containing addr stale (called on writes to watched blocks)."""
+        self._generations[addr >> 11] += 1
+
+    def clear(self) -> None:
+        """Drop all cached charsets."""
+        self._charsets.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached charsets."""
+        return len(self._charsets)
+
+
 # =============================================================================
 # VIC-II Chip Emulation
 # =============================================================================
@@ -264,6 +426,9 @@ class C64VIC:
         self.char_rom = char_rom
         self.cpu = cpu
         self.cia2 = cia2  # For VIC bank selection
+        # Decoded character sets shared by the renderers (attached to the
+        # memory write path by C64Memory)
+        self.glyph_atlas = GlyphAtlas(char_rom)
         self.video_timing = video_timing if video_timing is not None else PAL
 
         # --- Power-on register defaults (C64 reset state-ish) -----------------
@@ -398,6 +563,22 @@ class C64VIC:
         # VIC bank snapshot (from CIA2) - games may switch banks mid-frame
         self.vic_bank_snapshot = None
         self.c64_memory = None  # Set later via set_memory()
+        # Optional headless frame capture (c64.frame_sink.FrameSink), fed
+        # each VBlank snapshot from the CPU thread
+        self.frame_sink = None
+
+        # Per-raster-line state for line-based rendering (see _latch_lines):
+        # registers $D000-$D02E and the VIC bank in effect for each line of
+        # the current frame, and the completed frame's copy taken at VBlank.
+        # Register writes drop the latch so unchanged lines share one record
+        self.line_records: list[bytes | None] = [None] * self.raster_lines
+        self.line_banks: list[int] = [0] * self.raster_lines
+        self.line_snapshot: tuple[list[bytes | None], list[int]] | None = None
+        self._line_latch: bytes | None = None
+
+        # Event on a mos6502.scheduler.EventScheduler (see attach_scheduler);
+        # None while update() is polled every raster line instead
+        self.raster_event = None
 
         self.log.info(
             "VIC-II %s initialized (%d lines, %d cycles/line, %d cycles/frame)",
@@ -422,29 +603,71 @@ class C64VIC:
         return 0x0000  # Default to bank 0
 
     # --------------------------------------------------------------------- IRQ /
+    def attach_scheduler(self, scheduler) -> None:
+        """Run update() from scheduler events instead of polling every line.
+
+        The event fires at the next raster compare line and at the start of
+        each frame (VBlank). In between, register writes ($D000-$D3FF, and
+        VIC bank switches via C64Memory) call update() first, so every line
+        crossed is still latched with the registers in effect on it.
+        """
+        self.raster_event = scheduler.add(self._on_raster_event, "vic-raster")
+        self.raster_event.schedule(self.next_event_cycle())
+
+    def next_event_cycle(self) -> int:
+        """Return the CPU cycle of the next raster compare line or frame start."""
+        line = self.cpu.cycles_executed // self.cycles_per_line
+        raster = line % self.raster_lines
+        ahead = self.raster_lines - raster
+        compare = self.regs[0x12] | ((self.regs[0x11] & 0x80) << 1)
+        if compare < self.raster_lines:
+            ahead = min(ahead, (compare - raster) % self.raster_lines or self.raster_lines)
+        return (line + ahead) * self.cycles_per_line
+
+    def _on_raster_event(self, cycle: int) -> None:
+        """Scheduler callback: catch up to the due line and schedule the next event."""
+        self.update()
+        self.raster_event.schedule(self.next_event_cycle())
+
     def update(self) -> None:
         """
         Update raster position based on CPU cycles and generate raster IRQ
-        when the raster counter matches the compare register.
+        when the raster counter reaches the compare register.
+
+        Lines are crossed in bulk (less than a frame at a time): every crossed
+        line is latched, and the compare and first visible lines count as
+        reached if they were crossed.
         """
         # Derive raster from total CPU cycles; we don't try to be sub-cycle accurate.
         total_lines = self.cpu.cycles_executed // self.cycles_per_line
         new_raster = total_lines % self.raster_lines
 
         if new_raster != self.current_raster:
+            current_raster = self.current_raster
+            crossed = (new_raster - current_raster) % self.raster_lines
+
+            # Latch the state for each line crossed, publishing the completed
+            # frame's lines when the raster wraps
+            if new_raster < current_raster:
+                self._latch_lines(current_raster + 1, self.raster_lines)
+                self.line_snapshot = (self.line_records[:], self.line_banks[:])
+                self._latch_lines(0, new_raster + 1)
+            else:
+                self._latch_lines(current_raster + 1, new_raster + 1)
+
             # Snapshot VIC registers at first visible line (~51 on PAL)
             # This captures scroll/mode values when the game has set them for display
             # Games like Pitfall change scroll during visible area, reset during border
             # Snapshotting at VBlank would catch inconsistent values
             first_visible_line = 51  # First line of display area on PAL/NTSC
-            if self.current_raster < first_visible_line <= new_raster:
+            if (first_visible_line - current_raster - 1) % self.raster_lines < crossed:
                 # Crossed into visible area - snapshot registers now
                 self.regs_snapshot = bytes(self.regs)
                 self.vic_bank_snapshot = self.get_vic_bank()
 
             # Detect frame completion (VBlank) when raster wraps back to 0
             # This happens when new_raster < current_raster (wrapped around)
-            if new_raster < self.current_raster:
+            if new_raster < current_raster:
                 # Take RAM snapshot NOW while we're at VBlank
                 # This ensures consistent frame data before CPU continues
                 # Use snapshot_vic_bank() to bypass memory handler and avoid infinite recursion
@@ -454,6 +677,8 @@ class C64VIC:
                     self.ram_snapshot = self.c64_memory.snapshot_vic_bank(vic_bank)
                     self.ram_snapshot_bank = vic_bank  # Remember bank offset for rendering
                     self.color_snapshot = bytes(self.c64_memory.ram_color)
+                if self.frame_sink is not None:
+                    self.frame_sink.capture(self)
                 # Warn if frame_complete is still set (render thread falling behind)
                 if self.frame_complete.is_set():
                     log.warning(
@@ -464,7 +689,7 @@ class C64VIC:
             # 9-bit raster compare value: low byte in $D012, bit 8 in $D011 bit 7
             compare = self.regs[0x12] | ((self.regs[0x11] & 0x80) << 1)
 
-            if new_raster == compare:
+            if (compare - current_raster - 1) % self.raster_lines < crossed and compare < self.raster_lines:
                 # Always set the raster IRQ flag when raster matches compare value
                 # This flag is set regardless of whether IRQ is enabled
                 # (The enable bit only controls whether an actual interrupt fires)
@@ -472,7 +697,7 @@ class C64VIC:
                 self.irq_flags |= 0x01
 
                 log.info(
-                    "*** VIC RASTER MATCH: line %d == compare %d, irq_enabled=$%02X "
+                    "*** VIC RASTER MATCH: line %d reached compare %d, irq_enabled=$%02X "
                     "(bit0=%s), irq_flags now=$%02X ***",
                     new_raster,
                     compare,
@@ -497,12 +722,23 @@ class C64VIC:
 
         self.current_raster = new_raster
 
+    def _latch_lines(self, first: int, stop: int) -> None:
+        """Record the current registers and VIC bank for raster lines first..stop-1."""
+        latch = self._line_latch
+        if latch is None:
+            latch = self._line_latch = bytes(self.regs[:0x2F])
+        bank = self.get_vic_bank()
+        for line in range(first, stop):
+            self.line_records[line] = latch
+            self.line_banks[line] = bank
+
     # ---------------------------------------------------------------- Register I/O /
     def read(self, addr) -> int:
         reg = addr & 0x3F
 
         # $D011: Control register 1 (bit 7 is raster bit 8)
         if reg == 0x11:
+            self.update()
             # Bit 7 is raster line bit 8
             result = self.regs[0x11] & 0x7F
             if self.current_raster > 255:
@@ -549,7 +785,13 @@ class C64VIC:
 
     def write(self, addr, val) -> None:
         reg = addr & 0x3F
+        # Latch the lines crossed so far with the registers before this write
+        self.update()
         self.regs[reg] = val & 0xFF
+        self._line_latch = None
+        # A new compare line moves the next raster event
+        if reg in (0x11, 0x12) and self.raster_event is not None:
+            self.raster_event.schedule(self.next_event_cycle())
 
         # $D012: raster compare low byte
         if reg == 0x12:
@@ -607,45 +849,6 @@ class C64VIC:
             )
 
     # ---------------------------------------------------------------- Rendering /
-    def _get_char_data(self, ram, vic_bank, char_offset, char_code):
-        """Get 8-byte character glyph data from char ROM or RAM.
-
-        The VIC-II can see character ROM at offset $1000-$1FFF within banks 0 and 2:
-        - Bank 0 ($0000): Char ROM at VIC address $1000-$1FFF (CPU $1000-$1FFF)
-        - Bank 1 ($4000): No char ROM - always RAM
-        - Bank 2 ($8000): Char ROM at VIC address $1000-$1FFF (CPU $9000-$9FFF)
-        - Bank 3 ($C000): No char ROM - always RAM
-
-        Args:
-            ram: RAM array
-            vic_bank: VIC bank base address ($0000, $4000, $8000, or $C000)
-            char_offset: Character base offset within VIC bank (from D018 bits 1-3)
-            char_code: Character code (0-255)
-
-        Returns:
-            8-byte character glyph data
-        """
-        glyph_offset = char_code * 8
-
-        # Check if char ROM is visible at this address
-        # Char ROM appears at offset $1000-$1FFF within banks 0 and 2 only
-        char_addr_in_bank = char_offset + glyph_offset
-        use_char_rom = False
-
-        if vic_bank == 0x0000 or vic_bank == 0x8000:
-            # Banks 0 and 2 have char ROM at $1000-$1FFF
-            if 0x1000 <= char_addr_in_bank < 0x2000:
-                use_char_rom = True
-
-        if use_char_rom:
-            # Read from character ROM
-            rom_addr = (char_addr_in_bank - 0x1000) & 0x0FFF
-            return self.char_rom[rom_addr : rom_addr + 8]
-        else:
-            # Read from RAM
-            ram_addr = vic_bank + char_addr_in_bank
-            return bytes(ram[ram_addr + i] for i in range(8))
-
     def render_frame(self, surface, ram, color_ram) -> None:
         """
         Render a full frame into the given pygame surface.
@@ -725,6 +928,7 @@ class C64VIC:
 
     def _render_standard_text(self, surface, ram, color_ram, vic_bank, char_offset, screen_base, bg_color, x_origin, y_origin):
         """Render standard 40x25 text mode."""
+        glyphs = self.glyph_atlas.charset(ram, vic_bank, char_offset).hires
         for row in range(25):
             for col in range(40):
                 cell_addr = screen_base + row * 40 + col
@@ -737,28 +941,23 @@ class C64VIC:
                 reverse = char_code & 0x80
                 char_code &= 0x7F
 
-                # Fetch 8×8 glyph from char ROM or RAM
-                glyph = self._get_char_data(ram, vic_bank, char_offset, char_code)
+                # Pre-expanded 8×8 glyph from the atlas
+                pixels = glyphs[char_code]
+
+                if reverse:
+                    cell_colors = (COLORS[color], COLORS[bg_color])
+                else:
+                    cell_colors = (COLORS[bg_color], COLORS[color])
 
                 base_x = x_origin + col * 8
                 base_y = y_origin + row * 8
 
-                for y in range(8):
-                    line = glyph[y]
-                    for x in range(8):
-                        bit = (line >> (7 - x)) & 0x01
-
-                        if reverse:
-                            fg = COLORS[bg_color]
-                            bg = COLORS[color]
-                        else:
-                            fg = COLORS[color]
-                            bg = COLORS[bg_color]
-
-                        surface.set_at((base_x + x, base_y + y), fg if bit else bg)
+                for i, bit in enumerate(pixels):
+                    surface.set_at((base_x + (i & 7), base_y + (i >> 3)), cell_colors[bit])
 
     def _render_multicolor_text(self, surface, ram, color_ram, vic_bank, char_offset, screen_base, bg_colors, x_origin, y_origin):
         """Render multicolor text mode (MCM=1, BMM=0, ECM=0)."""
+        charset = self.glyph_atlas.charset(ram, vic_bank, char_offset)
         for row in range(25):
             for col in range(40):
                 cell_addr = screen_base + row * 40 + col
@@ -770,37 +969,24 @@ class C64VIC:
                 # If color bit 3 is set, use multicolor mode for this cell
                 use_multicolor = char_color & 0x08
 
-                # Fetch 8×8 glyph from char ROM or RAM
-                glyph = self._get_char_data(ram, vic_bank, char_offset, char_code)
+                if use_multicolor:
+                    # Multicolor: 4 double-width pixels per row
+                    pixels = charset.multicolor[char_code]
+                    cell_colors = (COLORS[bg_colors[0]], COLORS[bg_colors[1]], COLORS[bg_colors[2]], COLORS[char_color & 0x07])
+                else:
+                    # Standard: 8 single-width pixels per row
+                    pixels = charset.hires[char_code]
+                    cell_colors = (COLORS[bg_colors[0]], COLORS[char_color])
 
                 base_x = x_origin + col * 8
                 base_y = y_origin + row * 8
 
-                for y in range(8):
-                    line = glyph[y]
-                    if use_multicolor:
-                        # Multicolor: 4 double-width pixels
-                        for x in range(4):
-                            bits = (line >> (6 - x * 2)) & 0x03
-                            if bits == 0:
-                                c = COLORS[bg_colors[0]]
-                            elif bits == 1:
-                                c = COLORS[bg_colors[1]]
-                            elif bits == 2:
-                                c = COLORS[bg_colors[2]]
-                            else:
-                                c = COLORS[char_color & 0x07]
-                            surface.set_at((base_x + x * 2, base_y + y), c)
-                            surface.set_at((base_x + x * 2 + 1, base_y + y), c)
-                    else:
-                        # Standard: 8 single-width pixels
-                        for x in range(8):
-                            bit = (line >> (7 - x)) & 0x01
-                            c = COLORS[char_color] if bit else COLORS[bg_colors[0]]
-                            surface.set_at((base_x + x, base_y + y), c)
+                for i, value in enumerate(pixels):
+                    surface.set_at((base_x + (i & 7), base_y + (i >> 3)), cell_colors[value])
 
     def _render_ecm_text(self, surface, ram, color_ram, vic_bank, char_offset, screen_base, bg_colors, x_origin, y_origin):
         """Render extended background color mode (ECM=1, BMM=0, MCM=0)."""
+        glyphs = self.glyph_atlas.charset(ram, vic_bank, char_offset).hires
         for row in range(25):
             for col in range(40):
                 cell_addr = screen_base + row * 40 + col
@@ -813,18 +999,15 @@ class C64VIC:
                 bg_select = (char_code >> 6) & 0x03
                 char_code &= 0x3F  # Only 64 characters available
 
-                # Fetch 8×8 glyph from char ROM or RAM
-                glyph = self._get_char_data(ram, vic_bank, char_offset, char_code)
+                # Pre-expanded 8×8 glyph from the atlas
+                pixels = glyphs[char_code]
+                cell_colors = (COLORS[bg_colors[bg_select]], COLORS[char_color])
 
                 base_x = x_origin + col * 8
                 base_y = y_origin + row * 8
 
-                for y in range(8):
-                    line = glyph[y]
-                    for x in range(8):
-                        bit = (line >> (7 - x)) & 0x01
-                        c = COLORS[char_color] if bit else COLORS[bg_colors[bg_select]]
-                        surface.set_at((base_x + x, base_y + y), c)
+                for i, bit in enumerate(pixels):
+                    surface.set_at((base_x + (i & 7), base_y + (i >> 3)), cell_colors[bit])
 
     def _render_hires_bitmap(self, surface, ram, bitmap_base, screen_base, x_origin, y_origin):
         """Render standard hires bitmap mode (320x200, BMM=1, MCM=0)."""
@@ -945,7 +1128,7 @@ class C64VIC:
 
                             x_screen = sprite_x + byte_idx * 8 + px * 2
                             if x_expand:
-                                x_screen *= 2
+                                x_screen = sprite_x + (byte_idx * 8 + px * 2) * 2
                                 for dx in range(4):
                                     self._set_sprite_pixel(surface, x_screen + dx, y_screen, c)
                                     if y_expand:
@@ -965,7 +1148,7 @@ class C64VIC:
                             c = COLORS[sprite_color]
                             x_screen = sprite_x + byte_idx * 8 + px
                             if x_expand:
-                                x_screen *= 2
+                                x_screen = sprite_x + (byte_idx * 8 + px) * 2
                                 self._set_sprite_pixel(surface, x_screen, y_screen, c)
                                 self._set_sprite_pixel(surface, x_screen + 1, y_screen, c)
                                 if y_expand:
@@ -976,6 +1159,25 @@ class C64VIC:
                                 if y_expand:
                                     self._set_sprite_pixel(surface, x_screen, y_screen2, c)
 
+    def report_sprite_collisions(self, sprite_sprite: int, sprite_bg: int) -> None:
+        """Latch sprite collisions found while rendering a frame.
+
+        The bits accumulate in $D01E/$D01F until read. The first collision
+        since the last read sets $D019 bit 2 (sprite-sprite) or bit 1
+        (sprite-background) and raises an IRQ if it is enabled in $D01A.
+        """
+        flags = 0x00
+        if sprite_sprite and not self.sprite_sprite_collision:
+            flags |= 0x04
+        if sprite_bg and not self.sprite_bg_collision:
+            flags |= 0x02
+        self.sprite_sprite_collision |= sprite_sprite
+        self.sprite_bg_collision |= sprite_bg
+        if flags:
+            self.irq_flags |= flags
+            if self.irq_enabled & flags:
+                self.cpu.irq_pending = True
+
     def _set_sprite_pixel(self, surface, x, y, color):
         """Set a sprite pixel with bounds checking."""
         if 0 <= x < self.total_width and 0 <= y < self.total_height:
@@ -1,7 +1,7 @@
 """Shared fixtures and constants for 1541 drive tests.
 
 This module provides common test fixtures for all drive-related tests:
-- DRIVE_MODES: Parametrized drive runner modes (threaded, synchronous, multiprocess)
+- DRIVE_MODES: Parametrized drive runner modes (threaded, synchronous, speculative, multiprocess, virtual)
 - Common ROM/fixture path constants
 - Shared helper functions
 """
@@ -30,7 +30,9 @@ ROMS_AVAILABLE = (
 DRIVE_MODES = [
     pytest.param("threaded", id="threaded"),
     pytest.param("synchronous", id="synchronous"),
+    pytest.param("speculative", id="speculative"),
     pytest.param("multiprocess", id="multiprocess", marks=pytest.mark.slow),
+    pytest.param("virtual", id="virtual"),
 ]
 
 # Common C64 memory addresses
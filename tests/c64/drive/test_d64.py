@@ -12,6 +12,7 @@ from pathlib import Path
 from systems.c64.drive.d64 import (
     D64Image,
     DirectoryEntry,
+    DiskFullError,
     SECTORS_PER_TRACK,
     D64_35_TRACK_SIZE,
     FILE_TYPE_PRG,
@@ -182,6 +183,69 @@ class TestD64Directory:
         assert result is None
 
 
+class TestD64FileWrite:
+    """Test writing, reading back and deleting files."""
+
+    def test_write_and_read_back(self):
+        """A multi-sector file round-trips through the sector chain."""
+        d64 = D64Image()
+        data = bytes(i & 0xFF for i in range(1000))
+        entry = d64.write_file("PROG", data)
+
+        assert entry.size_sectors == 4  # 254 data bytes per sector
+        assert (entry.track, entry.sector) == (17, 0)  # Nearest the directory track
+        assert d64.read_file("PROG") == data
+        assert d64.find_file("PROG").size_sectors == 4
+
+    def test_last_sector_length(self):
+        """The last sector's link byte is the index of its last used byte."""
+        d64 = D64Image()
+        entry = d64.write_file("ONE", b"\x01\x08\xAA")
+
+        assert d64.read_sector(entry.track, entry.sector)[:2] == bytes([0, 4])
+        assert d64.read_file(entry) == b"\x01\x08\xAA"
+
+    def test_existing_file_needs_replace(self):
+        """Writing an existing name raises unless replace is set."""
+        d64 = D64Image()
+        d64.write_file("PROG", b"\x01\x08" + bytes(600))
+        free = d64.get_free_blocks()
+
+        with pytest.raises(FileExistsError):
+            d64.write_file("PROG", b"\x01\x08")
+
+        d64.write_file("PROG", b"\x01\x08", replace=True)
+        assert d64.read_file("PROG") == b"\x01\x08"
+        assert d64.get_free_blocks() == free + 2
+
+    def test_delete_frees_blocks(self):
+        """Deleting a file frees its blocks and directory entry."""
+        d64 = D64Image()
+        free = d64.get_free_blocks()
+        d64.write_file("PROG", bytes(300))
+
+        assert d64.delete_file("PROG") is True
+        assert d64.read_directory() == []
+        assert d64.get_free_blocks() == free
+        assert d64.delete_file("PROG") is False
+
+    def test_directory_grows(self):
+        """More than 8 files extend the directory chain on track 18."""
+        d64 = D64Image()
+        for i in range(20):
+            d64.write_file(f"FILE{i}", bytes([i]))
+
+        assert [entry.filename for entry in d64.read_directory()] == [f"FILE{i}" for i in range(20)]
+        assert d64.read_file("FILE19") == bytes([19])
+
+    def test_disk_full(self):
+        """A file larger than the free blocks raises DiskFullError."""
+        d64 = D64Image()
+        with pytest.raises(DiskFullError):
+            d64.write_file("HUGE", bytes(254 * (d64.get_free_blocks() + 1)))
+        assert d64.read_directory() == []
+
+
 class TestD64SaveLoad:
     """Test saving and loading D64 files."""
 
@@ -6,6 +6,8 @@ from pathlib import Path
 from systems.c64.drive.drive1541 import (
     Drive1541,
     Drive1541Memory,
+    IDLE_TRAP,
+    IDLE_TRAP_CODE,
     ROM_SIZE,
     RAM_SIZE,
     VIA1_START,
@@ -205,6 +207,22 @@ class TestDrive1541DiskOperations:
         finally:
             temp_path.unlink()
 
+    def test_gcr_cache_is_opt_in(self, tmp_path):
+        """Encoded tracks are only cached on disk when a cache dir is given."""
+        from systems.c64.drive.d64 import D64Image
+        disk_path = tmp_path / "disk.d64"
+        D64Image().save(disk_path)
+
+        drive = Drive1541()
+        drive.insert_disk(disk_path)
+        assert drive.gcr_disk.cache_dir is None
+
+        cache_dir = tmp_path / "gcr"
+        drive = Drive1541(gcr_cache_dir=cache_dir)
+        drive.insert_disk(disk_path)
+        drive.gcr_disk.get_track(18)
+        assert len(list(cache_dir.glob("*.gcr"))) == 1
+
 
 class TestDrive1541IECBus:
     """Test IEC bus interface."""
@@ -438,3 +456,108 @@ class TestDrive1541SyncDetection:
         # VIA2 PB7 = 1 when no sync (released)
         port_b = drive.via2.read(0x00)
         assert (port_b & 0x80) == 0x80, "PB7 should be high when not in sync"
+
+
+# $C000: start VIA2 timer 1 free-running (IRQ every $1001 cycles) and enable
+# the ATN interrupt, then idle: the loop bumps $31 when the IRQ handler has
+# seen ATN asserted ($30). The handler counts interrupts in $11.
+IDLE_ROM = bytes([
+    0x78,                          # SEI
+    0xA9, 0x01, 0x8D, 0x0C, 0x18,  # LDA #$01 / STA $180C (PCR: CA1 rising)
+    0xA9, 0x40, 0x8D, 0x0B, 0x1C,  # LDA #$40 / STA $1C0B (ACR: T1 continuous)
+    0xA9, 0x00, 0x8D, 0x04, 0x1C,  # LDA #$00 / STA $1C04 (T1 latch low)
+    0xA9, 0x10, 0x8D, 0x05, 0x1C,  # LDA #$10 / STA $1C05 (T1 start)
+    0xA9, 0xC0, 0x8D, 0x0E, 0x1C,  # LDA #$C0 / STA $1C0E (VIA2 IER: T1)
+    0xA9, 0x82, 0x8D, 0x0E, 0x18,  # LDA #$82 / STA $180E (VIA1 IER: CA1)
+    0x58,                          # CLI
+    0xA5, 0x30,                    # loop: LDA $30
+    0xF0, 0x06,                    # BEQ trap
+    0xE6, 0x31,                    # INC $31
+    0xA9, 0x00, 0x85, 0x30,        # LDA #$00 / STA $30
+    0x4C, 0x20, 0xC0,              # trap: JMP loop
+    0xAD, 0x01, 0x18,              # irq: LDA $1801 (clears CA1)
+    0xAD, 0x04, 0x1C,              # LDA $1C04 (clears T1)
+    0xE6, 0x11,                    # INC $11
+    0xAD, 0x00, 0x18,              # LDA $1800
+    0x10, 0x04,                    # BPL done (ATN released)
+    0xA9, 0x01, 0x85, 0x30,        # LDA #$01 / STA $30
+    0x40,                          # done: RTI
+])
+IDLE_ROM_TRAP = 0xC02A
+
+
+def make_idle_drive(idle_trap=IDLE_ROM_TRAP):
+    """Return a reset drive running IDLE_ROM, sleeping at idle_trap (None: never)."""
+    from mos6502 import CPU, CPUVariant
+
+    drive = Drive1541()
+    drive.cpu = CPU(cpu_variant=CPUVariant.NMOS_6502, verbose_cycles=False)
+    drive.cpu.ram.memory_handler = drive.memory
+    drive.memory.rom[:len(IDLE_ROM)] = IDLE_ROM
+    drive.memory.rom[0x3FFC:] = bytes([0x00, 0xC0, 0x2D, 0xC0])
+    drive.idle_trap = idle_trap
+    drive.reset()
+    return drive
+
+
+def run_idle_drive(drive, cycles, step=7):
+    """Tick the drive in C64-instruction-sized steps."""
+    for _ in range(cycles // step):
+        drive.tick(step)
+
+
+class TestDrive1541IdleSleep:
+    """Test sleeping the drive CPU in its idle loop."""
+
+    def test_sleep_matches_running(self):
+        """Timer interrupts are serviced as often as with the CPU running."""
+        awake = make_idle_drive(idle_trap=None)
+        asleep = make_idle_drive()
+        run_idle_drive(awake, 100_002)
+        run_idle_drive(asleep, 100_002)
+
+        assert asleep.memory.ram[0x11] == awake.memory.ram[0x11] == 100_002 // 0x1001
+        # The clocks agree up to the overshoot of the last instruction
+        assert (asleep.cpu.cycles_executed + asleep._pending_cycles
+                == awake.cpu.cycles_executed + awake._pending_cycles)
+        assert asleep.slept_cycles > 90_000
+        assert awake.slept_cycles == 0
+
+    def test_atn_edge_wakes_drive(self):
+        """Asserting ATN wakes the drive to service its interrupt."""
+        drive = make_idle_drive()
+        run_idle_drive(drive, 1_001)
+        assert drive.asleep
+
+        drive.set_iec_atn(False)
+        assert not drive.asleep
+        run_idle_drive(drive, 203)
+        assert drive.memory.ram[0x31] == 1
+        assert not drive.asleep  # ATN still asserted
+
+        drive.set_iec_atn(True)
+        run_idle_drive(drive, 203)
+        assert drive.asleep
+
+    def test_no_sleep_with_motor_on(self):
+        """The drive keeps running while the motor is on."""
+        drive = make_idle_drive()
+        drive.motor_on = True
+        run_idle_drive(drive, 10_003)
+        assert not drive.asleep
+        assert drive.slept_cycles == 0
+
+    def test_load_rom_traps_known_dos_only(self):
+        """The idle trap is set only if the ROM has the DOS 2.6 idle loop."""
+        rom_data = bytearray(ROM_SIZE)
+        for expected in (None, IDLE_TRAP):
+            with tempfile.NamedTemporaryFile(suffix=".rom", delete=False) as f:
+                f.write(rom_data)
+                temp_path = Path(f.name)
+            try:
+                drive = Drive1541()
+                drive.load_rom(temp_path)
+                assert drive.idle_trap == expected
+            finally:
+                temp_path.unlink()
+            rom_data[IDLE_TRAP - 0xC000:IDLE_TRAP - 0xC000 + 3] = IDLE_TRAP_CODE
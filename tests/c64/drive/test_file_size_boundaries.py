@@ -51,6 +51,7 @@ DRIVE_MODES = [
     pytest.param("threaded", id="threaded"),
     pytest.param("synchronous", id="synchronous"),
     pytest.param("multiprocess", id="multiprocess", marks=pytest.mark.slow),
+    pytest.param("virtual", id="virtual"),
 ]
 
 # Maximum cycles for operations
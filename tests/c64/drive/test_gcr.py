@@ -9,6 +9,7 @@ Reference:
 """
 
 import pytest
+from systems.c64.drive.d64 import D64Image, SECTORS_PER_TRACK, TRACK_SPEED_ZONE
 from systems.c64.drive.gcr import (
     GCR_ENCODE,
     GCR_DECODE,
@@ -416,6 +417,64 @@ class TestGCRDisk:
         assert disk.get_track(41) is None
         assert disk.get_track(-1) is None
 
+    def test_tracks_are_encoded_on_first_access(self):
+        """Tracks are only encoded when read, and match eager encoding."""
+        d64 = D64Image()
+        d64.write_file("HELLO", bytes(i & 0xFF for i in range(1000)))
+        disk = GCRDisk(d64)
+        assert all(track is None for track in disk.tracks)
+
+        gcr_track = disk.get_track(17)
+        assert disk.get_track(17) is gcr_track
+        assert [n for n, track in enumerate(disk.tracks) if track is not None] == [17]
+
+        expected = GCRTrack(17, SECTORS_PER_TRACK[16], TRACK_SPEED_ZONE[16])
+        expected.build_from_d64(d64, disk.disk_id)
+        assert gcr_track.data == expected.data
+
+    def test_get_track_beyond_image(self):
+        """Tracks past the end of the image do not exist."""
+        disk = GCRDisk(D64Image())
+        assert disk.get_track(36) is None
+        assert disk.get_track(35) is not None
+
+    def test_update_sector_skips_unencoded_tracks(self):
+        """Sector updates only re-encode tracks that were already built."""
+        d64 = D64Image()
+        disk = GCRDisk(d64)
+        d64.write_sector(1, 0, bytes([0xAA] * 256))
+        disk.update_sector(1, 0)
+        assert disk.tracks[1] is None
+        data, _checksum, valid = decode_sector_data(bytes(disk.get_track(1).data[39:364]))
+        assert data == bytes([0xAA] * 256)
+        assert valid
+
+    def test_cache_reuses_encoded_tracks(self, tmp_path, monkeypatch):
+        """A second disk with the same contents loads its tracks from the cache."""
+        d64 = D64Image()
+        first = GCRDisk(d64, cache_dir=tmp_path)
+        data = bytes(first.get_track(18).data)
+        assert len(list(tmp_path.glob("*.gcr"))) == 1
+
+        def fail(*args):
+            raise AssertionError("track was re-encoded")
+
+        monkeypatch.setattr(GCRTrack, "build_from_d64", fail)
+        second = GCRDisk(D64Image(), cache_dir=tmp_path)
+        assert second.get_track(18).data == data
+
+    def test_cache_is_keyed_by_contents(self, tmp_path):
+        """Changing a sector gives the track a new cache entry."""
+        d64 = D64Image()
+        GCRDisk(d64, cache_dir=tmp_path).get_track(1)
+        d64.write_sector(1, 3, bytes([0x42] * 256))
+        gcr_track = GCRDisk(d64, cache_dir=tmp_path).get_track(1)
+
+        assert len(list(tmp_path.glob("*.gcr"))) == 2
+        expected = GCRTrack(1, SECTORS_PER_TRACK[0], TRACK_SPEED_ZONE[0])
+        expected.build_from_d64(d64, GCRDisk(d64).disk_id)
+        assert gcr_track.data == expected.data
+
 
 class TestGCRConstants:
     """Test GCR module constants."""
@@ -0,0 +1,199 @@
+"""Tests for the shared-memory IEC synchronization of MultiprocessDrive1541.
+
+These run both sides of the protocol in one process (the drive side in a
+thread), so no 1541 ROM is needed.
+"""
+
+import os
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from c64.drive.drive1541 import Drive1541, VIA1_DATA_OUT
+from c64.drive.multiprocess_drive import DriveIECPort
+from c64.drive.multiprocess_iec_bus import (
+    C64_ATN_OUT_BIT,
+    DRIVE_DATA_OUT_BIT,
+    RING_SLOTS,
+    MultiprocessIECBus,
+    SharedIECState,
+)
+
+
+class MockCIA2:
+    """Mock CIA2 with a CPU cycle counter."""
+
+    def __init__(self):
+        self.port_a = 0x00
+        self.ddr_a = 0x3F  # ATN, CLK, DATA as outputs
+        self.cpu = MagicMock()
+        self.cpu.cycles_executed = 0
+
+
+@pytest.fixture
+def shared():
+    """A fresh shared segment, plus a second handle as the drive process would open it."""
+    state = SharedIECState(name=f"test_iec_{os.getpid()}_{id(object())}", create=True)
+    peer = SharedIECState(name=state.name, create=False)
+    yield state, peer
+    peer.close()
+    state.close()
+    state.unlink()
+
+
+class TestTransitionRing:
+    """Test the single-producer/single-consumer ring."""
+
+    def test_fifo_order_and_pop_until(self, shared):
+        """Entries come out in order; pop_until stops at the first later stamp."""
+        state, peer = shared
+        for cycle in (10, 20, 30):
+            assert state.c64_ring.push(cycle, cycle // 10)
+
+        assert len(peer.c64_ring) == 3
+        assert peer.c64_ring.pop_until(25) == 2
+        assert peer.c64_ring.peek() == (30, 3)
+        assert peer.c64_ring.pop_until(25) is None
+
+    def test_full_ring_rejects_and_wraps(self, shared):
+        """push() fails when full and succeeds again after the consumer pops."""
+        state, peer = shared
+        ring = state.drive_ring
+        for cycle in range(RING_SLOTS):
+            assert ring.push(cycle, cycle & 7)
+        assert not ring.push(RING_SLOTS, 0)
+
+        assert peer.drive_ring.pop_until(9) == 9 & 7
+        for cycle in range(RING_SLOTS, RING_SLOTS + 10):
+            assert ring.push(cycle, cycle & 7)
+        assert peer.drive_ring.pop_until(RING_SLOTS + 9) == (RING_SLOTS + 9) & 7
+        assert len(ring) == 0
+
+    def test_concurrent_producer(self, shared):
+        """A producer thread and a consumer see every entry exactly once, in order."""
+        state, peer = shared
+        count = 20 * RING_SLOTS
+
+        def produce():
+            for cycle in range(count):
+                while not state.c64_ring.push(cycle, cycle & 0xFF):
+                    pass
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        received = []
+        while len(received) < count:
+            entry = peer.c64_ring.peek()
+            if entry is not None:
+                received.append(entry)
+                peer.c64_ring.pop()
+        producer.join()
+
+        assert received == [(cycle, cycle & 0xFF) for cycle in range(count)]
+
+
+class TestC64Side:
+    """Test that MultiprocessIECBus reads the drive's lines at the C64's cycle."""
+
+    def make_bus(self, state):
+        cia2 = MockCIA2()
+        bus = MultiprocessIECBus(state)
+        bus.connect_c64(cia2)
+        state.set_drive_ready(True)
+        return bus, cia2
+
+    def test_update_pushes_stamped_transitions(self, shared):
+        """Output changes are stamped with the C64 cycle; unchanged outputs are not pushed."""
+        state, peer = shared
+        bus, cia2 = self.make_bus(state)
+        cia2.cpu.cycles_executed = 120
+        cia2.port_a = 0x08  # ATN out
+        bus.update()
+        cia2.cpu.cycles_executed = 130
+        bus.update()
+
+        assert peer.c64_ring.pop_until(1000) == C64_ATN_OUT_BIT
+        assert len(peer.c64_ring) == 0
+        assert peer.get_c64_cycles() == 120
+        assert bus.atn is False
+
+    def test_read_waits_for_drive_clock(self, shared):
+        """A read at cycle t sees exactly the drive transitions stamped <= t."""
+        state, peer = shared
+        bus, cia2 = self.make_bus(state)
+        transitions = {100: DRIVE_DATA_OUT_BIT, 300: 0}
+
+        def drive():
+            # Run in steps of 50 cycles, staying within reach of the C64
+            for cycle in range(0, 500, 50):
+                while peer.get_c64_cycles() + 100 < cycle:
+                    pass
+                if cycle in transitions:
+                    peer.drive_ring.push(cycle, transitions[cycle])
+                peer.set_drive_cycles(cycle)
+
+        thread = threading.Thread(target=drive)
+        thread.start()
+        samples = []
+        for cycle in (50, 99, 100, 250, 299, 300, 450):
+            cia2.cpu.cycles_executed = cycle
+            samples.append(bool(bus.get_c64_input() & 0x80))
+        thread.join()
+
+        assert samples == [True, True, False, False, False, True, True]
+        assert bus.timeouts == 0
+
+    def test_read_without_drive_does_not_wait(self, shared):
+        """With the drive process gone the bus keeps its last state."""
+        state, _peer = shared
+        bus, cia2 = self.make_bus(state)
+        state.set_drive_ready(False)
+        cia2.cpu.cycles_executed = 10_000
+        assert bus.get_c64_input() == 0xFF
+        assert bus.timeouts == 0
+
+
+class TestDriveSide:
+    """Test DriveIECPort against transitions pushed by the C64 side."""
+
+    @pytest.fixture
+    def port(self, shared):
+        state, peer = shared
+        state.set_c64_cycles(1000)
+        drive = Drive1541(device_number=8)
+        drive.cpu = MagicMock()
+        drive.cpu.cycles_executed = 0
+        drive.via1.pcr = 0x01  # CA1 on positive edge, as the DOS sets it
+        return DriveIECPort(drive, peer)
+
+    def test_clock_starts_at_c64_clock(self, port):
+        """The drive clock is in C64 cycles from the published origin."""
+        port.drive.cpu.cycles_executed = 25
+        assert port.now() == 1025
+
+    def test_atn_edge_applied_at_its_cycle(self, shared, port):
+        """ATN asserted at cycle 1040 raises CA1 once the drive reaches 1040."""
+        state, _peer = shared
+        state.c64_ring.push(1040, C64_ATN_OUT_BIT)
+
+        port.apply(1039)
+        assert port.drive.iec_atn is True
+        assert port.next_transition() == 1040
+
+        port.apply(1040)
+        assert port.drive.iec_atn is False
+        assert port.drive.via1.ifr & 0x02  # CA1 flag
+
+    def test_drive_outputs_pushed_with_drive_clock(self, shared, port):
+        """A VIA1 port B write pushes the drive's lines stamped with its clock."""
+        state, _peer = shared
+        drive = port.drive
+        drive.cpu.cycles_executed = 7
+        drive.via1.ddrb = VIA1_DATA_OUT
+        drive.via1.orb = VIA1_DATA_OUT
+        port.update()
+
+        assert state.drive_ring.peek() == (1007, DRIVE_DATA_OUT_BIT)
+        assert state.get_drive_cycles() == 1007
+        assert drive.iec_data is False
@@ -45,7 +45,9 @@ requires_fixtures = pytest.mark.skipif(
 DRIVE_MODES = [
     pytest.param("threaded", id="threaded"),
     pytest.param("synchronous", id="synchronous"),
+    pytest.param("speculative", id="speculative"),
     pytest.param("multiprocess", id="multiprocess", marks=pytest.mark.slow),
+    pytest.param("virtual", id="virtual"),
 ]
 
 # Maximum cycles for operations
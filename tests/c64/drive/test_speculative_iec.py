@@ -0,0 +1,154 @@
+"""Tests for SpeculativeIECBus (drive run-ahead with rollback).
+
+The drive runs a small ROM that echoes CLK IN to DATA OUT and counts ATN
+interrupts, so no 1541 DOS ROM is needed. Every scenario is run twice: with
+run-ahead, and pinned to lockstep (window 0). The C64 must see the same bus
+state at every read either way.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from mos6502 import CPU, CPUVariant
+from mos6502.scheduler import EventScheduler
+from c64.drive import speculative_iec_bus
+from c64.drive.drive1541 import Drive1541
+from c64.drive.speculative_iec_bus import DriveCheckpoint, SpeculativeIECBus
+
+# $C000: set up VIA1, then loop copying CLK IN (PB2) to DATA OUT (PB1) and
+# counting iterations in $20; the IRQ handler at $C01F counts ATN edges in $10
+ECHO_ROM = bytes([
+    0x78,                    # SEI
+    0xA9, 0x1A, 0x8D, 0x02, 0x18,  # LDA #$1A / STA $1802 (DDRB)
+    0xA9, 0x01, 0x8D, 0x0C, 0x18,  # LDA #$01 / STA $180C (PCR: CA1 rising)
+    0xA9, 0x82, 0x8D, 0x0E, 0x18,  # LDA #$82 / STA $180E (IER: CA1)
+    0x58,                    # CLI
+    0xAD, 0x00, 0x18,        # loop: LDA $1800
+    0x29, 0x04,              # AND #$04
+    0x4A,                    # LSR
+    0x8D, 0x00, 0x18,        # STA $1800
+    0xE6, 0x20,              # INC $20
+    0x4C, 0x11, 0xC0,        # JMP loop
+    0xAD, 0x01, 0x18,        # irq: LDA $1801 (clears CA1)
+    0xE6, 0x10,              # INC $10
+    0x40,                    # RTI
+])
+
+CLK_OUT = 0x10
+ATN_OUT = 0x08
+
+
+def make_bus():
+    """Return (bus, drive, cia2, scheduler) with the echo ROM reset and attached."""
+    drive = Drive1541(device_number=8)
+    drive.cpu = CPU(cpu_variant=CPUVariant.NMOS_6502, verbose_cycles=False)
+    drive.cpu.ram.memory_handler = drive.memory
+    drive.memory.rom[:len(ECHO_ROM)] = ECHO_ROM
+    drive.memory.rom[0x3FFC:] = bytes([0x00, 0xC0, 0x1F, 0xC0])
+    drive.reset()
+
+    cia2 = MagicMock()
+    cia2.port_a = 0x00
+    cia2.ddr_a = 0x3F
+    cia2.cpu.cycles_executed = 0
+
+    bus = SpeculativeIECBus()
+    bus.connect_c64(cia2)
+    bus.connect_drive(drive)
+    scheduler = EventScheduler()
+    bus.attach_scheduler(scheduler)
+    return bus, drive, cia2, scheduler
+
+
+def run_script(script):
+    """Play (cycle, port_a or None) steps: write port A, or read the bus if None."""
+    bus, drive, cia2, scheduler = make_bus()
+    reads = []
+    for cycle, port_a in script:
+        # Advance the C64 an instruction at a time so events run on time
+        now = cia2.cpu.cycles_executed
+        while now < cycle:
+            now = min(cycle, now + 5)
+            cia2.cpu.cycles_executed = now
+            scheduler.run(now)
+        if port_a is None:
+            reads.append(bus.get_c64_input())
+        else:
+            cia2.port_a = port_a
+            bus.update()
+    return reads, bus, drive
+
+
+def handshake_script():
+    """Toggle CLK and read DATA back at varying delays; then pulse ATN and idle."""
+    script = []
+    cycle = 1000
+    for i in range(20):
+        script.append((cycle, CLK_OUT if i % 2 == 0 else 0x00))
+        script.append((cycle + 5 + 3 * i, None))
+        script.append((cycle + 120, None))
+        cycle += 400 + 13 * i
+    script += [(cycle, ATN_OUT), (cycle + 200, 0x00), (cycle + 300, None), (cycle + 5_000, None)]
+    return script
+
+
+@pytest.fixture
+def lockstep(monkeypatch):
+    """Pin the run-ahead window to zero."""
+    monkeypatch.setattr(speculative_iec_bus, "MIN_RUN_AHEAD", 0)
+    monkeypatch.setattr(speculative_iec_bus, "MAX_RUN_AHEAD", 0)
+
+
+class TestSpeculativeIECBus:
+    """Test that run-ahead and rollback preserve what the C64 sees."""
+
+    def test_matches_lockstep(self, request):
+        """Every read sees the same bus state as running the drive in lockstep."""
+        script = handshake_script()
+        reads, bus, drive = run_script(script)
+        request.getfixturevalue("lockstep")
+        expected, _bus, lockstep_drive = run_script(script)
+
+        assert reads == expected
+        assert drive.memory.ram[0x10] == lockstep_drive.memory.ram[0x10] == 1  # One ATN edge
+        assert bus.rollbacks > 0
+        assert bus.late_changes == 0
+
+    def test_echo_seen_after_drive_loop(self):
+        """DATA follows CLK once the drive loop has run (about 20 cycles)."""
+        reads, _bus, _drive = run_script([(1000, CLK_OUT), (1100, None), (2000, 0x00), (2100, None)])
+        assert reads == [0x3F, 0xFF]
+
+    def test_quiet_bus_runs_in_large_batches(self):
+        """Without C64 line changes the drive is not rolled back and the window grows."""
+        _reads, bus, _drive = run_script([(200_000, None)])
+        assert bus.rollbacks == 0
+        assert bus.window == speculative_iec_bus.MAX_RUN_AHEAD
+        assert bus.batches < 200_000 // speculative_iec_bus.MIN_RUN_AHEAD
+        assert bus.drive_cycle >= 200_000
+
+    def test_conflict_shrinks_window(self):
+        """A line change the drive already read past rolls back and halves the window."""
+        _reads, bus, _drive = run_script([(50_000, None), (50_010, CLK_OUT)])
+        assert bus.rollbacks == 1
+        assert bus.window < speculative_iec_bus.MAX_RUN_AHEAD
+        assert bus.drive_cycle == 50_010
+
+
+class TestDriveCheckpoint:
+    """Test that restoring a checkpoint reproduces the drive's execution."""
+
+    def test_restore_replays_identically(self):
+        """Running, restoring and running again gives the same state."""
+        _bus, drive, _cia2, _scheduler = make_bus()
+        Drive1541.tick(drive, 500)
+        checkpoint = DriveCheckpoint.take(drive, 500)
+
+        Drive1541.tick(drive, 1000)
+        first = (drive.cpu.PC, drive.cpu.cycles_executed, bytes(drive.memory.ram), drive.via1.orb)
+        checkpoint.restore(drive)
+        assert drive.cpu.cycles_executed == checkpoint.cpu_cycles
+
+        Drive1541.tick(drive, 1000)
+        assert (drive.cpu.PC, drive.cpu.cycles_executed, bytes(drive.memory.ram), drive.via1.orb) == first
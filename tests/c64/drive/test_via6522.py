@@ -258,6 +258,26 @@ class TestVIA6522InterruptRegisters:
 
         assert True in irq_states
 
+    def test_cycles_until_irq(self):
+        """cycles_until_irq() is the tick count at which an enabled timer raises its flag."""
+        via = VIA6522()
+        via.t1_counter = 0x0200
+        via.t1_running = True
+        via.t2_counter = 0x0100
+        via.t2_running = True
+        assert via.cycles_until_irq() is None  # Nothing enabled
+
+        via.ier = IRQ_T1
+        assert via.cycles_until_irq() == 0x0200
+        via.ier = IRQ_T1 | IRQ_T2
+        due = via.cycles_until_irq()
+        assert due == 0x0100
+
+        via.tick(due - 1)
+        assert not via.ifr & IRQ_T2
+        via.tick(1)
+        assert via.ifr & IRQ_T2
+
 
 class TestVIA6522ControlLines:
     """Test VIA CA1/CA2/CB1/CB2 control line behavior."""
@@ -0,0 +1,275 @@
+"""Tests for VirtualDrive (KERNAL trap-based disk access).
+
+A bare CPU calls the trapped KERNAL routine addresses with JSR, so no C64
+ROMs are needed: the fake KERNAL only holds the RESTOR vector table, and every
+call must be served by the trap and return to the caller.
+"""
+
+import pytest
+
+from mos6502 import CPU, CPUVariant, errors
+from systems.c64.drive.d64 import D64Image
+from systems.c64.drive.virtual_drive import (
+    DFLTN,
+    EAL,
+    FA,
+    FAT,
+    FNADR,
+    FNLEN,
+    KERNAL_START,
+    KERNAL_VECTOR_TABLE,
+    LA,
+    LAT,
+    LDTND,
+    MEMUSS,
+    SA,
+    SAT,
+    STAL,
+    STATUS,
+    VirtualDrive,
+)
+
+# Default KERNAL targets of the $0314-$0333 vectors
+VECTORS = [
+    0xEA31, 0xFE66, 0xFE47, 0xF34A, 0xF291, 0xF20E, 0xF250, 0xF333,
+    0xF157, 0xF1CA, 0xF6ED, 0xF13E, 0xF32F, 0xFE66, 0xF4A5, 0xF5ED,
+]
+OPEN, CLOSE, CHKIN, CLRCHN, CHRIN, GETIN, LOAD, SAVE = (
+    VECTORS[3], VECTORS[4], VECTORS[5], VECTORS[7], VECTORS[8], VECTORS[11], VECTORS[14], VECTORS[15],
+)
+
+KERNAL = bytearray(0x2000)
+for _index, _target in enumerate(VECTORS):
+    KERNAL[KERNAL_VECTOR_TABLE - KERNAL_START + 2 * _index] = _target & 0xFF
+    KERNAL[KERNAL_VECTOR_TABLE - KERNAL_START + 2 * _index + 1] = _target >> 8
+
+CALLER = 0x0A00
+FILENAME = 0x0B00
+
+
+def make_drive(disk=None):
+    """Return (cpu, drive) with the traps installed on a bare CPU."""
+    cpu = CPU(cpu_variant=CPUVariant.NMOS_6502, verbose_cycles=False)
+    cpu.reset()
+    # Zero page and the KERNAL file tables start out clear
+    for address in range(0x0300):
+        cpu.ram[address] = 0
+    drive = VirtualDrive(device_number=8)
+    drive.disk = disk if disk is not None else D64Image()
+    drive.install(cpu, KERNAL)
+    cpu.breakpoint_callback = drive.trap
+    return cpu, drive
+
+
+def set_file(cpu, name, logical=1, device=8, secondary=0):
+    """Set up the KERNAL file parameters (SETLFS/SETNAM)."""
+    encoded = name.encode("ascii")
+    for i, value in enumerate(encoded):
+        cpu.ram[FILENAME + i] = value
+    cpu.ram[FNLEN] = len(encoded)
+    cpu.ram[FNADR] = FILENAME & 0xFF
+    cpu.ram[FNADR + 1] = FILENAME >> 8
+    cpu.ram[LA] = logical
+    cpu.ram[FA] = device
+    cpu.ram[SA] = secondary
+
+
+def call(cpu, routine, a=0, x=0):
+    """JSR to a trapped routine and check that it returned to the caller."""
+    program = [0x20, routine & 0xFF, routine >> 8, 0x4C, 0x03, CALLER >> 8]  # JSR routine / JMP *
+    for i, value in enumerate(program):
+        cpu.ram[CALLER + i] = value
+    cpu.PC = CALLER
+    cpu.A = a
+    cpu.X = x
+    with pytest.raises(errors.CPUCycleExhaustionError):
+        cpu.execute(cycles=50)
+    assert cpu.PC == CALLER + 3
+
+
+def read_channel(cpu):
+    """Read bytes with CHRIN until the status byte is set."""
+    data = bytearray()
+    while True:
+        call(cpu, CHRIN)
+        data.append(cpu.A)
+        if cpu.ram[STATUS]:
+            return bytes(data), cpu.ram[STATUS]
+
+
+class TestVirtualDriveLoad:
+    """Test LOAD and VERIFY through the ILOAD trap."""
+
+    def test_load_relocates_to_memuss(self):
+        """Secondary address 0 loads at MEMUSS and returns the end address."""
+        disk = D64Image()
+        payload = bytes(i & 0xFF for i in range(300))
+        disk.write_file("HELLO", b"\x01\x08" + payload)
+        cpu, _drive = make_drive(disk)
+        set_file(cpu, "HELLO")
+        cpu.ram[MEMUSS] = 0x00
+        cpu.ram[MEMUSS + 1] = 0x10
+
+        call(cpu, LOAD)
+
+        assert bytes(cpu.ram[0x1000 + i] for i in range(300)) == payload
+        end = 0x1000 + 300
+        assert (cpu.X, cpu.Y) == (end & 0xFF, end >> 8)
+        assert cpu.ram[EAL] | (cpu.ram[EAL + 1] << 8) == end
+        assert cpu.ram[STATUS] == 0x40
+        assert cpu.C is False
+
+    def test_load_uses_file_address(self):
+        """LOAD"NAME",8,1 loads at the address in the file header."""
+        disk = D64Image()
+        disk.write_file("HIGH", b"\x00\xC0\xAA\xBB")
+        cpu, _drive = make_drive(disk)
+        set_file(cpu, "HI*", secondary=1)
+
+        call(cpu, LOAD)
+
+        assert (cpu.ram[0xC000], cpu.ram[0xC001]) == (0xAA, 0xBB)
+        assert cpu.ram[EAL] | (cpu.ram[EAL + 1] << 8) == 0xC002
+
+    def test_file_not_found(self):
+        """A missing file returns KERNAL error 4 with ST=$42."""
+        cpu, drive = make_drive()
+        set_file(cpu, "MISSING")
+
+        call(cpu, LOAD)
+
+        assert cpu.C is True
+        assert cpu.A == 4
+        assert cpu.ram[STATUS] == 0x42
+        assert drive._status_message() == b"62,FILE NOT FOUND,00,00\r"
+
+    def test_verify_mismatch(self):
+        """VERIFY compares memory and sets ST bit 4 on a difference."""
+        disk = D64Image()
+        disk.write_file("DATA", b"\x00\x20\x01\x02")
+        cpu, _drive = make_drive(disk)
+        set_file(cpu, "DATA", secondary=1)
+        cpu.ram[0x2000] = 0x01
+        cpu.ram[0x2001] = 0x00
+
+        call(cpu, LOAD, a=1)
+
+        assert cpu.ram[0x2001] == 0x00  # Verify does not write
+        assert cpu.ram[STATUS] == 0x50
+
+    def test_directory_listing(self):
+        """LOAD"$" returns a BASIC program listing the directory."""
+        disk = D64Image()
+        disk.write_file("FIRST", b"\x01\x08" + bytes(600))
+        cpu, _drive = make_drive(disk)
+        set_file(cpu, "$", secondary=1)
+
+        call(cpu, LOAD)
+
+        end = cpu.ram[EAL] | (cpu.ram[EAL + 1] << 8)
+        listing = bytes(cpu.ram[address] for address in range(0x0401, end))
+        assert b'"EMPTY DISK      " 00 2A' in listing
+        assert bytes([0x03, 0x00]) + b'   "FIRST"' in listing
+        assert b"PRG" in listing
+        assert listing.endswith(b"BLOCKS FREE.".ljust(25) + b"\x00\x00\x00")
+
+    def test_other_devices_fall_through(self):
+        """Calls for other devices, or with the KERNAL banked out, are not served."""
+        cpu, drive = make_drive()
+        set_file(cpu, "HELLO", device=9)
+        assert drive.trap(cpu, LOAD) is False
+
+        cpu.ram[FA] = 8
+        drive.install(cpu, KERNAL, kernal_visible=lambda: False)
+        assert drive.trap(cpu, LOAD) is False
+
+
+class TestVirtualDriveSave:
+    """Test SAVE through the ISAVE trap."""
+
+    def test_save_writes_and_persists(self, tmp_path):
+        """SAVE writes STAL..EAL with the load address and saves the image."""
+        path = tmp_path / "save.d64"
+        D64Image().save(path)
+        cpu, drive = make_drive(D64Image(path))
+        for i in range(10):
+            cpu.ram[0x0801 + i] = i + 1
+        set_file(cpu, "PROG", secondary=1)
+        cpu.ram[STAL], cpu.ram[STAL + 1] = 0x01, 0x08
+        cpu.ram[EAL], cpu.ram[EAL + 1] = 0x0B, 0x08
+
+        call(cpu, SAVE)
+
+        assert cpu.C is False
+        expected = b"\x01\x08" + bytes(range(1, 11))
+        assert drive.disk.read_file("PROG") == expected
+        assert D64Image(path).read_file("PROG") == expected
+
+    def test_save_existing_needs_replace(self):
+        """Saving over a file fails with 63 unless the name starts with "@"."""
+        disk = D64Image()
+        disk.write_file("PROG", b"\x01\x08\x00")
+        cpu, drive = make_drive(disk)
+        cpu.ram[STAL], cpu.ram[STAL + 1] = 0x01, 0x08
+        cpu.ram[EAL], cpu.ram[EAL + 1] = 0x03, 0x08
+
+        set_file(cpu, "PROG", secondary=1)
+        call(cpu, SAVE)
+        assert drive._status_message().startswith(b"63,FILE EXISTS")
+
+        set_file(cpu, "@0:PROG", secondary=1)
+        call(cpu, SAVE)
+        assert drive._status_message().startswith(b"00, OK")
+        assert len(drive.disk.read_directory()) == 1
+
+
+class TestVirtualDriveFiles:
+    """Test OPEN/CHKIN/CHRIN/CLRCHN/CLOSE."""
+
+    def test_read_sequential_file(self):
+        """An opened file is read byte by byte up to EOF, then RETURN."""
+        disk = D64Image()
+        disk.write_file("TEXT", b"HI\r")
+        cpu, drive = make_drive(disk)
+        set_file(cpu, "TEXT,S,R", logical=2, secondary=2)
+
+        call(cpu, OPEN)
+        assert cpu.ram[LDTND] == 1
+        assert (cpu.ram[LAT], cpu.ram[FAT], cpu.ram[SAT]) == (2, 8, 0x62)
+
+        call(cpu, CHKIN, x=2)
+        assert cpu.ram[DFLTN] == 8
+
+        assert read_channel(cpu) == (b"HI\r", 0x40)
+        call(cpu, GETIN)
+        assert cpu.A == 0x0D
+
+        assert drive.trap(cpu, CLRCHN) is False  # The KERNAL finishes CLRCHN
+        assert cpu.ram[DFLTN] == 0
+
+        call(cpu, CLOSE, a=2)
+        assert cpu.ram[LDTND] == 0
+        assert drive.channels == {}
+
+    def test_command_channel(self):
+        """Commands sent on OPEN report through the error channel, which then resets."""
+        disk = D64Image()
+        disk.write_file("OLD", b"\x01\x08")
+        cpu, _drive = make_drive(disk)
+        set_file(cpu, "S:O*", logical=15, secondary=15)
+
+        call(cpu, OPEN)
+        call(cpu, CHKIN, x=15)
+
+        assert read_channel(cpu) == (b"01, FILES SCRATCHED,01,00\r", 0x40)
+        assert disk.read_directory() == []
+
+        cpu.ram[STATUS] = 0
+        assert read_channel(cpu) == (b"00, OK,00,00\r", 0x40)
+
+    def test_write_channels_fall_through(self):
+        """Files opened for writing are left to the KERNAL."""
+        cpu, drive = make_drive()
+        set_file(cpu, "NEW,S,W", logical=2, secondary=2)
+        assert drive.trap(cpu, OPEN) is False
+        assert cpu.ram[LDTND] == 0
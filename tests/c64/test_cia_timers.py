@@ -5,8 +5,14 @@ These tests verify that the 6526 CIA timers work correctly,
 including the auto-load behavior when writing the timer latch high byte.
 """
 
+from unittest.mock import MagicMock
+
 import pytest
 
+from mos6502.scheduler import EventScheduler
+from systems.c64.cia1 import CIA1
+from systems.c64.cia2 import CIA2
+
 
 class TestCIATimerLatchAutoLoad:
     """Test that writing timer latch high byte auto-loads counter when stopped."""
@@ -791,3 +797,106 @@ class TestCIASDROutputModeEnableFLAG:
         # CIA2 should NOT have FLAG bit set
         assert not (cia2.icr_data & 0x10), \
             "Transitioning to input mode should NOT trigger FLAG"
+
+
+class TestCIAScheduledTimers:
+    """Test event-driven timers: exact underflow cycles and lazy counter reads."""
+
+    @pytest.fixture(params=[CIA1, CIA2])
+    def cia(self, request):
+        """CIA on an EventScheduler with a mock CPU, TOD stopped."""
+        cpu = MagicMock()
+        cpu.cycles_executed = 0
+        cpu.irq_pending = False
+        cpu.nmi_pending = False
+        cia = request.param(cpu=cpu)
+        cia.tod_running = False
+        cia.scheduler = EventScheduler()
+        cia.attach_scheduler(cia.scheduler)
+        return cia
+
+    def run_to(self, cia, cycle):
+        """Advance the mock CPU and run the due events."""
+        cia.cpu.cycles_executed = cycle
+        cia.scheduler.run(cycle)
+
+    def interrupt(self, cia):
+        return cia.cpu.irq_pending if isinstance(cia, CIA1) else cia.cpu.nmi_pending
+
+    def test_nothing_scheduled_while_idle(self, cia):
+        """Stopped timers and a stopped TOD need no event."""
+        assert not cia.timer_event.scheduled
+
+    def test_underflow_event_at_exact_cycle(self, cia):
+        """Starting Timer A schedules its underflow; the interrupt fires then, not earlier."""
+        cia.write(0x04, 99)
+        cia.write(0x05, 0)
+        cia.write(0x0D, 0x81)
+        cia.write(0x0E, 0x01)  # Start, continuous
+        assert cia.timer_event.cycle == 100
+
+        self.run_to(cia, 99)
+        assert not self.interrupt(cia)
+        self.run_to(cia, 100)
+        assert cia.icr_data & 0x01
+        assert self.interrupt(cia)
+        # Continuous mode: next underflow one period (latch + 1) later
+        assert cia.timer_event.cycle == 200
+
+    def test_counter_read_from_cycle_delta(self, cia):
+        """$DC04/$DC05 read the counter at the current cycle without polling."""
+        cia.write(0x04, 0x00)
+        cia.write(0x05, 0x10)
+        cia.write(0x0E, 0x11)  # Force load + start
+        cia.cpu.cycles_executed = 0x234
+        assert cia.read(0x04) | (cia.read(0x05) << 8) == 0x1000 - 0x234
+
+    def test_stopping_timer_cancels_event(self, cia):
+        """A timer stopped before its underflow never fires."""
+        cia.write(0x06, 50)
+        cia.write(0x07, 0)
+        cia.write(0x0F, 0x01)
+        assert cia.timer_event.cycle == 51
+        cia.cpu.cycles_executed = 20
+        cia.write(0x0F, 0x00)
+        assert not cia.timer_event.scheduled
+        assert cia.timer_b_counter == 30
+
+        self.run_to(cia, 1000)
+        assert cia.icr_data & 0x02 == 0
+
+    def test_timer_b_counts_timer_a_underflows(self, cia):
+        """Timer B in mode 2 underflows on the Timer A event after its count."""
+        cia.write(0x04, 9)
+        cia.write(0x05, 0)
+        cia.write(0x06, 2)
+        cia.write(0x07, 0)
+        cia.write(0x0F, 0x41)  # Count Timer A underflows
+        cia.write(0x0E, 0x01)
+        for cycle in (10, 20):
+            self.run_to(cia, cycle)
+            assert cia.icr_data & 0x02 == 0
+        self.run_to(cia, 30)
+        assert cia.icr_data & 0x02
+
+    def test_tod_ticks_and_alarm(self, cia):
+        """The TOD event fires once per 1/10 second and raises the alarm."""
+        cia.write(0x0F, 0x80)  # Write alarm
+        cia.write(0x0B, 0x00)
+        cia.write(0x0A, 0x00)
+        cia.write(0x09, 0x00)
+        cia.write(0x08, 0x03)
+        cia.write(0x0F, 0x00)
+        cia.write(0x0D, 0x84)
+        cia.write(0x0E, 0x80)  # 50 Hz
+        cia.write(0x0B, 0x00)
+        cia.write(0x08, 0x00)  # Starts the clock
+        tick = cia.tod_cycles_per_tick
+        assert cia.timer_event.cycle == tick
+
+        self.run_to(cia, 2 * tick)
+        assert cia.read(0x08) == 2
+        assert not self.interrupt(cia)
+        self.run_to(cia, 3 * tick)
+        assert cia.icr_data & 0x04
+        assert self.interrupt(cia)
@@ -0,0 +1,106 @@
+"""Tests for headless frame capture (c64.frame_sink)."""
+
+import shlex
+import sys
+import threading
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from systems.c64.frame_sink import FrameSink  # noqa: E402
+from systems.c64.vic_render import FrameRenderer  # noqa: E402
+from tests.c64.test_vic_render import make_vic  # noqa: E402
+
+
+def completed_frame(seed: int = 1, d018: int = 0x14):
+    """VIC holding a VBlank snapshot (bank 0) and the frame it should produce."""
+    vic, ram, color_ram = make_vic(seed, 0x10, 0x00, d018, 0x0000)
+    vic.ram_snapshot = ram[:0x4000]
+    vic.ram_snapshot_bank = 0x0000
+    vic.color_snapshot = color_ram
+    vic.regs_snapshot = bytes(vic.regs)
+    visible = bytearray(0x10000)
+    visible[:0x4000] = ram[:0x4000]
+    expected = FrameRenderer(vic).render(bytes(visible), color_ram)
+    return vic, FrameRenderer(vic).to_rgb(expected).tobytes()
+
+
+class TestFrameSink:
+    """Test the capture formats, decimation and back-pressure."""
+
+    def test_png_sequence_with_decimation(self, tmp_path):
+        """Every Nth frame is written as a numbered PNG."""
+        vic, _rgb = completed_frame()
+        sink = FrameSink(vic, tmp_path / "frames", "png", every=3)
+        for _ in range(7):
+            sink.capture(vic)
+        sink.close()
+
+        names = sorted(path.name for path in (tmp_path / "frames").iterdir())
+        assert names == ["frame_000000.png", "frame_000001.png", "frame_000002.png"]
+        assert (tmp_path / "frames" / names[0]).read_bytes().startswith(b"\x89PNG")
+        assert (sink.frames_seen, sink.frames_written, sink.frames_dropped) == (7, 3, 0)
+
+    def test_raw_stream(self, tmp_path):
+        """Frames are appended to one RGB24 stream in order."""
+        vic, rgb = completed_frame()
+        sink = FrameSink(vic, tmp_path / "frames.rgb", "raw", workers=4)
+        for _ in range(5):
+            sink.capture(vic)
+        sink.close()
+
+        assert (tmp_path / "frames.rgb").read_bytes() == rgb * 5
+
+    def test_pipe_to_encoder(self, tmp_path):
+        """Frames are written to the encoder's stdin."""
+        vic, rgb = completed_frame()
+        out = tmp_path / "piped.rgb"
+        script = f"import shutil, sys; shutil.copyfileobj(sys.stdin.buffer, open({str(out)!r}, 'wb'))"
+        sink = FrameSink(vic, f"{shlex.quote(sys.executable)} -c {shlex.quote(script)}", "pipe")
+        sink.capture(vic)
+        sink.capture(vic)
+        sink.close()
+
+        assert out.read_bytes() == rgb * 2
+
+    def test_full_queue_drops_frames(self, tmp_path):
+        """capture() never waits: frames beyond max_pending are dropped."""
+        vic, _rgb = completed_frame()
+        sink = FrameSink(vic, tmp_path / "frames.rgb", "raw", workers=1, max_pending=2)
+        release = threading.Event()
+        sink._pool.submit(release.wait)  # Hold the encoder
+
+        for _ in range(5):
+            sink.capture(vic)
+        release.set()
+        sink.close()
+
+        assert (sink.frames_written, sink.frames_dropped) == (2, 3)
+
+    def test_charset_read_from_snapshot(self, tmp_path):
+        """A RAM charset written after capture() still renders as captured."""
+        vic, rgb = completed_frame(d018=0x18)  # Charset at $2000 (RAM)
+        # Attach the VIC's atlas to live memory the way C64Memory does
+        live = bytearray(vic.ram_snapshot) + bytearray(0xC000)
+        vic.glyph_atlas.attach(live)
+        vic.glyph_atlas.watch(0x0000, 0x2000)
+        sink = FrameSink(vic, tmp_path / "frames.rgb", "raw", workers=1)
+        release = threading.Event()
+        sink._pool.submit(release.wait)  # Hold the encoder
+
+        sink.capture(vic)
+        live[0x2000:0x2800] = bytes(0x800)
+        vic.glyph_atlas.invalidate(0x2000)
+        release.set()
+        sink.close()
+
+        assert (tmp_path / "frames.rgb").read_bytes() == rgb
+
+    def test_invalid_options(self, tmp_path):
+        """Unknown formats and zero decimation are rejected."""
+        vic, _rgb = completed_frame()
+        with pytest.raises(ValueError):
+            FrameSink(vic, tmp_path / "x", "gif")
+        with pytest.raises(ValueError):
+            FrameSink(vic, tmp_path / "x", "png", every=0)
@@ -9,9 +9,15 @@ The banking logic is critical for diagnostic cartridges that need to test RAM
 underneath ROM regions by setting LORAM=0 and HIRAM=0.
 """
 
+import types
+
 import pytest
 from systems.c64 import C64
 from systems.c64.cartridges import StaticROMCartridge
+from systems.c64.memory import C64Memory
+from systems.c64.vic import GlyphAtlas, ScreenDirtyTracker
+
+import mos6502
 
 from .conftest import C64_ROMS_DIR, requires_c64_roms
 
@@ -391,3 +397,350 @@ class TestBankingIntegration:
         c64.memory.port = 0x35  # LORAM=1, HIRAM=0, CHAREN=1
         ram_value = c64.memory.read(0xA000)
         assert ram_value == 0xCC, "HIRAM=0 should expose RAM under BASIC"
+
+
+class _Chip:
+    """I/O chip stand-in that returns a fixed register value and records writes."""
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+        self.writes = []
+        self.regs = bytearray(0x40)
+        self.regs[0x18] = 0x14  # VIC: screen at $0400
+        self.port_a = 0x03      # CIA2: VIC bank 0
+
+    def read(self, addr: int) -> int:
+        return self.value
+
+    def write(self, addr: int, value: int) -> None:
+        self.writes.append((addr, value))
+        self.regs[addr & 0x3F] = value
+        if addr & 0x0F == 0x00:
+            self.port_a = value
+
+    def update(self) -> None:
+        """VIC: catch up the raster (nothing to do)."""
+
+    def get_vic_bank(self) -> int:
+        return ((~self.port_a) & 0x03) * 0x4000
+
+
+def make_memory(ram_data: bytearray, dirty_tracker=None, glyph_atlas=None) -> C64Memory:
+    """Create a C64Memory with marker-filled ROMs and stand-in chips (no ROM files needed)."""
+    return C64Memory(
+        types.SimpleNamespace(data=ram_data),
+        basic_rom=bytes([0xBA] * 0x2000),
+        kernal_rom=bytes([0xCE] * 0x2000),
+        char_rom=bytes([0xC4] * 0x1000),
+        cia1=_Chip(0xC1), cia2=_Chip(0xC2), vic=_Chip(0x1C), sid=_Chip(0x5D),
+        dirty_tracker=dirty_tracker,
+        glyph_atlas=glyph_atlas,
+    )
+
+
+def expected_source(addr: int, port: int, exrom: bool, game: bool) -> int:
+    """Reference PLA decode: marker value the CPU sees at addr."""
+    loram, hiram, charen = port & 1, port & 2, port & 4
+    ultimax = exrom and not game
+    if 0x8000 <= addr <= 0x9FFF and (ultimax or (not exrom and loram and hiram)):
+        return 0x81
+    if 0xA000 <= addr <= 0xBFFF and loram and hiram:
+        return 0xA1 if not exrom and not game else 0xBA
+    if 0xD000 <= addr <= 0xDFFF:
+        if charen:
+            return 0x1C
+        if loram or hiram:
+            return 0xC4
+    if addr >= 0xE000:
+        if ultimax:
+            return 0xE1
+        if hiram:
+            return 0xCE
+    return 0x11
+
+
+class TestBankTables:
+    """Test the precomputed PLA banking tables against a reference decode."""
+
+    ADDRESSES = (0x0002, 0x7FFF, 0x8000, 0x9FFF, 0xA000, 0xBFFF, 0xC000, 0xCFFF, 0xD012, 0xE000, 0xFFFF)
+
+    @pytest.fixture
+    def memory(self):
+        ram = bytearray([0x11] * 0x10000)
+        memory = make_memory(ram)
+        memory.cartridge = StaticROMCartridge(
+            roml_data=bytes([0x81] * 0x2000),
+            romh_data=bytes([0xA1] * 0x2000),
+            ultimax_romh_data=bytes([0xE1] * 0x2000),
+        )
+        return memory
+
+    def test_all_32_configurations(self, memory):
+        """Every port/EXROM/GAME combination maps every region like the PLA."""
+        cartridge = memory.cartridge
+        ram = mos6502.memory.RAM()
+        ram.memory_handler = memory
+        for exrom in (False, True):
+            for game in (False, True):
+                cartridge._exrom, cartridge._game = exrom, game
+                for port in range(8):
+                    memory.port = 0x30 | port
+                    for addr in self.ADDRESSES:
+                        expected = expected_source(addr, port, exrom, game)
+                        assert memory.read(addr) == expected, f"${addr:04X} port={port} EXROM={exrom} GAME={game}"
+                        assert ram[addr] == expected
+
+    def test_line_change_switches_table(self, memory):
+        """A cartridge changing EXROM/GAME on its own is seen by the next read."""
+        memory.port = 0x37
+        memory.cartridge._exrom, memory.cartridge._game = False, True  # 8K
+        assert memory.read(0x8000) == 0x81
+        assert memory.read(0xA000) == 0xBA
+
+        memory.cartridge._exrom = True  # Disabled, e.g. a FastLoad timeout
+        assert memory.read(0x8000) == 0x11
+
+    def test_detach_restores_plain_banking(self, memory):
+        """Removing the cartridge stops its line changes reaching the memory map."""
+        cartridge = memory.cartridge
+        memory.cartridge = None
+        assert cartridge.lines_listener is None
+        cartridge._exrom, cartridge._game = True, False
+        memory.port = 0x37
+        assert memory.read(0xE000) == 0xCE
+        assert memory.read(0x8000) == 0x11
+
+    def test_missing_rom_reads_image(self):
+        """Short ROM images are read through the image itself."""
+        memory = C64Memory(
+            types.SimpleNamespace(data=bytearray(0x10000)),
+            basic_rom=bytes([0xBA] * 0x100), kernal_rom=bytes([0xCE] * 0x2000), char_rom=bytes(0x1000),
+            cia1=_Chip(0), cia2=_Chip(0), vic=_Chip(0), sid=_Chip(0),
+        )
+        assert memory.read_pages[0xA0] is None
+        assert memory.read(0xA0FF) == 0xBA
+        with pytest.raises(IndexError):
+            memory.read(0xA100)
+
+
+class _DirtyTracker(ScreenDirtyTracker):
+    """ScreenDirtyTracker that also records VIC and color RAM notifications."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.vic = 0
+        self.color = []
+
+    def mark_vic_dirty(self) -> None:
+        super().mark_vic_dirty()
+        self.vic += 1
+
+    def mark_color_dirty(self, addr: int) -> None:
+        super().mark_color_dirty(addr)
+        self.color.append(addr)
+
+
+class TestIODispatch:
+    """Test the page-keyed $D000-$DFFF I/O dispatch."""
+
+    @pytest.fixture
+    def memory(self):
+        return make_memory(bytearray(0x10000), dirty_tracker=_DirtyTracker())
+
+    @pytest.mark.parametrize("addr, chip", [
+        (0xD012, "vic"), (0xD3D2, "vic"),
+        (0xD418, "sid"), (0xD7F8, "sid"),
+        (0xDC0D, "cia1"), (0xDCFD, "cia1"),
+        (0xDD00, "cia2"), (0xDDF0, "cia2"),
+    ])
+    def test_chip_pages_and_mirrors(self, memory, addr, chip):
+        """Every page of a chip's range, mirrors included, reaches the chip with the full address."""
+        assert memory.read(addr) == getattr(memory, chip).value
+        memory.write(addr, 0x42)
+        assert getattr(memory, chip).writes == [(addr, 0x42)]
+
+    def test_color_ram(self, memory):
+        """Color RAM stores 4 bits, reads the upper nybble high and marks cells dirty."""
+        memory.write(0xDBE7, 0x3A)
+        assert memory.ram_color[0x3E7] == 0x0A
+        assert memory.read(0xDBE7) == 0xFA
+        assert memory.dirty_tracker.color == [0xDBE7]
+
+    def test_vic_mirror_writes_mark_dirty(self, memory):
+        """Writes to mirrored VIC registers mark the VIC dirty like the originals."""
+        memory.write(0xD020, 0x01)
+        memory.write(0xD060, 0x01)  # $D020 mirror
+        memory.write(0xD03F, 0x01)  # Unused register
+        assert memory.dirty_tracker.vic == 2
+
+    def test_cartridge_io(self, memory):
+        """I/O1/I/O2 are open bus without a cartridge and reach the cartridge once attached."""
+        assert memory.read(0xDE00) == 0xFF
+        memory.write(0xDF00, 0x01)
+
+        calls = []
+        cartridge = StaticROMCartridge(roml_data=bytes(0x2000))
+        cartridge.read_io1 = lambda addr: calls.append(("read", addr)) or 0x5A
+        cartridge.write_io2 = lambda addr, value: calls.append(("write", addr, value))
+        memory.cartridge = cartridge
+
+        assert memory.read(0xDE42) == 0x5A
+        memory.write(0xDF01, 0x07)
+        assert calls == [("read", 0xDE42), ("write", 0xDF01, 0x07)]
+
+    def test_io_hidden_with_charen_clear(self, memory):
+        """CHAREN=0 maps character ROM for reads; writes still go to RAM."""
+        memory.port = 0x33
+        assert memory.read(0xD012) == 0xC4
+        memory.write(0xD012, 0x42)
+        assert memory.vic.writes == []
+        assert memory.snapshot_ram()[0xD012] == 0x42
+
+
+class TestWritePages:
+    """Test the page write table and screen dirty tracking."""
+
+    @pytest.fixture
+    def memory(self):
+        memory = make_memory(bytearray(0x10000), dirty_tracker=_DirtyTracker())
+        memory.dirty_tracker.clear()
+        return memory
+
+    def test_ram_writes_under_rom(self, memory):
+        """Writes under BASIC/KERNAL/character ROM land in RAM."""
+        memory.port = 0x33  # Character ROM visible at $D000
+        for addr in (0x0002, 0x7FFF, 0xA000, 0xC000, 0xD012, 0xFFFF):
+            memory.write(addr, 0x42)
+            assert memory.snapshot_ram()[addr] == 0x42
+        assert memory.vic.writes == []
+
+    def test_cpu_port(self, memory):
+        """$00/$01 update the CPU port and leave RAM alone."""
+        memory.write(0x0000, 0x2F)
+        memory.write(0x0001, 0x35)
+        assert (memory.ddr, memory.port) == (0x2F, 0x35)
+        assert memory.snapshot_ram()[0x0001] == 0x00
+        assert memory.read(0xA000) == 0x00  # BASIC banked out
+
+    def test_default_screen_is_watched(self, memory):
+        """Writes to $0400-$07E7 mark cells dirty; other RAM does not."""
+        memory.write(0x0400, 0x01)
+        memory.write(0x07E7, 0x01)
+        memory.write(0x07F8, 0x01)  # Sprite pointer, not a cell
+        memory.write(0x0800, 0x01)
+        assert memory.dirty_tracker.get_dirty_cells() == {(0, 0), (24, 39)}
+
+    def test_screen_follows_d018_and_vic_bank(self, memory):
+        """Relocating the screen with $D018 and CIA2 moves the watched pages."""
+        tracker = memory.dirty_tracker
+        memory.write(0xD018, 0x84)  # Screen at bank + $2000
+        assert tracker.screen_base == 0x2000
+        assert tracker.needs_full_redraw()
+        tracker.clear()
+
+        memory.write(0x0400, 0x01)
+        assert not tracker.has_changes()
+        memory.write(0x2029, 0x01)
+        assert tracker.get_dirty_cells() == {(1, 1)}
+        tracker.clear()
+
+        memory.write(0xDD00, 0x02)  # VIC bank 1 ($4000)
+        assert tracker.screen_base == 0x6000
+        tracker.clear()
+        memory.write(0x6000, 0x01)
+        assert tracker.get_dirty_cells() == {(0, 0)}
+        assert memory.snapshot_ram()[0x6000] == 0x01
+
+    def test_screen_under_io_keeps_io_writes(self, memory):
+        """A watched page under visible I/O still writes the I/O chip."""
+        memory.write(0xDD00, 0x00)  # VIC bank 3 ($C000)
+        memory.write(0xD018, 0x44)  # Screen at $D000
+        memory.dirty_tracker.clear()
+        memory.write(0xD020, 0x05)
+        assert (0xD020, 0x05) in memory.vic.writes
+
+    def test_cartridge_ram_in_roml(self, memory):
+        """Cartridges that accept ROML writes keep them from C64 RAM."""
+        cartridge = StaticROMCartridge(roml_data=bytes(0x2000))
+        cartridge.write_roml = lambda addr, data: addr < 0x9000
+        memory.cartridge = cartridge
+        memory.write(0x8000, 0x42)
+        memory.write(0x9000, 0x43)
+        assert memory.snapshot_ram()[0x8000] == 0x00
+        assert memory.snapshot_ram()[0x9000] == 0x43
+
+
+class TestGlyphAtlas:
+    """Test glyph atlas caching and invalidation through the write path."""
+
+    @pytest.fixture
+    def memory(self):
+        ram = bytearray(0x10000)
+        ram[0x2000:0x2800] = bytes(range(256)) * 8
+        return make_memory(ram, ScreenDirtyTracker(), GlyphAtlas(bytes([0xC4] * 0x1000)))
+
+    def test_rom_and_ram_charsets(self, memory):
+        """Banks 0/2 see character ROM at $1000-$1FFF, RAM elsewhere."""
+        atlas = memory.glyph_atlas
+        assert atlas.charset(None, 0x0000, 0x1000).glyphs[1] == bytes([0xC4] * 8)
+        assert atlas.charset(None, 0x8000, 0x1800).key == ("rom", 0x0800)
+        memory.write(0xD018, 0x18)  # Charset at $2000
+        charset = atlas.charset(None, 0x0000, 0x2000)
+        assert charset.glyphs[1] == bytes(range(8, 16))
+        assert charset.hires[1][56:] == bytes([0, 0, 0, 0, 1, 1, 1, 1])  # $0F
+        assert charset.multicolor[1][56:] == bytes([0, 0, 0, 0, 3, 3, 3, 3])
+        assert atlas.charset(memory.snapshot_ram(), 0x4000, 0x1000).key == ("ram", 0x5000)
+
+    def test_register_writes_watch_charsets(self, memory):
+        """$D018/$DD00 writes watch RAM charsets; the ROM window is never watched."""
+        atlas = memory.glyph_atlas
+        memory.write(0xD018, 0x14)  # Char ROM at $1000
+        assert atlas.watched == set()
+        memory.write(0xDD00, 0x02)  # VIC bank 1: $5000 is RAM
+        assert atlas.watched == {0x5000}
+        assert memory._page_writers[0x57] == memory._write_charset
+        memory.write(0xD018, 0x18)
+        assert atlas.watched == {0x5000, 0x6000}
+
+    def test_lookups_leave_write_table_alone(self, memory):
+        """Renderer lookups never change the write table, even for unwatched charsets."""
+        writers = list(memory._page_writers)
+        charset = memory.glyph_atlas.charset(memory.snapshot_ram(), 0x0000, 0x2000)
+        assert charset.glyphs[1] == bytes(range(8, 16))
+        assert memory.glyph_atlas.watched == set()
+        assert memory._page_writers == writers
+
+    def test_write_invalidates_cached_charset(self, memory):
+        """Writes to a watched RAM charset invalidate it; other writes keep it."""
+        atlas = memory.glyph_atlas
+        assert memory._page_writers[0x20] == memory._write_ram_direct
+        memory.write(0xD018, 0x18)
+        assert atlas.watched == {0x2000}
+        assert memory._page_writers[0x27] == memory._write_charset
+        charset = atlas.charset(None, 0x0000, 0x2000)
+
+        memory.write(0x2800, 0x55)
+        assert atlas.charset(None, 0x0000, 0x2000) is charset
+
+        memory.write(0x2008, 0xFF)
+        assert memory.snapshot_ram()[0x2008] == 0xFF
+        assert atlas.charset(None, 0x0000, 0x2000).glyphs[1][0] == 0xFF
+
+    def test_charset_sharing_screen_pages(self, memory):
+        """A charset over the screen matrix still marks written cells dirty."""
+        memory.write(0xD018, 0x10)  # Screen at $0400, charset at $0000
+        memory.write(0x0400, 0x01)
+        assert memory.dirty_tracker.get_dirty_cells() == {(0, 0)}
+
+    def test_unattached_atlas_checks_contents(self):
+        """Without a write path a RAM charset is reused only while unchanged."""
+        atlas = GlyphAtlas(bytes(0x1000))
+        ram = bytearray(0x10000)
+        charset = atlas.charset(ram, 0x4000, 0x0000)
+        charset.cache["surfaces"] = {}
+        assert atlas.charset(ram, 0x4000, 0x0000) is charset
+        ram[0x4000] = 0x80
+        changed = atlas.charset(ram, 0x4000, 0x0000)
+        assert changed is not charset
+        assert changed.cache == {}
+        assert changed.hires[0][0] == 1
@@ -0,0 +1,321 @@
+"""Tests for the NumPy VIC-II frame renderers (c64.vic_render).
+
+Every mode is rendered by both C64VIC.render_frame() (per-pixel set_at) and
+FrameRenderer and the frames must match pixel for pixel. LineRenderer must
+match FrameRenderer line by line for the registers latched on each line.
+"""
+
+import random
+import struct
+import zlib
+from unittest.mock import MagicMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from systems.c64.vic import C64VIC as VIC, COLORS  # noqa: E402
+from systems.c64.vic_render import FrameRenderer, LineRenderer, SpriteRenderer  # noqa: E402
+
+COLOR_INDEX = {rgb: index for index, rgb in enumerate(COLORS)}
+
+
+class IndexSurface:
+    """Stand-in pygame surface that records palette indices."""
+
+    def __init__(self, width: int, height: int) -> None:
+        self.pixels = np.zeros((height, width), dtype=np.uint8)
+
+    def fill(self, color) -> None:
+        self.pixels[:] = COLOR_INDEX[color]
+
+    def set_at(self, position, color) -> None:
+        x, y = position
+        if 0 <= x < self.pixels.shape[1] and 0 <= y < self.pixels.shape[0]:
+            self.pixels[y, x] = COLOR_INDEX[color]
+
+
+def make_vic(seed: int, d011: int, d016: int, d018: int, bank: int):
+    """Create a VIC with random registers, RAM, color RAM and character ROM."""
+    rng = random.Random(seed)
+    cpu = MagicMock()
+    cpu.cycles_executed = 0
+    vic = VIC(char_rom=bytes(rng.randrange(256) for _ in range(0x1000)), cpu=cpu)
+    for reg in range(0x20, 0x2F):
+        vic.regs[reg] = rng.randrange(256)
+    vic.regs[0x11] = d011 | rng.randrange(8)
+    vic.regs[0x16] = d016 | rng.randrange(8)
+    vic.regs[0x18] = d018
+    vic.vic_bank_snapshot = bank
+
+    # A few sprites, some expanded/multicolor (all in front: the classic
+    # renderer has no background priority)
+    vic.regs[0x15] = rng.randrange(256)
+    vic.regs[0x17] = rng.randrange(256)
+    vic.regs[0x1B] = 0x00
+    vic.regs[0x1C] = rng.randrange(256)
+    vic.regs[0x1D] = rng.randrange(256)
+    for sprite in range(8):
+        vic.regs[sprite * 2] = rng.randrange(24, 250)
+        vic.regs[sprite * 2 + 1] = rng.randrange(50, 200)
+
+    ram = bytes(rng.randrange(256) for _ in range(0x10000))
+    color_ram = bytes(rng.randrange(256) for _ in range(0x400))
+    return vic, ram, color_ram
+
+
+MODES = [
+    pytest.param(0x10, 0x00, id="standard-text"),
+    pytest.param(0x10, 0x10, id="multicolor-text"),
+    pytest.param(0x50, 0x00, id="ecm-text"),
+    pytest.param(0x30, 0x00, id="hires-bitmap"),
+    pytest.param(0x30, 0x10, id="multicolor-bitmap"),
+    pytest.param(0x00, 0x00, id="display-off"),
+]
+
+
+class TestFrameRenderer:
+    """Test that the NumPy renderer matches C64VIC.render_frame()."""
+
+    @pytest.mark.parametrize("d011, d016", MODES)
+    @pytest.mark.parametrize("d018, bank", [
+        (0x14, 0x0000),  # Screen $0400, character ROM
+        (0x1C, 0x4000),  # Bank 1: RAM charset at $7000
+        (0x28, 0x8000),  # Bank 2: bitmap at $A000, charset at $A000
+        (0xF6, 0xC000),  # Screen $FC00, RAM charset at $D800
+    ])
+    def test_matches_classic_renderer(self, d011, d016, d018, bank):
+        """Border, scroll, mode, charset source and sprites match pixel for pixel."""
+        vic, ram, color_ram = make_vic(d018 + bank + d011 + d016, d011, d016, d018, bank)
+        regs = bytes(vic.regs)
+        vic.regs_snapshot = regs
+
+        surface = IndexSurface(vic.total_width, vic.total_height)
+        vic.render_frame(surface, ram, color_ram)
+        frame = FrameRenderer(vic).render(ram, color_ram)
+
+        assert frame.shape == (vic.total_height, vic.total_width)
+        mismatches = np.argwhere(frame != surface.pixels)
+        assert len(mismatches) == 0, f"First mismatch (y, x): {mismatches[0]}"
+
+    def test_png_and_raw_output(self, tmp_path):
+        """PNG and raw RGB24 output decode to the palette colors of the frame."""
+        vic, ram, color_ram = make_vic(1, 0x10, 0x00, 0x14, 0x0000)
+        renderer = FrameRenderer(vic)
+        frame = renderer.render(ram, color_ram)
+
+        renderer.save_raw(tmp_path / "frame.rgb", frame)
+        raw = (tmp_path / "frame.rgb").read_bytes()
+        assert len(raw) == vic.total_width * vic.total_height * 3
+        assert tuple(raw[:3]) == COLORS[frame[0, 0]]
+
+        renderer.save_png(tmp_path / "frame.png", frame)
+        png = (tmp_path / "frame.png").read_bytes()
+        assert png.startswith(b"\x89PNG\r\n\x1a\n")
+        width, height = struct.unpack(">II", png[16:24])
+        assert (width, height) == (vic.total_width, vic.total_height)
+        idat_length = struct.unpack(">I", png[33:37])[0]
+        scanlines = zlib.decompress(png[41:41 + idat_length])
+        stride = 1 + width * 3
+        assert scanlines[stride + 1:stride + 1 + width * 3] == raw[width * 3:width * 6]
+
+
+def line_state(vic, *splits):
+    """Per-raster-line records/banks: the VIC's registers, then (raster, {reg: value}) changes."""
+    regs = bytearray(vic.regs[:0x2F])
+    records, banks = [], []
+    changes = dict(splits)
+    for raster in range(vic.raster_lines):
+        for reg, value in changes.get(raster, {}).items():
+            regs[reg] = value
+        records.append(bytes(regs))
+        banks.append(vic.vic_bank_snapshot)
+    return records, banks
+
+
+class TestLineRenderer:
+    """Test per-raster-line rendering and line-level dirty detection."""
+
+    @pytest.mark.parametrize("d011, d016", MODES)
+    def test_uniform_lines_match_frame_renderer(self, d011, d016):
+        """Without mid-frame changes the line renderer draws the same frame."""
+        vic, ram, color_ram = make_vic(7, d011, d016, 0x1C, 0x4000)
+        records, banks = line_state(vic)
+
+        frame = LineRenderer(vic).render_lines(ram, color_ram, records, banks)
+
+        assert np.array_equal(frame, FrameRenderer(vic).render(ram, color_ram, records[0], 0x4000))
+
+    def test_raster_splits(self):
+        """Mode, screen, scroll, sprite and color changes take effect on their line."""
+        vic, ram, color_ram = make_vic(11, 0x10, 0x00, 0x14, 0x0000)
+        renderer = LineRenderer(vic)
+        top = 100  # Frame line of the split
+        split = top + renderer.raster_offset
+        records, banks = line_state(
+            vic,
+            (split, {0x11: 0x3B, 0x16: 0x18, 0x18: 0x38, 0x21: 0x02, 0x03: 0x80}),
+            (split + 50, {0x20: 0x07}),
+        )
+
+        frame = renderer.render_lines(ram, color_ram, records, banks)
+
+        reference = FrameRenderer(vic)
+        upper = reference.render(ram, color_ram, records[split - 1], 0x0000)
+        lower = reference.render(ram, color_ram, records[split], 0x0000)
+        bottom = reference.render(ram, color_ram, records[split + 50], 0x0000)
+        assert np.array_equal(frame[:top], upper[:top])
+        assert np.array_equal(frame[top:top + 50], lower[top:top + 50])
+        assert np.array_equal(frame[top + 50:], bottom[top + 50:])
+
+    def test_only_changed_lines_are_redrawn(self):
+        """Unchanged frames draw nothing; memory and register changes redraw their lines."""
+        vic, ram, color_ram = make_vic(5, 0x10, 0x00, 0x14, 0x0000)
+        vic.regs[0x15] = 0x00
+        ram = bytearray(ram)
+        renderer = LineRenderer(vic)
+        records, banks = line_state(vic)
+
+        renderer.render_lines(ram, color_ram, records, banks)
+        assert renderer.dirty_lines == vic.total_height
+        frame = renderer.render_lines(ram, color_ram, records, banks).copy()
+        assert renderer.dirty_lines == 0
+
+        # One screen cell on text row 3: that row's 8 pixel lines
+        ram[0x0400 + 3 * 40 + 5] ^= 0xFF
+        changed = renderer.render_lines(ram, color_ram, records, banks)
+        assert 0 < renderer.dirty_lines <= 8
+        assert np.array_equal(changed, FrameRenderer(vic).render(bytes(ram), color_ram, records[0], 0x0000))
+        assert not np.array_equal(changed, frame)
+
+        # Border color on one raster line
+        records, banks = line_state(vic, (200, {0x20: 0x01}), (201, {0x20: vic.regs[0x20]}))
+        renderer.render_lines(ram, color_ram, records, banks)
+        assert renderer.dirty_lines == 1
+
+    def test_moving_sprite_erases_old_position(self):
+        """A sprite moving between frames leaves no trail."""
+        vic, ram, color_ram = make_vic(9, 0x10, 0x00, 0x14, 0x0000)
+        vic.regs[0x15] = 0x01
+        vic.regs[0x17] = 0x00
+        renderer = LineRenderer(vic)
+        renderer.render_lines(ram, color_ram, *line_state(vic))
+
+        vic.regs[0x01] += 40
+        records, banks = line_state(vic)
+        frame = renderer.render_lines(ram, color_ram, records, banks)
+
+        assert renderer.dirty_lines == 42
+        assert np.array_equal(frame, FrameRenderer(vic).render(ram, color_ram, records[0], 0x0000))
+
+
+def sprite_scene(sprites):
+    """VIC in standard text mode with a blank screen except a solid block at cell (row 2, column 2).
+
+    sprites maps sprite number -> (x, y); every sprite is a solid 24x21 block.
+    """
+    vic, ram, color_ram = make_vic(3, 0x10, 0x00, 0x14, 0x0000)
+    vic.regs[0x11] = 0x1B
+    vic.regs[0x16] = 0x08
+    vic.regs[0x15] = vic.regs[0x17] = vic.regs[0x1C] = vic.regs[0x1D] = vic.regs[0x10] = 0x00
+    ram = bytearray(ram)
+    ram[0x0400:0x07E8] = bytes([0x20]) * 1000  # Blank cells
+    ram[0x0400 + 2 * 40 + 2] = 0xA0  # Reverse space: all foreground
+    vic.glyph_atlas.char_rom = bytes(0x1000)
+    vic.glyph_atlas.clear()
+    ram[0x0340:0x0340 + 63] = bytes([0xFF]) * 63
+    for sprite, (x, y) in sprites.items():
+        vic.regs[0x15] |= 1 << sprite
+        vic.regs[sprite * 2], vic.regs[sprite * 2 + 1] = x & 0xFF, y
+        if x > 0xFF:
+            vic.regs[0x10] |= 1 << sprite
+        ram[0x07F8 + sprite] = 0x0D  # $0340
+    return vic, bytes(ram), color_ram
+
+
+class TestSpriteRenderer:
+    """Test sprite priority, collisions and the pattern cache."""
+
+    def test_priority(self):
+        """Lower sprites win; a sprite behind the foreground is hidden only where the foreground is."""
+        # The foreground cell spans sprite coordinates x 40-47, y 66-73
+        vic, ram, color_ram = sprite_scene({0: (40, 60), 1: (44, 64)})
+        vic.regs[0x27], vic.regs[0x28] = 0x02, 0x05
+        vic.regs[0x1B] = 0x01  # Sprite 0 behind the foreground
+        frame = FrameRenderer(vic).render(ram, color_ram, bytes(vic.regs))
+
+        def pixel(x, y):
+            return frame[y - 50 + vic.border_top, x - 24 + vic.border_left]
+
+        assert pixel(40, 60) == 0x02  # Sprite 0 alone
+        assert pixel(50, 64) == 0x02  # Sprite 0 over sprite 1, background pixel
+        foreground = color_ram[2 * 40 + 2] & 0x0F
+        assert pixel(44, 70) == foreground  # Sprite 0 wins, but is behind the foreground
+        assert pixel(40, 66) == foreground
+        assert pixel(66, 84) == 0x05  # Sprite 1 alone
+
+    def test_collisions(self):
+        """Overlaps latch $D01E/$D01F bits and $D019 flags; reads clear them."""
+        vic, ram, color_ram = sprite_scene({0: (40, 60), 1: (44, 64), 2: (200, 150), 3: (300, 200)})
+        vic.irq_flags = 0x00
+        vic.irq_enabled = 0x04
+        vic.cpu.irq_pending = False
+
+        FrameRenderer(vic).render(ram, color_ram, bytes(vic.regs))
+
+        assert vic.irq_flags == 0x06
+        assert vic.cpu.irq_pending is True
+        assert vic.read(0xD01E) == 0x03
+        assert vic.read(0xD01F) == 0x03
+        assert vic.read(0xD01E) == 0x00
+        assert vic.read(0xD01F) == 0x00
+
+    def test_line_renderer_reports_unchanged_frames(self):
+        """Collisions are reported again for a frame with no dirty lines."""
+        vic, ram, color_ram = sprite_scene({0: (40, 60), 1: (44, 64)})
+        renderer = LineRenderer(vic)
+        records, banks = line_state(vic)
+        renderer.render_lines(ram, color_ram, records, banks)
+        assert vic.read(0xD01E) == 0x03
+
+        renderer.render_lines(ram, color_ram, records, banks)
+        assert renderer.dirty_lines == 0
+        assert vic.read(0xD01E) == 0x03
+
+    def test_patterns_are_cached(self):
+        """Expanded patterns are built once per data and mode."""
+        vic, _ram, _color = sprite_scene({})
+        sprites = SpriteRenderer(vic)
+        data = bytes(range(63))
+
+        pattern = sprites.pattern(data, True, True, True)
+        assert pattern.shape == (42, 48)
+        assert sprites.pattern(data, True, True, True) is pattern
+        assert sprites.pattern(data, False, False, False).shape == (21, 24)
+        # Byte 1 = %00000001: the last pixel pair selects color 1
+        assert list(pattern[0, 16:32]) == [0] * 12 + [1] * 4
+
+
+class TestLineLatch:
+    """Test that the VIC latches register state per raster line."""
+
+    def test_records_follow_register_writes(self):
+        """Each line records the registers in effect when the raster reached it."""
+        vic, _ram, _color = make_vic(1, 0x10, 0x00, 0x14, 0x0000)
+        for raster in range(1, vic.raster_lines):
+            if raster == 100:
+                vic.write(0xD020, 0x02)
+            vic.cpu.cycles_executed = raster * vic.cycles_per_line
+            vic.update()
+        assert vic.line_snapshot is None
+
+        vic.cpu.cycles_executed = vic.raster_lines * vic.cycles_per_line
+        vic.update()
+
+        records, banks = vic.line_snapshot
+        assert records[99][0x20] != 0x02
+        assert records[100][0x20] == 0x02
+        assert records[100] is records[vic.raster_lines - 1]
+        assert banks == [0x0000] * vic.raster_lines
+        # The new frame's first line is latched into the live records only
+        assert vic.line_records[0][0x20] == 0x02
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Tests for batched cycle accounting (MOS6502CPU.batched_cycles)."""
+
+import functools
+import random
+
+import pytest
+
+import mos6502
+from mos6502 import errors
+from mos6502 import instructions
+from mos6502.core import INFINITE_CYCLES
+from mos6502.instructions.specialized import specialize_handler
+
+
+@functools.cache
+def random_memory(seed: int) -> bytes:
+    """Return 64K of reproducible random memory."""
+    return random.Random(seed).randbytes(0x10000)
+
+
+def make_cpu(cpu_variant, seed: int, batched_cycles: bool) -> mos6502.CPU:
+    """Create a CPU with random registers and memory."""
+    rng = random.Random(seed)
+    cpu = mos6502.CPU(cpu_variant=cpu_variant, batched_cycles=batched_cycles)
+    cpu.reset()
+    cpu.ram.data[:] = random_memory(seed)
+    cpu.A, cpu.X, cpu.Y = rng.randrange(256), rng.randrange(256), rng.randrange(256)
+    cpu.S = 0x0100 | rng.randrange(256)
+    cpu._flags.value = rng.randrange(256)
+    cpu.PC = 0x0200 | rng.randrange(0x100)
+    return cpu
+
+
+def run_one(cpu: mos6502.CPU, opcode: int) -> tuple:
+    """Execute a single instruction and return the resulting CPU state."""
+    cpu.ram[cpu.PC] = opcode
+    try:
+        cpu.execute(max_instructions=1)
+        error = None
+    except errors.CPUCycleExhaustionError:
+        error = None
+    except Exception as exc:  # noqa: BLE001 - JAM and friends raise by design
+        error = type(exc)
+    return (
+        error, cpu.PC, cpu.A, cpu.X, cpu.Y, cpu.S, cpu._flags.value,
+        cpu.cycles_executed, bytes(cpu.ram.data),
+    )
+
+
+class TestBatchedCycles:
+    """Test that batched accounting charges the same cycles as per-access ticks."""
+
+    def test_every_opcode_charges_same_cycles(self, cpu_variant) -> None:
+        """State and cycles_executed agree with per-access mode for all opcodes."""
+        for opcode in range(256):
+            if instructions.OPCODE_LOOKUP.get(opcode) is None:
+                continue
+            for seed in range(4):
+                reference = run_one(make_cpu(cpu_variant, seed, batched_cycles=False), opcode)
+                batched_cpu = make_cpu(cpu_variant, seed, batched_cycles=True)
+                result = run_one(batched_cpu, opcode)
+
+                assert result == reference, f"opcode 0x{opcode:02X} seed {seed}"
+                assert batched_cpu._pending_cycles == 0
+
+    def test_tick_callbacks_run_once_per_instruction(self) -> None:
+        """pre/post_tick_callback see one summed tick per instruction."""
+        cpu = mos6502.CPU(batched_cycles=True)
+        cpu.reset()
+        # LDA $12FF,X with X=1 crosses a page: 4 + 1 cycles
+        cpu.ram.data[0x0400:0x0403] = bytes([instructions.LDA_ABSOLUTE_X_0xBD, 0xFF, 0x12])
+        cpu.PC, cpu.X = 0x0400, 0x01
+
+        pre, post = [], []
+        cpu.pre_tick_callback = lambda cpu, cycles: pre.append(cycles)
+        cpu.post_tick_callback = lambda cpu, cycles: post.append((cycles, cpu.cycles_executed))
+        start = cpu.cycles_executed
+
+        with pytest.raises(errors.CPUCycleExhaustionError):
+            cpu.execute(max_instructions=1)
+
+        assert pre == [5]
+        assert post == [(5, start + 5)]
+
+    def test_cycle_budget_is_honoured(self) -> None:
+        """execute(cycles=...) still stops at the first instruction boundary past the budget."""
+        reference = mos6502.CPU()
+        batched = mos6502.CPU(batched_cycles=True)
+        for cpu in (reference, batched):
+            cpu.reset()
+            cpu.ram.data[0x0400:0x0403] = bytes([instructions.JMP_ABSOLUTE_0x4C, 0x00, 0x04])
+            cpu.PC = 0x0400
+            with pytest.raises(errors.CPUCycleExhaustionError):
+                cpu.execute(cycles=100)
+
+        assert batched.cycles_executed == reference.cycles_executed
+        assert batched.cycles == reference.cycles
+
+    def test_irq_sequence_is_charged(self) -> None:
+        """The IRQ sequence is flushed before the next boundary check."""
+        results = []
+        for batched_cycles in (False, True):
+            cpu = mos6502.CPU(batched_cycles=batched_cycles)
+            cpu.reset()
+            cpu.ram[0x0400] = instructions.NOP_IMPLIED_0xEA
+            cpu.ram[0xFFFE], cpu.ram[0xFFFF] = 0x00, 0x05
+            cpu.PC = 0x0400
+            cpu.I = 0
+            cpu.irq_pending = True
+
+            with pytest.raises(errors.CPUCycleExhaustionError):
+                cpu.execute(max_instructions=1)
+
+            assert cpu._pending_cycles == 0
+            results.append((cpu.PC, cpu.S, cpu.cycles_executed))
+
+        assert results[0] == results[1]
+        assert results[1][0] == 0x0500
+
+    def test_block_engine_matches_interpreter(self) -> None:
+        """Translated blocks flush batched cycles after every instruction."""
+        program = bytes([
+            instructions.LDX_IMMEDIATE_0xA2, 0x00,
+            instructions.INX_IMPLIED_0xE8,
+            instructions.LDA_ABSOLUTE_X_0xBD, 0xFF, 0x12,
+            instructions.BNE_RELATIVE_0xD0, 0xFA,
+            instructions.JMP_ABSOLUTE_0x4C, 0x00, 0x04,
+        ])
+        results = []
+        for engine, batched_cycles in (("interpreter", False), ("block", True)):
+            cpu = mos6502.CPU(execution_engine=engine, batched_cycles=batched_cycles)
+            cpu.reset()
+            cpu.ram.data[0x0400:0x0400 + len(program)] = program
+            cpu.PC = 0x0400
+            with pytest.raises(errors.CPUCycleExhaustionError):
+                cpu.execute(cycles=5000)
+            results.append((cpu.PC, cpu.X, cpu.cycles_executed, cpu.instructions_executed))
+
+        assert results[0] == results[1]
+
+    def test_toggle_rebuilds_handler_table(self) -> None:
+        """Switching modes swaps in the matching specialized handlers."""
+        from mos6502.instructions.load._lda import _lda_6502
+
+        cpu = mos6502.CPU()
+        handler = _lda_6502.lda_absolute_x_0xbd
+        assert cpu._opcode_handler_cache[instructions.LDA_ABSOLUTE_X_0xBD] is specialize_handler(handler)
+
+        cpu.batched_cycles = True
+        assert cpu.batched_cycles
+        assert cpu._opcode_handler_cache[instructions.LDA_ABSOLUTE_X_0xBD] is specialize_handler(
+            handler, batched_cycles=True,
+        )
+
+    def test_ignored_while_verbose(self) -> None:
+        """verbose_cycles keeps per-access ticks."""
+        cpu = mos6502.CPU(verbose_cycles=True, batched_cycles=True)
+        cpu.cycles = INFINITE_CYCLES
+        cpu.tick(3)
+
+        assert cpu._pending_cycles == 0
+        assert cpu.cycles_executed == 3
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""Tests for the basic-block execution engine (mos6502.block_cache).
+
+The block engine must be indistinguishable from the interpreter: same
+registers, flags, memory, cycle counts, and interrupt sampling points.
+Each test runs the same program under both engines and compares the results.
+"""
+
+import pytest
+
+import mos6502
+from mos6502 import errors
+from mos6502.core import INFINITE_CYCLES
+
+
+# Sum loop with an indexed read that crosses a page boundary (penalty cycles)
+#   $0200: LDX #$00
+#   $0202: LDA #$00
+#   $0204: CLC
+#   $0205: ADC $03F0,X
+#   $0208: STA $0400,X
+#   $020B: INX
+#   $020C: CPX #$40
+#   $020E: BNE $0204
+#   $0210: JMP $0210
+SUM_LOOP = bytes([
+    0xA2, 0x00,
+    0xA9, 0x00,
+    0x18,
+    0x7D, 0xF0, 0x03,
+    0x9D, 0x00, 0x04,
+    0xE8,
+    0xE0, 0x40,
+    0xD0, 0xF4,
+    0x4C, 0x10, 0x02,
+])
+
+
+def make_cpu(engine: str, cpu_variant: str = mos6502.CPUVariant.NMOS_6502, program: bytes = SUM_LOOP) -> mos6502.CPU:
+    """Create a reset CPU with program loaded at $0200."""
+    cpu = mos6502.CPU(cpu_variant=cpu_variant, execution_engine=engine)
+    cpu.reset()
+    for offset, value in enumerate(program):
+        cpu.ram[0x0200 + offset] = value
+    for i in range(0x80):
+        cpu.ram[0x03F0 + i] = (i * 3) & 0xFF
+    cpu.PC = 0x0200
+    return cpu
+
+
+def cpu_state(cpu: mos6502.CPU) -> tuple:
+    """Return the architecturally visible state of a CPU."""
+    return (
+        cpu.PC, cpu.A, cpu.X, cpu.Y, cpu.S, cpu._flags.value,
+        cpu.cycles_executed, cpu.instructions_executed,
+        bytes(cpu.ram.data),
+    )
+
+
+def run_until_exhausted(cpu: mos6502.CPU, **kwargs) -> None:
+    """Execute, swallowing the exhaustion error that ends every run."""
+    with pytest.raises(errors.CPUCycleExhaustionError):
+        cpu.execute(**kwargs)
+
+
+class TestEngineSelection:
+    """Test selecting the execution engine."""
+
+    def test_default_engine_is_interpreter(self) -> None:
+        """CPUs use the interpreter unless asked otherwise."""
+        cpu = mos6502.CPU()
+        assert cpu.execution_engine == "interpreter"
+        assert cpu.block_cache is None
+
+    def test_unknown_engine_raises(self) -> None:
+        """Unknown engine names are rejected."""
+        with pytest.raises(ValueError, match="Unknown execution engine"):
+            mos6502.CPU(execution_engine="jit")
+
+    def test_switching_engines_attaches_and_detaches_code_watcher(self) -> None:
+        """The block cache watches RAM writes only while selected."""
+        cpu = mos6502.CPU()
+        cpu.execution_engine = "block"
+        assert cpu.ram.code_watcher is cpu.block_cache
+
+        cpu.execution_engine = "interpreter"
+        assert cpu.ram.code_watcher is None
+        assert cpu.block_cache is None
+
+
+class TestBlockEngineMatchesInterpreter:
+    """Test that both engines produce identical results."""
+
+    @pytest.mark.parametrize("cycles", [1, 7, 100, 1234, 3000])
+    def test_cycle_budget(self, cpu_variant, cycles) -> None:
+        """Cycle-limited runs stop at the same instruction boundary."""
+        reference = make_cpu("interpreter", cpu_variant)
+        blocks = make_cpu("block", cpu_variant)
+
+        run_until_exhausted(reference, cycles=cycles)
+        run_until_exhausted(blocks, cycles=cycles)
+
+        assert cpu_state(blocks) == cpu_state(reference)
+        assert blocks.cycles == reference.cycles
+        assert blocks.block_cache.translations > 0
+
+    @pytest.mark.parametrize("max_instructions", [1, 5, 33, 200])
+    def test_instruction_limit(self, max_instructions) -> None:
+        """Instruction-limited runs execute exactly the same instructions."""
+        reference = make_cpu("interpreter")
+        blocks = make_cpu("block")
+
+        run_until_exhausted(reference, max_instructions=max_instructions)
+        run_until_exhausted(blocks, max_instructions=max_instructions)
+
+        assert cpu_state(blocks) == cpu_state(reference)
+
+    def test_self_modifying_code_in_loop(self) -> None:
+        """Patching an opcode inside a cached loop takes effect on the next pass."""
+        #   $0200: LDX #$05
+        #   $0202: LDY #$00
+        #   $0204: INY          <- patched to DEX by the loop
+        #   $0205: LDA #$CA
+        #   $0207: STA $0204
+        #   $020A: DEX
+        #   $020B: BNE $0204
+        #   $020D: JMP $020D
+        program = bytes([
+            0xA2, 0x05, 0xA0, 0x00, 0xC8, 0xA9, 0xCA, 0x8D, 0x04, 0x02,
+            0xCA, 0xD0, 0xF7, 0x4C, 0x0D, 0x02,
+        ])
+        reference = make_cpu("interpreter", program=program)
+        blocks = make_cpu("block", program=program)
+
+        run_until_exhausted(reference, cycles=500)
+        run_until_exhausted(blocks, cycles=500)
+
+        assert (blocks.X, blocks.Y) == (0, 1)
+        assert cpu_state(blocks) == cpu_state(reference)
+        assert blocks.block_cache.invalidations > 0
+
+    def test_self_modifying_code_ahead_in_running_block(self) -> None:
+        """Patching a later opcode of the running block is not missed."""
+        #   $0200: LDA #$E8
+        #   $0202: STA $0206
+        #   $0205: NOP
+        #   $0206: INY          <- patched to INX before it executes
+        #   $0207: JMP $0207
+        program = bytes([0xA9, 0xE8, 0x8D, 0x06, 0x02, 0xEA, 0xC8, 0x4C, 0x07, 0x02])
+        blocks = make_cpu("block", program=program)
+        # Translate the whole block up front so the patch hits cached code
+        blocks.block_cache.lookup(0x0200, 0)
+
+        run_until_exhausted(blocks, cycles=100)
+
+        assert (blocks.X, blocks.Y) == (1, 0)
+
+    def test_irq_and_nmi_sampling(self) -> None:
+        """Interrupts are taken at the same instruction boundaries."""
+        def build(engine: str) -> tuple[mos6502.CPU, list]:
+            cpu = make_cpu(engine)
+            cpu.I = 0
+            # IRQ handler at $0600: INC $10, RTI - NMI handler at $0680: INC $11, RTI
+            for offset, value in enumerate([0xE6, 0x10, 0x40]):
+                cpu.ram[0x0600 + offset] = value
+            for offset, value in enumerate([0xE6, 0x11, 0x40]):
+                cpu.ram[0x0680 + offset] = value
+            cpu.ram[0xFFFE], cpu.ram[0xFFFF] = 0x00, 0x06
+            cpu.ram[0xFFFA], cpu.ram[0xFFFB] = 0x80, 0x06
+
+            trace = []
+
+            def periodic() -> None:
+                calls = len(trace)
+                trace.append((cpu.cycles_executed, cpu.PC))
+                cpu.irq_pending = calls % 3 == 1
+                cpu.nmi_pending = calls % 5 == 2
+
+            cpu.periodic_callback = periodic
+            cpu.periodic_callback_interval = 37
+            return cpu, trace
+
+        reference, reference_trace = build("interpreter")
+        blocks, block_trace = build("block")
+
+        run_until_exhausted(reference, cycles=5000)
+        run_until_exhausted(blocks, cycles=5000)
+
+        assert block_trace == reference_trace
+        assert reference.ram[0x10] > 0
+        assert reference.ram[0x11] > 0
+        assert cpu_state(blocks) == cpu_state(reference)
+
+    def test_infinite_cycles_with_instruction_limit(self) -> None:
+        """INFINITE_CYCLES is left untouched by translated blocks."""
+        blocks = make_cpu("block")
+        run_until_exhausted(blocks, max_instructions=100)
+        assert blocks.cycles == INFINITE_CYCLES
+
+
+class TestSplicedHandlers:
+    """Test that translated blocks inline the specialized handler bodies."""
+
+    def test_handler_bodies_are_spliced(self) -> None:
+        """Plain loads, stores and arithmetic are not called through handlers."""
+        cpu = make_cpu("block")
+        block = cpu.block_cache.lookup(0x0200, 0)
+
+        assert block.length == 1 + 7
+        assert "_sp_h" not in block.source
+        assert "_sp_tick" not in block.source
+        # Only the ADC/STA abs,X page crossings and the taken BNE (plus its
+        # page crossing) are counted at run time
+        assert block.source.count("_sp_cycles += 1\n") == 4
+
+    def test_unspliceable_handlers_are_called(self) -> None:
+        """Handlers that do more than move data (PLP) are still called."""
+        cpu = make_cpu("block", program=bytes([0x28, 0xE8, 0x4C, 0x02, 0x02]))
+        block = cpu.block_cache.lookup(0x0200, 0)
+
+        assert "_sp_h0(cpu)" in block.source
+        assert "_sp_h1" not in block.source
+
+    @pytest.mark.parametrize("batched_cycles", [False, True])
+    def test_io_accesses_see_interpreter_cycle_counts(self, batched_cycles) -> None:
+        """Reads and writes through an I/O page see the interpreter's cycle counts."""
+        #   $0200: LDX #$20
+        #   $0202: LDA $D012
+        #   $0205: STA $D020
+        #   $0208: LDA $CFF0,X   <- crosses into the I/O page
+        #   $020B: INC $D019
+        #   $020E: ADC $D000,X
+        #   $0211: INX
+        #   $0212: BNE $0202
+        #   $0214: JMP $0214
+        program = bytes([
+            0xA2, 0x20, 0xAD, 0x12, 0xD0, 0x8D, 0x20, 0xD0, 0xBD, 0xF0, 0xCF,
+            0xEE, 0x19, 0xD0, 0x7D, 0x00, 0xD0, 0xE8, 0xD0, 0xEE, 0x4C, 0x14, 0x02,
+        ])
+
+        class IOHandler:
+            """RAM with an I/O page at $D000 whose reads return the cycle count."""
+
+            def __init__(self, cpu: mos6502.CPU) -> None:
+                self.cpu = cpu
+                self.data = bytearray(cpu.ram.data)
+                self.accesses = []
+                view = memoryview(self.data)
+                self.read_pages = [None if page == 0xD0 else view[page << 8:(page + 1) << 8] for page in range(256)]
+                self.page_readers = [self.read] * 256
+
+            def read(self, addr: int) -> int:
+                if addr >> 8 == 0xD0:
+                    self.accesses.append(("read", addr, self.cpu.cycles_executed))
+                    return self.cpu.cycles_executed & 0xFF
+                return self.data[addr]
+
+            def write(self, addr: int, value: int) -> None:
+                if addr >> 8 == 0xD0:
+                    self.accesses.append(("write", addr, int(value) & 0xFF, self.cpu.cycles_executed))
+                self.data[addr] = int(value) & 0xFF
+
+            def bank_fingerprint(self) -> int:
+                return 0
+
+        def run(engine: str) -> tuple:
+            cpu = mos6502.CPU(execution_engine=engine, batched_cycles=batched_cycles)
+            cpu.reset()
+            handler = IOHandler(cpu)
+            handler.data[0x0200:0x0200 + len(program)] = program
+            cpu.ram.memory_handler = handler
+            cpu.PC = 0x0200
+            run_until_exhausted(cpu, cycles=3000)
+            return (cpu.PC, cpu.A, cpu.X, cpu.Y, cpu._flags.value, cpu.cycles_executed, cpu.cycles,
+                    bytes(handler.data), handler.accesses)
+
+        reference = run("interpreter")
+
+        assert run("block") == reference
+        assert len(reference[-1]) > 100
+
+
+class TestBlockEngineFallback:
+    """Test that the block engine steps aside when it cannot be exact."""
+
+    def test_pc_callback_uses_interpreter(self) -> None:
+        """A pc_callback needs every PC write, so no blocks are translated."""
+        cpu = make_cpu("block")
+        seen = []
+        cpu.pc_callback = seen.append
+
+        run_until_exhausted(cpu, cycles=200)
+
+        assert len(cpu.block_cache) == 0
+        assert seen
+
+    def test_memory_handler_without_fingerprint_uses_interpreter(self) -> None:
+        """Handlers that cannot describe their banking disable the block engine."""
+        cpu = make_cpu("block")
+        data = bytearray(cpu.ram.data)
+
+        class PlainHandler:
+            def read(self, addr: int) -> int:
+                return data[addr]
+
+            def write(self, addr: int, value: int) -> None:
+                data[addr] = int(value) & 0xFF
+
+        cpu.ram.memory_handler = PlainHandler()
+        run_until_exhausted(cpu, cycles=200)
+
+        assert len(cpu.block_cache) == 0
+
+
+class TestBankFingerprint:
+    """Test that translated code is keyed by the memory handler's banking."""
+
+    def test_bank_switch_inside_block(self) -> None:
+        """Switching banks mid-block resumes from the newly visible code."""
+        # Both banks at $1000: LDA #$01, STA $01, then INX (bank 0) / INY (bank 1)
+        banks = [
+            bytes([0xA9, 0x01, 0x85, 0x01, 0xE8, 0x4C, 0x05, 0x10]),
+            bytes([0xA9, 0x01, 0x85, 0x01, 0xC8, 0x4C, 0x05, 0x10]),
+        ]
+
+        class BankedHandler:
+            def __init__(self) -> None:
+                self.port = 0
+                self.data = bytearray(0x10000)
+
+            def read(self, addr: int) -> int:
+                if 0x1000 <= addr < 0x1000 + len(banks[0]):
+                    return banks[self.port][addr - 0x1000]
+                return self.data[addr]
+
+            def write(self, addr: int, value: int) -> None:
+                if addr == 0x0001:
+                    self.port = int(value) & 0x01
+                self.data[addr] = int(value) & 0xFF
+
+            def bank_fingerprint(self) -> int:
+                return self.port
+
+            def bank_switch_addresses(self) -> list[int]:
+                return [0x0001]
+
+        cpu = mos6502.CPU(execution_engine="block")
+        cpu.reset()
+        cpu.ram.memory_handler = BankedHandler()
+        cpu.PC = 0x1000
+
+        run_until_exhausted(cpu, cycles=60)
+
+        assert (cpu.X, cpu.Y) == (0, 1)
+        assert (0x1000, 0) in cpu.block_cache.blocks
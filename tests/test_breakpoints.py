@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Tests for CPU breakpoints (MOS6502CPU.add_breakpoint)."""
+
+import pytest
+
+import mos6502
+from mos6502 import errors
+from mos6502 import instructions
+
+# $0400: LDX #$00 / loop: INX / BNE loop / JMP $0500
+PROGRAM = bytes([
+    instructions.LDX_IMMEDIATE_0xA2, 0x00,
+    instructions.INX_IMPLIED_0xE8,
+    instructions.BNE_RELATIVE_0xD0, 0xFD,
+    instructions.JMP_ABSOLUTE_0x4C, 0x00, 0x05,
+])
+
+
+def make_cpu(execution_engine: str = "interpreter") -> mos6502.CPU:
+    """Create a CPU with PROGRAM at $0400 and NOPs at $0500."""
+    cpu = mos6502.CPU(execution_engine=execution_engine)
+    cpu.reset()
+    cpu.ram.data[0x0400:0x0400 + len(PROGRAM)] = PROGRAM
+    cpu.ram.data[0x0500:0x0510] = bytes([instructions.NOP_IMPLIED_0xEA]) * 0x10
+    cpu.PC = 0x0400
+    return cpu
+
+
+class TestBreakpoints:
+    """Test breakpoint hits, dispatch and removal."""
+
+    @pytest.mark.parametrize("execution_engine", ["interpreter", "block"])
+    def test_raises_when_pc_reaches_address(self, execution_engine) -> None:
+        """Without a callback a hit raises CPUBreakpointError at the boundary."""
+        cpu = make_cpu(execution_engine)
+        cpu.add_breakpoint(0x0500)
+
+        with pytest.raises(errors.CPUBreakpointError) as excinfo:
+            cpu.execute(cycles=100_000)
+
+        assert excinfo.value.address == 0x0500
+        assert cpu.PC == 0x0500
+        assert cpu.X == 0x00
+
+    def test_range_and_resume(self) -> None:
+        """Ranges match every address; resuming runs the instruction at the breakpoint."""
+        cpu = make_cpu()
+        cpu.add_breakpoint(range(0x0500, 0x0510))
+
+        with pytest.raises(errors.CPUBreakpointError):
+            cpu.execute(cycles=100_000)
+        with pytest.raises(errors.CPUBreakpointError) as excinfo:
+            cpu.execute(cycles=100_000)
+
+        assert excinfo.value.address == 0x0501
+
+    def test_callback_dispatch(self) -> None:
+        """A callback is called on each hit instead of raising."""
+        cpu = make_cpu()
+        hits = []
+        cpu.breakpoint_callback = lambda cpu, pc: hits.append((pc, cpu.X))
+        cpu.add_breakpoint(0x0402)
+
+        with pytest.raises(errors.CPUCycleExhaustionError):
+            cpu.execute(cycles=100_000)
+
+        # Reached after LDX and after each of the 255 taken branches
+        assert len(hits) == 256
+        assert hits[0] == (0x0402, 0x00)
+        assert cpu.instructions_executed > 256
+
+    def test_callback_may_stop_execution(self) -> None:
+        """StopIteration from the callback ends execute() with counters written back."""
+        cpu = make_cpu()
+
+        def stop(cpu, pc: int) -> None:
+            raise StopIteration
+
+        cpu.breakpoint_callback = stop
+        cpu.add_breakpoint(0x0405)
+
+        with pytest.raises(StopIteration):
+            cpu.execute(cycles=100_000)
+
+        assert cpu.PC == 0x0405
+        assert cpu.instructions_executed == 1 + 2 * 256
+
+    def test_remove_and_clear(self) -> None:
+        """Removed breakpoints no longer hit and the bitmap is dropped when empty."""
+        cpu = make_cpu()
+        cpu.add_breakpoint(range(0x0500, 0x0504))
+        cpu.add_breakpoint(0x0402)
+        cpu.remove_breakpoint(range(0x0500, 0x0502))
+        assert cpu.breakpoints == frozenset({0x0402, 0x0502, 0x0503})
+
+        cpu.remove_breakpoint(0x0402)
+        cpu.remove_breakpoint(range(0x0502, 0x0504))
+        assert cpu._breakpoint_map is None
+
+        cpu.add_breakpoint(0x0500)
+        cpu.clear_breakpoints()
+        with pytest.raises(errors.CPUCycleExhaustionError):
+            cpu.execute(cycles=10_000)
+
+    def test_block_engine_ends_blocks_at_breakpoints(self) -> None:
+        """Translated blocks stop before an instruction at a breakpoint address."""
+        cpu = make_cpu("block")
+        cpu.add_breakpoint(0x0503)
+
+        with pytest.raises(errors.CPUBreakpointError) as excinfo:
+            cpu.execute(cycles=100_000)
+
+        assert excinfo.value.address == 0x0503
+        assert cpu.PC == 0x0503
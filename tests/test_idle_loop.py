@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Tests for idle-loop fast-forward (MOS6502CPU.idle_loop_skip)."""
+
+import pytest
+
+import mos6502
+from mos6502 import errors
+from mos6502 import instructions
+
+IRQ_HANDLER = 0x0600
+
+# $0400: wait: JSR $0500 / LDA $10 / STA $11 / BEQ wait / INX / JMP $0409
+# $0500: LDY #$07 / RTS
+# $0600: INC $10 / RTI (IRQ handler)
+WAIT_LOOP = bytes([
+    instructions.JSR_ABSOLUTE_0x20, 0x00, 0x05,
+    instructions.LDA_ZEROPAGE_0xA5, 0x10,
+    instructions.STA_ZEROPAGE_0x85, 0x11,
+    instructions.BEQ_RELATIVE_0xF0, 0xF7,
+    instructions.INX_IMPLIED_0xE8,
+    instructions.JMP_ABSOLUTE_0x4C, 0x09, 0x04,
+])
+SUBROUTINE = bytes([instructions.LDY_IMMEDIATE_0xA0, 0x07, instructions.RTS_IMPLIED_0x60])
+INTERRUPT = bytes([instructions.INC_ZEROPAGE_0xE6, 0x10, instructions.RTI_IMPLIED_0x40])
+
+
+class PagedMemory:
+    """Minimal memory handler with a volatile I/O page at $D000."""
+
+    def __init__(self) -> None:
+        self.data = bytearray(0x10000)
+        self.io_reads = 0
+
+    def read(self, addr: int) -> int:
+        if addr >> 8 == 0xD0:
+            self.io_reads += 1
+            return 0
+        return self.data[addr]
+
+    def write(self, addr: int, value: int) -> None:
+        self.data[addr] = value & 0xFF
+
+    def is_volatile(self, addr: int) -> bool:
+        return addr >> 8 == 0xD0
+
+
+def make_cpu(idle_loop_skip: bool, program: bytes = WAIT_LOOP, **kwargs) -> mos6502.CPU:
+    """Create a CPU running program at $0400 with the subroutine and IRQ handler loaded."""
+    cpu = mos6502.CPU(idle_loop_skip=idle_loop_skip, **kwargs)
+    cpu.reset()
+    cpu.ram.data[0x0400:0x0400 + len(program)] = program
+    cpu.ram.data[0x0500:0x0500 + len(SUBROUTINE)] = SUBROUTINE
+    cpu.ram.data[IRQ_HANDLER:IRQ_HANDLER + len(INTERRUPT)] = INTERRUPT
+    cpu.ram.data[0xFFFE], cpu.ram.data[0xFFFF] = IRQ_HANDLER & 0xFF, IRQ_HANDLER >> 8
+    cpu.ram.data[0x10] = 0x00
+    cpu.PC = 0x0400
+    cpu._flags.value = 0x00
+    return cpu
+
+
+def run(cpu: mos6502.CPU, **kwargs) -> tuple:
+    """Run until the budget ends and return the complete CPU state."""
+    with pytest.raises(errors.CPUCycleExhaustionError):
+        cpu.execute(**kwargs)
+    return (
+        cpu.PC, cpu.A, cpu.X, cpu.Y, cpu.S, cpu._flags.value,
+        cpu.cycles, cpu.cycles_executed, cpu.instructions_executed,
+        bytes(cpu.ram.data),
+    )
+
+
+def with_raster_irq(cpu: mos6502.CPU, events: list, irq_line: int) -> None:
+    """Install a periodic callback that raises IRQ on one "raster line"."""
+    cpu.periodic_callback_interval = 63
+
+    def update() -> None:
+        events.append((cpu.cycles_executed, cpu.PC, cpu.A, cpu.Y, cpu.S))
+        cpu.irq_pending = len(events) % 100 == irq_line
+
+    cpu.periodic_callback = update
+
+
+class TestIdleLoopSkip:
+    """Test that skipping idle loops is indistinguishable from running them."""
+
+    @pytest.mark.parametrize("options", [
+        {},
+        {"flat_registers": True},
+        {"batched_cycles": True, "lazy_flags": True},
+    ])
+    def test_matches_interpreter_with_interrupts(self, options) -> None:
+        """Callbacks, interrupts, registers, memory and counters match exactly."""
+        results = []
+        for idle_loop_skip in (False, True):
+            cpu = make_cpu(idle_loop_skip, **options)
+            events: list = []
+            with_raster_irq(cpu, events, irq_line=37)
+            results.append((run(cpu, cycles=50_000), events))
+
+        assert results[1] == results[0]
+        assert cpu.idle_loop_detector.skipped_instructions > 0
+
+    def test_cycle_budget_and_instruction_limit(self) -> None:
+        """Skips stop exactly where the budget or instruction limit ends."""
+        for kwargs in ({"cycles": 12_345}, {"max_instructions": 4_321}):
+            reference = run(make_cpu(False), **kwargs)
+            cpu = make_cpu(True)
+            assert run(cpu, **kwargs) == reference
+            assert cpu.idle_loop_detector.skips == 1
+
+    def test_resumes_across_execute_calls(self) -> None:
+        """A loop probed in one execute() call is skipped in the next."""
+        reference = make_cpu(False)
+        cpu = make_cpu(True)
+        for _ in range(20):
+            assert run(cpu, cycles=777) == run(reference, cycles=777)
+
+    def test_busy_loop_is_not_skipped(self) -> None:
+        """A loop that changes a register every pass is executed normally."""
+        program = bytes([
+            instructions.INX_IMPLIED_0xE8,
+            instructions.JMP_ABSOLUTE_0x4C, 0x00, 0x04,
+        ])
+        reference = run(make_cpu(False, program), cycles=20_000)
+        cpu = make_cpu(True, program)
+
+        assert run(cpu, cycles=20_000) == reference
+        assert cpu.idle_loop_detector.skips == 0
+
+    def test_memory_change_ends_skipping(self) -> None:
+        """A write by the periodic callback to memory the loop reads is seen on time."""
+        results = []
+        for idle_loop_skip in (False, True):
+            cpu = make_cpu(idle_loop_skip)
+            cpu.periodic_callback_interval = 100
+
+            def update(cpu=cpu) -> None:
+                if cpu.cycles_executed >= 5_000:
+                    cpu.ram[0x10] = 0x01
+
+            cpu.periodic_callback = update
+            results.append(run(cpu, cycles=10_000))
+
+        assert results[1] == results[0]
+        assert results[1][2] > 0  # Left the wait loop and counted with INX
+
+    def test_volatile_reads_are_not_skipped(self) -> None:
+        """Loops polling I/O registers run every pass."""
+        program = bytes([
+            instructions.LDA_ABSOLUTE_0xAD, 0x12, 0xD0,
+            instructions.BEQ_RELATIVE_0xF0, 0xFB,
+        ])
+        cpu = make_cpu(True, program)
+        memory = PagedMemory()
+        memory.data[:] = cpu.ram.data
+        cpu.ram.memory_handler = memory
+
+        run(cpu, cycles=7_000)
+
+        assert memory.io_reads == 1_000
+        assert cpu.idle_loop_detector.skips == 0
+        assert cpu.ram.memory_handler is memory
+
+    def test_disabled_with_hooks(self) -> None:
+        """Breakpoints and handlers without is_volatile() turn skipping off."""
+        cpu = make_cpu(True)
+        cpu.add_breakpoint(0x0409)
+        run(cpu, cycles=5_000)
+        assert cpu.idle_loop_detector.skips == 0
+
+        cpu = make_cpu(True)
+        cpu.ram.memory_handler = type("Handler", (), {
+            "read": lambda self, addr: cpu.ram.data[addr],
+            "write": lambda self, addr, value: None,
+        })()
+        run(cpu, cycles=5_000)
+        assert cpu.idle_loop_detector.skips == 0
+
+    def test_toggle(self) -> None:
+        """The detector is created on demand and dropped when disabled."""
+        cpu = mos6502.CPU()
+        assert cpu.idle_loop_detector is None
+
+        cpu.idle_loop_skip = True
+        assert cpu.idle_loop_skip
+        cpu.idle_loop_skip = False
+        assert cpu.idle_loop_detector is None
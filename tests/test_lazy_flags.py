@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Tests for lazy flag evaluation (flags.LazyFlagsRegister)."""
+
+import random
+
+import pytest
+
+import mos6502
+from mos6502 import errors
+from mos6502 import flags
+from mos6502 import instructions
+from mos6502.flags import FlagsRegister
+from mos6502.flags import LazyFlagsRegister
+from mos6502.flags import QuietFlagsRegister
+
+
+def apply_operations(register: FlagsRegister, operations: list[tuple]) -> list[int]:
+    """Apply (method, args) operations, reading the register after some of them."""
+    observed = []
+    for method, *args in operations:
+        if method == "read":
+            observed.append(register.value)
+        elif method == "bit":
+            register[args[0]] = args[1]
+        else:
+            getattr(register, method)(*args)
+    observed.append(register.value)
+    return observed
+
+
+class TestLazyFlagsRegister:
+    """Test the lazy register against the eager one."""
+
+    def test_matches_eager_register(self) -> None:
+        """Random operation sequences produce identical flag values."""
+        rng = random.Random(6502)
+        for _ in range(500):
+            operations = []
+            for _ in range(rng.randint(1, 12)):
+                a = rng.randrange(256)
+                b = rng.randrange(256)
+                kind = rng.choice(["set_nz", "set_add", "set_sub", "set_compare", "bit", "read"])
+                if kind == "set_nz":
+                    operations.append((kind, a))
+                elif kind == "set_add":
+                    operations.append((kind, a, b, a + b + rng.randint(0, 1)))
+                elif kind == "set_sub":
+                    operations.append((kind, a, b, a - b - rng.randint(0, 1)))
+                elif kind == "set_compare":
+                    operations.append((kind, a, b))
+                elif kind == "bit":
+                    operations.append((kind, rng.choice([flags.C, flags.Z, flags.V, flags.N, flags.D]), rng.randint(0, 1)))
+                else:
+                    operations.append((kind,))
+
+            initial = rng.randrange(256)
+            eager = apply_operations(QuietFlagsRegister(initial), operations)
+            lazy = apply_operations(LazyFlagsRegister(initial), operations)
+            assert lazy == eager, operations
+
+    def test_updates_are_deferred_until_read(self) -> None:
+        """Recorded results are only folded into the value on access."""
+        register = LazyFlagsRegister(0x20)
+        register.set_add(0x7F, 0x01, 0x80)
+        register.set_nz(0x80)
+
+        assert register._value == 0x20
+        assert register[flags.V] == 1
+        assert register[flags.N] == 1
+        assert register[flags.C] == 0
+        assert register._value == 0xE0
+
+    def test_compare_keeps_pending_overflow(self) -> None:
+        """A compare after ADC leaves the ADC's V flag intact."""
+        register = LazyFlagsRegister(0x20)
+        register.set_add(0x50, 0x50, 0xA0)
+        register.set_compare(0x10, 0x10)
+
+        assert register[flags.V] == 1
+        assert register[flags.Z] == 1
+        assert register[flags.C] == 1
+
+    def test_value_assignment_discards_pending(self) -> None:
+        """Assigning the whole register (PLP/RTI) replaces recorded results."""
+        register = LazyFlagsRegister(0x20)
+        register.set_nz(0)
+        register.value = 0x81
+
+        assert register.value == 0x81
+
+
+class TestCPULazyFlags:
+    """Test selecting lazy flags on the CPU."""
+
+    def test_lazy_flags_selects_register_class(self) -> None:
+        """lazy_flags swaps the CPU's flags register in place."""
+        cpu = mos6502.CPU(lazy_flags=True)
+        assert cpu.lazy_flags
+        assert type(cpu._flags) is LazyFlagsRegister
+
+        cpu._flags.set_nz(0)
+        cpu.lazy_flags = False
+        assert type(cpu._flags) is QuietFlagsRegister
+        assert cpu.Z
+
+    def test_verbose_cycles_disables_lazy_flags(self) -> None:
+        """Flag change logging needs eager updates."""
+        cpu = mos6502.CPU(lazy_flags=True, verbose_cycles=True)
+        assert type(cpu._flags) is FlagsRegister
+
+    def test_php_pushes_resolved_flags(self, cpu_variant) -> None:
+        """PHP sees the flags of the preceding CMP."""
+        cpu = mos6502.CPU(cpu_variant=cpu_variant, lazy_flags=True)
+        cpu.reset()
+        # CMP #$40 with A=$40, then PHP
+        program = [instructions.LDA_IMMEDIATE_0xA9, 0x40,
+                   instructions.CMP_IMMEDIATE_0xC9, 0x40,
+                   instructions.PHP_IMPLIED_0x08]
+        for offset, value in enumerate(program):
+            cpu.ram[0x0200 + offset] = value
+        cpu.PC = 0x0200
+
+        with pytest.raises(errors.CPUCycleExhaustionError):
+            cpu.execute(max_instructions=3)
+
+        pushed = cpu.ram[0x01FD]
+        assert pushed & (1 << flags.Z)
+        assert pushed & (1 << flags.C)
+        assert not pushed & (1 << flags.N)
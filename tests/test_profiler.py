@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Tests for the fast-path execution profiler (mos6502.profiler)."""
+
+import pytest
+
+import mos6502
+from mos6502 import errors
+from mos6502 import instructions
+from mos6502.profiler import ExecutionProfiler
+from mos6502.profiler import HotSpot
+
+# $0400: LDX #$00 / loop: INX / BNE loop / JMP $0400
+PROGRAM = bytes([
+    instructions.LDX_IMMEDIATE_0xA2, 0x00,
+    instructions.INX_IMPLIED_0xE8,
+    instructions.BNE_RELATIVE_0xD0, 0xFD,
+    instructions.JMP_ABSOLUTE_0x4C, 0x00, 0x04,
+])
+
+
+def run(profiler: ExecutionProfiler | None, cycles: int = 10_000, **kwargs) -> mos6502.CPU:
+    """Run PROGRAM at $0400 with an optional profiler attached."""
+    cpu = mos6502.CPU(**kwargs)
+    cpu.reset()
+    cpu.ram.data[0x0400:0x0400 + len(PROGRAM)] = PROGRAM
+    cpu.PC = 0x0400
+    cpu.profiler = profiler
+    with pytest.raises(errors.CPUCycleExhaustionError):
+        cpu.execute(cycles=cycles)
+    return cpu
+
+
+class TestExecutionProfiler:
+    """Test opcode/address counting and reporting."""
+
+    @pytest.mark.parametrize("options", [
+        {},
+        {"batched_cycles": True},
+        {"execution_engine": "block"},
+        {"idle_loop_skip": True},
+        {"verbose_cycles": True},
+    ])
+    def test_counts_every_instruction(self, options) -> None:
+        """Counters add up to the executed instructions and cycles."""
+        profiler = ExecutionProfiler()
+        cpu = run(profiler, cycles=2_000, **options)
+
+        assert profiler.instructions == cpu.instructions_executed
+        assert profiler.cycles == cpu.cycles_executed - 7  # Reset cycles are not an instruction
+        assert profiler.pc_hits[0x0402] == profiler.opcode_counts[instructions.INX_IMPLIED_0xE8]
+        assert profiler.pc_hits[0x0403] == profiler.pc_hits[0x0402]
+
+    def test_does_not_change_execution(self) -> None:
+        """A profiled run ends in the same state as an unprofiled one."""
+        reference = run(None)
+        cpu = run(ExecutionProfiler())
+
+        assert (cpu.PC, cpu.X, cpu.cycles_executed, cpu.instructions_executed) == (
+            reference.PC, reference.X, reference.cycles_executed, reference.instructions_executed,
+        )
+
+    def test_hot_spots_and_ranges(self) -> None:
+        """Hot spots are sorted by cycles and ranges sum the per-address cycles."""
+        profiler = ExecutionProfiler()
+        run(profiler)
+
+        spots = profiler.hot_spots(limit=2)
+        assert [spot.address for spot in spots] == [0x0403, 0x0402]
+        # Taken BNE costs 3 cycles, INX 2
+        assert spots[1] == HotSpot(0x0402, spots[1].hits, 2 * spots[1].hits)
+        assert profiler.hot_spots(limit=1, key="hits")[0].address in (0x0402, 0x0403)
+
+        by_range = profiler.range_cycles({"loop": range(0x0402, 0x0405), "all": range(0x10000)})
+        assert by_range["all"] == profiler.cycles
+        assert by_range["loop"] == spots[0].cycles + spots[1].cycles
+
+        with pytest.raises(ValueError, match="Unknown hot spot key"):
+            profiler.hot_spots(key="bytes")
+
+    def test_report(self) -> None:
+        """The report lists ranges, disassembled hot spots and opcodes."""
+        profiler = ExecutionProfiler()
+        run(profiler)
+
+        report = profiler.report(
+            limit=3,
+            ranges={"program": range(0x0400, 0x0408)},
+            disassemble=lambda address: f"<{address:04X}>",
+        )
+
+        assert "program" in report
+        assert "<0403>" in report
+        assert "INX" in report
+
+        profiler.reset()
+        assert profiler.instructions == 0
+        assert profiler.hot_spots() == []
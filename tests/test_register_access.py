@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Tests for flat register storage and the swapped-in QuietMOS6502CPU."""
+
+import functools
+import random
+
+import pytest
+
+import mos6502
+from mos6502 import errors
+from mos6502 import instructions
+from mos6502.core import MOS6502CPU
+from mos6502.core import QuietMOS6502CPU
+from mos6502.registers import Registers
+
+
+@functools.cache
+def random_memory(seed: int) -> bytes:
+    """Return 64K of reproducible random memory."""
+    return random.Random(seed).randbytes(0x10000)
+
+
+def run_one(cpu_variant, seed: int, opcode: int, flat_registers: bool) -> tuple:
+    """Execute a single instruction on a randomized CPU and return its state."""
+    rng = random.Random(seed)
+    cpu = mos6502.CPU(cpu_variant=cpu_variant, flat_registers=flat_registers)
+    cpu.reset()
+    cpu.ram.data[:] = random_memory(seed)
+    cpu.A, cpu.X, cpu.Y = rng.randrange(256), rng.randrange(256), rng.randrange(256)
+    cpu.S = 0x0100 | rng.randrange(256)
+    cpu._flags.value = rng.randrange(256)
+    cpu.PC = 0x0200 | rng.randrange(0x100)
+    cpu.ram[cpu.PC] = opcode
+    try:
+        cpu.execute(max_instructions=1)
+        error = None
+    except errors.CPUCycleExhaustionError:
+        error = None
+    except Exception as exc:  # noqa: BLE001 - JAM and friends raise by design
+        error = type(exc)
+    return (
+        error, cpu.PC, cpu.A, cpu.X, cpu.Y, cpu.S, cpu._flags.value,
+        cpu.cycles_executed, bytes(cpu.ram.data),
+    )
+
+
+class TestFlatRegisters:
+    """Test registers stored in the CPU's own slots."""
+
+    def test_registers_are_cpu_slots(self) -> None:
+        """Flat mode makes the CPU its own register storage."""
+        cpu = mos6502.CPU(flat_registers=True)
+        cpu.A, cpu.X, cpu.Y, cpu.S, cpu.PC = 0x1A2, 0x34, 0x56, 0x1FF, 0x12345
+
+        assert cpu._registers is cpu
+        assert (cpu._A, cpu._X, cpu._Y, cpu._S, cpu._PC) == (0xA2, 0x34, 0x56, 0x01FF, 0x2345)
+
+    def test_toggle_preserves_values(self) -> None:
+        """Switching storage carries the register values over."""
+        cpu = mos6502.CPU()
+        cpu.A, cpu.X, cpu.Y, cpu.S, cpu.PC = 0x12, 0x34, 0x56, 0x01AB, 0xC000
+
+        cpu.flat_registers = True
+        assert (cpu.A, cpu.X, cpu.Y, cpu.S, cpu.PC) == (0x12, 0x34, 0x56, 0x01AB, 0xC000)
+
+        cpu.A = 0x99
+        cpu.flat_registers = False
+        assert isinstance(cpu._registers, Registers)
+        assert (cpu.A, cpu.X, cpu.Y, cpu.S, cpu.PC) == (0x99, 0x34, 0x56, 0x01AB, 0xC000)
+
+    def test_every_opcode_matches_object_storage(self, cpu_variant) -> None:
+        """All opcodes produce the same state with either storage."""
+        for opcode in range(256):
+            if instructions.OPCODE_LOOKUP.get(opcode) is None:
+                continue
+            for seed in range(2):
+                reference = run_one(cpu_variant, seed, opcode, flat_registers=False)
+                result = run_one(cpu_variant, seed, opcode, flat_registers=True)
+                assert result == reference, f"opcode 0x{opcode:02X} seed {seed}"
+
+
+class TestQuietRegisterAccess:
+    """Test swapping between MOS6502CPU and QuietMOS6502CPU."""
+
+    def test_quiet_class_without_hooks(self) -> None:
+        """A CPU without verbose mode or pc_callback uses the quiet properties."""
+        assert type(mos6502.CPU()) is QuietMOS6502CPU
+        assert type(mos6502.CPU(verbose_cycles=True)) is MOS6502CPU
+
+    def test_pc_callback_swaps_class(self) -> None:
+        """Setting pc_callback restores the checking properties, clearing it removes them."""
+        cpu = mos6502.CPU()
+        seen = []
+        cpu.pc_callback = seen.append
+        assert type(cpu) is MOS6502CPU
+
+        cpu.PC = 0x1234
+        assert seen == [0x1234]
+
+        cpu.pc_callback = None
+        assert type(cpu) is QuietMOS6502CPU
+        cpu.PC = 0x4321
+        assert seen == [0x1234]
+
+    def test_pc_callback_sees_handler_jumps(self) -> None:
+        """Inlined PC writes in handlers still call pc_callback."""
+        cpu = mos6502.CPU()
+        cpu.reset()
+        cpu.ram[0x0400], cpu.ram[0x0401], cpu.ram[0x0402] = instructions.JMP_ABSOLUTE_0x4C, 0x00, 0x20
+        cpu.PC = 0x0400
+        seen = []
+        cpu.pc_callback = seen.append
+
+        with pytest.raises(errors.CPUCycleExhaustionError):
+            cpu.execute(max_instructions=1)
+
+        assert seen[-1] == 0x2000
+
+    def test_verbose_toggle_swaps_class(self) -> None:
+        """execute() picks up verbose_cycles changes."""
+        cpu = mos6502.CPU()
+        cpu.reset()
+        cpu.verbose_cycles = True
+        with pytest.raises(errors.CPUCycleExhaustionError):
+            cpu.execute(max_instructions=1)
+        assert type(cpu) is MOS6502CPU
+
+    def test_subclass_keeps_its_class(self) -> None:
+        """Subclasses are never swapped and keep their overrides."""
+
+        class CountingCPU(mos6502.CPU):
+            @property
+            def A(self) -> int:  # noqa: N802
+                return 0x42
+
+            @A.setter
+            def A(self, A: int) -> None:  # noqa: N802 N803
+                pass
+
+        cpu = CountingCPU()
+        assert type(cpu) is CountingCPU
+        cpu.reset()
+        cpu.ram[0x0400] = instructions.TAX_IMPLIED_0xAA
+        cpu.PC = 0x0400
+        with pytest.raises(errors.CPUCycleExhaustionError):
+            cpu.execute(max_instructions=1)
+        assert cpu.X == 0x42
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Tests for the logging-free release opcode handlers."""
+
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+import mos6502
+from mos6502 import errors
+from mos6502 import instructions
+from mos6502.core import MOS6502CPU
+from mos6502.core import QuietMOS6502CPU
+from mos6502.flags import FlagsRegister
+from mos6502.flags import QuietFlagsRegister
+from mos6502.release_handlers import release_handler
+
+
+def _handler_with_warning(cpu) -> None:
+    """Handler-shaped function mixing trace calls and a warning."""
+    cpu.log.debug("d")
+    cpu.A = 1
+    if cpu.A:
+        cpu.log.info("branch")
+    cpu.log.warning("kept")
+    cpu.log.info("i")
+
+
+def traces(handler) -> bool:
+    """Return True if a handler still calls cpu.log.info()."""
+    return "info" in handler.__code__.co_names
+
+
+class TestReleaseHandlerTable:
+    """Test which handler table the CPU dispatches through."""
+
+    def test_release_handlers_used_by_default(self, cpu) -> None:
+        """Without verbose_cycles every handler in the table is logging-free."""
+        handlers = [handler for handler in cpu._opcode_handler_cache if handler is not None]
+
+        assert handlers
+        assert not any(traces(handler) for handler in handlers)
+        assert type(cpu._flags) is QuietFlagsRegister
+
+    def test_verbose_cycles_uses_logging_handlers(self) -> None:
+        """verbose_cycles keeps the original handlers and flag logging."""
+        cpu = mos6502.CPU(verbose_cycles=True)
+
+        lda = cpu._opcode_handler_cache[instructions.LDA_IMMEDIATE_0xA9]
+        assert traces(lda)
+        assert type(cpu._flags) is FlagsRegister
+
+    def test_toggling_verbose_cycles_switches_table(self) -> None:
+        """execute() picks up verbose_cycles changes made after construction."""
+        cpu = mos6502.CPU()
+        cpu.reset()
+        cpu.ram[0x0200] = instructions.NOP_IMPLIED_0xEA
+        cpu.ram[0x0201] = instructions.NOP_IMPLIED_0xEA
+        cpu.PC = 0x0200
+
+        cpu.verbose_cycles = True
+        with pytest.raises(errors.CPUCycleExhaustionError):
+            cpu.execute(max_instructions=1)
+        assert traces(cpu._opcode_handler_cache[instructions.NOP_IMPLIED_0xEA])
+        assert type(cpu._flags) is FlagsRegister
+
+        cpu.verbose_cycles = False
+        with pytest.raises(errors.CPUCycleExhaustionError):
+            cpu.execute(max_instructions=1)
+        assert not traces(cpu._opcode_handler_cache[instructions.NOP_IMPLIED_0xEA])
+        assert type(cpu._flags) is QuietFlagsRegister
+
+    def test_release_handlers_switch(self) -> None:
+        """release_handlers=False keeps the logging handlers without verbose_cycles."""
+        cpu = mos6502.CPU()
+
+        cpu.release_handlers = False
+        assert not cpu.verbose_cycles
+        assert traces(cpu._opcode_handler_cache[instructions.LDA_IMMEDIATE_0xA9])
+        assert type(cpu._flags) is FlagsRegister
+        assert type(cpu) is MOS6502CPU
+
+        cpu.release_handlers = True
+        assert not traces(cpu._opcode_handler_cache[instructions.LDA_IMMEDIATE_0xA9])
+        assert type(cpu._flags) is QuietFlagsRegister
+        assert type(cpu) is QuietMOS6502CPU
+
+    def test_plp_keeps_flags_register_class(self, cpu) -> None:
+        """PLP restores flags without switching back to the logging register."""
+        cpu.ram[0x01FE] = 0xC3
+        cpu.S = 0x01FD
+        cpu.ram[0x0200] = instructions.PLP_IMPLIED_0x28
+        cpu.PC = 0x0200
+
+        with pytest.raises(errors.CPUCycleExhaustionError):
+            cpu.execute(max_instructions=1)
+
+        assert type(cpu._flags) is QuietFlagsRegister
+        assert cpu.C
+        assert cpu.N
+
+
+class TestReleaseHandler:
+    """Test the handler transformation itself."""
+
+    def test_release_handler_is_cached_and_wraps_original(self) -> None:
+        """Each handler is transformed once and keeps a link to its source."""
+        from mos6502.instructions.load._lda import _lda_6502
+
+        original = _lda_6502.lda_absolute_x_0xbd
+        release = release_handler(original)
+
+        assert release is not original
+        assert release_handler(original) is release
+        assert release.__wrapped__ is original
+        assert release.__name__ == original.__name__
+        assert release.__doc__ == original.__doc__
+        assert release.__code__.co_filename == original.__code__.co_filename
+
+    def test_warnings_are_kept(self) -> None:
+        """Only debug/info traces are stripped; warnings still reach the log."""
+        cpu = MagicMock()
+
+        release_handler(_handler_with_warning)(cpu)
+
+        cpu.log.info.assert_not_called()
+        cpu.log.debug.assert_not_called()
+        cpu.log.warning.assert_called_once_with("kept")
+        assert cpu.A == 1
+
+    def test_flag_changes_not_logged_in_release_mode(self, cpu, caplog) -> None:
+        """QuietFlagsRegister sets bits without emitting flag log records."""
+        with caplog.at_level(logging.INFO, logger="mos6502.cpu.flags"):
+            cpu.C = 1
+            cpu.N = 1
+
+        assert cpu.C
+        assert cpu.N
+        assert not caplog.records
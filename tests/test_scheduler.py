@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Tests for the cycle-ordered event scheduler (mos6502.scheduler)."""
+
+import pytest
+
+import mos6502
+from mos6502 import errors
+from mos6502.scheduler import NEVER, EventScheduler
+from tests.test_idle_loop import make_cpu
+
+
+class TestEventScheduler:
+    """Test event ordering, replacement and cancellation."""
+
+    def test_runs_due_events_in_cycle_order(self) -> None:
+        """run() calls every due event once, earliest first, with its due cycle."""
+        scheduler = EventScheduler()
+        calls = []
+        for name, cycle in (("b", 200), ("a", 100), ("c", 300)):
+            scheduler.add(lambda due, name=name: calls.append((name, due)), name).schedule(cycle)
+
+        assert scheduler.next_cycle == 100
+        scheduler.run(250)
+
+        assert calls == [("a", 100), ("b", 200)]
+        assert scheduler.next_cycle == 300
+        assert (scheduler.pending, scheduler.dispatched) == (1, 2)
+
+    def test_schedule_replaces_and_cancel_drops(self) -> None:
+        """An event has at most one pending cycle."""
+        scheduler = EventScheduler()
+        calls = []
+        event = scheduler.add(calls.append, "timer")
+        event.schedule(100)
+        event.schedule(150)
+        other = scheduler.add(calls.append, "other")
+        other.schedule(120)
+        other.cancel()
+
+        scheduler.run(1000)
+
+        assert calls == [150]
+        assert not event.scheduled
+        assert scheduler.next_cycle == NEVER
+
+    def test_callbacks_can_schedule_due_events(self) -> None:
+        """Events rescheduled into the past run in the same call."""
+        scheduler = EventScheduler()
+        calls = []
+
+        def tick(cycle: int) -> None:
+            calls.append(cycle)
+            if cycle < 400:
+                event.schedule(cycle + 100)
+
+        event = scheduler.add(tick)
+        event.schedule(100)
+        scheduler.run(350)
+
+        assert calls == [100, 200, 300]
+        assert scheduler.next_cycle == 400
+
+    def test_replaced_entries_are_compacted(self) -> None:
+        """Rescheduling the same event does not grow the heap without bound."""
+        scheduler = EventScheduler()
+        event = scheduler.add(lambda cycle: None)
+        for cycle in range(10_000):
+            event.schedule(cycle)
+        assert len(scheduler._heap) < 100
+        assert scheduler.events() == [event]
+
+
+def with_scheduled_irq(cpu: mos6502.CPU) -> list:
+    """Schedule a "raster" event every 63 cycles that raises IRQ every 10th time."""
+    scheduler = EventScheduler()
+    cpu.scheduler = scheduler
+    trace = []
+
+    def raster(cycle: int) -> None:
+        trace.append((cycle, cpu.cycles_executed, cpu.PC))
+        cpu.irq_pending = len(trace) % 10 == 3
+        event.schedule(cycle + 63)
+
+    event = scheduler.add(raster, "raster")
+    event.schedule(cpu.cycles_executed + 63)
+    return trace
+
+
+class TestExecuteWithScheduler:
+    """Test that execute() runs events at the first boundary at or after their cycle."""
+
+    def run(self, cpu: mos6502.CPU, cycles: int) -> tuple:
+        with pytest.raises(errors.CPUCycleExhaustionError):
+            cpu.execute(cycles=cycles)
+        return (cpu.PC, cpu.A, cpu.X, cpu.Y, cpu.S, cpu.cycles_executed, bytes(cpu.ram.data))
+
+    def test_events_run_on_time(self) -> None:
+        """No event runs early or later than one instruction after its cycle."""
+        cpu = make_cpu(False)
+        trace = with_scheduled_irq(cpu)
+        self.run(cpu, 20_000)
+
+        assert len(trace) == 20_000 // 63
+        assert all(0 <= executed - due < 8 for due, executed, _pc in trace)
+        assert cpu.ram.data[0x10] > 0  # IRQ handler ran
+
+    @pytest.mark.parametrize("engine, idle_loop_skip", [("block", False), ("interpreter", True)])
+    def test_engines_match_interpreter(self, engine, idle_loop_skip) -> None:
+        """The block engine and idle-loop skipping stop at the next event."""
+        results = []
+        for options in ({}, {"execution_engine": engine, "idle_loop_skip": idle_loop_skip}):
+            skip = options.pop("idle_loop_skip", False)
+            cpu = make_cpu(skip, **options)
+            trace = with_scheduled_irq(cpu)
+            results.append((self.run(cpu, 50_000), trace))
+
+        assert results[1] == results[0]
+        if idle_loop_skip:
+            assert cpu.idle_loop_detector.skipped_instructions > 0
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Tests for the code-generated specialized opcode handlers (mos6502.instructions.specialized)."""
+
+import random
+from copy import deepcopy
+
+import pytest
+
+import mos6502
+from mos6502 import errors
+from mos6502 import instructions
+from mos6502.instructions.specialized import INLINED_HELPERS
+from mos6502.instructions.specialized import specialize_handler
+from mos6502.release_handlers import release_handler
+
+
+def make_cpu(cpu_variant, seed: int, events: list) -> mos6502.CPU:
+    """Create a CPU with random registers and memory that records PC and tick events."""
+    rng = random.Random(seed)
+    cpu = mos6502.CPU(cpu_variant=cpu_variant)
+    cpu.reset()
+    cpu.ram.data[:] = bytes(rng.randrange(256) for _ in range(0x10000))
+    cpu.A, cpu.X, cpu.Y = rng.randrange(256), rng.randrange(256), rng.randrange(256)
+    cpu.S = 0x0100 | rng.randrange(256)
+    cpu._flags.value = rng.randrange(256)
+    cpu.PC = 0x0200 | rng.randrange(0x100)
+
+    cpu.pc_callback = lambda pc: events.append(("pc", pc))
+    cpu.pre_tick_callback = lambda cpu, cycles: events.append(("pre", cycles))
+    cpu.post_tick_callback = lambda cpu, cycles: events.append(("post", cycles))
+    return cpu
+
+
+def run_handler(handler, cpu: mos6502.CPU) -> tuple:
+    """Call an opcode handler and return the resulting CPU state."""
+    try:
+        handler(cpu)
+        error = None
+    except Exception as exc:  # noqa: BLE001 - JAM and friends raise by design
+        error = type(exc)
+    return (
+        error, cpu.PC, cpu.A, cpu.X, cpu.Y, cpu.S, cpu._flags.value,
+        cpu.cycles_executed, bytes(cpu.ram.data),
+    )
+
+
+class TestSpecializedHandlers:
+    """Test that specialized handlers match the handlers they are generated from."""
+
+    def test_every_opcode_matches_release_handler(self, cpu_variant) -> None:
+        """Registers, flags, memory, cycles and callback order agree for all opcodes."""
+        table = mos6502.CPU(cpu_variant=cpu_variant)._opcode_handler_cache
+        for opcode, specialized in enumerate(table):
+            if specialized is None:
+                continue
+            release = release_handler(getattr(specialized, "__wrapped__", specialized))
+            for seed in range(8):
+                reference_events, specialized_events = [], []
+                reference = run_handler(release, make_cpu(cpu_variant, seed, reference_events))
+                result = run_handler(specialized, make_cpu(cpu_variant, seed, specialized_events))
+
+                assert result == reference, f"opcode 0x{opcode:02X} seed {seed}"
+                assert specialized_events == reference_events, f"opcode 0x{opcode:02X} seed {seed}"
+
+    def test_addressing_helpers_are_inlined(self, cpu) -> None:
+        """Indexed load/store handlers no longer call the generic helpers."""
+        for opcode in (instructions.LDA_ABSOLUTE_X_0xBD, instructions.STA_ZEROPAGE_X_0x95,
+                       instructions.LDA_INDIRECT_INDEXED_Y_0xB1, instructions.ADC_ABSOLUTE_Y_0x79):
+            handler = cpu._opcode_handler_cache[opcode]
+            assert not set(INLINED_HELPERS) & set(handler.__code__.co_names)
+            assert "_X" in handler.__code__.co_names or "_Y" in handler.__code__.co_names
+
+    def test_specialized_handler_is_cached(self) -> None:
+        """Each handler is generated once and keeps a link to its source."""
+        from mos6502.instructions.load._lda import _lda_6502
+
+        original = _lda_6502.lda_absolute_x_0xbd
+        specialized = specialize_handler(original)
+
+        assert specialize_handler(original) is specialized
+        assert specialized.__wrapped__ is original
+        assert specialized.__code__.co_filename == original.__code__.co_filename
+
+    def test_verbose_cycles_uses_original_handlers(self) -> None:
+        """The generated handlers are only used in the release table."""
+        cpu = mos6502.CPU(verbose_cycles=True)
+        handler = cpu._opcode_handler_cache[instructions.LDA_ABSOLUTE_X_0xBD]
+        assert "fetch_absolute_mode_address" in handler.__code__.co_names
+
+    def test_subclass_overriding_helper_keeps_method_calls(self) -> None:
+        """A CPU subclass that overrides read_byte still sees every read."""
+        reads = []
+
+        class TracingCPU(mos6502.CPU):
+            def read_byte(self, address: int) -> int:
+                reads.append(address)
+                return super().read_byte(address)
+
+        cpu = TracingCPU()
+        cpu.reset()
+        cpu.ram[0x0200], cpu.ram[0x0201], cpu.ram[0x0202] = instructions.LDA_ABSOLUTE_0xAD, 0x34, 0x12
+        cpu.PC = 0x0200
+
+        with pytest.raises(mos6502.errors.CPUCycleExhaustionError):
+            cpu.execute(max_instructions=1)
+
+        assert reads == [0x1234]
+
+
+class TestRAMBoundRead:
+    """Test the pre-bound read function used by the specialized handlers."""
+
+    def test_follows_memory_handler(self, cpu) -> None:
+        """Installing or removing a memory handler rebinds RAM.bound_read."""
+        cpu.ram[0x1234] = 0x42
+        assert cpu.ram.bound_read(0x1234) == 0x42
+
+        class ConstantHandler:
+            def read(self, addr: int) -> int:
+                return 0x99
+
+            def write(self, addr: int, value: int) -> None:
+                pass
+
+        cpu.ram.memory_handler = ConstantHandler()
+        assert cpu.ram.bound_read(0x1234) == 0x99
+
+        cpu.ram.memory_handler = None
+        assert cpu.ram.bound_read(0x1234) == 0x42
+
+    def test_flat_ram_pages_are_live(self, cpu) -> None:
+        """Without a handler every page reads straight from RAM.data."""
+        cpu.ram[0x1234] = 0x42
+        assert cpu.ram.read_pages[0x12][0x34] == 0x42
+        assert cpu.ram.page_readers[0x12](0x1234) == 0x42
+
+    def test_handler_without_page_table_uses_read(self, cpu) -> None:
+        """Handlers without read_pages get every read through read()."""
+        reads = []
+
+        class CountingHandler:
+            def read(self, addr: int) -> int:
+                reads.append(addr)
+                return 0x99
+
+            def write(self, addr: int, value: int) -> None:
+                pass
+
+        cpu.ram.memory_handler = CountingHandler()
+        assert cpu.ram[0x1234] == 0x99
+        assert reads == [0x1234]
+        assert cpu.ram.read_pages == [None] * 256
+
+    def test_handler_page_table_is_indexed_directly(self, cpu) -> None:
+        """Mapped pages bypass read() and remapping a page takes effect at once."""
+        rom = bytes(range(256))
+
+        class PagedHandler:
+            def __init__(self) -> None:
+                self.data = bytearray(0x10000)
+                self.read_pages = [memoryview(self.data)[page << 8:(page + 1) << 8] for page in range(256)]
+                self.read_pages[0xD0] = None
+                self.page_readers = [self.read] * 256
+                self.io_reads = 0
+
+            def read(self, addr: int) -> int:
+                self.io_reads += 1
+                return 0xEE
+
+            def write(self, addr: int, value: int) -> None:
+                self.data[addr] = value
+
+        handler = PagedHandler()
+        handler.data[0x2010] = 0x55
+        cpu.ram.memory_handler = handler
+
+        # LDA $2010 / STA $0300 / LDA $D012 / STA $0301
+        program = bytes([
+            instructions.LDA_ABSOLUTE_0xAD, 0x10, 0x20,
+            instructions.STA_ABSOLUTE_0x8D, 0x00, 0x03,
+            instructions.LDA_ABSOLUTE_0xAD, 0x12, 0xD0,
+            instructions.STA_ABSOLUTE_0x8D, 0x01, 0x03,
+        ])
+        handler.data[0x0400:0x0400 + len(program)] = program
+        cpu.PC = 0x0400
+        with pytest.raises(errors.CPUCycleExhaustionError):
+            cpu.execute(max_instructions=4)
+        assert (handler.data[0x0300], handler.data[0x0301]) == (0x55, 0xEE)
+        assert handler.io_reads == 1
+
+        handler.read_pages[0x20] = memoryview(rom)
+        assert cpu.ram[0x2010] == 0x10
+
+    def test_deepcopy(self, cpu) -> None:
+        """Copies rebind their page table to their own data."""
+        cpu.ram[0x1234] = 0x00
+        copy = deepcopy(cpu)
+        copy.ram[0x1234] = 0x42
+        assert copy.ram.read_pages[0x12][0x34] == 0x42
+        assert cpu.ram.read_pages[0x12][0x34] == 0x00